@@ -0,0 +1,24 @@
+"""
+End-to-end audit benchmarks.
+
+Runs the real audit pipeline against the stand-in SQL Server driver
+(autodbaudit.infrastructure.sql.stand_in) at preset fleet scales and
+times each phase separately: connect, every collector, SQLite persist,
+findings diff, stats, Excel save, annotation read/write and Persian
+report generation. Results are written as JSON and can be compared
+against a stored baseline so regressions are caught before a release:
+
+    python -m benchmarks --preset small --output bench_small.json
+    python -m benchmarks --preset small --baseline benchmarks/baselines/small.json
+    python -m benchmarks --preset small --save-baseline
+
+See benchmarks/README.md for presets and the result format.
+"""
+
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+
+if find_spec("autodbaudit") is None:
+    # Running from a source checkout without an installed package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
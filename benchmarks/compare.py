@@ -0,0 +1,81 @@
+"""
+Baseline comparison for benchmark results.
+
+A phase regresses when it is slower than the baseline by more than the
+relative tolerance AND by more than an absolute floor; the floor keeps
+millisecond phases from failing a run on scheduler noise.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_SECONDS = 0.05
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> dict[str, Any]:
+    """
+    Compare phase times of a result with a baseline result.
+
+    Args:
+        current: Result of this run
+        baseline: Stored result to compare with (same preset)
+        tolerance: Allowed slowdown as a fraction (0.25 = 25%)
+        min_seconds: Slowdowns smaller than this never count as regressions
+
+    Returns:
+        {"phases": {phase: {baseline, current, ratio, status}}, "regressions": [...],
+         "scale_mismatch": bool}
+    """
+    phases: dict[str, dict[str, Any]] = {}
+    regressions: list[str] = []
+    baseline_phases = baseline.get("phases", {})
+    current_phases = current.get("phases", {})
+
+    for name in sorted(set(baseline_phases) | set(current_phases)):
+        before = baseline_phases.get(name, {}).get("seconds")
+        after = current_phases.get(name, {}).get("seconds")
+        entry: dict[str, Any] = {"baseline": before, "current": after, "ratio": None}
+        if before is None:
+            entry["status"] = "new"
+        elif after is None:
+            entry["status"] = "missing"
+        else:
+            entry["ratio"] = round(after / before, 3) if before > 0 else None
+            slower = after - before
+            if slower > min_seconds and after > before * (1 + tolerance):
+                entry["status"] = "regression"
+                regressions.append(name)
+            elif before - after > min_seconds and before > after * (1 + tolerance):
+                entry["status"] = "improvement"
+            else:
+                entry["status"] = "ok"
+        phases[name] = entry
+
+    return {
+        "baseline_commit": baseline.get("environment", {}).get("git_commit"),
+        "tolerance": tolerance,
+        "min_seconds": min_seconds,
+        "scale_mismatch": baseline.get("scale") != current.get("scale"),
+        "phases": phases,
+        "regressions": regressions,
+    }
+
+
+def format_comparison(comparison: dict[str, Any]) -> str:
+    """Human-readable table of a comparison."""
+    lines = [f"{'phase':<32}{'baseline':>12}{'current':>12}{'ratio':>8}  status"]
+    for name, entry in comparison["phases"].items():
+        before = "-" if entry["baseline"] is None else f"{entry['baseline']:.3f}s"
+        after = "-" if entry["current"] is None else f"{entry['current']:.3f}s"
+        ratio = "-" if entry["ratio"] is None else f"{entry['ratio']:.2f}x"
+        lines.append(f"{name:<32}{before:>12}{after:>12}{ratio:>8}  {entry['status']}")
+    if comparison["scale_mismatch"]:
+        lines.append("WARNING: baseline was recorded at a different scale")
+    return "\n".join(lines)
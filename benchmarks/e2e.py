@@ -0,0 +1,255 @@
+"""
+End-to-end audit benchmark run.
+
+One run builds a synthetic fleet with the stand-in driver, writes the
+config for it and runs AuditService twice: a baseline audit (untimed)
+and the measured audit. The later phases (diff, stats, annotations,
+Persian report) then work on those two runs and the saved report, the
+way a sync does.
+
+OS-level collection over PowerShell remoting is out of scope: the
+benchmark fleet has no hosts to remote into, so services are collected
+through the T-SQL fallback like on a target without WinRM.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Iterable
+
+from autodbaudit.infrastructure.sql.odbc import use_odbc
+from autodbaudit.infrastructure.sql.stand_in import FleetSpec, StandInDriver
+
+from .timing import PhaseTimer, instrumented, patched
+
+logger = logging.getLogger(__name__)
+
+# Phases in pipeline order (collector phases are "collect.<name>")
+PHASES = (
+    "connect",
+    "collect",
+    "persist",
+    "excel_save",
+    "diff",
+    "stats",
+    "annotations_read",
+    "annotations_write",
+    "persian",
+)
+
+# Share of report rows given annotations before the write phase
+ANNOTATED_SHARE = 0.1
+
+
+def _collector_classes() -> dict[str, type]:
+    # pylint: disable=import-outside-toplevel
+    from autodbaudit.application.collectors import (
+        AccessControlCollector,
+        ConfigurationCollector,
+        DatabaseCollector,
+        InfrastructureCollector,
+        SecurityPolicyCollector,
+        ServerPropertiesCollector,
+    )
+
+    return {
+        "server_properties": ServerPropertiesCollector,
+        "access_control": AccessControlCollector,
+        "configuration": ConfigurationCollector,
+        "infrastructure": InfrastructureCollector,
+        "databases": DatabaseCollector,
+        "security_policy": SecurityPolicyCollector,
+    }
+
+
+def write_fleet_config(spec: FleetSpec, config_dir: Path) -> None:
+    """audit_config.json and sql_targets.json for the fleet's instances."""
+    config_dir.mkdir(parents=True, exist_ok=True)
+    audit_config = {
+        "organization": "Benchmark",
+        "audit_year": 2025,
+        "audit_date": "2025-01-01",
+        # Stand-in hosts don't exist on the network
+        "prescan": {"enabled": False},
+    }
+    targets = [
+        {
+            "id": server,
+            "name": server,
+            "server": server,
+            "instance": None,
+            "port": 1433,
+            "auth": "integrated",
+            "enabled": True,
+        }
+        for server in spec.server_names()
+    ]
+    (config_dir / "audit_config.json").write_text(json.dumps(audit_config, indent=2), encoding="utf-8")
+    (config_dir / "sql_targets.json").write_text(json.dumps({"targets": targets}, indent=2), encoding="utf-8")
+
+
+def _instrument(stack: ExitStack, timer: PhaseTimer) -> None:
+    """Wrap the methods implementing each audit phase."""
+    # pylint: disable=import-outside-toplevel
+    import importlib
+
+    from autodbaudit.application.collectors.base import BaseCollector
+    from autodbaudit.infrastructure.excel import EnhancedReportWriter
+    from autodbaudit.infrastructure.sql.connector import SqlConnector
+    from autodbaudit.infrastructure.sqlite import HistoryStore
+    from autodbaudit.infrastructure.sqlite import schema
+
+    for method in ("test_connection", "detect_version"):
+        stack.enter_context(instrumented(timer, SqlConnector, method, "connect"))
+
+    for name, collector in _collector_classes().items():
+        stack.enter_context(instrumented(timer, collector, "collect", f"collect.{name}"))
+
+    # Persistence: findings plus the per-entity rows collectors save directly
+    stack.enter_context(instrumented(timer, BaseCollector, "save_finding", "persist"))
+    for collector in _collector_classes().values():
+        module = importlib.import_module(collector.__module__)
+        for attribute in dir(module):
+            if attribute.startswith("save_") and getattr(module, attribute) is getattr(schema, attribute, None):
+                stack.enter_context(instrumented(timer, module, attribute, "persist"))
+    for method in ("upsert_server", "upsert_instance", "link_instance_to_run"):
+        stack.enter_context(instrumented(timer, HistoryStore, method, "persist"))
+
+    stack.enter_context(instrumented(timer, EnhancedReportWriter, "save", "excel_save"))
+
+
+def _annotate(annotations: dict[str, dict], share: float) -> dict[str, dict]:
+    """Reviewer notes on a share of the report rows (what a review round adds)."""
+    step = max(int(round(1 / share)), 1) if share > 0 else 0
+    annotated = {}
+    for index, (key, fields) in enumerate(annotations.items()):
+        fields = dict(fields)
+        if step and index % step == 0:
+            if "notes" in fields:
+                fields["notes"] = f"Benchmark note {index}"
+            if "justification" in fields:
+                fields["justification"] = "Accepted for benchmark"
+        annotated[key] = fields
+    return annotated
+
+
+def run_e2e(
+    spec: FleetSpec,
+    workdir: Path,
+    phases: Iterable[str] = PHASES,
+) -> dict[str, Any]:
+    """
+    Run the audit pipeline once and time its phases.
+
+    Args:
+        spec: Fleet to audit
+        workdir: Empty directory for config, history database and reports
+        phases: Phases to run after the audit (connect, collect, persist and
+                excel_save are part of the audit and always run)
+
+    Returns:
+        {"phases": {...}, "wall_seconds": {...}, "counts": {...}}
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    from autodbaudit.application.annotation_sync import AnnotationSyncService
+    from autodbaudit.application.audit_service import AuditService
+    from autodbaudit.application.collectors.infrastructure import InfrastructureCollector
+    from autodbaudit.application.diff.findings_diff import diff_findings
+    from autodbaudit.application.persian_generator import PersianExcelGenerator
+    from autodbaudit.application.stats_service import StatsService
+    from autodbaudit.infrastructure.sqlite import HistoryStore
+
+    phases = set(phases)
+    config_dir, output_dir = workdir / "config", workdir / "output"
+    write_fleet_config(spec, config_dir)
+
+    timer = PhaseTimer()
+    wall: dict[str, float] = {}
+    counts: dict[str, int] = {}
+    driver = StandInDriver(spec)
+
+    with ExitStack() as stack:
+        previous = use_odbc(driver)
+        stack.callback(use_odbc, previous)
+        stack.enter_context(
+            patched(InfrastructureCollector, "_collect_services_via_powershell", lambda self: 0)
+        )
+        _instrument(stack, timer)
+
+        # Baseline audit: gives the diff and stats phases a previous run
+        timer.enabled = False
+        started = time.perf_counter()
+        service = AuditService(config_dir, output_dir)
+        service.run_audit(skip_save=True)
+        baseline_run_id = service._audit_run_id  # pylint: disable=protected-access
+        wall["baseline_audit"] = time.perf_counter() - started
+
+        timer.enabled = True
+        started = time.perf_counter()
+        service = AuditService(config_dir, output_dir)
+        report = Path(service.run_audit())
+        current_run_id = service._audit_run_id  # pylint: disable=protected-access
+        wall["audit"] = time.perf_counter() - started
+
+    counts["queries"] = driver.queries
+    counts["rows_served"] = driver.rows_served
+
+    store = HistoryStore(output_dir / "audit_history.db")
+    annotation_sync = AnnotationSyncService(output_dir / "audit_history.db")
+    try:
+        baseline_findings = store.get_findings(baseline_run_id)
+        current_findings = store.get_findings(current_run_id)
+        counts["findings"] = len(current_findings)
+
+        if "diff" in phases:
+            with timer.phase("diff"):
+                result = diff_findings(baseline_findings, current_findings)
+            counts["diff_changes"] = result.total_changes
+
+        if "stats" in phases:
+            with timer.phase("stats"):
+                StatsService(store, annotation_sync).calculate(baseline_run_id, current_run_id)
+
+        annotations: dict[str, dict] = {}
+        if "annotations_read" in phases or "annotations_write" in phases:
+            with timer.phase("annotations_read"):
+                annotations = annotation_sync.read_all_from_excel(report)
+            counts["annotation_rows"] = len(annotations)
+
+        if "annotations_write" in phases:
+            annotated = _annotate(annotations, ANNOTATED_SHARE)
+            with timer.phase("annotations_write"):
+                counts["annotation_cells_written"] = annotation_sync.write_all_to_excel(report, annotated)
+
+        if "persian" in phases:
+            with timer.phase("persian"):
+                PersianExcelGenerator().generate(report)
+    finally:
+        store.close()
+
+    wall["total"] = wall["baseline_audit"] + wall["audit"] + sum(
+        timer.results().get(name, {}).get("seconds", 0.0)
+        for name in ("diff", "stats", "annotations_read", "annotations_write", "persian")
+    )
+    return {
+        "phases": timer.results(),
+        "wall_seconds": {name: round(seconds, 6) for name, seconds in wall.items()},
+        "counts": counts,
+        "report_bytes": report.stat().st_size,
+    }
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident memory of this process (None where unavailable)."""
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
@@ -0,0 +1,75 @@
+"""
+Fleet scale presets for the end-to-end benchmark.
+
+Permission rows (instances x databases x permissions_per_db) grow from
+10k (small) to 1M (large), the range seen in real estates. Everything
+else is kept at typical per-instance sizes so presets differ mainly in
+fleet size and permission volume.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+from autodbaudit.infrastructure.sql.stand_in import FleetSpec
+
+PRESETS: dict[str, dict[str, Any]] = {
+    # Seconds; for checking the harness itself (and CI)
+    "smoke": {
+        "instances": 2,
+        "databases": 3,
+        "logins": 20,
+        "users_per_db": 10,
+        "permissions_per_db": 20,
+    },
+    # 10 instances, 10k permission rows
+    "small": {
+        "instances": 10,
+        "databases": 10,
+        "logins": 50,
+        "users_per_db": 25,
+        "permissions_per_db": 100,
+    },
+    # 100 instances, 100k permission rows
+    "medium": {
+        "instances": 100,
+        "databases": 10,
+        "logins": 50,
+        "users_per_db": 25,
+        "permissions_per_db": 100,
+    },
+    # 1,000 instances, 1M permission rows
+    "large": {
+        "instances": 1000,
+        "databases": 10,
+        "logins": 50,
+        "users_per_db": 25,
+        "permissions_per_db": 100,
+    },
+}
+
+
+def fleet_for(preset: str, **overrides: Any) -> FleetSpec:
+    """
+    FleetSpec of a preset, with optional field overrides (e.g. latency).
+
+    Raises:
+        KeyError: If the preset is unknown
+    """
+    if preset not in PRESETS:
+        raise KeyError(f"Unknown preset {preset!r} (choose from {', '.join(PRESETS)})")
+    spec = FleetSpec(**PRESETS[preset])
+    return replace(spec, **overrides) if overrides else spec
+
+
+def describe_scale(spec: FleetSpec) -> dict[str, int]:
+    """Row counts a fleet produces (recorded with every result)."""
+    return {
+        "instances": spec.instances,
+        "databases": spec.instances * spec.databases,
+        "logins": spec.instances * spec.logins,
+        "database_users": spec.instances * spec.databases * (spec.users_per_db + 2),
+        "permission_rows": spec.instances
+        * (spec.databases * spec.permissions_per_db + spec.server_permissions),
+    }
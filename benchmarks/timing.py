@@ -0,0 +1,99 @@
+"""
+Per-phase timing for the benchmark.
+
+Phases are measured by wrapping the methods that implement them, so the
+benchmark times the production code path rather than a re-implementation
+of it. Time is exclusive: a persist call made from inside a collector is
+charged to "persist", not to the collector. Phases that run on the
+audit's worker threads add up across threads and can exceed wall time.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+class PhaseTimer:
+    """Accumulates exclusive seconds and call counts per phase (thread-safe)."""
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self._totals: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list[list[Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Charge the time spent in the block (minus nested phases) to name."""
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        frame = [name, time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            if stack:
+                stack[-1][2] += elapsed
+            with self._lock:
+                total = self._totals.setdefault(name, [0.0, 0])
+                total[0] += elapsed - frame[2]
+                total[1] += 1
+
+    def wrap(self, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """func, timed as phase name."""
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def results(self) -> dict[str, dict[str, float]]:
+        """{phase: {"seconds": exclusive seconds, "calls": count}}, sorted by phase."""
+        with self._lock:
+            return {
+                name: {"seconds": round(seconds, 6), "calls": int(calls)}
+                for name, (seconds, calls) in sorted(self._totals.items())
+            }
+
+
+@contextmanager
+def patched(owner: Any, attribute: str, replacement: Any) -> Iterator[None]:
+    """Temporarily replace owner.attribute (restores inherited attributes too)."""
+    own = attribute in vars(owner)
+    original = vars(owner)[attribute] if own else None
+    setattr(owner, attribute, replacement)
+    try:
+        yield
+    finally:
+        if own:
+            setattr(owner, attribute, original)
+        else:
+            delattr(owner, attribute)
+
+
+@contextmanager
+def instrumented(timer: PhaseTimer, owner: Any, attribute: str, name: str) -> Iterator[None]:
+    """Time every call of owner.attribute as phase name while the block runs."""
+    original = getattr(owner, attribute)
+    if isinstance(vars(owner).get(attribute), staticmethod):
+        replacement: Any = staticmethod(timer.wrap(original, name))
+    else:
+        replacement = timer.wrap(original, name)
+    with patched(owner, attribute, replacement):
+        yield
@@ -31,6 +31,9 @@ a = Analysis(
     binaries=[],
     datas=[
         (assets_path, 'assets'),
+        # Remediation templates (see jinja_generator._get_template_dir)
+        (os.path.join(src_path, 'autodbaudit', 'application', 'remediation', 'templates'),
+         os.path.join('assets', 'remediation_templates')),
     ],
     hiddenimports=[
         'rich.console',
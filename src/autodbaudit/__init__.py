@@ -18,6 +18,11 @@ Usage:
 __version__ = "0.1.0"
 __author__ = "AutoDBAudit Team"
 
-from autodbaudit.application.audit_service import AuditService
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = ["AuditService", "__version__"]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AuditService": "autodbaudit.application.audit_service",
+})
@@ -5,11 +5,15 @@ Contains service classes that orchestrate business workflows.
 Services coordinate between domain models and infrastructure.
 """
 
-from autodbaudit.application.audit_service import AuditService
-
-from autodbaudit.application.remediation.service import RemediationService
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "AuditService",
     "RemediationService",
 ]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AuditService": "autodbaudit.application.audit_service",
+    "RemediationService": "autodbaudit.application.remediation.service",
+})
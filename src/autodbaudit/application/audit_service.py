@@ -10,13 +10,15 @@ from __future__ import annotations
 import concurrent.futures
 import logging
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from dataclasses import dataclass
 
 from autodbaudit.infrastructure.config_loader import ConfigLoader, SqlTarget
+from autodbaudit.infrastructure.reachability import WINRM_PORTS, probe_host, scan_endpoints
 from autodbaudit.infrastructure.sql.connector import SqlConnector
 from autodbaudit.infrastructure.sql.query_provider import get_query_provider
 from autodbaudit.infrastructure.excel import EnhancedReportWriter
@@ -135,6 +137,8 @@ class AuditService:
         skip_save: bool = False,
         # Allow reusing existing writer (for SyncService injection)
         writer: EnhancedReportWriter | None = None,
+        # Restrict the scan to a subset of targets (targeted sync)
+        target_filter: Callable[[SqlTarget], bool] | None = None,
     ) -> Path | EnhancedReportWriter:
         """
         Run the audit workflow.
@@ -146,6 +150,7 @@ class AuditService:
             organization: Optional organization name for report
             skip_save: If True, returns populate writer instead of saving file
             writer: Optional existing writer to use
+            target_filter: Optional predicate; only targets it accepts are scanned
 
         Returns:
             Path object if saved, or EnhancedReportWriter if skip_save=True
@@ -153,7 +158,7 @@ class AuditService:
         # Step 1: Perform the scan (collect data)
         # This populates the writer and the database
         writer, run_id, _counts = self._perform_audit_scan(
-            targets_file, organization, writer
+            targets_file, organization, writer, target_filter
         )
 
         # Step 2: Save Report (unless skipped)
@@ -175,15 +180,19 @@ class AuditService:
             audit_config = self.config_loader.load_audit_config()
             config_org = audit_config.organization
             expected_builds = audit_config.expected_builds
+            history_storage = audit_config.history_storage
         except Exception:
             config_org = None
             expected_builds = {}
+            history_storage = "full"
 
         final_org = organization or config_org or "Security Audit"
         audit_name = "SQL Server Security Audit"
 
         # Initialize SQLite history store (Main thread only)
         store = self._get_history_store()
+        if history_storage == "content_addressed":
+            store.enable_content_addressed_storage()
         audit_run = store.begin_audit_run(organization=final_org)
         self._audit_run_id = audit_run.id
 
@@ -215,6 +224,7 @@ class AuditService:
         targets_file: str,
         organization: str | None,
         writer: EnhancedReportWriter | None = None,
+        target_filter: Callable[[SqlTarget], bool] | None = None,
     ) -> tuple[EnhancedReportWriter, int, dict]:
         """
         Core audit logic: Connects, Scans, Collects.
@@ -232,6 +242,9 @@ class AuditService:
 
         writer, run_id, expected_builds = self._initialize_audit_run(organization, writer)
         targets = self._load_targets(targets_file)
+        if target_filter is not None:
+            targets = [t for t in targets if target_filter(t)]
+            logger.info("Target filter applied: %d targets selected", len(targets))
 
         success_count, error_count = self._execute_parallel_scan(
             ScanContext(
@@ -278,10 +291,14 @@ class AuditService:
             finally:
                 thread_store.close()
 
+        # Drop targets that don't answer on their SQL port before queueing any work
+        targets, unreachable = self._prescan_targets([t for t in context.targets if t.enabled])
+        error_count += len(unreachable)
+
         # Execute in parallel
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_target = {
-                executor.submit(process_target_safe, t): t for t in context.targets if t.enabled
+                executor.submit(process_target_safe, t): t for t in targets
             }
 
             for future in concurrent.futures.as_completed(future_to_target):
@@ -301,6 +318,67 @@ class AuditService:
 
         return success_count, error_count
 
+    def _prescan_targets(
+        self, targets: list[SqlTarget]
+    ) -> tuple[list[SqlTarget], list[SqlTarget]]:
+        """
+        TCP-sweep all targets' SQL ports (and WinRM ports) in one pass.
+
+        Named instances without a configured port can't be probed (the port
+        comes from SQL Browser) and are always scheduled.
+
+        Returns:
+            (targets to scan, unreachable targets)
+        """
+        try:
+            audit_config = self.config_loader.load_audit_config()
+            enabled = audit_config.prescan_enabled
+            timeout = audit_config.prescan_timeout
+            include_winrm = audit_config.prescan_winrm
+        except Exception:
+            enabled, timeout, include_winrm = True, 0.75, True
+
+        if not enabled or not targets:
+            return targets, []
+
+        sql_endpoints: dict[int, tuple[str, int]] = {}
+        endpoints: list[tuple[str, int]] = []
+        for index, target in enumerate(targets):
+            port = target.port or (None if target.instance else 1433)
+            if port is None:
+                continue
+            host = probe_host(target.server)
+            sql_endpoints[index] = (host, port)
+            endpoints.append((host, port))
+            if include_winrm:
+                endpoints.extend((host, p) for p in WINRM_PORTS)
+
+        started = time.perf_counter()
+        reachable = scan_endpoints(endpoints, timeout=timeout)
+
+        scan, unreachable = [], []
+        for index, target in enumerate(targets):
+            endpoint = sql_endpoints.get(index)
+            if endpoint is None or reachable.get(endpoint, True):
+                scan.append(target)
+            else:
+                unreachable.append(target)
+                logger.error(
+                    "Error processing %s: unreachable (no TCP response on %s:%d)",
+                    target.display_name,
+                    endpoint[0],
+                    endpoint[1],
+                )
+
+        logger.info(
+            "Pre-scan: %d/%d targets reachable (%d endpoints in %.2fs)",
+            len(scan),
+            len(targets),
+            len(reachable),
+            time.perf_counter() - started,
+        )
+        return scan, unreachable
+
     def _process_target(
         self,
         target: SqlTarget,
@@ -379,6 +457,7 @@ class AuditService:
             audit_run_id=self._audit_run_id,
             instance_id=instance.id,
             expected_builds=context.expected_builds or {},
+            output_dir=self.output_dir,
         )
         counts = collector.collect_all(
             server_name=target.server,
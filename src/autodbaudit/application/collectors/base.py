@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any
 from autodbaudit.infrastructure.sqlite.schema import save_finding, build_entity_key
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from autodbaudit.infrastructure.sql.connector import SqlConnector
     from autodbaudit.infrastructure.sql.query_provider import QueryProvider
     from autodbaudit.infrastructure.excel import EnhancedReportWriter
@@ -40,6 +42,9 @@ class CollectorContext:  # pylint: disable=too-many-instance-attributes
     # Metadata
     expected_builds: dict[str, str] | None = None
 
+    # Configured output directory (history DB, caches)
+    output_dir: Path | None = None
+
 
 class BaseCollector(ABC):
     """
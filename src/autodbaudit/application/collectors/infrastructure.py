@@ -7,7 +7,7 @@ from __future__ import annotations
 import logging
 import json
 from autodbaudit.application.collectors.base import BaseCollector
-from autodbaudit.infrastructure.psremoting.facade import PSRemotingFacade
+from autodbaudit.infrastructure.psremoting.facade import PSRemotingFacade, get_host_inventory
 from autodbaudit.utils.resources import get_base_path
 
 logger = logging.getLogger(__name__)
@@ -145,7 +145,7 @@ class InfrastructureCollector(BaseCollector):
     ) -> PSRemotingFacade:
         """Create PS remoting facade for the target host (with supplied credentials)."""
         # For now we instantiate fresh; consider DI if reused broadly.
-        return PSRemotingFacade()
+        return PSRemotingFacade(output_dir=self.ctx.output_dir)
 
     def _determine_service_type(self, svc_name: str, instance: str) -> tuple[str, str]:
         """Determine service type and instance based on service name."""
@@ -215,33 +215,30 @@ class InfrastructureCollector(BaseCollector):
                 else self.ctx.server_name
             )
             facade = self._create_facade(target_host, username, password)
-            # Use facade to run a data-collection script (placeholder; replace with real script)
-            script = "Get-Service | Select-Object Name, DisplayName, Status, StartType, StartName | ConvertTo-Json -Compress"
-            command_result = facade.run_command(
+            # Services come from the shared per-host inventory batch (one round trip)
+            inventory = get_host_inventory(
+                facade,
                 target_host,
-                script,
                 {"windows_credentials": {"domain_admin": {"username": username, "password": password}}},
-                prefer_method=None,
             )
-            if not command_result.success:
-                logger.error("PowerShell service collection failed: %s", command_result.stderr)
+            if "services" in inventory.errors:
+                logger.error("PowerShell service collection failed: %s", inventory.errors["services"])
                 return 0
 
-            try:
-                ps_services = json.loads(command_result.stdout) if command_result.stdout else []
-            except Exception as e:  # pylint: disable=broad-except
-                logger.error("Failed to parse service data: %s", e)
-                return 0
+            ps_services = inventory.get("services") or []
+            if isinstance(ps_services, dict):
+                ps_services = [ps_services]  # ConvertTo-Json unwraps single items
             if not ps_services:
+                command = inventory.command
                 logger.warning(
                     "PowerShell executed but returned no services. "
                     "Raw Output Sample: %s",
-                    str(result.raw_output)[:500] if result.raw_output else "None",
+                    command.stdout[:500] if command and command.stdout else "None",
                 )
-                if result.error:
-                    logger.warning("PS Result Error: %s", result.error)
                 return 0
 
+            instance = self.ctx.instance_name
+
             for svc in ps_services:
                 svc_name = svc.get("name", "")
                 start_mode = svc.get("start_mode", "")
@@ -19,6 +19,8 @@ from autodbaudit.application.collectors.infrastructure import InfrastructureColl
 from autodbaudit.application.collectors.security_policy import SecurityPolicyCollector
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from autodbaudit.infrastructure.sql.connector import SqlConnector
     from autodbaudit.infrastructure.sql.query_provider import QueryProvider
     from autodbaudit.infrastructure.excel import EnhancedReportWriter
@@ -43,6 +45,7 @@ class AuditDataCollector:
         audit_run_id: int | None = None,
         instance_id: int | None = None,
         expected_builds: dict[str, str] | None = None,
+        output_dir: Path | None = None,
     ) -> None:
         """
         Initialize the orchestrator.
@@ -54,6 +57,7 @@ class AuditDataCollector:
         self.audit_run_id = audit_run_id
         self.instance_id = instance_id
         self.expected_builds = expected_builds or {}
+        self.output_dir = output_dir
 
     def collect_all(  # pylint: disable=too-many-locals
         self,
@@ -74,6 +78,7 @@ class AuditDataCollector:
             audit_run_id=self.audit_run_id,
             instance_id=self.instance_id,
             expected_builds=self.expected_builds,
+            output_dir=self.output_dir,
             server_name=server_name,
             instance_name=instance_name,
         )
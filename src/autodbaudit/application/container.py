@@ -11,6 +11,7 @@ from typing import Optional
 
 from ..domain.config.audit_settings import AuditSettings
 from ..infrastructure.config.credential_manager import CredentialManager
+from ..infrastructure.config.key_agent import get_key_agent
 from ..infrastructure.config.manager import ConfigManager
 from ..infrastructure.config.repository import ConfigRepository
 from ..infrastructure.sqlite.store import HistoryStore
@@ -74,14 +75,18 @@ class Container:
     def config_manager(self) -> ConfigManager:
         """Get the configuration manager."""
         if self._config_manager is None:
-            self._config_manager = ConfigManager(self.config_dir)
+            self._config_manager = ConfigManager(
+                self.config_dir, credential_manager=self.credential_manager
+            )
         return self._config_manager
 
     @property
     def credential_manager(self) -> CredentialManager:
         """Get the credential manager."""
         if self._credential_manager is None:
-            self._credential_manager = CredentialManager(self.config_repository)
+            self._credential_manager = CredentialManager(
+                self.config_repository, key_agent=get_key_agent()
+            )
         return self._credential_manager
 
     @property
@@ -109,7 +114,10 @@ class Container:
     def cache_manager(self) -> ConnectionCacheManager:
         """Get the connection cache manager."""
         if self._cache_manager is None:
-            self._cache_manager = ConnectionCacheManager()
+            # Persistent tier shares discovered connection methods across runs
+            self._cache_manager = ConnectionCacheManager(
+                db_path=self.config_dir.parent / "output" / "audit_history.db"
+            )
         return self._cache_manager
 
     @property
@@ -13,10 +13,12 @@ from autodbaudit.application.diff.findings_diff import (
     diff_findings,
     FindingsDiffResult,
     build_findings_map,
+    index_findings,
 )
 
 __all__ = [
     "diff_findings",
     "FindingsDiffResult",
     "build_findings_map",
+    "index_findings",
 ]
@@ -13,7 +13,9 @@ Architecture Note:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from itertools import product
 from typing import Any
 
 from autodbaudit.domain.change_types import (
@@ -22,13 +24,89 @@ from autodbaudit.domain.change_types import (
     DetectedChange,
     RiskLevel,
     EntityType,
+    TransitionResult,
 )
 from autodbaudit.domain.state_machine import (
     classify_finding_transition,
+    is_exception_eligible,
 )
 from autodbaudit.domain.entity_key import normalize_key_string
 
 
+# =============================================================================
+# Lookup Tables
+# =============================================================================
+
+# Entity type prefixes that precede server|instance in an entity key
+ENTITY_KEY_TYPES = frozenset(
+    {
+        "sa_account",
+        "login",
+        "config",
+        "service",
+        "database",
+        "backup",
+        "trigger",
+        "protocol",
+        "encryption",
+        "db_user",
+        "db_role",
+        "db_role_member",
+        "permission",
+        "db_permission",
+        "linked_server",
+        "orphaned_user",
+        "audit_settings",
+        "sensitive_role",
+        "role_member",
+        "server_role_member",
+        "instance",
+        "version",
+    }
+)
+
+# Type prefixes tried when matching annotation keys to finding keys
+ANNOTATION_KEY_TYPES: tuple[str, ...] = (
+    "sa_account",
+    "login",
+    "server_role_member",
+    "config",
+    "service",
+    "database",
+    "db_user",
+    "db_role",
+    "permission",
+    "orphaned_user",
+    "trigger",
+    "protocol",
+    "backup",
+    "audit_settings",
+    "encryption",
+    "linked_server",
+    "instance",
+)
+
+_STATUS_VALUES: tuple[FindingStatus | None, ...] = (None, *FindingStatus)
+
+# (old_status, new_status, old_exc, new_exc, instance_scanned) -> TransitionResult
+# Precomputed from the state machine so it stays the single source of truth.
+TRANSITION_TABLE: dict[
+    tuple[FindingStatus | None, FindingStatus | None, bool, bool, bool],
+    TransitionResult,
+] = {
+    (old_status, new_status, old_exc, new_exc, scanned): classify_finding_transition(
+        old_status=old_status,
+        new_status=new_status,
+        old_has_exception=old_exc,
+        new_has_exception=new_exc,
+        instance_was_scanned=scanned,
+    )
+    for old_status, new_status, old_exc, new_exc, scanned in product(
+        _STATUS_VALUES, _STATUS_VALUES, (False, True), (False, True), (False, True)
+    )
+}
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -97,6 +175,44 @@ def build_findings_map(findings: list[dict[str, Any]]) -> dict[str, dict[str, An
     return {f.get("entity_key", ""): f for f in findings if f.get("entity_key")}
 
 
+class IndexedFinding:
+    """Compact per-run view of a finding: parsed status plus the source row."""
+
+    __slots__ = ("status", "finding")
+
+    def __init__(self, status: FindingStatus | None, finding: dict[str, Any]):
+        self.status = status
+        self.finding = finding
+
+
+def index_findings(findings: list[dict[str, Any]]) -> dict[str, IndexedFinding]:
+    """
+    Build a map of interned entity_key -> IndexedFinding.
+
+    Same keying rules as build_findings_map, but each status is parsed once
+    and keys are interned so both runs share one string object per key.
+
+    Args:
+        findings: List of finding dicts with 'entity_key'
+
+    Returns:
+        Dict keyed by entity_key
+    """
+    statuses: dict[Any, FindingStatus | None] = {}
+    index: dict[str, IndexedFinding] = {}
+    for f in findings:
+        key = f.get("entity_key")
+        if not key:
+            continue
+        raw_status = f.get("status")
+        if raw_status in statuses:
+            status = statuses[raw_status]
+        else:
+            status = statuses[raw_status] = FindingStatus.from_string(raw_status)
+        index[sys.intern(key)] = IndexedFinding(status, f)
+    return index
+
+
 def extract_server_instance(
     entity_key: str,
     finding: dict[str, Any] | None = None,
@@ -126,62 +242,14 @@ def extract_server_instance(
 
     if len(parts) >= 3:
         # Check if first part is a type
-        known_types = {
-            "sa_account",
-            "login",
-            "config",
-            "service",
-            "database",
-            "backup",
-            "trigger",
-            "protocol",
-            "encryption",
-            "db_user",
-            "db_role",
-            "db_role_member",
-            "permission",
-            "db_permission",
-            "linked_server",
-            "orphaned_user",
-            "audit_settings",
-            "sensitive_role",
-            "role_member",
-            "server_role_member",
-            "instance",
-            "version",
-        }
-        if parts[0].lower() in known_types:
+        if parts[0].lower() in ENTITY_KEY_TYPES:
             return parts[1], parts[2]
 
     # Fallback for legacy format: Server|Instance|...
     if len(parts) >= 2:
         # DON'T return parts[0], parts[1] blindly - might be type|uuid
         # Check if parts[0] looks like a type
-        known_types = {
-            "sa_account",
-            "login",
-            "config",
-            "service",
-            "database",
-            "backup",
-            "trigger",
-            "protocol",
-            "encryption",
-            "db_user",
-            "db_role",
-            "db_role_member",
-            "permission",
-            "db_permission",
-            "linked_server",
-            "orphaned_user",
-            "audit_settings",
-            "sensitive_role",
-            "role_member",
-            "server_role_member",
-            "instance",
-            "version",
-        }
-        if parts[0].lower() in known_types:
+        if parts[0].lower() in ENTITY_KEY_TYPES:
             # This is type|something format - can't extract server/instance
             return "", ""
         # Assume Server|Instance format
@@ -207,10 +275,21 @@ def is_instance_valid(
     if not valid_instance_keys:
         return True  # No validation = assume valid
 
-    server, instance = extract_server_instance(entity_key)
-    check_key = f"{server}|{instance}".lower()
+    return scanned_instance_key(entity_key) in {k.lower() for k in valid_instance_keys}
+
+
+def scanned_instance_key(entity_key: str) -> str:
+    """
+    Get the lowercase "server|instance" key an entity key belongs to.
+
+    Args:
+        entity_key: The entity key to parse
 
-    return check_key in {k.lower() for k in valid_instance_keys}
+    Returns:
+        Key comparable against lowercased scanned instance keys
+    """
+    server, instance = extract_server_instance(entity_key)
+    return f"{server}|{instance}".lower()
 
 
 def derive_entity_type(entity_key: str) -> EntityType:
@@ -346,6 +425,10 @@ def diff_findings(
     This is THE primary diff function for findings comparison.
     Uses the domain state machine for accurate transition classification.
 
+    Both runs are indexed once (see index_findings) and joined on entity_key;
+    transitions are read from TRANSITION_TABLE instead of re-running the
+    state machine for every key.
+
     Args:
         old_findings: Previous run's findings
         new_findings: Current run's findings
@@ -361,110 +444,91 @@ def diff_findings(
 
     old_exceptions = old_exceptions or set()
     new_exceptions = new_exceptions or set()
-    valid_instance_keys = valid_instance_keys or set()
-
-    old_map = build_findings_map(old_findings)
-    new_map = build_findings_map(new_findings)
+    valid_lower = {k.lower() for k in valid_instance_keys or ()}
 
-    # Track processed keys to avoid double-counting
-    processed_keys: set[str] = set()
+    old_index = index_findings(old_findings)
+    new_index = index_findings(new_findings)
 
     # Process all keys from old findings (check for Fixed, Regression, Still Failing)
-    for key, old_f in old_map.items():
-        processed_keys.add(key)
-
-        old_status = FindingStatus.from_string(old_f.get("status"))
-        old_excepted = key in old_exceptions
+    for key, old_entry in old_index.items():
+        old_f = old_entry.finding
+        new_entry = new_index.get(key)
+        new_status = new_entry.status if new_entry is not None else None
+        new_excepted = key in new_exceptions
 
         # Check instance validity
-        instance_scanned = is_instance_valid(key, valid_instance_keys)
-
-        # Get new status
-        if key in new_map:
-            new_f = new_map[key]
-            new_status = FindingStatus.from_string(new_f.get("status"))
-            new_reason = new_f.get("reason", "")
-        else:
-            new_status = None
-            new_reason = old_f.get("reason", "")
-
-        new_excepted = key in new_exceptions
+        instance_scanned = not valid_lower or scanned_instance_key(key) in valid_lower
 
         # Classify transition
-        transition = classify_finding_transition(
-            old_status=old_status,
-            new_status=new_status,
-            old_has_exception=old_excepted,
-            new_has_exception=new_excepted,
-            instance_was_scanned=instance_scanned,
-        )
+        transition = TRANSITION_TABLE[
+            (
+                old_entry.status,
+                new_status,
+                key in old_exceptions,
+                new_excepted,
+                instance_scanned,
+            )
+        ]
+        change_type = transition.change_type
 
         if transition.should_log:
+            new_f = new_entry.finding if new_entry is not None else {}
             # Use new finding if available, fallback to old finding for server/instance
-            finding_data = new_map.get(key, old_f)
-            server, instance = extract_server_instance(key, finding_data)
-            entity_type = derive_entity_type(key)
+            server, instance = extract_server_instance(
+                key, new_f if new_entry is not None else old_f
+            )
 
             change = DetectedChange(
-                entity_type=entity_type,
+                entity_type=derive_entity_type(key),
                 entity_key=key,
-                change_type=transition.change_type,
-                description=_build_detailed_description(
-                    transition.change_type, key, old_f, new_map.get(key, {})
-                ),
+                change_type=change_type,
+                description=_build_detailed_description(change_type, key, old_f, new_f),
                 risk_level=(
                     RiskLevel.HIGH
-                    if transition.change_type == ChangeType.REGRESSION
+                    if change_type == ChangeType.REGRESSION
                     else RiskLevel.LOW
                 ),
                 old_value=old_f.get("status"),
-                new_value=new_map.get(key, {}).get("status"),
+                new_value=new_f.get("status"),
                 server=server,
                 instance=instance,
             )
 
             # Add to appropriate list and increment count
-            if transition.change_type == ChangeType.FIXED:
+            if change_type == ChangeType.FIXED:
                 result.fixed.append(change)
                 result.fixed_count += 1
-            elif transition.change_type == ChangeType.REGRESSION:
+            elif change_type == ChangeType.REGRESSION:
                 result.regressions.append(change)
                 result.regression_count += 1
-            elif transition.change_type == ChangeType.EXCEPTION_ADDED:
+            elif change_type == ChangeType.EXCEPTION_ADDED:
                 result.exception_changes.append(change)
                 result.exception_added_count += 1
-            elif transition.change_type == ChangeType.EXCEPTION_REMOVED:
+            elif change_type == ChangeType.EXCEPTION_REMOVED:
                 result.exception_changes.append(change)
                 result.exception_removed_count += 1
 
         # Count still failing (not logged, but tracked for stats)
-        if transition.change_type == ChangeType.STILL_FAILING:
+        elif change_type == ChangeType.STILL_FAILING:
             if not new_excepted:  # Only count if not exceptioned
                 result.still_failing_count += 1
 
     # Process new findings not in old (check for New Issues)
-    for key, new_f in new_map.items():
-        if key in processed_keys:
+    for key, new_entry in new_index.items():
+        if key in old_index:
             continue  # Already processed
 
-        new_status = FindingStatus.from_string(new_f.get("status"))
-        new_excepted = key in new_exceptions
-
-        # Classify as new item
-        transition = classify_finding_transition(
-            old_status=None,  # Didn't exist before
-            new_status=new_status,
-            old_has_exception=False,
-            new_has_exception=new_excepted,
-            instance_was_scanned=True,  # If it's in new, instance was reached
-        )
+        # Classify as new item (if it's in new, instance was reached)
+        transition = TRANSITION_TABLE[
+            (None, new_entry.status, False, key in new_exceptions, True)
+        ]
 
         if transition.should_log and transition.change_type == ChangeType.NEW_ISSUE:
+            new_f = new_entry.finding
             server, instance = extract_server_instance(key, new_f)
-            entity_type = derive_entity_type(key)
 
             change = DetectedChange(
-                entity_type=entity_type,
+                entity_type=derive_entity_type(key),
                 entity_key=key,
                 change_type=ChangeType.NEW_ISSUE,
                 description=_build_detailed_description(
@@ -496,6 +560,7 @@ def get_exception_keys(
     Note: Annotations are keyed as 'entity_type|entity_key' but findings
     only have 'entity_key'. We must try all known type prefixes.
     All comparisons are case-insensitive (normalized to lowercase).
+    Each distinct key is normalized and resolved once per call.
 
     Args:
         findings: List of findings
@@ -504,28 +569,6 @@ def get_exception_keys(
     Returns:
         Set of entity keys with valid exceptions
     """
-    from autodbaudit.domain.state_machine import is_exception_eligible
-
-    KNOWN_TYPES = [
-        "sa_account",
-        "login",
-        "server_role_member",
-        "config",
-        "service",
-        "database",
-        "db_user",
-        "db_role",
-        "permission",
-        "orphaned_user",
-        "trigger",
-        "protocol",
-        "backup",
-        "audit_settings",
-        "encryption",
-        "linked_server",
-        "instance",
-    ]
-
     # Build normalized (lowercase) annotations map for case-insensitive lookup
     normalized_annotations = {
         normalize_key_string(k): v for k, v in annotations.items()
@@ -536,24 +579,29 @@ def get_exception_keys(
         norm_key = normalize_key_string(key)
         if norm_key in normalized_annotations:
             return normalized_annotations[norm_key]
-        for etype in KNOWN_TYPES:
+        for etype in ANNOTATION_KEY_TYPES:
             prefixed = f"{etype}|{norm_key}"
             if prefixed in normalized_annotations:
                 return normalized_annotations[prefixed]
         return None
 
+    resolved: dict[str, bool] = {}
     result = set()
     for f in findings:
         key = f.get("entity_key", "")
         status = FindingStatus.from_string(f.get("status"))
 
         if status and status.is_discrepant():
-            ann = find_annotation(key)
-            if ann and is_exception_eligible(
-                status=status,
-                has_justification=bool(ann.get("justification")),
-                review_status=ann.get("review_status"),
-            ):
+            excepted = resolved.get(key)
+            if excepted is None:
+                ann = find_annotation(key)
+                excepted = bool(ann) and is_exception_eligible(
+                    status=status,
+                    has_justification=bool(ann.get("justification")),
+                    review_status=ann.get("review_status"),
+                )
+                resolved[key] = excepted
+            if excepted:
                 result.add(key)
 
     return result
@@ -0,0 +1,93 @@
+"""
+OS Data Components micro-component.
+Parser, credentials, store and facade shared by every OS data lookup.
+
+Components are built once per output directory; the store keeps its rows
+in that directory's audit_history.db and the facade uses its session pool.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from autodbaudit.domain.targets.parser import TargetParser
+from autodbaudit.infrastructure.cache.os_data_store import OsDataStore
+from autodbaudit.infrastructure.credentials.repository import CredentialRepository
+from autodbaudit.infrastructure.psremoting.facade import PSRemotingFacade, get_host_inventory
+from autodbaudit.infrastructure.remediation.results import Result, Success, Failure
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OsDataComponents:
+    """Collaborators shared by every OS data lookup in the process."""
+    parser: TargetParser
+    credentials: CredentialRepository
+    store: OsDataStore
+    output_dir: Path | None = None
+    facade: PSRemotingFacade | None = None
+
+    def get_facade(self) -> PSRemotingFacade:
+        """Shared facade, created on first remote collection."""
+        with _components_lock:
+            if self.facade is None:
+                self.facade = PSRemotingFacade(output_dir=self.output_dir)
+            return self.facade
+
+
+_components: dict[Path | None, OsDataComponents] = {}
+_components_lock = threading.RLock()
+
+
+def shared_components(output_dir: Path | str | None = None) -> OsDataComponents:
+    """
+    Process-wide OS data components for an output directory (built once).
+
+    Args:
+        output_dir: Audit output directory; None keeps cached OS data in memory only
+    """
+    key = Path(output_dir).resolve() if output_dir else None
+    with _components_lock:
+        if key not in _components:
+            _components[key] = OsDataComponents(
+                parser=TargetParser(),
+                credentials=CredentialRepository(),
+                store=OsDataStore(key / "audit_history.db" if key else None),
+                output_dir=key,
+            )
+        return _components[key]
+
+
+def collect_host(components: OsDataComponents, hostname: str) -> Result[dict, str]:
+    """
+    Pull OS data for one host through the shared facade.
+    Returns Success with {"raw": <Get-ComputerInfo JSON>} or Failure.
+    """
+    try:
+        username_result = components.credentials.get_username(hostname)
+        if isinstance(username_result, Failure):
+            return username_result
+
+        password_result = components.credentials.get_password(hostname)
+        if isinstance(password_result, Failure):
+            return password_result
+
+        # Shared per-host inventory batch
+        inventory = get_host_inventory(
+            components.get_facade(),
+            hostname,
+            {"windows_credentials": {"domain_admin": {"username": username_result.value, "password": password_result.value}}},
+        )
+        if "computer_info" in inventory.errors:
+            return Failure(inventory.errors["computer_info"] or "OS data collection failed")
+
+        return Success({"raw": json.dumps(inventory.get("computer_info"))})
+
+    except Exception as e:
+        logger.warning("PSRemote collection failed for %s: %s", hostname, e)
+        return Failure(f"PSRemote collection failed: {str(e)}")
@@ -1,6 +1,7 @@
 """
 OS Data Orchestrator micro-component.
 Coordinates OS data collection with priority fallback chain.
+Parser, credentials, facade and cache are shared process-wide.
 Ultra-granular component (<50 lines) following Railway patterns.
 """
 
@@ -8,18 +9,11 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from pathlib import Path
 
-from autodbaudit.domain.targets.parser import TargetParser
-from autodbaudit.infrastructure.cache.os_data_manager import OsDataCacheManager
-from autodbaudit.infrastructure.credentials.repository import CredentialRepository
-from autodbaudit.infrastructure.psremoting.facade import PSRemotingFacade
+from autodbaudit.application.os_data.components import collect_host, shared_components
 from autodbaudit.infrastructure.remediation.results import Result, Success, Failure
 
-if TYPE_CHECKING:
-    from autodbaudit.domain.targets.parser import ParsedTarget
-    from autodbaudit.infrastructure.cache.os_data_manager import CachedOsData
-
 logger = logging.getLogger(__name__)
 
 @dataclass(frozen=True)
@@ -29,6 +23,8 @@ class OsDataOrchestrator:
     Railway-oriented: returns Success with result or Failure.
     """
 
+    output_dir: Path | None = None  # Where the OS data cache lives (None = memory)
+
     def orchestrate_collection(
         self,
         target_id: str,
@@ -65,43 +61,18 @@ class OsDataOrchestrator:
 
     def _try_psremote_collection(self, target_id: str) -> Result[dict, str]:
         """Attempt PSRemote data collection."""
+        components = shared_components(self.output_dir)
         try:
-            # Parse target
-            parser = TargetParser()
-            parse_result = parser.parse_target_id(target_id)
-
+            parse_result = components.parser.parse_target_id(target_id)
             if isinstance(parse_result, Failure):
                 return parse_result
 
-            parsed_target = parse_result.value
-
-            # Get credentials
-            cred_repo = CredentialRepository()
-
-            username_result = cred_repo.get_username(parsed_target.hostname)
-            if isinstance(username_result, Failure):
-                return username_result
-
-            password_result = cred_repo.get_password(parsed_target.hostname)
-            if isinstance(password_result, Failure):
-                return password_result
-
-            # Invoke PSRemote collection
-            facade = PSRemotingFacade()
-            script = "Get-ComputerInfo | ConvertTo-Json -Compress"
-            invoke_result = facade.run_command(
-                parsed_target.hostname,
-                script,
-                {"windows_credentials": {"domain_admin": {"username": username_result.value, "password": password_result.value}}},
-                prefer_method=None,
-            )
-
-            if invoke_result.success:
+            hostname = parse_result.value.hostname
+            result = collect_host(components, hostname)
+            if isinstance(result, Success):
                 # Cache successful result
-                cache_manager = OsDataCacheManager()
-                cache_manager.store(target_id, {"raw": invoke_result.stdout})
-
-            return Success({"raw": invoke_result.stdout}) if invoke_result.success else Failure(invoke_result.stderr or "OS data collection failed")
+                components.store.store_many({target_id: result.value}, {target_id: hostname})
+            return result
 
         except Exception as e:
             logger.warning("PSRemote collection failed for %s: %s", target_id, e)
@@ -110,8 +81,7 @@ class OsDataOrchestrator:
     def _try_cached_collection(self, target_id: str) -> Result[dict, str]:
         """Attempt cached data retrieval."""
         try:
-            cache_manager = OsDataCacheManager()
-            cache_result = cache_manager.retrieve(target_id)
+            cache_result = shared_components(self.output_dir).store.retrieve(target_id)
 
             if isinstance(cache_result, Failure):
                 return cache_result
@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Literal
 
 from autodbaudit.application.os_data.orchestrator import OsDataOrchestrator
@@ -33,6 +34,8 @@ class OsDataPuller:
     Delegates to ultra-granular micro-components.
     """
 
+    output_dir: Path | None = None  # Audit output dir holding the OS data cache
+
     def get_os_data(
         self,
         target_id: str,
@@ -50,7 +53,7 @@ class OsDataPuller:
         Returns:
             OsDataResult with source, data, and metadata
         """
-        orchestrator = OsDataOrchestrator()
+        orchestrator = OsDataOrchestrator(output_dir=self.output_dir)
         result = orchestrator.orchestrate_collection(
             target_id=target_id,
             can_pull_os_data=can_pull_os_data,
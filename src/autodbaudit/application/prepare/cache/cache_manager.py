@@ -3,15 +3,27 @@ Cache Management Service - Ultra-granular component for connection caching.
 
 This module provides intelligent caching of connection information with
 TTL-based expiration and memory-efficient storage.
+
+Two tiers: a bounded in-process LRU and, when db_path is given, a
+persistent LRU table in audit_history.db shared by every CLI invocation.
+Entries past their TTL but within max_stale_seconds (an hour by default)
+are served immediately while a registered revalidator refreshes them on
+a daemon thread (stale-while-revalidate), so a refresh never holds up
+process exit.
 """
 
 import logging
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 
 from autodbaudit.domain.config import ServerConnectionInfo
 
+from .persistent_tier import PersistentCacheTier
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +54,14 @@ class CacheEntry:
         return max(0, self.ttl_seconds - self.get_age_seconds())
 
 
+# Called with a cache key and the stale info; returns fresh info, or None
+# if the server no longer connects the cached way
+Revalidator = Callable[[str, ServerConnectionInfo], Optional[ServerConnectionInfo]]
+
+# Background revalidations running at once
+MAX_CONCURRENT_REFRESHES = 2
+
+
 class ConnectionCacheManager:
     """
     Specialized cache manager for connection information.
@@ -49,16 +69,45 @@ class ConnectionCacheManager:
     Provides TTL-based caching with automatic cleanup and statistics.
     """
 
-    def __init__(self, default_ttl: int = 300) -> None:
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        max_entries: int = 512,
+        db_path: Optional[Path | str] = None,
+        max_stale_seconds: int = 3600,
+        persistent_max_entries: int = 2048,
+    ) -> None:
         """
         Initialize the cache manager.
 
         Args:
             default_ttl: Default TTL for cache entries in seconds
+            max_entries: In-memory LRU bound
+            db_path: SQLite file for the persistent tier (None = memory only)
+            max_stale_seconds: How long past its TTL an entry may still be
+                served while it is revalidated (needs a revalidator)
+            persistent_max_entries: LRU bound of the persistent tier
         """
         self.default_ttl = default_ttl
-        self._cache: Dict[str, CacheEntry] = {}
+        self.max_entries = max_entries
+        self.max_stale_seconds = max_stale_seconds
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._stats = CacheStats()
+        self._lock = threading.RLock()
+        self._persistent = (
+            PersistentCacheTier(db_path, persistent_max_entries) if db_path else None
+        )
+        self._revalidator: Optional[Revalidator] = None
+        self._refreshing: set[str] = set()
+        self._refresh_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REFRESHES)
+
+    def set_revalidator(self, revalidator: Optional[Revalidator]) -> None:
+        """
+        Register the callback used to refresh stale entries in the background.
+
+        Without one, expired entries are treated as misses.
+        """
+        self._revalidator = revalidator
 
     def get(self, key: str) -> Optional[ServerConnectionInfo]:
         """
@@ -70,21 +119,97 @@ class ConnectionCacheManager:
         Returns:
             Cached connection info or None if not found/expired
         """
-        entry = self._cache.get(key)
-        if entry is None:
-            self._stats.record_miss()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                entry = self._load_persistent(key)
+                if entry is None:
+                    self._stats.record_miss()
+                    return None
+            else:
+                self._cache.move_to_end(key)
+
+            if not entry.is_expired():
+                self._stats.record_hit()
+                logger.debug("Cache hit for key: %s (age: %.1fs)",
+                            key, entry.get_age_seconds())
+                return entry.data
+
+            overdue = entry.get_age_seconds() - entry.ttl_seconds
+            if overdue > self.max_stale_seconds:
+                logger.debug("Cache entry expired for key: %s", key)
+                self.delete(key)
+                self._stats.record_miss()
+                return None
+            if self._revalidator is None:
+                # Can't refresh it here; leave the persistent copy for a
+                # process that can (e.g. prepare)
+                self._cache.pop(key, None)
+                self._stats.record_miss()
+                return None
+
+            # Stale: answer now, refresh behind the caller's back
+            self._stats.record_stale_hit()
+            logger.debug("Serving stale cache entry for key: %s (%.0fs past TTL)", key, overdue)
+            self._schedule_refresh(key, entry.data)
+            return entry.data
+
+    def _load_persistent(self, key: str) -> Optional[CacheEntry]:
+        """Promote an entry from the persistent tier into memory (caller holds lock)."""
+        if self._persistent is None:
             return None
-
-        if entry.is_expired():
-            logger.debug("Cache entry expired for key: %s", key)
-            self.delete(key)
-            self._stats.record_miss()
+        loaded = self._persistent.load(key)
+        if loaded is None:
             return None
-
-        self._stats.record_hit()
-        logger.debug("Cache hit for key: %s (age: %.1fs)",
-                    key, entry.get_age_seconds())
-        return entry.data
+        data, stored_at = loaded
+        entry = CacheEntry(data=data, timestamp=stored_at, ttl_seconds=self.default_ttl)
+        self._stats.record_persistent_hit()
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Insert into the memory tier, evicting least recently used entries (caller holds lock)."""
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            evicted, _ = self._cache.popitem(last=False)
+            self._stats.record_eviction()
+            logger.debug("Evicted cache entry for key: %s", evicted)
+
+    def _schedule_refresh(self, key: str, stale: ServerConnectionInfo) -> None:
+        """Revalidate a stale entry on a daemon thread, once per key at a time."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        threading.Thread(
+            target=self._refresh,
+            args=(key, stale),
+            name=f"prepare-cache-refresh-{key}",
+            daemon=True,
+        ).start()
+
+    def _refresh(self, key: str, stale: ServerConnectionInfo) -> None:
+        revalidator = self._revalidator
+        try:
+            with self._refresh_slots:
+                fresh = revalidator(key, stale) if revalidator else None
+            if fresh is None:
+                # Server no longer connects the cached way: next get() re-prepares
+                self.delete(key)
+                with self._lock:
+                    self._stats.record_refresh_failure()
+            else:
+                self.put(key, fresh)
+                with self._lock:
+                    self._stats.record_refresh()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Background revalidation failed for %s: %s", key, exc)
+            self.delete(key)
+            with self._lock:
+                self._stats.record_refresh_failure()
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
 
     def put(
         self,
@@ -107,8 +232,14 @@ class ConnectionCacheManager:
             ttl_seconds=ttl
         )
 
-        self._cache[key] = entry
-        self._stats.record_put()
+        with self._lock:
+            self._remember(key, entry)
+            self._stats.record_put()
+        if self._persistent is not None:
+            evicted = self._persistent.store(key, data, entry.timestamp)
+            with self._lock:
+                for _ in range(evicted):
+                    self._stats.record_eviction()
         logger.debug("Cached connection info for key: %s (TTL: %ds)", key, ttl)
 
     def delete(self, key: str) -> bool:
@@ -121,18 +252,24 @@ class ConnectionCacheManager:
         Returns:
             True if entry was deleted, False if not found
         """
-        if key in self._cache:
-            del self._cache[key]
-            self._stats.record_delete()
-            logger.debug("Deleted cache entry for key: %s", key)
-            return True
+        if self._persistent is not None:
+            self._persistent.delete(key)
+        with self._lock:
+            if key in self._cache:
+                del self._cache[key]
+                self._stats.record_delete()
+                logger.debug("Deleted cache entry for key: %s", key)
+                return True
         return False
 
     def clear(self) -> None:
-        """Clear all cache entries."""
-        count = len(self._cache)
-        self._cache.clear()
-        self._stats.reset()
+        """Clear all cache entries (both tiers)."""
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            self._stats.reset()
+        if self._persistent is not None:
+            self._persistent.clear()
         logger.info("Cleared %d cache entries", count)
 
     def cleanup_expired(self) -> int:
@@ -142,14 +279,15 @@ class ConnectionCacheManager:
         Returns:
             Number of entries removed
         """
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry.is_expired()
-        ]
+        with self._lock:
+            expired_keys = [
+                key for key, entry in self._cache.items()
+                if entry.is_expired()
+            ]
 
-        for key in expired_keys:
-            del self._cache[key]
-            self._stats.record_delete()
+            for key in expired_keys:
+                del self._cache[key]
+                self._stats.record_delete()
 
         if expired_keys:
             logger.info("Cleaned up %d expired cache entries", len(expired_keys))
@@ -163,7 +301,21 @@ class ConnectionCacheManager:
         Returns:
             Cache statistics object
         """
-        return self._stats.copy()
+        with self._lock:
+            return self._stats.copy()
+
+    def get_size_info(self) -> Dict[str, Any]:
+        """Entry counts and bounds of both tiers."""
+        with self._lock:
+            memory_entries = len(self._cache)
+        persistent = self._persistent
+        return {
+            "memory_entries": memory_entries,
+            "memory_max_entries": self.max_entries,
+            "persistent_enabled": bool(persistent and persistent.available),
+            "persistent_entries": persistent.count() if persistent else 0,
+            "persistent_max_entries": persistent.max_entries if persistent else 0,
+        }
 
     def get_all_keys(self) -> list[str]:
         """Get all cache keys."""
@@ -204,12 +356,19 @@ class CacheStats:
     """
     Cache statistics tracking.
 
-    Tracks hits, misses, puts, and deletes for performance monitoring.
+    Tracks hits, misses, puts, deletes, evictions and background
+    revalidation for performance monitoring. stale_hits and
+    persistent_hits are subsets of hits.
     """
     hits: int = 0
     misses: int = 0
     puts: int = 0
     deletes: int = 0
+    evictions: int = 0
+    stale_hits: int = 0
+    persistent_hits: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
 
     def record_hit(self) -> None:
         """Record a cache hit."""
@@ -227,6 +386,27 @@ class CacheStats:
         """Record a cache delete."""
         self.deletes += 1
 
+    def record_eviction(self) -> None:
+        """Record an LRU eviction (either tier)."""
+        self.evictions += 1
+
+    def record_stale_hit(self) -> None:
+        """Record a stale entry served while being revalidated."""
+        self.hits += 1
+        self.stale_hits += 1
+
+    def record_persistent_hit(self) -> None:
+        """Record an entry found in the persistent tier."""
+        self.persistent_hits += 1
+
+    def record_refresh(self) -> None:
+        """Record a successful background revalidation."""
+        self.refreshes += 1
+
+    def record_refresh_failure(self) -> None:
+        """Record a background revalidation that dropped the entry."""
+        self.refresh_failures += 1
+
     def get_hit_rate(self) -> float:
         """Get cache hit rate (0.0 to 1.0)."""
         total = self.hits + self.misses
@@ -235,6 +415,8 @@ class CacheStats:
     def reset(self) -> None:
         """Reset all statistics."""
         self.hits = self.misses = self.puts = self.deletes = 0
+        self.evictions = self.stale_hits = self.persistent_hits = 0
+        self.refreshes = self.refresh_failures = 0
 
     def copy(self) -> 'CacheStats':
         """Create a copy of the statistics."""
@@ -242,5 +424,10 @@ class CacheStats:
             hits=self.hits,
             misses=self.misses,
             puts=self.puts,
-            deletes=self.deletes
+            deletes=self.deletes,
+            evictions=self.evictions,
+            stale_hits=self.stale_hits,
+            persistent_hits=self.persistent_hits,
+            refreshes=self.refreshes,
+            refresh_failures=self.refresh_failures,
         )
@@ -0,0 +1,151 @@
+"""
+Persistent tier for the connection cache.
+
+Stores ServerConnectionInfo snapshots in audit_history.db so that
+prepare, audit and sync runs (separate processes) share discovered
+connection methods. The table is bounded: once it holds more than
+max_entries rows, the least recently used ones are evicted.
+
+Failures here never fail a prepare - the cache degrades to memory-only.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from autodbaudit.domain.config import ServerConnectionInfo
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prepare_cache (
+    cache_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_prepare_cache_access ON prepare_cache(last_access);
+"""
+
+
+class PersistentCacheTier:
+    """SQLite-backed LRU store of connection info keyed by server."""
+
+    def __init__(self, db_path: Path | str, max_entries: int = 2048) -> None:
+        """
+        Initialize the persistent tier.
+
+        Args:
+            db_path: SQLite database file (normally audit_history.db)
+            max_entries: Row bound; least recently used rows are evicted beyond it
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._ready = False
+        self.available = True
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        if not self._ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn.executescript(_SCHEMA)
+            self._ready = True
+        return conn
+
+    def _run(self, operation, default=None):
+        """Run operation(conn) under the lock; on database errors disable the tier."""
+        if not self.available:
+            return default
+        with self._lock:
+            try:
+                conn = self._connect()
+                try:
+                    with conn:
+                        return operation(conn)
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as exc:
+                logger.warning("Persistent prepare cache disabled (%s): %s", self.db_path, exc)
+                self.available = False
+                return default
+
+    def load(self, key: str) -> Optional[Tuple[ServerConnectionInfo, float]]:
+        """
+        Load an entry and mark it recently used.
+
+        Returns:
+            (connection info, stored_at epoch seconds) or None
+        """
+        def operation(conn: sqlite3.Connection):
+            row = conn.execute(
+                "SELECT payload, stored_at FROM prepare_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE prepare_cache SET last_access = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            return row
+
+        row = self._run(operation)
+        if row is None:
+            return None
+        try:
+            return ServerConnectionInfo.model_validate_json(row[0]), float(row[1])
+        except ValueError as exc:
+            logger.debug("Dropping unreadable prepare cache entry %s: %s", key, exc)
+            self.delete(key)
+            return None
+
+    def store(self, key: str, data: ServerConnectionInfo, stored_at: float) -> int:
+        """
+        Upsert an entry and enforce the LRU bound.
+
+        Returns:
+            Number of entries evicted
+        """
+        payload = data.model_dump_json()
+
+        def operation(conn: sqlite3.Connection) -> int:
+            conn.execute(
+                """
+                INSERT INTO prepare_cache (cache_key, payload, stored_at, last_access)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    payload = excluded.payload,
+                    stored_at = excluded.stored_at,
+                    last_access = excluded.last_access
+                """,
+                (key, payload, stored_at, time.time()),
+            )
+            cursor = conn.execute(
+                """
+                DELETE FROM prepare_cache WHERE cache_key IN (
+                    SELECT cache_key FROM prepare_cache
+                    ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+            return max(cursor.rowcount, 0)
+
+        return self._run(operation, 0)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry."""
+        self._run(lambda conn: conn.execute("DELETE FROM prepare_cache WHERE cache_key = ?", (key,)))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._run(lambda conn: conn.execute("DELETE FROM prepare_cache"))
+
+    def count(self) -> int:
+        """Number of stored entries."""
+        return self._run(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM prepare_cache").fetchone()[0], 0
+        )
@@ -3,15 +3,23 @@ Connection Method Selection Service - Ultra-granular component for method select
 
 This module provides intelligent connection method selection based on
 OS type, availability, and performance characteristics.
+
+When a history provider is set, methods a server has recently connected
+with are ranked first; the OS preference order breaks ties.
 """
 
 import logging
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from autodbaudit.domain.config import ConnectionMethod, OSType
 
 logger = logging.getLogger(__name__)
 
+# Server name -> learned success rate per connection method value (0..1)
+HistoryProvider = Callable[[str], Dict[str, float]]
+
+_NEUTRAL_SCORE = 0.5
+
 
 class ConnectionMethodSelector:
     """
@@ -20,8 +28,14 @@ class ConnectionMethodSelector:
     Uses intelligent selection logic based on OS, availability, and preferences.
     """
 
-    def __init__(self) -> None:
-        """Initialize the connection method selector."""
+    def __init__(self, history: Optional[HistoryProvider] = None) -> None:
+        """
+        Initialize the connection method selector.
+
+        Args:
+            history: Optional per-server success rates (e.g. MethodRanker.method_scores)
+        """
+        self.history = history
         # Define method preferences by OS type
         self._os_preferences: dict[OSType, List[ConnectionMethod]] = {
             OSType.WINDOWS: [
@@ -47,7 +61,8 @@ class ConnectionMethodSelector:
     def select_preferred_method(
         self,
         available_methods: List[ConnectionMethod],
-        os_type: OSType
+        os_type: OSType,
+        server_name: Optional[str] = None,
     ) -> Optional[ConnectionMethod]:
         """
         Select the preferred connection method.
@@ -55,6 +70,7 @@ class ConnectionMethodSelector:
         Args:
             available_methods: List of available connection methods
             os_type: Detected operating system type
+            server_name: Server to consult recorded history for (optional)
 
         Returns:
             Preferred connection method or None if none available
@@ -63,6 +79,13 @@ class ConnectionMethodSelector:
             logger.warning("No connection methods available")
             return None
 
+        scores = self._history_scores(server_name)
+        if scores:
+            best = self.rank_methods(available_methods, os_type, server_name)[0]
+            logger.info("Selected connection method %s for %s from history",
+                      best.value, server_name)
+            return best
+
         # Get preferences for this OS type
         preferences = self._os_preferences.get(os_type, self._os_preferences[OSType.UNKNOWN])
 
@@ -100,7 +123,8 @@ class ConnectionMethodSelector:
     def rank_methods(
         self,
         methods: List[ConnectionMethod],
-        os_type: OSType
+        os_type: OSType,
+        server_name: Optional[str] = None,
     ) -> List[ConnectionMethod]:
         """
         Rank connection methods by preference for the given OS.
@@ -108,11 +132,29 @@ class ConnectionMethodSelector:
         Args:
             methods: List of methods to rank
             os_type: Target operating system
+            server_name: Server whose recorded success rates rank first (optional)
 
         Returns:
             Methods sorted by preference (best first)
         """
-        return sorted(methods, key=lambda m: self.get_method_priority(m, os_type))
+        scores = self._history_scores(server_name)
+        return sorted(
+            methods,
+            key=lambda m: (
+                -scores.get(m.value, _NEUTRAL_SCORE),
+                self.get_method_priority(m, os_type),
+            ),
+        )
+
+    def _history_scores(self, server_name: Optional[str]) -> Dict[str, float]:
+        """Learned success rates for a server; empty without history."""
+        if self.history is None or not server_name:
+            return {}
+        try:
+            return self.history(server_name)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("No method history for %s: %s", server_name, exc)
+            return {}
 
     def is_method_suitable(
         self,
@@ -136,7 +178,8 @@ class ConnectionMethodSelector:
         self,
         failed_method: ConnectionMethod,
         available_methods: List[ConnectionMethod],
-        os_type: OSType
+        os_type: OSType,
+        server_name: Optional[str] = None,
     ) -> List[ConnectionMethod]:
         """
         Get fallback methods when a preferred method fails.
@@ -145,9 +188,10 @@ class ConnectionMethodSelector:
             failed_method: Method that failed
             available_methods: All available methods
             os_type: Target operating system
+            server_name: Server to consult recorded history for (optional)
 
         Returns:
             List of fallback methods in preference order
         """
         remaining_methods = [m for m in available_methods if m != failed_method]
-        return self.rank_methods(remaining_methods, os_type)
+        return self.rank_methods(remaining_methods, os_type, server_name)
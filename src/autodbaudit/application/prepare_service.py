@@ -6,6 +6,10 @@ modern Python patterns and dependency injection.
 """
 
 import logging
+import threading
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, List, Optional
 from datetime import datetime
@@ -23,6 +27,7 @@ from autodbaudit.domain.config.prepare_server import PrepareServerResult, Server
 from ..infrastructure.config.manager import ConfigManager
 from ..infrastructure.psremoting.connection_manager import PSRemotingConnectionManager
 from ..infrastructure.psremoting.models import PSRemotingResult
+from ..infrastructure.reachability import WINRM_PORTS, probe_host, scan_endpoints
 from ..infrastructure.sqlite.store import HistoryStore
 from .prepare.cache.cache_manager import ConnectionCacheManager
 from .prepare.connection.connection_tester import ConnectionTestingService
@@ -33,6 +38,15 @@ from .prepare.status_service import PrepareStatusService
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _HostOutcome:
+    """Result of preparing one physical host, shared by all its targets."""
+
+    connection_info: Optional[ServerConnectionInfo]
+    error_message: Optional[str] = None
+    logs: List[str] = field(default_factory=list)
+
+
 class PrepareService:
     """
     Ultra-granular prepare service using dependency injection.
@@ -75,12 +89,26 @@ class PrepareService:
         self.cache_manager = cache_manager or ConnectionCacheManager()
         self.history_store = history_store  # Will be set later if None
         self.connection_manager = connection_manager or PSRemotingConnectionManager()
+        ranker = getattr(self.connection_manager, "method_ranker", None)
+        if ranker is not None and getattr(self.method_selector, "history", True) is None:
+            # Rank methods by what each server actually connected with before
+            self.method_selector.history = ranker.method_scores
         self.status_service = PrepareStatusService(
             self.cache_manager,
             self.connection_manager.repository,
             self.connection_manager
         )
 
+        # Host-level single-flight: one prepare per physical host at a time.
+        # Each prepare_targets pass keeps its own finished outcomes so every
+        # instance on a host reuses them (including failures).
+        self._host_lock = threading.Lock()
+        self._host_flights: dict[tuple, Future] = {}
+
+        # Stale cache entries are served at once and re-prepared in the background
+        self._cache_targets: dict[str, SqlTarget] = {}
+        self.cache_manager.set_revalidator(self._revalidate_cached)
+
         # Apply dynamic timeouts
         self._configure_timeouts()
 
@@ -107,16 +135,106 @@ class PrepareService:
         Returns:
             PrepareResult with success/failure status
         """
+        return self._prepare_target(target)
+
+    def _prepare_target(
+        self, target: SqlTarget, pass_flights: Optional[dict[tuple, Future]] = None
+    ) -> PrepareResult:
+        """Prepare one target; pass_flights holds the outcomes of the current pass."""
         logger.info("Preparing target: %s (%s)", target.name, target.server)
 
         # Check cache first
+        self._cache_targets.setdefault(target.server, target)
         cached_info = self.cache_manager.get(target.server)
         if cached_info is not None:
             logger.info("Using cached connection info for target: %s", target.name)
             return PrepareResult.success_result(target, cached_info)
 
-        # Fresh preparation using ultra-granular services
-        logs = [f"Starting preparation for target: {target.name}"]
+        outcome, shared = self._prepare_host(target, pass_flights)
+        logs = list(outcome.logs)
+        if shared:
+            logs.insert(0, f"Reused preparation of host {target.server} for target: {target.name}")
+
+        if outcome.connection_info is not None:
+            self._persist_server_state(target, outcome.connection_info)
+            return PrepareResult.success_result(target, outcome.connection_info, logs)
+        return PrepareResult.failure_result(target, outcome.error_message or "Preparation failed", logs)
+
+    def _revalidate_cached(
+        self, server: str, cached: ServerConnectionInfo
+    ) -> Optional[ServerConnectionInfo]:
+        """
+        Check that a stale cache entry still connects (background thread).
+
+        Uses the no-config connection test: a cache read must never change
+        WinRM settings on the target. If the server no longer connects the
+        entry is dropped and the next prepare runs in the foreground.
+        """
+        target = self._cache_targets.get(server)
+        if target is None:
+            return None
+        credentials = {
+            "os_auth": getattr(target, "os_auth", None),
+            "credentials_ref": target.credentials_ref,
+        }
+        if not self.connection_manager.test_connection(target.server, credentials):
+            return None
+        return cached.model_copy(
+            update={"is_available": True, "last_checked": self._get_timestamp()}
+        )
+
+    @staticmethod
+    def _host_key(target: SqlTarget) -> tuple:
+        """Targets with the same key share one host preparation."""
+        return (
+            probe_host(target.server).lower(),
+            getattr(target, "os_auth", None),
+            target.credentials_ref,
+        )
+
+    def _prepare_host(
+        self, target: SqlTarget, pass_flights: Optional[dict[tuple, Future]] = None
+    ) -> tuple[_HostOutcome, bool]:
+        """
+        Prepare the target's host, coalescing with any in-flight prepare of it.
+
+        Args:
+            target: Target whose host is prepared
+            pass_flights: Flights of a prepare_targets pass; finished outcomes
+                stay there for the rest of the pass. Without it only
+                concurrent callers share a prepare.
+
+        Returns:
+            (outcome, shared) - shared is True if another caller did the work
+        """
+        flights = self._host_flights if pass_flights is None else pass_flights
+        key = self._host_key(target)
+        with self._host_lock:
+            flight = flights.get(key)
+            owner = flight is None
+            if owner:
+                flight = Future()
+                flights[key] = flight
+
+        if not owner:
+            return flight.result(), True
+
+        try:
+            outcome = self._prepare_host_uncached(target)
+        except BaseException as exc:
+            with self._host_lock:
+                flights.pop(key, None)
+            flight.set_exception(exc)
+            raise
+        flight.set_result(outcome)
+        if pass_flights is None:
+            with self._host_lock:
+                flights.pop(key, None)
+        return outcome, False
+
+    def _prepare_host_uncached(self, target: SqlTarget) -> _HostOutcome:
+        """Detect OS and run the PS remoting setup for the target's host."""
+        logs = [f"Starting preparation for host: {target.server}"]
 
         try:
             # Step 1: Detect OS type
@@ -126,7 +244,7 @@ class PrepareService:
             # Step 2: Perform full PS remoting preparation/connection attempt
             ps_result: PSRemotingResult = self.connection_manager.connect_to_server(
                 target.server,
-                {"os_auth": target.os_auth, "credentials_ref": target.credentials_ref},
+                {"os_auth": getattr(target, "os_auth", None), "credentials_ref": target.credentials_ref},
                 allow_config=True,
             )
 
@@ -136,7 +254,13 @@ class PrepareService:
                     available_methods.append(self._map_method(attempt.connection_method))
             if ps_result.is_success() and ConnectionMethod.POWERSHELL_REMOTING not in available_methods:
                 available_methods.append(ConnectionMethod.POWERSHELL_REMOTING)
-            preferred_method = available_methods[0] if available_methods else None
+            preferred_method = (
+                self.method_selector.select_preferred_method(
+                    available_methods, os_type, target.server
+                )
+                if available_methods
+                else None
+            )
             successful_permutations = [
                 {
                     "auth_method": a.auth_method,
@@ -170,18 +294,17 @@ class PrepareService:
             # Cache successful results
             if ps_result.is_success():
                 self.cache_manager.put(target.server, connection_info)
-                self._persist_server_state(target, connection_info)
                 logs.append("PS remoting preparation completed successfully")
-                return PrepareResult.success_result(target, connection_info, logs)
+                return _HostOutcome(connection_info, logs=logs)
             error_msg = f"PS remoting preparation failed: {ps_result.error_message}"
             logs.append(error_msg)
-            return PrepareResult.failure_result(target, error_msg, logs)
+            return _HostOutcome(None, error_msg, logs)
 
         except Exception as e:
-            error_msg = f"Preparation failed for target {target.name}: {e}"
+            error_msg = f"Preparation failed for host {target.server}: {e}"
             logs.append(error_msg)
             logger.error("Preparation failed: %s", e)
-            return PrepareResult.failure_result(target, error_msg, logs)
+            return _HostOutcome(None, error_msg, logs)
 
     def prepare_targets(
         self,
@@ -196,41 +319,155 @@ class PrepareService:
             rerun_failed_once: Whether to rerun failed servers once to detect manual fixes
 
         Returns:
-            List of PrepareResult objects
+            List of PrepareResult objects, in the order of targets
         """
         if targets is None:
             targets = self.config_manager.get_enabled_targets()
 
+        requested = list(targets)
+        reachable, unreachable_results = self._prescan_targets(requested)
+        self._preload_credentials(reachable)
+
+        # Each host is prepared once per pass; its instances share the outcome.
+        # Attempt rows of the whole run are written in batches, not one commit each.
+        with self._attempt_log_buffer():
+            results = self._run_prepare_pass(reachable)
+
+            if rerun_failed_once:
+                failed = [i for i, res in enumerate(results) if not res.success]
+                if failed:
+                    logger.info("Retrying %d failed targets to detect manual fixes...", len(failed))
+                    retry_results = self._run_prepare_pass([reachable[i] for i in failed])
+                    # Replace old results with retry results for those targets
+                    for index, retry_result in zip(failed, retry_results):
+                        results[index] = retry_result
+
+        # Pre-scan keeps both lists in request order; merge them back
+        prepared = iter(zip(reachable, results))
+        unreachable = iter(unreachable_results)
+        next_prepared = next(prepared, None)
+        ordered: List[PrepareResult] = []
+        for target in requested:
+            if next_prepared is not None and next_prepared[0] is target:
+                ordered.append(next_prepared[1])
+                next_prepared = next(prepared, None)
+            else:
+                ordered.append(next(unreachable))
+        return ordered
+
+    def _preload_credentials(self, targets: List[SqlTarget]) -> None:
+        """Load every target's credentials in one pass (one key derivation) into the cache."""
+        refs = [t.credentials_ref for t in targets if getattr(t, "credentials_ref", None)]
+        if not refs:
+            return
+        try:
+            self.config_manager.get_credentials(refs, strict=False)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("Credential preload failed; loading per target instead: %s", exc)
+
+    def _attempt_log_buffer(self) -> AbstractContextManager:
+        """Buffer PS remoting attempt logging for a prepare run, if supported."""
+        repository = getattr(self.connection_manager, "repository", None)
+        buffered = getattr(repository, "buffered_attempts", None)
+        return buffered() if callable(buffered) else nullcontext()
+
+    def _run_prepare_pass(self, targets: List[SqlTarget]) -> List[PrepareResult]:
+        """
+        One prepare pass: every host is prepared at most once.
+
+        Returns:
+            Results in the order of targets
+        """
+        pass_flights: dict[tuple, Future] = {}
+        order = self._interleave_hosts(targets)
+        run = [targets[i] for i in order]
         if self.audit_settings.enable_parallel_processing:
-            results = self._prepare_targets_parallel(targets)
+            run_results = self._prepare_targets_parallel(run, pass_flights)
         else:
-            results = self._prepare_targets_sequential(targets)
-
-        if rerun_failed_once:
-            failed = [res.target for res in results if not res.success]  # type: ignore[attr-defined]
-            if failed:
-                logger.info("Retrying %d failed targets to detect manual fixes...", len(failed))
-                retry_results = (
-                    self._prepare_targets_parallel(failed)
-                    if self.audit_settings.enable_parallel_processing
-                    else self._prepare_targets_sequential(failed)
-                )
-                # Replace old results with retry results for those targets
-                retry_map = {res.target.name: res for res in retry_results}  # type: ignore[attr-defined]
-                results = [
-                    retry_map.get(res.target.name, res)  # type: ignore[attr-defined]
-                    for res in results
-                ]
+            run_results = self._prepare_targets_sequential(run, pass_flights)
 
-        return results
+        results: List[Optional[PrepareResult]] = [None] * len(targets)
+        for index, result in zip(order, run_results):
+            results[index] = result
+        return results  # type: ignore[return-value]
+
+    def _interleave_hosts(self, targets: List[SqlTarget]) -> List[int]:
+        """
+        Order target indices round-robin across hosts.
 
-    def _prepare_targets_sequential(self, targets: List[SqlTarget]) -> List[PrepareResult]:
+        Parallel workers then start on distinct hosts first instead of
+        several workers waiting on the same host's single-flight prepare.
+        """
+        groups: dict[tuple, List[int]] = {}
+        for index, target in enumerate(targets):
+            groups.setdefault(self._host_key(target), []).append(index)
+        if len(groups) < len(targets):
+            logger.info(
+                "Preparing %d targets on %d distinct hosts", len(targets), len(groups)
+            )
+        ordered: List[int] = []
+        queues = list(groups.values())
+        depth = max((len(q) for q in queues), default=0)
+        for position in range(depth):
+            ordered.extend(q[position] for q in queues if position < len(q))
+        return ordered
+
+    def _prescan_targets(
+        self, targets: List[SqlTarget]
+    ) -> tuple[List[SqlTarget], List[PrepareResult]]:
+        """
+        TCP-probe every target's SQL and WinRM ports in one sweep.
+
+        A host answering on none of them is down (or firewalled off entirely)
+        and fails immediately instead of walking through every prepare layer.
+
+        Returns:
+            (targets to prepare, failure results for unreachable targets)
+        """
+        if not self.audit_settings.enable_reachability_prescan or not targets:
+            return targets, []
+
+        host_ports: dict[str, list[int]] = {}
+        for target in targets:
+            ports = host_ports.setdefault(probe_host(target.server), list(WINRM_PORTS))
+            if target.port and target.port not in ports:
+                ports.append(target.port)
+
+        reachable = scan_endpoints(
+            [(host, port) for host, ports in host_ports.items() for port in ports],
+            timeout=self.audit_settings.prescan_timeout_ms / 1000,
+        )
+        live_hosts = {host for (host, _), is_open in reachable.items() if is_open}
+
+        to_prepare: List[SqlTarget] = []
+        failures: List[PrepareResult] = []
+        for target in targets:
+            host = probe_host(target.server)
+            if host in live_hosts:
+                to_prepare.append(target)
+                continue
+            ports = ", ".join(str(p) for p in host_ports[host])
+            error_msg = f"Host unreachable: no TCP response on port(s) {ports}"
+            logger.warning("Skipping %s (%s): %s", target.name, target.server, error_msg)
+            failures.append(PrepareResult.failure_result(target, error_msg, [error_msg]))
+
+        if failures:
+            logger.info(
+                "Pre-scan: %d/%d targets reachable", len(to_prepare), len(targets)
+            )
+        return to_prepare, failures
+
+    def _prepare_targets_sequential(
+        self,
+        targets: List[SqlTarget],
+        pass_flights: Optional[dict[tuple, Future]] = None,
+    ) -> List[PrepareResult]:
         """Prepare targets sequentially."""
         logger.info("Preparing %d targets sequentially with ultra-granular services", len(targets))
         results = []
 
         for target in targets:
-            result = self.prepare_target(target)
+            result = self._prepare_target(target, pass_flights)
             results.append(result)
 
         successful = sum(1 for r in results if r.success)
@@ -238,44 +475,48 @@ class PrepareService:
 
         return results
 
-    def _prepare_targets_parallel(self, targets: List[SqlTarget]) -> List[PrepareResult]:
+    def _prepare_targets_parallel(
+        self,
+        targets: List[SqlTarget],
+        pass_flights: Optional[dict[tuple, Future]] = None,
+    ) -> List[PrepareResult]:
         """
         Prepare targets in parallel for better performance.
 
         Args:
             targets: List of targets to prepare
+            pass_flights: Host outcomes shared within the current pass
 
         Returns:
-            List of prepare results
+            List of prepare results, in the order of targets
         """
         import concurrent.futures
 
-        max_workers = min(self.audit_settings.max_parallel_targets, len(targets))
+        max_workers = max(1, min(self.audit_settings.max_parallel_targets, len(targets)))
 
         logger.info("Preparing %d targets with %d parallel workers", len(targets), max_workers)
 
-        results = []
+        results: List[Optional[PrepareResult]] = [None] * len(targets)
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all prepare tasks
-            future_to_target = {
-                executor.submit(self.prepare_target, target): target
-                for target in targets
+            future_to_index = {
+                executor.submit(self._prepare_target, target, pass_flights): index
+                for index, target in enumerate(targets)
             }
 
             # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_target):
-                target = future_to_target[future]
+            for future in concurrent.futures.as_completed(future_to_index):
+                index = future_to_index[future]
+                target = targets[index]
                 try:
-                    result = future.result()
-                    results.append(result)
+                    results[index] = future.result()
                     logger.debug("Completed preparation for target: %s", target.name)
                 except Exception as e:
                     logger.error("Preparation failed for target %s: %s", target.name, e)
                     # Create failure result
-                    failure_result = PrepareResult.failure_result(
+                    results[index] = PrepareResult.failure_result(
                         target, f"Parallel preparation failed: {e}", [f"Error: {e}"]
                     )
-                    results.append(failure_result)
 
         successful = sum(1 for r in results if r.success)
         logger.info(
@@ -284,7 +525,7 @@ class PrepareService:
             len(results)
         )
 
-        return results
+        return results  # type: ignore[return-value]
 
     def clear_cache(self) -> None:
         """Clear all caches in ultra-granular services."""
@@ -308,7 +549,13 @@ class PrepareService:
                 "misses": cache_stats.misses,
                 "puts": cache_stats.puts,
                 "deletes": cache_stats.deletes,
+                "evictions": cache_stats.evictions,
+                "stale_hits": cache_stats.stale_hits,
+                "persistent_hits": cache_stats.persistent_hits,
+                "refreshes": cache_stats.refreshes,
+                "refresh_failures": cache_stats.refresh_failures,
                 "hit_rate": cache_stats.get_hit_rate(),
+                **self.cache_manager.get_size_info(),
             },
             "os_detection_cache_size": len(self.os_detector._detection_cache),
             "connection_test_cache_size": len(self.connection_tester._test_cache),
@@ -7,22 +7,40 @@ Supports:
 - Table variable approach for batch operations
 - Exception-aware commenting with visual indicators
 - Lockout prevention (never touch connecting user)
+
+Environments are cached per template directory for the whole process, and
+compiled templates are persisted with a FileSystemBytecodeCache in the
+output folder's jinja_cache, so neither repeated generators nor later runs
+(or RemediationService's worker processes) recompile them.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
 
 from autodbaudit.utils.resources import get_base_path
 
 logger = logging.getLogger(__name__)
 
+# Compiled template bytecode lives in <output_dir>/jinja_cache
+BYTECODE_CACHE_DIRNAME = "jinja_cache"
+
+_ENV_CACHE: dict[tuple[str, str | None], Environment] = {}
+_ENV_LOCK = threading.Lock()
+
 
 def _get_template_dir() -> Path:
     """Get template directory with PyInstaller support."""
@@ -35,6 +53,83 @@ def _get_template_dir() -> Path:
     return get_base_path() / "assets" / "remediation_templates"
 
 
+def _comment_sql(text: str) -> str:
+    """Comment out T-SQL code."""
+    lines = text.split("\n")
+    return "\n".join(f"-- {line}" if line.strip() else line for line in lines)
+
+
+def _comment_ps(text: str) -> str:
+    """Comment out PowerShell code."""
+    lines = text.split("\n")
+    return "\n".join(f"# {line}" if line.strip() else line for line in lines)
+
+
+def bytecode_cache_dir_for(output_dir: Path | str | None) -> Path | None:
+    """Bytecode cache folder for an output directory (None: no disk cache)."""
+    return Path(output_dir) / BYTECODE_CACHE_DIRNAME if output_dir else None
+
+
+def get_environment(
+    template_dir: Path | None = None,
+    bytecode_cache_dir: Path | None = None,
+) -> Environment:
+    """
+    Get the shared Jinja2 environment for a template directory.
+
+    Templates are bundled (never edited at runtime), so auto_reload is
+    off and each template is compiled at most once per process; the
+    bytecode cache also skips compilation on later runs.
+
+    Args:
+        template_dir: Template root (default: packaged templates)
+        bytecode_cache_dir: Where to persist compiled templates
+            (None disables the on-disk cache)
+    """
+    template_dir = template_dir or _get_template_dir()
+    key = (
+        str(template_dir.resolve()),
+        str(bytecode_cache_dir.resolve()) if bytecode_cache_dir else None,
+    )
+
+    with _ENV_LOCK:
+        env = _ENV_CACHE.get(key)
+        if env is not None:
+            return env
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            try:
+                bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+            except OSError as e:
+                logger.warning("Template bytecode cache disabled: %s", e)
+
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(default=False),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True,
+            auto_reload=False,
+            bytecode_cache=bytecode_cache,
+        )
+
+        # Add custom filters
+        env.filters["comment_sql"] = _comment_sql
+        env.filters["comment_ps"] = _comment_ps
+        env.filters["exception_wrap"] = JinjaScriptGenerator._exception_wrap
+
+        _ENV_CACHE[key] = env
+        return env
+
+
+def clear_environment_cache() -> None:
+    """Drop cached environments (e.g. after templates change in development)."""
+    with _ENV_LOCK:
+        _ENV_CACHE.clear()
+
+
 @dataclass
 class RemediationItem:
     """Single remediation item for template rendering."""
@@ -88,39 +183,52 @@ class JinjaScriptGenerator:
     Implements table variable approach for batch operations.
     """
 
-    def __init__(self, template_dir: Path | None = None) -> None:
-        """Initialize with template directory."""
+    TSQL_TEMPLATE = "tsql/main_script.sql.j2"
+    PS_TEMPLATE = "powershell/os_fixes.ps1.j2"
+
+    def __init__(
+        self,
+        template_dir: Path | None = None,
+        output_dir: Path | str | None = None,
+    ) -> None:
+        """
+        Initialize with template directory.
+
+        Args:
+            template_dir: Template root (default: packaged templates)
+            output_dir: Output folder; compiled templates are cached in its
+                jinja_cache (None keeps them in memory only)
+        """
         self.template_dir = template_dir or _get_template_dir()
 
         # Ensure template directories exist
         (self.template_dir / "tsql").mkdir(parents=True, exist_ok=True)
         (self.template_dir / "powershell").mkdir(parents=True, exist_ok=True)
 
-        # Initialize Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(default=False),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # Shared, process-wide environment (compiled templates are cached)
+        self.env = get_environment(self.template_dir, bytecode_cache_dir_for(output_dir))
+        self._templates: dict[str, Template] = {}
 
-        # Add custom filters
-        self.env.filters["comment_sql"] = self._comment_sql
-        self.env.filters["comment_ps"] = self._comment_ps
-        self.env.filters["exception_wrap"] = self._exception_wrap
+    def _template(self, name: str) -> Template:
+        """Compiled template, looked up once per generator."""
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.env.get_template(name)
+        return template
 
-    def _comment_sql(self, text: str) -> str:
+    @staticmethod
+    def _comment_sql(text: str) -> str:
         """Comment out T-SQL code."""
-        lines = text.split("\n")
-        return "\n".join(f"-- {line}" if line.strip() else line for line in lines)
+        return _comment_sql(text)
 
-    def _comment_ps(self, text: str) -> str:
+    @staticmethod
+    def _comment_ps(text: str) -> str:
         """Comment out PowerShell code."""
-        lines = text.split("\n")
-        return "\n".join(f"# {line}" if line.strip() else line for line in lines)
+        return _comment_ps(text)
 
+    @staticmethod
     def _exception_wrap(
-        self, item: RemediationItem, aggressiveness: int, for_ps: bool = False
+        item: RemediationItem, aggressiveness: int, for_ps: bool = False
     ) -> tuple[str, str]:
         """
         Get prefix/suffix for exception-aware wrapping.
@@ -162,7 +270,7 @@ class JinjaScriptGenerator:
 
         Uses table variable approach for batch operations.
         """
-        template = self.env.get_template("tsql/main_script.sql.j2")
+        template = self._template(self.TSQL_TEMPLATE)
 
         content = template.render(
             ctx=context,
@@ -181,7 +289,7 @@ class JinjaScriptGenerator:
         output_path: Path,
     ) -> Path:
         """Generate PowerShell remediation script for OS-level fixes."""
-        template = self.env.get_template("powershell/os_fixes.ps1.j2")
+        template = self._template(self.PS_TEMPLATE)
 
         content = template.render(
             ctx=context,
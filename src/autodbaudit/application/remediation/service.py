@@ -1,11 +1,17 @@
 """
 Modular Remediation Service.
 Orchestrates generation of scripts using specialized handlers.
+
+Instances are independent (each gets its own handlers, context and output
+files), so per-instance generation runs in a process pool.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import TYPE_CHECKING
 from pathlib import Path
 from datetime import datetime
@@ -22,8 +28,14 @@ from autodbaudit.application.remediation.handlers.database import DatabaseHandle
 from autodbaudit.application.remediation.handlers.infrastructure import (
     InfrastructureHandler,
 )
+from autodbaudit.application.remediation.jinja_generator import (
+    bytecode_cache_dir_for,
+    get_environment,
+)
 
 if TYPE_CHECKING:
+    from jinja2 import Environment
+
     from autodbaudit.application.remediation.handlers.base import RemediationAction
 
 logger = logging.getLogger(__name__)
@@ -51,9 +63,17 @@ class RemediationService:
         audit_run_id: int | None = None,
         sql_targets: list[dict] | None = None,
         aggressiveness: int = 1,
+        max_workers: int | None = None,
     ) -> list[Path]:
         """
         Generate remediation scripts for all findings.
+
+        Args:
+            audit_run_id: Run to remediate (latest if None)
+            sql_targets: Target config dicts, used for port/login lookup
+            aggressiveness: Fix intensity (1-3)
+            max_workers: Processes rendering instances in parallel
+                (None = CPU count, 1 = in-process)
         """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
@@ -69,6 +89,28 @@ class RemediationService:
                 return []
             audit_run_id = row["id"]
 
+        # Pivot annotations to one row per entity_key, so the findings fetch
+        # below is a single linear join: no correlated subquery per finding
+        # and no row fan-out from joining every annotation field
+        conn.execute("DROP TABLE IF EXISTS temp.annotation_pivot")
+        conn.execute(
+            """
+            CREATE TEMP TABLE annotation_pivot AS
+            SELECT
+                entity_key,
+                MAX(CASE WHEN status_override = 'exception' THEN 1 ELSE 0 END)
+                    AS is_exceptionalized,
+                MAX(CASE WHEN field_name = 'justification' THEN field_value END)
+                    AS justification
+            FROM annotations
+            GROUP BY entity_key
+        """
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX temp.idx_annotation_pivot_key "
+            "ON annotation_pivot(entity_key)"
+        )
+
         # Get findings with exception status from annotations
         findings = conn.execute(
             """SELECT 
@@ -83,24 +125,14 @@ class RemediationService:
                 i.id as instance_db_id, 
                 s.hostname as server_name,
                 si.os_platform as host_platform,
-                -- Check if exceptionalized (has annotation with status_override='exception')
-                CASE 
-                    WHEN a.status_override = 'exception' THEN 1 
-                    ELSE 0 
-                END as is_exceptionalized,
-                -- Get justification from annotation field_value
-                COALESCE(
-                    (SELECT field_value FROM annotations 
-                     WHERE entity_key = f.entity_key 
-                     AND field_name = 'justification'
-                     LIMIT 1),
-                    ''
-                ) as justification
+                -- Exceptionalized: any annotation with status_override='exception'
+                COALESCE(a.is_exceptionalized, 0) as is_exceptionalized,
+                COALESCE(a.justification, '') as justification
             FROM findings f
             JOIN instances i ON f.instance_id = i.id
             JOIN servers s ON i.server_id = s.id
             LEFT JOIN server_info si ON si.instance_id = i.id AND si.audit_run_id = f.audit_run_id
-            LEFT JOIN annotations a ON a.entity_key = f.entity_key
+            LEFT JOIN annotation_pivot a ON a.entity_key = f.entity_key
             WHERE f.audit_run_id = ?
             AND f.status IN ('FAIL', 'WARN')
             ORDER BY s.hostname, i.instance_name, f.finding_type
@@ -151,37 +183,20 @@ class RemediationService:
             return []
 
         # Map (server, instance) -> port
-        # Because instances table doesn't store port, we must look it up from config
-        instance_port_map = {}
-        conn_user_map = {}
-
-        if sql_targets:
-            for t in sql_targets:
-                srv = t.get("server", "").lower()
-                inst = (
-                    t.get("instance") or "DEFAULT"
-                ).upper()  # Normalize None to DEFAULT
-                # Actually, instance name in DB might be "MSSQLSERVER" for default
-                # But assume sql_targets matches what we found or close enough
-                # If target has "instance" field use it, else try to infer
-
-                port = t.get("port") or 1433
-                conn_user = t.get("username", "")
-
-                # We need to match what's in the DB.
-                # DB has 'instance_name' which comes from actual connection (e.g. MSSQLSERVER)
-                # target config has 'instance' (optional) or we rely on port.
-
-                # Let's map (srv, inst) -> port if feasible, else default 1433.
-                # For remediation generation, best effort is okay.
-
-                # Using just server+port from config for user map
-                # Store (username, original_target_address)
-                conn_user_map[(srv, port)] = (conn_user, t.get("server", ""))
-
-                # Also store for port lookup if we can match server
-                # But we don't know the DB instance name easily for the key without more logic
-                # So let's iterate findings and best-match.
+        # Because instances table doesn't store port, we must look it up from config.
+        # Built once; the first matching target wins, as in sql_targets order.
+        instance_port_map: dict[tuple[str, str], int] = {}
+        # (server, port) -> (username, original_target_address)
+        conn_user_map: dict[tuple[str, int], tuple[str, str]] = {}
+
+        for t in sql_targets or []:
+            srv = t.get("server", "").lower()
+            port = t.get("port") or 1433
+            conn_user_map[(srv, port)] = (t.get("username", ""), t.get("server", ""))
+
+            # Target without instance = default instance (MSSQLSERVER in the DB)
+            inst = (t.get("instance") or "MSSQLSERVER").lower()
+            instance_port_map.setdefault((srv, inst), port)
 
         # Group by instance
         by_instance: dict[tuple, list] = {}
@@ -190,28 +205,16 @@ class RemediationService:
             server_name = f["server_name"]
             instance_name = f["instance_name"]
 
-            # Try to find port from targets
-            port = 1433
-            if sql_targets:
-                for t in sql_targets:
-                    # Simple case-insensitive hostname match
-                    if t.get("server", "").lower() == server_name.lower():
-                        # If finding instance is MSSQLSERVER and target instance is None/Default -> match
-                        # If finding instance matches target instance -> match
-                        tgt_inst = t.get("instance")
-                        if tgt_inst and tgt_inst.lower() == instance_name.lower():
-                            port = t.get("port") or 1433
-                            break
-                        if not tgt_inst and instance_name == "MSSQLSERVER":
-                            port = t.get("port") or 1433
-                            break
+            port = instance_port_map.get(
+                (server_name.lower(), instance_name.lower()), 1433
+            )
 
             key = (server_name, instance_name, port, inst_id)
             if key not in by_instance:
                 by_instance[key] = []
             by_instance[key].append(dict(f))
 
-        generated = []
+        jobs = []
         for (server, instance, port, inst_id), instance_findings in by_instance.items():
             # Lookup connection info
             # conn_user_map stores (username, target_server_address)
@@ -224,22 +227,54 @@ class RemediationService:
             if instance_findings:
                 host_platform = instance_findings[0].get("host_platform") or "Windows"
 
-            paths = self._generate_instance_scripts(
-                server,
-                instance,
-                inst_id,
-                port,
-                instance_findings,
-                conn_user,
-                aggressiveness,
-                target_address=target_address,
-                host_platform=host_platform,
+            jobs.append(
+                (
+                    server,
+                    instance,
+                    inst_id,
+                    port,
+                    instance_findings,
+                    conn_user,
+                    aggressiveness,
+                    target_address,
+                    host_platform,
+                )
             )
-            generated.extend(paths)
+
+        generated = self._run_instance_jobs(jobs, max_workers)
 
         logger.info("Generated %d script files", len(generated))
         return generated
 
+    def _run_instance_jobs(
+        self, jobs: list[tuple], max_workers: int | None
+    ) -> list[Path]:
+        """
+        Render per-instance scripts, in a process pool when worthwhile.
+
+        Every job writes its own files, so results only need collecting.
+        Output order follows the job order either way.
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(self._generate_instance_scripts, *job)
+                        for job in jobs
+                    ]
+                    return [path for future in futures for path in future.result()]
+            except (BrokenProcessPool, OSError) as e:
+                # e.g. restricted environments without process spawning
+                logger.warning(
+                    "Parallel script generation unavailable (%s); running serially", e
+                )
+
+        generated: list[Path] = []
+        for job in jobs:
+            generated.extend(self._generate_instance_scripts(*job))
+        return generated
+
     def _generate_instance_scripts(
         self,
         server: str,
@@ -361,12 +396,16 @@ class RemediationService:
             )
 
         # OS Script (PowerShell) - Template
-        os_script = infra_handler.generate_os_script()
+        os_script = infra_handler.generate_os_script(self._template_env())
         os_path = self.output_dir / f"{safe_name}_OS_AUDIT.ps1"
         os_path.write_text(os_script, encoding="utf-8")
 
         return [main_path, rollback_path, os_path]
 
+    def _template_env(self) -> Environment:
+        """Shared Jinja environment, caching compiled templates in the output dir."""
+        return get_environment(bytecode_cache_dir=bytecode_cache_dir_for(self.db_path.parent))
+
     def _build_main_script(
         self,
         server: str,
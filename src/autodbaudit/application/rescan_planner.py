@@ -0,0 +1,179 @@
+"""
+Rescan Planner - decides which instances a targeted sync must rescan.
+
+A full sync reconnects to every target in sql_targets.json. A targeted
+sync only reconnects to instances with pending work:
+
+1. Open FAIL/WARN findings in the previous run (not documented exceptions)
+2. Remediation scripts executed since the previous run
+3. Explicit --only filters from the command line
+4. Targets that have no findings to carry (new or previously unreachable)
+
+Every other instance is carried forward from the previous run.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from autodbaudit.domain.change_types import FindingStatus
+from autodbaudit.application.stats_service import ExceptionIndex
+
+if TYPE_CHECKING:
+    from autodbaudit.infrastructure.config_loader import SqlTarget
+    from autodbaudit.infrastructure.sqlite import HistoryStore
+
+logger = logging.getLogger(__name__)
+
+
+def target_key(target: "SqlTarget") -> tuple[str, int, str]:
+    """Stable identity of a target across separately loaded configs."""
+    return (
+        target.server.lower(),
+        target.port or 1433,
+        (target.instance or "").lower(),
+    )
+
+
+def target_names(target: "SqlTarget") -> set[str]:
+    """All names a user may pass to --only to select this target."""
+    names = {
+        target.server,
+        target.display_name,
+        f"{target.server}\\{target.unique_instance}" if target.unique_instance else "",
+        f"{target.server}:{target.port or 1433}",
+        target.id or "",
+        target.name or "",
+    }
+    return {n.lower() for n in names if n}
+
+
+def _matches_endpoint(
+    target: "SqlTarget", hostname: str, port: int | None, instance_name: str | None
+) -> bool:
+    """Check whether a stored instance/script header refers to this target."""
+    if target.server.lower() != (hostname or "").lower():
+        return False
+    if port and (target.port or 1433) != port:
+        return False
+    if target.instance and instance_name:
+        return target.instance.lower() == instance_name.lower()
+    return True
+
+
+@dataclass
+class RescanPlan:
+    """Outcome of targeted sync planning."""
+
+    rescan: list["SqlTarget"] = field(default_factory=list)
+    carried: list["SqlTarget"] = field(default_factory=list)
+    carried_instance_ids: list[int] = field(default_factory=list)
+    reasons: dict[str, list[str]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._rescan_keys = {target_key(t) for t in self.rescan}
+
+    def includes(self, target: "SqlTarget") -> bool:
+        """Target filter for AuditService.run_audit."""
+        return target_key(target) in self._rescan_keys
+
+    @property
+    def carried_report_keys(self) -> set[tuple[str, str]]:
+        """(server, instance) pairs as written to the Excel report, lowercased."""
+        return {(t.server.lower(), t.unique_instance.lower()) for t in self.carried}
+
+
+def plan_targeted_rescan(
+    store: "HistoryStore",
+    previous_run_id: int,
+    targets: list["SqlTarget"],
+    annotations: dict[str, dict] | None = None,
+    only: list[str] | None = None,
+) -> RescanPlan:
+    """
+    Split enabled targets into those to rescan and those to carry forward.
+
+    Args:
+        store: History store holding the previous run
+        previous_run_id: Run whose findings are carried forward
+        targets: Targets loaded from sql_targets.json
+        annotations: Current annotations (exceptions do not count as pending)
+        only: Explicit target names that must be rescanned
+
+    Returns:
+        RescanPlan with rescan/carried targets and per-target reasons
+    """
+    endpoints = store.get_instance_endpoints_for_run(previous_run_id)
+
+    # Instances with open, undocumented discrepancies
+    index = ExceptionIndex(annotations or {})
+    pending_ids: set[int] = set()
+    for finding in store.get_findings(previous_run_id):
+        status = FindingStatus.from_string(finding.get("status"))
+        if status is None or not status.is_discrepant():
+            continue
+        if finding.get("instance_id") in pending_ids:
+            continue
+        if not index.is_exceptioned(finding.get("entity_key", "")):
+            pending_ids.add(finding["instance_id"])
+
+    # Scripts executed since the previous run started
+    previous_run = store.get_audit_run(previous_run_id)
+    executions = (
+        store.get_script_executions_since(previous_run.started_at)
+        if previous_run and previous_run.started_at
+        else []
+    )
+
+    wanted = {n.lower() for n in only or []}
+    plan_rescan: list[SqlTarget] = []
+    plan_carried: list[SqlTarget] = []
+    carried_ids: list[int] = []
+    reasons: dict[str, list[str]] = {}
+
+    for target in targets:
+        if not target.enabled:
+            continue
+
+        matched = [
+            ep
+            for ep in endpoints
+            if _matches_endpoint(target, ep["hostname"], ep["port"], ep["instance_name"])
+        ]
+        why: list[str] = []
+        if wanted & target_names(target):
+            why.append("requested")
+        if not matched:
+            why.append("not in previous run")
+        if any(ep["instance_id"] in pending_ids for ep in matched):
+            why.append("open findings")
+        if any(
+            _matches_endpoint(target, ex["server_name"], ex["port"], ex["instance_name"])
+            for ex in executions
+        ):
+            why.append("remediation executed")
+
+        if why:
+            plan_rescan.append(target)
+            reasons[target.display_name] = why
+        else:
+            plan_carried.append(target)
+            carried_ids.extend(ep["instance_id"] for ep in matched)
+
+    unknown = wanted - set().union(*(target_names(t) for t in targets)) if targets else wanted
+    for name in sorted(unknown):
+        logger.warning("--only %s does not match any target in the config", name)
+
+    logger.info(
+        "Targeted sync: rescanning %d targets, carrying forward %d",
+        len(plan_rescan),
+        len(plan_carried),
+    )
+    return RescanPlan(
+        rescan=plan_rescan,
+        carried=plan_carried,
+        carried_instance_ids=carried_ids,
+        reasons=reasons,
+    )
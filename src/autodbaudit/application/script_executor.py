@@ -6,23 +6,44 @@ Safety Features:
 2. Credential protection - never modify the login used to connect
 3. Extensive logging - every batch logged with result
 4. Dry-run mode - validate without executing
+5. Optional concurrent apply across targets, capped per host and globally;
+   batches within a script always run in order
+6. Server-side validation - compile every batch under SET NOEXEC ON
 
 Usage:
     executor = ScriptExecutor(targets_file="sql_targets.json")
     executor.execute_folder("output/remediation_scripts", dry_run=True)
+    executor.execute_folder("output/remediation_scripts", max_workers=8, per_host=1)
+    executor.validate_folder("output/remediation_scripts")
     executor.execute_script("localhost_INTHEEND.sql")
 """
 
 from __future__ import annotations
 
+import io
 import logging
 import re
+import sys
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 from dataclasses import dataclass, field
-from autodbaudit.infrastructure.config_loader import ConfigLoader, SqlTarget
+from typing import Callable, Iterable, Iterator, TextIO, TypeVar
+from autodbaudit.infrastructure.config_loader import ConfigLoader, SqlTarget, TargetIndex
+from autodbaudit.infrastructure.sql.batch_splitter import SqlBatch, iter_batches
+from autodbaudit.infrastructure.remediation.dry_run_validator import DryRunValidator
+from autodbaudit.infrastructure.remediation.parallel_executor import ParallelExecutor
+from autodbaudit.infrastructure.remediation.results import Failure
 
 logger = logging.getLogger(__name__)
 
+R = TypeVar("R")
+
+# Script headers (Server/TargetServer/Port/Instance) live in the top comment
+HEADER_LINES = 100
+
 
 @dataclass
 class BatchResult:
@@ -33,6 +54,8 @@ class BatchResult:
     preview: str
     error: str | None = None
     rows_affected: int = 0
+    start_line: int = 0  # Source line range of the batch in the script
+    end_line: int = 0
 
 
 @dataclass
@@ -48,6 +71,7 @@ class ScriptResult:
     skipped: int = 0
     batch_results: list[BatchResult] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    cancelled: bool = False  # Not started because of fail-fast
 
     @property
     def success(self) -> bool:
@@ -79,20 +103,20 @@ class ScriptExecutor:
             else Path("config")
         )
         self.config_loader = ConfigLoader(str(config_dir))
-        self._targets_cache: list[SqlTarget] | None = None
+        self._target_index: TargetIndex | None = None
 
-    def _load_targets(self) -> list[SqlTarget]:
-        """Load SQL targets configuration."""
-        if self._targets_cache is None:
+    def _load_targets(self) -> TargetIndex:
+        """Load SQL targets configuration (indexed for lookups)."""
+        if self._target_index is None:
             # Pass filename only, ConfigLoader handles directory
             fname = self.targets_file.name
             try:
-                self._targets_cache = self.config_loader.load_sql_targets(fname)
+                self._target_index = self.config_loader.load_target_index(fname)
             except Exception as e:
                 logger.error("Failed to load targets: %s", e)
-                # Ensure we have a list to avoid NoneType or errors later
-                self._targets_cache = []
-        return self._targets_cache
+                # Ensure we have an (empty) index to avoid NoneType or errors later
+                self._target_index = TargetIndex(())
+        return self._target_index
 
     def _find_target(
         self, server: str, port: int | None = None, instance: str | None = None
@@ -103,72 +127,10 @@ class ScriptExecutor:
         2. Server + Port
         3. Server + Instance
         4. Server + Default Port (1433/None)
-        5. Server Only (First available)
+        5. Short name of an FQDN server
+        6. Server Only (First available)
         """
-        targets = self._load_targets()
-        server_norm = server.lower()
-        instance_norm = instance.lower() if instance else None
-
-        # Handle localhost aliases
-        aliases = {server_norm}
-        if server_norm in ("localhost", "127.0.0.1", "."):
-            aliases = {"localhost", "127.0.0.1", "."}
-
-        # 1. Exact Match: Server + Port + Instance (if all provided)
-        if port and instance_norm is not None:
-            for t in targets:
-                h = t.server.lower()
-                p = t.port or 1433
-                i = (t.instance or "").lower()
-                if h in aliases and p == port and i == instance_norm:
-                    return t
-
-        # 2. Server + Port
-        if port:
-            for t in targets:
-                h = t.server.lower()
-                p = t.port or 1433
-                if h in aliases and p == port:
-                    return t
-
-        # 3. Server + Instance
-        if instance_norm is not None:
-            for t in targets:
-                h = t.server.lower()
-                i = (t.instance or "").lower()
-                if h in aliases and i == instance_norm:
-                    return t
-
-        # 4. Server + Default Port (Implicit 1433)
-        # If no port specified, we prefer the target on 1433 over others
-        if not port:
-            for t in targets:
-                h = t.server.lower()
-                p = t.port or 1433
-                if h in aliases and p == 1433:
-                    return t
-
-        # 5. Fallback: Server partial match (FQDN) + Port/Instance logic
-        if "." in server_norm:
-            short_name = server_norm.split(".")[0]
-            for t in targets:
-                h = t.server.lower()
-                if h == short_name:
-                    # Apply similar logic checks if needed, or just return first FQDN match
-                    # For safety, let's repeat the checks or just return it?
-                    # Let's keep it simple: return if port matches or is default
-                    p = t.port or 1433
-                    # Same logic for port checking could apply here
-                    if not port or (t.port or 1433) == port:
-                        return t
-
-        # 6. Fallback: First Server match (Lowest Priority)
-        for t in targets:
-            h = t.server.lower()
-            if h in aliases:
-                return t
-
-        return None
+        return self._load_targets().find(server, port, instance)
 
     def _get_connection_for_script(
         self, script_path: Path
@@ -178,7 +140,8 @@ class ScriptExecutor:
 
         Returns: (server, instance, connection_login, port)
         """
-        content = script_path.read_text(encoding="utf-8")
+        with script_path.open(encoding="utf-8") as handle:
+            content = "".join(islice(handle, HEADER_LINES))
 
         # Parse server/instance/port from script header
         server_match = re.search(r"Server:\s*(.+)", content)
@@ -243,28 +206,30 @@ class ScriptExecutor:
 
         return server, cleaned_instance, connection_login, port
 
-    def _parse_batches(self, content: str) -> list[str]:
-        """Split script content into GO-separated batches."""
-        # Split on GO that's on its own line
-        batches = re.split(r"\n\s*GO\s*\n", content, flags=re.IGNORECASE)
+    def _iter_batches(self, script_path: Path) -> Iterator[SqlBatch]:
+        """Stream GO-separated batches from a script file."""
+        with script_path.open(encoding="utf-8") as handle:
+            yield from iter_batches(handle)
 
-        # Filter out empty batches and comment-only batches
-        valid_batches = []
-        for batch in batches:
-            # Remove comments and check if there's actual SQL
-            cleaned = re.sub(r"--.*$", "", batch, flags=re.MULTILINE)
-            cleaned = re.sub(r"/\*.*?\*/", "", cleaned, flags=re.DOTALL)
-            if cleaned.strip():
-                valid_batches.append(batch.strip())
+    def _count_batches(self, script_path: Path) -> int:
+        """Number of batches in a script, without holding it in memory."""
+        return sum(1 for _ in self._iter_batches(script_path))
 
-        return valid_batches
+    @staticmethod
+    def _strip_comments(batch: str) -> str:
+        """Remove -- and /* */ comments for pattern checks."""
+        cleaned = re.sub(r"--.*$", "", batch, flags=re.MULTILINE)
+        return re.sub(r"/\*.*?\*/", "", cleaned, flags=re.DOTALL)
 
     def _check_credential_safety(
-        self, batches: list[str], connection_login: str | None
+        self, batches: Iterable[str], connection_login: str | None
     ) -> tuple[list[str], list[int]]:
         """
         Check if any batch would modify the connection login.
 
+        Batches are consumed in a single pass, so a streamed script is
+        never held in memory.
+
         Returns: (warnings, skip_batch_indices)
         """
         warnings: list[str] = []
@@ -280,11 +245,16 @@ class ScriptExecutor:
         drop_login_pattern = re.compile(
             r"DROP\s+LOGIN\s+\[?" + re.escape(connection_login) + r"\]?", re.IGNORECASE
         )
+        # Check for SA if connection is SA
+        sa_pattern = (
+            re.compile(r"ALTER\s+LOGIN\s+\[?sa\]?", re.IGNORECASE)
+            if connection_login.lower() == "sa"
+            else None
+        )
 
         for i, batch in enumerate(batches):
             # Strip comments for safety check
-            cleaned = re.sub(r"--.*$", "", batch, flags=re.MULTILINE)
-            cleaned = re.sub(r"/\*.*?\*/", "", cleaned, flags=re.DOTALL)
+            cleaned = self._strip_comments(batch)
 
             if alter_login_pattern.search(cleaned) or drop_login_pattern.search(
                 cleaned
@@ -293,21 +263,11 @@ class ScriptExecutor:
                     f"⚠️ SKIPPING batch {i+1}: Would modify connection login '{connection_login}'"
                 )
                 skip_indices.append(i)
-
-        # Check for SA if connection is SA
-        if connection_login.lower() == "sa":
-            sa_pattern = re.compile(r"ALTER\s+LOGIN\s+\[?sa\]?", re.IGNORECASE)
-
-            for i, batch in enumerate(batches):
-                # Clean again or reuse cleaner logic if I refactored, but simple repeat is fine
-                cleaned = re.sub(r"--.*$", "", batch, flags=re.MULTILINE)
-                cleaned = re.sub(r"/\*.*?\*/", "", cleaned, flags=re.DOTALL)
-
-                if sa_pattern.search(cleaned) and i not in skip_indices:
-                    warnings.append(
-                        f"⚠️ SKIPPING batch {i+1}: Would modify SA account (your connection login)"
-                    )
-                    skip_indices.append(i)
+            elif sa_pattern and sa_pattern.search(cleaned):
+                warnings.append(
+                    f"⚠️ SKIPPING batch {i+1}: Would modify SA account (your connection login)"
+                )
+                skip_indices.append(i)
 
         return warnings, skip_indices
 
@@ -327,6 +287,9 @@ class ScriptExecutor:
         folder: str | Path,
         dry_run: bool = False,
         rollback: bool = False,
+        max_workers: int = 1,
+        per_host: int = 1,
+        fail_fast: bool = False,
     ) -> list[ScriptResult]:
         """
         Execute all scripts in a folder.
@@ -335,28 +298,26 @@ class ScriptExecutor:
             folder: Path to folder containing .sql and .ps1 scripts
             dry_run: If True, only show what would be executed
             rollback: If True, execute _ROLLBACK.sql scripts instead
+            max_workers: Scripts applied at once across all targets
+                (1 = sequential)
+            per_host: Scripts applied at once against the same host
+            fail_fast: Stop starting new scripts after the first failure;
+                the remaining scripts are returned as cancelled
         """
         folder = Path(folder)
         if not folder.exists():
             logger.error("Folder not found: %s", folder)
             return []
 
-        # Find SQL scripts
-        if rollback:
-            scripts = sorted(folder.glob("*_ROLLBACK.sql"))
-        else:
-            scripts = sorted(
-                s for s in folder.glob("*.sql") if "_ROLLBACK" not in s.name
-            )
-
-        # Find PS1 scripts (OS-level remediation)
-        ps1_scripts = sorted(folder.glob("*_OS_AUDIT.ps1"))
+        scripts, ps1_scripts = self._list_scripts(folder, rollback)
 
         if not scripts and not ps1_scripts:
             logger.info("No scripts found in %s", folder)
             return []
 
-        results = []
+        max_workers = max(1, max_workers)
+        per_host = max(1, per_host)
+
         print(f"\n{'='*60}")
         print(f"{'DRY RUN - ' if dry_run else ''}APPLY REMEDIATION")
         print(f"{'='*60}")
@@ -364,62 +325,416 @@ class ScriptExecutor:
         print(f"SQL Scripts: {len(scripts)}")
         print(f"PS1 Scripts: {len(ps1_scripts)}")
         print(f"Mode: {'Rollback' if rollback else 'Remediation'}")
+        if max_workers > 1:
+            print(f"Concurrency: {max_workers} total, {per_host} per host")
+        if fail_fast:
+            print("Policy: fail-fast")
         print(f"{'='*60}\n")
 
+        stop = threading.Event()
+
         # Execute SQL scripts first
-        for script in scripts:
-            result = self.execute_script(script, dry_run=dry_run)
-            results.append(result)
+        results = self._run_scripts(
+            scripts,
+            run_one=lambda script, out: self._execute_script_guarded(script, dry_run, out),
+            host_of=self._script_host,
+            is_failure=self._is_failed,
+            cancelled=self._cancelled_result,
+            max_workers=max_workers,
+            per_host=per_host,
+            stop=stop if fail_fast else None,
+        )
 
         # Execute PS1 scripts (OS-level remediations)
+        ps1_ok: list[bool | None] = []
         if ps1_scripts and not rollback:
             print(f"\n{'='*60}")
             print("EXECUTING OS-LEVEL REMEDIATIONS (PowerShell)")
             print(f"{'='*60}\n")
 
-            for ps1_script in ps1_scripts:
-                self._execute_ps1_script(ps1_script, dry_run=dry_run)
+            ps1_ok = self._run_scripts(
+                ps1_scripts,
+                run_one=lambda script, out: self._execute_ps1_script(script, dry_run, out),
+                host_of=self._script_host,
+                is_failure=lambda ok: ok is False,
+                cancelled=lambda script: None,
+                max_workers=max_workers,
+                per_host=per_host,
+                stop=stop if fail_fast else None,
+            )
 
         # Summary
         print(f"\n{'='*60}")
         print("SUMMARY")
         print(f"{'='*60}")
-        total_success = sum(1 for r in results if r.success)
-        total_failed = len(results) - total_success
-        print(
-            f"SQL Scripts: {len(results)} total, {total_success} successful, {total_failed} with errors"
+        total_cancelled = sum(1 for r in results if r.cancelled)
+        total_success = sum(1 for r in results if r.success and not r.cancelled)
+        total_failed = len(results) - total_success - total_cancelled
+        summary = (
+            f"SQL Scripts: {len(results)} total, {total_success} successful, "
+            f"{total_failed} with errors"
         )
+        if total_cancelled:
+            summary += f", {total_cancelled} not started (fail-fast)"
+        print(summary)
         if ps1_scripts:
-            print(f"PS1 Scripts: {len(ps1_scripts)} executed")
+            executed = sum(1 for ok in ps1_ok if ok is not None)
+            print(f"PS1 Scripts: {executed} executed")
 
         for result in results:
-            status = "✓" if result.success else "✗"
+            status = "-" if result.cancelled else ("✓" if result.success else "✗")
             print(
                 f"  {status} {result.script_path.name}: {result.successful}/{result.total_batches} batches"
             )
 
         return results
 
-    def _execute_ps1_script(self, script_path: Path, dry_run: bool = False) -> bool:
+    def _list_scripts(self, folder: Path, rollback: bool) -> tuple[list[Path], list[Path]]:
+        """Return (sql_scripts, ps1_scripts) to apply from a folder."""
+        # Find SQL scripts
+        if rollback:
+            scripts = sorted(folder.glob("*_ROLLBACK.sql"))
+        else:
+            scripts = sorted(
+                s for s in folder.glob("*.sql") if "_ROLLBACK" not in s.name
+            )
+
+        # Find PS1 scripts (OS-level remediation)
+        ps1_scripts = sorted(folder.glob("*_OS_AUDIT.ps1"))
+        return scripts, ps1_scripts
+
+    def validate_folder(
+        self,
+        folder: str | Path,
+        rollback: bool = False,
+        max_workers: int = 8,
+        parse_only: bool = False,
+    ) -> list[ScriptResult]:
+        """
+        Compile every SQL script on its target without executing it.
+
+        Each batch is sent under SET NOEXEC ON (or PARSEONLY). Scripts for
+        the same target share one connection; targets are validated in
+        parallel. PowerShell scripts are not validated.
+
+        Args:
+            folder: Path to folder containing .sql scripts
+            rollback: Validate _ROLLBACK.sql scripts instead
+            max_workers: Targets validated at once
+            parse_only: Syntax check only (SET PARSEONLY)
+
+        Returns:
+            One ScriptResult per script; failed batches carry the server's
+            compile error and source line range
+        """
+        folder = Path(folder)
+        if not folder.exists():
+            logger.error("Folder not found: %s", folder)
+            return []
+
+        scripts, _ = self._list_scripts(folder, rollback)
+        if not scripts:
+            logger.info("No scripts found in %s", folder)
+            return []
+
+        print(f"\nFolder: {folder}")
+        return self.validate_scripts(scripts, max_workers, parse_only)
+
+    def validate_scripts(
+        self,
+        scripts: list[Path],
+        max_workers: int = 8,
+        parse_only: bool = False,
+    ) -> list[ScriptResult]:
+        """Validate the given SQL scripts on their targets (see validate_folder)."""
+        scripts = [Path(s) for s in scripts]
+        mode = "PARSEONLY" if parse_only else "NOEXEC"
+        print(f"\n{'='*60}")
+        print(f"VALIDATE REMEDIATION (SET {mode} ON)")
+        print(f"{'='*60}")
+        print(f"SQL Scripts: {len(scripts)}")
+        print(f"{'='*60}\n")
+
+        # One connection per target, shared by that target's scripts
+        by_target: dict[tuple[str, str, int | None], list[Path]] = defaultdict(list)
+        done: dict[Path, ScriptResult] = {}
+        for script in scripts:
+            try:
+                server, instance, _, port = self._get_connection_for_script(script)
+            except Exception as e:
+                logger.error("Cannot resolve target of %s: %s", script.name, e)
+                done[script] = ScriptResult(
+                    script_path=script,
+                    server="",
+                    instance="",
+                    total_batches=0,
+                    warnings=[f"Target not resolved: {e}"],
+                )
+                continue
+            by_target[(server, instance, port)].append(script)
+
+        validator = DryRunValidator()
+
+        def validate_target(item: dict) -> list[ScriptResult]:
+            server, instance, port = item["key"]
+            results = [
+                ScriptResult(
+                    script_path=script,
+                    server=server,
+                    instance=instance,
+                    total_batches=self._count_batches(script),
+                )
+                for script in item["scripts"]
+            ]
+            for result in results:
+                done[result.script_path] = result
+
+            try:
+                conn = self._connect(server, instance, port)
+            except Exception as e:
+                logger.error("Failed to connect to %s: %s", server, e)
+                for result in results:
+                    result.warnings.append(f"Connection failed: {e}")
+                return results
+
+            try:
+                for result in results:
+                    outcome = validator.validate_on_server(
+                        conn, self._iter_batches(result.script_path), parse_only
+                    )
+                    if isinstance(outcome, Failure):
+                        result.warnings.append(outcome.error)
+                        continue
+                    for entry in outcome.value:
+                        ok = entry["error"] is None
+                        if entry["skipped"]:
+                            result.skipped += 1
+                        elif ok:
+                            result.successful += 1
+                        else:
+                            result.failed += 1
+                        result.batch_results.append(
+                            BatchResult(
+                                batch_num=entry["batch_num"],
+                                success=ok,
+                                preview="",
+                                error=entry["error"],
+                                start_line=entry["start_line"],
+                                end_line=entry["end_line"],
+                            )
+                        )
+            finally:
+                conn.close()
+            return results
+
+        outcome = ParallelExecutor().execute_parallel(
+            [{"server": key[0], "key": key, "scripts": items} for key, items in by_target.items()],
+            validate_target,
+            max_workers=max(1, max_workers),
+        )
+        if isinstance(outcome, Failure):
+            logger.error("Validation failed: %s", outcome.error)
+        else:
+            for item in outcome.value:
+                if isinstance(item, Failure):
+                    logger.error("%s", item.error)
+
+        results = [
+            done.get(script)
+            or ScriptResult(
+                script_path=script,
+                server="",
+                instance="",
+                total_batches=0,
+                warnings=["Not validated"],
+            )
+            for script in scripts
+        ]
+
+        # Summary
+        print(f"{'='*60}")
+        print("VALIDATION SUMMARY")
+        print(f"{'='*60}")
+        clean = sum(1 for r in results if r.success and not r.warnings)
+        print(f"SQL Scripts: {len(results)} total, {clean} compile cleanly")
+        for result in results:
+            status = "✓" if result.success and not result.warnings else "✗"
+            print(
+                f"  {status} {result.script_path.name}: "
+                f"{result.successful}/{result.total_batches} batches compile"
+            )
+            for warning in result.warnings:
+                print(f"      {warning}")
+            for batch in result.batch_results:
+                if not batch.success:
+                    print(
+                        f"      [{batch.batch_num:2d}] lines {batch.start_line}-{batch.end_line}: "
+                        f"{(batch.error or '')[:100]}"
+                    )
+
+        return results
+
+    def _run_scripts(
+        self,
+        scripts: list[Path],
+        run_one: Callable[[Path, TextIO | None], R],
+        host_of: Callable[[Path], str],
+        is_failure: Callable[[R], bool],
+        cancelled: Callable[[Path], R],
+        max_workers: int,
+        per_host: int,
+        stop: threading.Event | None,
+    ) -> list[R]:
+        """
+        Run scripts sequentially or concurrently, preserving input order.
+
+        Concurrent mode caps the number of scripts in flight per host and
+        overall: a script is only submitted once its host has a free slot,
+        so workers never sit blocked on a busy host. Each script still runs
+        its batches in order on a single connection and prints into its own
+        buffer, written out in one piece when it finishes. When stop is
+        given (fail-fast), the first failure sets it and scripts not yet
+        started are returned via cancelled().
+        """
+        if max_workers <= 1 or len(scripts) <= 1:
+            results: list[R] = []
+            for script in scripts:
+                if stop is not None and stop.is_set():
+                    results.append(cancelled(script))
+                    continue
+                result = run_one(script, None)
+                if stop is not None and is_failure(result):
+                    stop.set()
+                results.append(result)
+            return results
+
+        queued: dict[str, deque[Path]] = defaultdict(deque)
+        for script in scripts:
+            queued[host_of(script)].append(script)
+        running: dict[str, int] = defaultdict(int)
+        in_flight: dict[Future, tuple[Path, str, io.StringIO]] = {}
+        done: dict[Path, R] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while queued or in_flight:
+                # Round-robin over hosts with free slots
+                for host in list(queued):
+                    pending = queued[host]
+                    while (
+                        pending
+                        and running[host] < per_host
+                        and len(in_flight) < max_workers
+                    ):
+                        script = pending.popleft()
+                        if stop is not None and stop.is_set():
+                            done[script] = cancelled(script)
+                            continue
+                        buffer = io.StringIO()
+                        running[host] += 1
+                        in_flight[pool.submit(run_one, script, buffer)] = (script, host, buffer)
+                    if not pending:
+                        del queued[host]
+                if not in_flight:
+                    continue
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    script, host, buffer = in_flight.pop(future)
+                    running[host] -= 1
+                    sys.stdout.write(buffer.getvalue())
+                    sys.stdout.flush()
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error("Script %s failed: %s", script.name, e)
+                        continue
+                    if stop is not None and is_failure(result):
+                        stop.set()
+                    done[script] = result
+
+        return [done[s] if s in done else cancelled(s) for s in scripts]
+
+    def _execute_script_guarded(
+        self, script_path: Path, dry_run: bool, out: TextIO | None = None
+    ) -> ScriptResult:
+        """execute_script that reports unexpected errors in the result."""
+        try:
+            return self.execute_script(script_path, dry_run=dry_run, out=out)
+        except Exception as e:
+            logger.error("Failed to execute %s: %s", script_path.name, e)
+            print(f"✗ Error: {e}", file=out)
+            return ScriptResult(
+                script_path=script_path,
+                server="",
+                instance="",
+                total_batches=0,
+                warnings=[f"Execution error: {e}"],
+            )
+
+    def _script_host(self, script_path: Path) -> str:
+        """Host a SQL or PowerShell script targets (per-host concurrency key)."""
+        try:
+            if script_path.suffix.lower() == ".ps1":
+                server = self._ps1_server(script_path)
+            else:
+                server, _, _, _ = self._get_connection_for_script(script_path)
+        except OSError:
+            return script_path.name
+        target = self._find_target(server) if server else None
+        return (target.server if target else server or script_path.name).lower()
+
+    @staticmethod
+    def _ps1_server(script_path: Path) -> str:
+        """Server an OS script targets, from its $ServerName line."""
+        with script_path.open(encoding="utf-8") as handle:
+            content = "".join(islice(handle, HEADER_LINES))
+        match = re.search(r'^\$ServerName\s*=\s*"([^"]*)"', content, re.MULTILINE)
+        # Older scripts: <server>_<port>_<id>_<instance>_OS_AUDIT.ps1
+        return match.group(1) if match else script_path.stem.split("_")[0]
+
+    @staticmethod
+    def _is_failed(result: ScriptResult) -> bool:
+        """Failure for fail-fast purposes: a failed batch or no connection."""
+        return result.failed > 0 or any(
+            w.startswith(("Connection failed", "Execution error"))
+            for w in result.warnings
+        )
+
+    def _cancelled_result(self, script_path: Path) -> ScriptResult:
+        """Result for a script that was never started."""
+        try:
+            total = self._count_batches(script_path)
+        except OSError:
+            total = 0
+        return ScriptResult(
+            script_path=script_path,
+            server="",
+            instance="",
+            total_batches=total,
+            skipped=total,
+            warnings=["Not started: stopped after an earlier failure"],
+            cancelled=True,
+        )
+
+    def _execute_ps1_script(
+        self, script_path: Path, dry_run: bool = False, out: TextIO | None = None
+    ) -> bool:
         """
         Execute a PowerShell remediation script.
 
         Args:
             script_path: Path to the .ps1 script
             dry_run: If True, only show what would be executed
+            out: Stream for progress output (default: stdout)
 
         Returns:
             True if successful
         """
         import subprocess
 
-        print(f"\n--- Processing: {script_path.name} ---")
+        print(f"\n--- Processing: {script_path.name} ---", file=out)
 
-        # Parse server from script name (e.g., localhost_1444_3_MSSQLSERVER_OS_AUDIT.ps1)
-        name_parts = script_path.stem.split("_")
-        if len(name_parts) >= 1:
-            server = name_parts[0]
-            print(f"Target Server: {server}")
+        print(f"Target Server: {self._ps1_server(script_path)}", file=out)
 
         if dry_run:
             # For display, show the path as it will be resolved
@@ -428,9 +743,10 @@ class ScriptExecutor:
                 if not script_path.is_absolute()
                 else script_path
             )
-            print("[DRY RUN] Would execute PowerShell script:")
+            print("[DRY RUN] Would execute PowerShell script:", file=out)
             print(
-                f"  powershell.exe -ExecutionPolicy Bypass -File {display_path} -ApplyFix"
+                f"  powershell.exe -ExecutionPolicy Bypass -File {display_path} -ApplyFix",
+                file=out,
             )
             return True
 
@@ -454,7 +770,7 @@ class ScriptExecutor:
         ]
 
         try:
-            print("Executing PowerShell script...")
+            print("Executing PowerShell script...", file=out)
             # Run from script's directory for any relative paths IN the script
             script_dir = Path(abs_script_path).parent
             # Run with extended timeout for slow machines (5 minutes)
@@ -469,13 +785,13 @@ class ScriptExecutor:
             # Print output
             if result.stdout:
                 for line in result.stdout.strip().split("\n"):
-                    print(f"  {line}")
+                    print(f"  {line}", file=out)
 
             if result.returncode == 0:
-                print(f"✓ PowerShell script completed successfully")
+                print(f"✓ PowerShell script completed successfully", file=out)
                 return True
             else:
-                print(f"✗ PowerShell script failed (exit code: {result.returncode})")
+                print(f"✗ PowerShell script failed (exit code: {result.returncode})", file=out)
                 if result.stderr:
                     logger.error("PS1 stderr: %s", result.stderr[:500])
                 return False
@@ -484,21 +800,22 @@ class ScriptExecutor:
             logger.error(
                 "PowerShell script timed out after 5 minutes: %s", script_path.name
             )
-            print("✗ PowerShell script timed out (5 minute limit)")
+            print("✗ PowerShell script timed out (5 minute limit)", file=out)
             return False
         except FileNotFoundError:
             logger.error("PowerShell not found - cannot execute OS scripts")
-            print("✗ PowerShell not found on this system")
+            print("✗ PowerShell not found on this system", file=out)
             return False
         except Exception as e:
             logger.error("Failed to execute PS1: %s", e)
-            print(f"✗ Error: {e}")
+            print(f"✗ Error: {e}", file=out)
             return False
 
     def execute_script(
         self,
         script_path: str | Path,
         dry_run: bool = False,
+        out: TextIO | None = None,
     ) -> ScriptResult:
         """
         Execute a single script.
@@ -506,6 +823,7 @@ class ScriptExecutor:
         Args:
             script_path: Path to the .sql script
             dry_run: If True, only show what would be executed
+            out: Stream for progress output (default: stdout)
         """
         script_path = Path(script_path)
 
@@ -519,47 +837,56 @@ class ScriptExecutor:
                 warnings=["Script file not found"],
             )
 
-        print(f"\n--- Processing: {script_path.name} ---")
-
-        # Read and parse script
-        content = script_path.read_text(encoding="utf-8")
-        batches = self._parse_batches(content)
+        print(f"\n--- Processing: {script_path.name} ---", file=out)
 
         # Get connection info
         server, instance, connection_login, port = self._get_connection_for_script(
             script_path
         )
 
-        print(f"Server: {server}")
-        print(f"Port: {port or 1433}")
-        print(f"Instance: {instance or '(Default)'}")
-        print(f"Connection: {connection_login or 'Unknown'}")
-        print(f"Batches: {len(batches)}")
+        # First pass: count batches and check credential safety. Batches are
+        # streamed from the file; the second pass below re-reads them.
+        batch_count = 0
+
+        def batch_texts() -> Iterator[str]:
+            nonlocal batch_count
+            for batch in self._iter_batches(script_path):
+                batch_count += 1
+                yield batch.text
+
+        texts = batch_texts()
+        warnings, skip_list = self._check_credential_safety(texts, connection_login)
+        for _ in texts:
+            pass  # The check returns early when there is no login to protect
+        skip_indices = set(skip_list)
+
+        print(f"Server: {server}", file=out)
+        print(f"Port: {port or 1433}", file=out)
+        print(f"Instance: {instance or '(Default)'}", file=out)
+        print(f"Connection: {connection_login or 'Unknown'}", file=out)
+        print(f"Batches: {batch_count}", file=out)
 
         result = ScriptResult(
             script_path=script_path,
             server=server,
             instance=instance,
-            total_batches=len(batches),
-        )
-
-        # Check credential safety
-        warnings, skip_indices = self._check_credential_safety(
-            batches, connection_login
+            total_batches=batch_count,
         )
         result.warnings = warnings
 
         for warning in warnings:
-            print(warning)
+            print(warning, file=out)
 
         if dry_run:
-            print("\n[DRY RUN] Would execute the following batches:")
-            for i, batch in enumerate(batches):
+            print("\n[DRY RUN] Would execute the following batches:", file=out)
+            for i, batch in enumerate(self._iter_batches(script_path)):
+                preview = self._get_batch_preview(batch.text)
+                repeat = f" (x{batch.repeat})" if batch.repeat > 1 else ""
                 if i in skip_indices:
-                    print(f"  [{i+1:2d}] SKIP: {self._get_batch_preview(batch)}")
+                    print(f"  [{i+1:2d}] SKIP: {preview}", file=out)
                     result.skipped += 1
                 else:
-                    print(f"  [{i+1:2d}] EXEC: {self._get_batch_preview(batch)}")
+                    print(f"  [{i+1:2d}] EXEC{repeat}: {preview}", file=out)
                     result.successful += 1  # Would succeed in dry-run
             return result
 
@@ -571,26 +898,32 @@ class ScriptExecutor:
             result.warnings.append(f"Connection failed: {e}")
             return result
 
-        print("\nExecuting...")
+        print("\nExecuting...", file=out)
 
-        for i, batch in enumerate(batches):
+        for i, batch in enumerate(self._iter_batches(script_path)):
+            preview = self._get_batch_preview(batch.text)
             if i in skip_indices:
                 result.skipped += 1
                 result.batch_results.append(
                     BatchResult(
                         batch_num=i + 1,
                         success=True,
-                        preview=self._get_batch_preview(batch),
+                        preview=preview,
                         error="SKIPPED: Would modify connection login",
+                        start_line=batch.start_line,
+                        end_line=batch.end_line,
                     )
                 )
-                print(f"  [{i+1:2d}] SKIP")
+                print(f"  [{i+1:2d}] SKIP", file=out)
                 continue
 
             try:
                 cursor = conn.cursor()
-                cursor.execute(batch)
-                rows = cursor.rowcount
+                rows = 0
+                # GO <count> repeats the batch
+                for _ in range(batch.repeat):
+                    cursor.execute(batch.text)
+                    rows += max(cursor.rowcount, 0)
                 # conn.commit() - AutoCommit is ON
 
                 result.successful += 1
@@ -598,11 +931,13 @@ class ScriptExecutor:
                     BatchResult(
                         batch_num=i + 1,
                         success=True,
-                        preview=self._get_batch_preview(batch),
+                        preview=preview,
                         rows_affected=rows,
+                        start_line=batch.start_line,
+                        end_line=batch.end_line,
                     )
                 )
-                print(f"  [{i+1:2d}] ✓ OK")
+                print(f"  [{i+1:2d}] ✓ OK", file=out)
 
             except Exception as e:
                 result.failed += 1
@@ -611,21 +946,64 @@ class ScriptExecutor:
                     BatchResult(
                         batch_num=i + 1,
                         success=False,
-                        preview=self._get_batch_preview(batch),
+                        preview=preview,
                         error=error_msg,
+                        start_line=batch.start_line,
+                        end_line=batch.end_line,
                     )
                 )
-                print(f"  [{i+1:2d}] ✗ FAILED: {error_msg[:60]}")
-                logger.error("Batch %d failed: %s", i + 1, error_msg)
+                print(
+                    f"  [{i+1:2d}] ✗ FAILED (lines {batch.start_line}-{batch.end_line}): "
+                    f"{error_msg[:60]}",
+                    file=out,
+                )
+                logger.error(
+                    "Batch %d (lines %d-%d) failed: %s",
+                    i + 1,
+                    batch.start_line,
+                    batch.end_line,
+                    error_msg,
+                )
 
         conn.close()
 
         print(
-            f"\nResult: {result.successful} succeeded, {result.failed} failed, {result.skipped} skipped"
+            f"\nResult: {result.successful} succeeded, {result.failed} failed, {result.skipped} skipped",
+            file=out,
         )
 
+        self._record_execution(result, port)
         return result
 
+    def _record_execution(self, result: ScriptResult, port: int | None) -> None:
+        """
+        Record the executed script in the history DB.
+
+        Targeted sync reads these records to know which instances were
+        touched since the last run. Recording is best-effort and never
+        fails the remediation itself.
+        """
+        if not self.db_path.exists():
+            return
+
+        from autodbaudit.infrastructure.sqlite import HistoryStore
+
+        store = HistoryStore(self.db_path)
+        try:
+            store.initialize_schema()
+            store.record_script_execution(
+                server_name=result.server,
+                instance_name=result.instance,
+                port=port,
+                script_name=result.script_path.name,
+                successful=result.successful,
+                failed=result.failed,
+            )
+        except Exception as e:
+            logger.warning("Could not record execution of %s: %s", result.script_path.name, e)
+        finally:
+            store.close()
+
     def _connect(self, server: str, instance: str, port: int | None = None):
         """
         Create connection to SQL Server.
@@ -635,7 +1013,7 @@ class ScriptExecutor:
         - If only instance name (named instance, no port), use: server\\instance
         - Default (port 1433 with default instance): server,1433
         """
-        import pyodbc
+        from autodbaudit.infrastructure.sql.odbc import get_odbc
 
         # Find matching target
         target = self._find_target(server, port)
@@ -691,7 +1069,7 @@ class ScriptExecutor:
             )
 
         logger.debug("Connecting with: %s", server_str)
-        return pyodbc.connect(conn_str, autocommit=True, timeout=timeout)
+        return get_odbc().connect(conn_str, autocommit=True, timeout=timeout)
 
 
 def main():
@@ -708,14 +1086,38 @@ def main():
         "--rollback", action="store_true", help="Execute rollback scripts"
     )
     parser.add_argument("--targets", default="sql_targets.json", help="Targets file")
+    parser.add_argument(
+        "--parallel", type=int, default=1, help="Scripts applied at once"
+    )
+    parser.add_argument(
+        "--per-host", type=int, default=1, help="Scripts applied at once per host"
+    )
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop after the first failure"
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Compile scripts on the server under SET NOEXEC ON",
+    )
 
     args = parser.parse_args()
 
     executor = ScriptExecutor(targets_file=args.targets)
 
+    if args.folder and args.validate:
+        results = executor.validate_folder(
+            args.folder, rollback=args.rollback, max_workers=args.parallel if args.parallel > 1 else 8
+        )
+        return 0 if all(r.success and not r.warnings for r in results) else 1
     if args.folder:
         executor.execute_folder(
-            args.folder, dry_run=args.dry_run, rollback=args.rollback
+            args.folder,
+            dry_run=args.dry_run,
+            rollback=args.rollback,
+            max_workers=args.parallel,
+            per_host=args.per_host,
+            fail_fast=args.fail_fast,
         )
     elif args.script:
         executor.execute_script(args.script, dry_run=args.dry_run)
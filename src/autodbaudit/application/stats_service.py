@@ -7,17 +7,21 @@ All consumers (CLI, Excel Cover Sheet, --finalize) MUST use this service.
 Architecture Note:
     - Depends only on domain types and HistoryStore
     - No direct Excel or CLI coupling
-    - Computes stats fresh each time (no caching)
+    - Computes stats fresh each time (memoization lives only for one calculate())
     - All key comparisons are case-insensitive (normalized to lowercase)
+    - Each finding is classified exactly once; counters and diffs are
+      derived from the compact ClassifiedFinding records
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Protocol, Any
 
 from autodbaudit.domain.change_types import (
+    ChangeType,
     FindingStatus,
     SyncStats,
 )
@@ -50,6 +54,10 @@ class AnnotationsProvider(Protocol):
         """Get all annotations keyed by entity_key."""
         raise NotImplementedError("Implementations must provide get_all_annotations")
 
+    # Optional: get_annotations_as_of(run_id) -> dict | None
+    # When present, "since last sync" diffs use the annotations recorded
+    # for the previous run instead of the current ones.
+
 
 class InstanceValidator(Protocol):
     """Protocol for validating instance availability."""
@@ -60,11 +68,93 @@ class InstanceValidator(Protocol):
 
 
 # =============================================================================
-# Helper Classes
+# Lookup Tables
 # =============================================================================
 
-from collections import defaultdict
-from dataclasses import field
+# All known entity types for exception matching
+KNOWN_ENTITY_TYPES: tuple[str, ...] = (
+    "sa_account",
+    "login",
+    "server_role_member",
+    "config",
+    "service",
+    "database",
+    "db_user",
+    "db_role",
+    "db_role_member",
+    "permission",
+    "db_permission",
+    "orphaned_user",
+    "trigger",
+    "protocol",
+    "backup",
+    "audit_settings",
+    "encryption",
+    "linked_server",
+    "instance",
+    "sensitive_role",
+    "role_member",
+    "version",
+)
+
+# Entity key prefix -> sheet name.
+# This mapping should match SHEET_ANNOTATION_CONFIG keys in annotation_sync
+# or be readable enough for the user.
+KEY_PREFIX_SHEETS: dict[str, str] = {
+    "instance": "Instances",
+    "sa_account": "SA Account",
+    "login": "Server Logins",
+    "server_role_member": "Sensitive Roles",
+    "config": "Configuration",
+    "service": "Services",
+    "database": "Databases",
+    "db_user": "Database Users",
+    "db_role": "Database Roles",
+    "permission": "Permission Grants",
+    "orphaned_user": "Orphaned Users",
+    "linked_server": "Linked Servers",
+    "trigger": "Triggers",
+    "protocol": "Client Protocols",
+    "backup": "Backups",
+    "audit_settings": "Audit Settings",
+    "encryption": "Encryption",
+}
+
+# finding_type -> sheet name. MUST cover all entity types in the system.
+FINDING_TYPE_SHEETS: dict[str, str] = {
+    # Instance-level
+    "instance": "Instances",
+    "version": "Instances",
+    # Security findings
+    "sa_account": "Server Logins",
+    "login": "Server Logins",
+    "server_role_member": "Sensitive Roles",
+    "role_member": "Sensitive Roles",
+    "sensitive_role": "Sensitive Roles",
+    # Configuration
+    "config": "Configuration",
+    "service": "Services",
+    "protocol": "Client Protocols",
+    "audit_settings": "Audit Settings",
+    # Database-level
+    "database": "Databases",
+    "db_user": "Database Users",
+    "db_role": "Database Roles",
+    "db_role_member": "Database Roles",
+    "permission": "Permission Grants",
+    "db_permission": "Permission Grants",
+    "orphaned_user": "Orphaned Users",
+    # Infrastructure
+    "linked_server": "Linked Servers",
+    "trigger": "Triggers",
+    "backup": "Backups",
+    "encryption": "Encryption",
+}
+
+
+# =============================================================================
+# Helper Classes
+# =============================================================================
 
 
 @dataclass
@@ -85,6 +175,131 @@ class DiffResult:
     sheet_stats: dict[str, dict[str, int]] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class ClassifiedFinding:
+    """
+    A finding reduced to the fields every statistic is derived from.
+
+    Attributes:
+        key: Normalized (lowercase) entity key
+        sheet: Sheet name for per-sheet breakdowns ("" if unknown)
+        status: Parsed finding status (None if unparseable)
+        exceptioned: Whether a discrepant finding has a valid exception
+    """
+
+    key: str
+    sheet: str
+    status: FindingStatus | None
+    exceptioned: bool
+
+
+class ExceptionIndex:
+    """
+    Pre-normalized view of annotations for repeated exception lookups.
+
+    Normalizing and scanning the annotation dict once per finding made
+    exception checks O(findings x annotations). This index normalizes
+    every annotation once and memoizes the answer per normalized key.
+    """
+
+    def __init__(self, annotations: dict[str, dict]):
+        self.by_key: dict[str, dict] = {
+            normalize_key_string(k): v for k, v in annotations.items()
+        }
+
+        # Strategy 2: annotations carrying a legacy key, per annotation type
+        self.legacy_by_type: dict[str, list[tuple[str, dict]]] = defaultdict(list)
+        for ann_key, ann in self.by_key.items():
+            legacy_key = ann.get("_legacy_entity_key", "")
+            if legacy_key:
+                self.legacy_by_type[ann_key.split("|", 1)[0]].append(
+                    (normalize_key_string(legacy_key), ann)
+                )
+
+        # Strategies 4 & 5: only exception-eligible annotations can match
+        self.eligible_legacy: list[str] = []
+        self.eligible_remainders: dict[str, list[str]] = defaultdict(list)
+        for ann_key, ann in annotations.items():
+            if not _annotation_is_exception(ann):
+                continue
+            legacy_key = ann.get("_legacy_entity_key", "")
+            if legacy_key:
+                self.eligible_legacy.append(normalize_key_string(legacy_key))
+            ann_parts = normalize_key_string(ann_key).split("|", 1)
+            if len(ann_parts) >= 2:
+                self.eligible_remainders[ann_parts[0]].append(ann_parts[1])
+
+        self._memo: dict[str, bool] = {}
+
+    def is_exceptioned(self, entity_key: str) -> bool:
+        """Check if entity has a valid exception (memoized per normalized key)."""
+        normalized_entity_key = normalize_key_string(entity_key)
+        cached = self._memo.get(normalized_entity_key)
+        if cached is None:
+            cached = self._lookup(normalized_entity_key)
+            self._memo[normalized_entity_key] = cached
+        return cached
+
+    def _lookup(self, normalized_entity_key: str) -> bool:
+        """Resolve an exception using the strategies of StatsService._is_exceptioned."""
+        # === Strategy 1: Direct lookup ===
+        ann = self.by_key.get(normalized_entity_key)
+        if ann is not None:
+            return _annotation_is_exception(ann)
+
+        # === Strategy 2: Parse finding key and try type-based matching ===
+        # Finding format: type|server|instance|identifier
+        parts = normalized_entity_key.split("|")
+        finding_type = parts[0] if parts else ""
+        finding_remainder = "|".join(parts[1:]) if len(parts) > 1 else ""
+
+        if finding_type in KNOWN_ENTITY_TYPES:
+            for normalized_legacy, ann in self.legacy_by_type.get(finding_type, ()):
+                # Legacy key should match the NON-type portion,
+                # or might be the full key including type
+                if normalized_legacy in (finding_remainder, normalized_entity_key):
+                    return _annotation_is_exception(ann)
+
+        # === Strategy 3: Try adding type prefixes to entity_key ===
+        for etype in KNOWN_ENTITY_TYPES:
+            ann = self.by_key.get(f"{etype}|{normalized_entity_key}")
+            if ann is not None:
+                return _annotation_is_exception(ann)
+
+        # === Strategy 4: Match _legacy_entity_key of any exception ===
+        for normalized_legacy in self.eligible_legacy:
+            if normalized_entity_key == normalized_legacy:
+                return True
+            if finding_remainder and finding_remainder == normalized_legacy:
+                return True
+            # Substring check: finding key is contained in legacy
+            if normalized_entity_key in normalized_legacy:
+                return True
+            if finding_remainder and finding_remainder in normalized_legacy:
+                return True
+
+        # === Strategy 5: Strip type from annotation key and compare ===
+        # ann_remainder could be UUID or server|instance|entity
+        if finding_type:
+            for ann_remainder in self.eligible_remainders.get(finding_type, ()):
+                if finding_remainder == ann_remainder:
+                    return True
+                # Check if finding_remainder contains ann_remainder (for UUID match)
+                if ann_remainder in finding_remainder:
+                    return True
+
+        return False
+
+
+def _annotation_is_exception(ann: dict) -> bool:
+    """Check if an annotation documents an exception for a discrepant row."""
+    return is_exception_eligible(
+        status=FindingStatus.FAIL,
+        has_justification=bool(ann.get("justification")),
+        review_status=ann.get("review_status"),
+    )
+
+
 # =============================================================================
 # Stats Service
 # =============================================================================
@@ -125,6 +340,8 @@ class StatsService:
         self.findings = findings_provider
         self.annotations = annotations_provider
         self.instance_validator = instance_validator
+        self._sheet_by_type: dict[str, str] = {}
+        self._sheet_by_prefix: dict[str, str] = {}
 
     def calculate(
         self,
@@ -155,49 +372,45 @@ class StatsService:
                 current_run_id
             )
 
-        # Calculate current state
-        active_issues = self._count_active_issues(current_findings, annotations)
-        exceptions = self._count_exceptions(current_findings, annotations)
-        compliant = self._count_compliant(current_findings)
+        # Classify every finding exactly once. Exception checks are memoized
+        # per normalized key, so a key shared by several runs costs one lookup.
+        exception_index = ExceptionIndex(annotations)
+        current = self.classify_findings(current_findings, exception_index)
+        baseline = self.classify_findings(baseline_findings, exception_index)
 
-        # Calculate changes from baseline
-        # NOTE: For baseline comparison, we ideally need baseline annotations.
-        # However, annotations are typically "current state" of the UI.
-        # If we want true history of docs, we'd need to fetch historical annotations.
-        # For now, we assume annotations are compared "Last Sync vs Current".
-        # Baseline comparison uses current annotations for both sides to filter exceptions,
-        # but doesn't track "Docs Changed Since Baseline" (that's too noisy/hard).
-        baseline_diff = self._diff_findings(
-            old_findings=baseline_findings,
-            new_findings=current_findings,
-            old_annotations=annotations,  # Use current as proxy? Or empty?
-            # Actually, "Docs Changed" only makes sense for "Recent Sync".
-            # For Baseline, we just want exception counts.
-            new_annotations=annotations,
-            valid_instances=valid_instances,
+        # Calculate current state (single pass)
+        active_issues, exceptions, compliant, sheet_stats = self._aggregate_current(
+            current
         )
 
+        # Calculate changes from baseline
+        # NOTE: Annotations are "current state" of the UI, so the same exception
+        # flags are used on both sides. Exception and docs counts come from the
+        # action log below instead.
+        baseline_diff = self._diff_classified(baseline, current, valid_instances)
+
         # Calculate changes from previous sync
+        previous_annotations = None
         if previous_run_id and previous_run_id != baseline_run_id:
-            prev_findings = self.findings.get_findings(previous_run_id)
-
-            # TODO: We need PREVIOUS annotations to diff docs!
-            # If we don't have them, we can't count docs_added/updated correctly.
-            # HistoryStore doesn't currently version annotations (they are just persistent).
-            # This is a limitation: Annotations are overwrites.
-            # To fix this properly, we'd need to load "Annotation State at Run X".
-            # Since we can't do that yet without schema change, we might need to skip doc diffs
-            # OR rely on Action Log 'update_annotation' events if we had them.
-
-            # WORKAROUND: Use Actions recorded this sync for exception counts
-            # instead of broken annotation diff (which uses same annotations for both)
-            recent_diff = self._diff_findings(
-                old_findings=prev_findings,
-                new_findings=current_findings,
-                old_annotations=annotations,
-                new_annotations=annotations,
-                valid_instances=valid_instances,
+            # Annotation state recorded at the end of the previous sync
+            # (None for runs that predate annotation versioning)
+            if hasattr(self.annotations, "get_annotations_as_of"):
+                previous_annotations = self.annotations.get_annotations_as_of(
+                    previous_run_id
+                )
+            previous_index = (
+                ExceptionIndex(previous_annotations)
+                if previous_annotations is not None
+                else exception_index
+            )
+            previous = self.classify_findings(
+                self.findings.get_findings(previous_run_id), previous_index
             )
+            recent_diff = self._diff_classified(previous, current, valid_instances)
+            if previous_annotations is not None:
+                self._diff_docs(
+                    recent_diff, previous_annotations, annotations, valid_instances
+                )
         else:
             recent_diff = baseline_diff
 
@@ -205,6 +418,17 @@ class StatsService:
         # This fixes the "No recent documentation changes detected" issue
         action_counts = self._count_recent_actions(baseline_run_id, current_run_id)
 
+        # Docs changes come from the versioned annotation diff when the
+        # previous snapshot exists, otherwise from the action log
+        if previous_annotations is not None:
+            docs_counts = {
+                "docs_added": recent_diff.docs_added,
+                "docs_updated": recent_diff.docs_updated,
+                "docs_removed": recent_diff.docs_removed,
+            }
+        else:
+            docs_counts = action_counts
+
         return SyncStats(
             total_findings=len(current_findings),
             active_issues=active_issues,
@@ -222,13 +446,68 @@ class StatsService:
             exceptions_added_since_last=action_counts.get("exceptions_added", 0),
             exceptions_removed_since_last=action_counts.get("exceptions_removed", 0),
             exceptions_updated_since_last=action_counts.get("exceptions_updated", 0),
-            docs_added_since_last=action_counts.get("docs_added", 0),
-            docs_updated_since_last=action_counts.get("docs_updated", 0),
-            docs_removed_since_last=action_counts.get("docs_removed", 0),
+            docs_added_since_last=docs_counts.get("docs_added", 0),
+            docs_updated_since_last=docs_counts.get("docs_updated", 0),
+            docs_removed_since_last=docs_counts.get("docs_removed", 0),
             # Build current state per-sheet stats (not just changes)
-            sheet_stats=self._build_current_sheet_stats(current_findings, annotations),
+            sheet_stats=sheet_stats,
         )
 
+    def classify_findings(
+        self,
+        findings: list[dict],
+        exception_index: ExceptionIndex,
+    ) -> list[ClassifiedFinding]:
+        """
+        Reduce raw finding dicts to ClassifiedFinding records.
+
+        Args:
+            findings: Finding dicts from the store
+            exception_index: Index over the annotations to check exceptions against
+
+        Returns:
+            One record per finding, in input order
+        """
+        records: list[ClassifiedFinding] = []
+        append = records.append
+        for finding in findings:
+            entity_key = finding.get("entity_key") or ""
+            status = FindingStatus.from_string(finding.get("status"))
+            # Exceptions only matter for discrepant rows
+            exceptioned = bool(
+                status
+                and status.is_discrepant()
+                and exception_index.is_exceptioned(entity_key)
+            )
+            append(
+                ClassifiedFinding(
+                    key=normalize_key_string(entity_key),
+                    sheet=self._resolve_sheet(finding.get("finding_type", ""), entity_key),
+                    status=status,
+                    exceptioned=exceptioned,
+                )
+            )
+        return records
+
+    def _resolve_sheet(self, finding_type: str | None, entity_key: str) -> str:
+        """Resolve sheet name from finding_type, falling back to the key prefix."""
+        sheet_name = ""
+        if finding_type:
+            sheet_name = self._sheet_by_type.get(finding_type)
+            if sheet_name is None:
+                sheet_name = self._get_sheet_name_from_finding_type(finding_type)
+                self._sheet_by_type[finding_type] = sheet_name
+        if sheet_name:
+            return sheet_name
+
+        # Fallback: Derive from key if type is missing
+        prefix = entity_key.split("|", 1)[0].lower()
+        sheet_name = self._sheet_by_prefix.get(prefix)
+        if sheet_name is None:
+            sheet_name = self._get_sheet_name_from_key(entity_key)
+            self._sheet_by_prefix[prefix] = sheet_name
+        return sheet_name
+
     def _count_recent_actions(
         self,
         initial_run_id: int,
@@ -292,92 +571,47 @@ class StatsService:
 
         return counts
 
-    def _count_active_issues(
+    def _aggregate_current(
         self,
-        findings: list[dict],
-        annotations: dict[str, dict],
-    ) -> int:
+        records: list[ClassifiedFinding],
+    ) -> tuple[int, int, int, dict[str, dict[str, int]]]:
         """
-        Count active issues (discrepant without exception).
+        Derive current-state counters and per-sheet breakdown in one pass.
 
         Active = FAIL/WARN AND NOT exceptioned
-        """
-        count = 0
-        for finding in findings:
-            status = FindingStatus.from_string(finding.get("status"))
-            if status and status.is_discrepant():
-                entity_key = finding.get("entity_key", "")
-                if not self._is_exceptioned(entity_key, annotations):
-                    count += 1
-        return count
-
-    def _count_exceptions(
-        self,
-        findings: list[dict],
-        annotations: dict[str, dict],
-    ) -> int:
-        """
-        Count documented exceptions (discrepant WITH exception).
-
         Exception = FAIL/WARN AND exceptioned
-        """
-        count = 0
-        for finding in findings:
-            status = FindingStatus.from_string(finding.get("status"))
-            if status and status.is_discrepant():
-                entity_key = finding.get("entity_key", "")
-                if self._is_exceptioned(entity_key, annotations):
-                    count += 1
-        return count
-
-    def _count_compliant(self, findings: list[dict]) -> int:
-        """Count compliant items (PASS status)."""
-        count = 0
-        for finding in findings:
-            status = FindingStatus.from_string(finding.get("status"))
-            if status == FindingStatus.PASS:
-                count += 1
-        return count
+        Compliant = PASS
 
-    def _build_current_sheet_stats(
-        self,
-        findings: list[dict],
-        annotations: dict[str, dict],
-    ) -> dict[str, dict[str, int]]:
-        """
-        Build per-sheet breakdown of current state.
-
-        Returns dict of {sheet_name: {active: X, exceptions: X, compliant: X}}
+        Returns:
+            (active, exceptions, compliant, sheet_stats) where sheet_stats is
+            {sheet_name: {active: X, exceptions: X, compliant: X}}
         """
+        active = exceptions = compliant = 0
         sheet_stats: dict[str, dict[str, int]] = {}
 
-        for finding in findings:
-            finding_type = finding.get("finding_type", "")
-            sheet_name = self._get_sheet_name_from_finding_type(finding_type)
-
-            # Fallback: Derive from key if type is missing
-            if not sheet_name:
-                entity_key = finding.get("entity_key", "")
-                sheet_name = self._get_sheet_name_from_key(entity_key)
-
-            if not sheet_name:
-                continue
-
-            if sheet_name not in sheet_stats:
-                sheet_stats[sheet_name] = defaultdict(int)
-
-            status = FindingStatus.from_string(finding.get("status"))
-            entity_key = finding.get("entity_key", "")
+        for record in records:
+            stats = None
+            if record.sheet:
+                stats = sheet_stats.get(record.sheet)
+                if stats is None:
+                    stats = sheet_stats[record.sheet] = defaultdict(int)
 
+            status = record.status
             if status == FindingStatus.PASS:
-                sheet_stats[sheet_name]["compliant"] += 1
+                compliant += 1
+                if stats is not None:
+                    stats["compliant"] += 1
             elif status and status.is_discrepant():
-                if self._is_exceptioned(entity_key, annotations):
-                    sheet_stats[sheet_name]["exceptions"] += 1
+                if record.exceptioned:
+                    exceptions += 1
+                    if stats is not None:
+                        stats["exceptions"] += 1
                 else:
-                    sheet_stats[sheet_name]["active"] += 1
+                    active += 1
+                    if stats is not None:
+                        stats["active"] += 1
 
-        return sheet_stats
+        return active, exceptions, compliant, sheet_stats
 
     def _is_exceptioned(
         self,
@@ -395,148 +629,10 @@ class StatsService:
         2. Strip type prefix from finding, try matching with known type prefixes
         3. Match by _legacy_entity_key stored in annotation
         4. Match by checking if finding key (minus type) matches any annotation's non-type portion
-        """
-        # Normalize the entity_key to lowercase for matching
-        normalized_entity_key = normalize_key_string(entity_key)
-
-        # Build normalized lookup maps
-        normalized_annotations = {
-            normalize_key_string(k): v for k, v in annotations.items()
-        }
-
-        # === Strategy 1: Direct lookup ===
-        if normalized_entity_key in normalized_annotations:
-            ann = normalized_annotations[normalized_entity_key]
-            return is_exception_eligible(
-                status=FindingStatus.FAIL,
-                has_justification=bool(ann.get("justification")),
-                review_status=ann.get("review_status"),
-            )
 
-        # === Strategy 2: Parse finding key and try type-based matching ===
-        # Finding format: type|server|instance|identifier
-        parts = normalized_entity_key.split("|")
-        finding_type = parts[0] if parts else ""
-        finding_remainder = "|".join(parts[1:]) if len(parts) > 1 else ""
-
-        # All known entity types for matching
-        KNOWN_TYPES = [
-            "sa_account",
-            "login",
-            "server_role_member",
-            "config",
-            "service",
-            "database",
-            "db_user",
-            "db_role",
-            "db_role_member",
-            "permission",
-            "db_permission",
-            "orphaned_user",
-            "trigger",
-            "protocol",
-            "backup",
-            "audit_settings",
-            "encryption",
-            "linked_server",
-            "instance",
-            "sensitive_role",
-            "role_member",
-            "version",
-        ]
-
-        # If we know the type, look for type|<any_uuid_or_key> annotations
-        if finding_type in KNOWN_TYPES:
-            for ann_key, ann in normalized_annotations.items():
-                ann_parts = ann_key.split("|", 1)
-                if ann_parts[0] == finding_type:
-                    # Check if this annotation has a matching _legacy_entity_key
-                    legacy_key = ann.get("_legacy_entity_key", "")
-                    if legacy_key:
-                        normalized_legacy = normalize_key_string(legacy_key)
-                        # Legacy key should match the NON-type portion
-                        if finding_remainder == normalized_legacy:
-                            return is_exception_eligible(
-                                status=FindingStatus.FAIL,
-                                has_justification=bool(ann.get("justification")),
-                                review_status=ann.get("review_status"),
-                            )
-                        # Or legacy key might be full key including type
-                        if normalized_entity_key == normalized_legacy:
-                            return is_exception_eligible(
-                                status=FindingStatus.FAIL,
-                                has_justification=bool(ann.get("justification")),
-                                review_status=ann.get("review_status"),
-                            )
-
-        # === Strategy 3: Try adding type prefixes to entity_key ===
-        for etype in KNOWN_TYPES:
-            prefixed_key = f"{etype}|{normalized_entity_key}"
-            if prefixed_key in normalized_annotations:
-                ann = normalized_annotations[prefixed_key]
-                return is_exception_eligible(
-                    status=FindingStatus.FAIL,
-                    has_justification=bool(ann.get("justification")),
-                    review_status=ann.get("review_status"),
-                )
-
-        # === Strategy 4: Brute force - check all annotations ===
-        for ann_key, ann in annotations.items():
-            normalized_ann_key = normalize_key_string(ann_key)
-
-            # Check if annotation has justification or exception status
-            if not is_exception_eligible(
-                status=FindingStatus.FAIL,
-                has_justification=bool(ann.get("justification")),
-                review_status=ann.get("review_status"),
-            ):
-                continue
-
-            # Check _legacy_entity_key field
-            legacy_key = ann.get("_legacy_entity_key", "")
-            if legacy_key:
-                normalized_legacy = normalize_key_string(legacy_key)
-                if normalized_entity_key == normalized_legacy:
-                    return True
-                if finding_remainder and finding_remainder == normalized_legacy:
-                    return True
-                # Substring check: finding key is contained in legacy
-                if normalized_entity_key in normalized_legacy:
-                    return True
-                if finding_remainder and finding_remainder in normalized_legacy:
-                    return True
-
-        # === Strategy 5: Strip type from annotation key and compare ===
-        # Annotation key format: type|uuid OR type|server|instance|entity
-        # If type|uuid, check if uuid portion matches any part of finding
-        # If type|server|instance|entity, check if non-type portion matches finding_remainder
-        for ann_key, ann in annotations.items():
-            # Check if annotation has justification or exception status
-            if not is_exception_eligible(
-                status=FindingStatus.FAIL,
-                has_justification=bool(ann.get("justification")),
-                review_status=ann.get("review_status"),
-            ):
-                continue
-
-            normalized_ann_key = normalize_key_string(ann_key)
-            ann_parts = normalized_ann_key.split("|", 1)
-
-            if len(ann_parts) >= 2:
-                ann_type = ann_parts[0]
-                ann_remainder = ann_parts[1]
-
-                # If annotation type matches finding type
-                if finding_type and ann_type == finding_type:
-                    # Check if the non-type portion matches
-                    # ann_remainder could be UUID or server|instance|entity
-                    if finding_remainder == ann_remainder:
-                        return True
-                    # Check if finding_remainder contains ann_remainder (for UUID match)
-                    if ann_remainder in finding_remainder:
-                        return True
-
-        return False
+        For repeated lookups build one ExceptionIndex and reuse it.
+        """
+        return ExceptionIndex(annotations).is_exceptioned(entity_key)
 
     def _diff_findings(
         self,
@@ -559,194 +655,189 @@ class StatsService:
         Returns:
             DiffResult with counts
         """
+        new_index = ExceptionIndex(new_annotations)
+        old_index = (
+            new_index
+            if old_annotations is new_annotations
+            else ExceptionIndex(old_annotations)
+        )
+        result = self._diff_classified(
+            self.classify_findings(old_findings, old_index),
+            self.classify_findings(new_findings, new_index),
+            valid_instances,
+        )
+        self._diff_docs(result, old_annotations, new_annotations, valid_instances)
+        return result
+
+    def _diff_classified(
+        self,
+        old_records: list[ClassifiedFinding],
+        new_records: list[ClassifiedFinding],
+        valid_instances: set[str],
+    ) -> DiffResult:
+        """
+        Diff two classified findings lists using the state machine.
+
+        Args:
+            old_records: Previous findings, already classified
+            new_records: Current findings, already classified
+            valid_instances: Set of scanned instance keys
+
+        Returns:
+            DiffResult with status/exception transition counts
+        """
         result = DiffResult()
 
         # Build maps for efficient lookup
-        old_map = {f["entity_key"]: f for f in old_findings}
-        new_map = {f["entity_key"]: f for f in new_findings}
+        old_map = {r.key: r for r in old_records}
+        new_map = {r.key: r for r in new_records}
 
         # Check for instance validity
-        check_validity = len(valid_instances) > 0
-
-        # Process old → new transitions
-        for key, old_f in old_map.items():
-            old_status = FindingStatus.from_string(old_f.get("status"))
+        valid_lower = {v.lower() for v in valid_instances}
 
-            # Check instance validity
-            instance_scanned = True
-            if check_validity:
-                instance_scanned = self._is_valid_instance_key(key, valid_instances)
+        # Transitions only depend on these flags, so classify each combination once
+        transitions: dict[tuple, ChangeType] = {}
 
-            if key in new_map:
-                new_f = new_map[key]
-                new_status = FindingStatus.from_string(new_f.get("status"))
-            else:
-                new_status = None  # Item disappeared
-
-            # Get exception states
-            # Use same annotations for old check because annotations are persistent/timeless
-            old_excepted = self._is_exceptioned(key, old_annotations)
-            new_excepted = self._is_exceptioned(key, new_annotations)
-
-            # Classify transition
-            transition = classify_finding_transition(
-                old_status=old_status,
-                new_status=new_status,
-                old_has_exception=old_excepted,
-                new_has_exception=new_excepted,
-                instance_was_scanned=instance_scanned,
+        # Process old → new transitions
+        for key, old_r in old_map.items():
+            instance_scanned = (
+                not valid_lower or self._key_in_instances(key, valid_lower)
             )
 
-            # Count by type
-            from autodbaudit.domain.change_types import ChangeType
+            new_r = new_map.get(key)
+            new_status = new_r.status if new_r else None  # None: item disappeared
+            new_excepted = new_r.exceptioned if new_r else False
 
-            # Resolve sheet name from finding_type (not entity_key which lacks type prefix)
-            finding_type = old_f.get("finding_type", "")
-            sheet_name = self._get_sheet_name_from_finding_type(finding_type)
-
-            # Fallback
-            if not sheet_name:
-                sheet_name = self._get_sheet_name_from_key(key)
-
-            if sheet_name:
-                if sheet_name not in result.sheet_stats:
-                    result.sheet_stats[sheet_name] = defaultdict(int)
-                stats = result.sheet_stats[sheet_name]
-
-            if transition.change_type == ChangeType.FIXED:
+            flags = (
+                old_r.status,
+                new_status,
+                old_r.exceptioned,
+                new_excepted,
+                instance_scanned,
+            )
+            change_type = transitions.get(flags)
+            if change_type is None:
+                change_type = classify_finding_transition(
+                    old_status=old_r.status,
+                    new_status=new_status,
+                    old_has_exception=old_r.exceptioned,
+                    new_has_exception=new_excepted,
+                    instance_was_scanned=instance_scanned,
+                ).change_type
+                transitions[flags] = change_type
+
+            stats = None
+            if old_r.sheet:
+                stats = result.sheet_stats.get(old_r.sheet)
+                if stats is None:
+                    stats = result.sheet_stats[old_r.sheet] = defaultdict(int)
+
+            if change_type == ChangeType.FIXED:
                 result.fixed += 1
-                if sheet_name:
+                if stats is not None:
                     stats["fixed"] += 1
-            elif transition.change_type == ChangeType.REGRESSION:
+            elif change_type == ChangeType.REGRESSION:
                 result.regressions += 1
-                if sheet_name:
+                if stats is not None:
                     stats["regressions"] += 1
-            elif transition.change_type == ChangeType.EXCEPTION_ADDED:
+            elif change_type == ChangeType.EXCEPTION_ADDED:
                 result.exceptions_added += 1
-                if sheet_name:
+                if stats is not None:
                     stats["exceptions_added"] += 1
-            elif transition.change_type == ChangeType.EXCEPTION_REMOVED:
+            elif change_type == ChangeType.EXCEPTION_REMOVED:
                 result.exceptions_removed += 1
-                if sheet_name:
+                if stats is not None:
                     stats["exceptions_removed"] += 1
-            elif transition.change_type == ChangeType.EXCEPTION_UPDATED:
+            elif change_type == ChangeType.EXCEPTION_UPDATED:
                 result.exceptions_updated += 1
-                if sheet_name:
+                if stats is not None:
                     stats["exceptions_updated"] += 1
-            elif transition.change_type == ChangeType.STILL_FAILING:
+            elif change_type == ChangeType.STILL_FAILING:
                 if not new_excepted:  # Only count if not exceptioned
                     result.still_failing += 1
-                    if sheet_name:
+                    if stats is not None:
                         stats["active"] += 1
 
-        # Check for documentation changes (Notes/Dates) on ALL items
-        # This runs independently of status changes
-        if old_annotations and new_annotations:
-            for key, new_ann in new_annotations.items():
-                if check_validity and not self._is_valid_instance_key(
-                    key, valid_instances
-                ):
-                    continue
-
-        # Check for documentation changes (Notes/Dates) on ALL items
-        # This runs independently of status changes
-        if old_annotations and new_annotations:
-            # Check for Additions / Updates
-            for key, new_ann in new_annotations.items():
-                if check_validity and not self._is_valid_instance_key(
-                    key, valid_instances
-                ):
-                    continue
-
-                new_has = self._has_docs(new_ann)
-
-                if key not in old_annotations:
-                    # New annotation key
-                    if new_has:
-                        result.docs_added += 1
-                else:
-                    # Existing annotation key
-                    old_ann = old_annotations[key]
-                    old_has = self._has_docs(old_ann)
-
-                    if not old_has and new_has:
-                        # Existing key, but docs newly added
-                        result.docs_added += 1
-                    elif old_has and not new_has:
-                        # Existing key, docs cleared (counted as removed here or below?)
-                        # We handle removed keys below perfectly.
-                        # But if key stays and docs are cleared, we count removed here.
-                        result.docs_removed += 1
-                    elif old_has and new_has:
-                        # Both have docs, check if changed
-                        if self._has_docs_changed(old_ann, new_ann):
-                            result.docs_updated += 1
-
-            # Check for Removed Keys (where key itself disappears)
-            for key, old_ann in old_annotations.items():
-                if check_validity and not self._is_valid_instance_key(
-                    key, valid_instances
-                ):
-                    continue
-
-                if key not in new_annotations:
-                    if self._has_docs(old_ann):
-                        result.docs_removed += 1
-
         # Check for new issues (in new but not in old)
-        for key, new_f in new_map.items():
-            if key not in old_map:
-                new_status = FindingStatus.from_string(new_f.get("status"))
-                if new_status and new_status.is_discrepant():
-                    # Only count if not already exceptioned
-                    if not self._is_exceptioned(key, new_annotations):
-                        result.new_issues += 1
-                        # Track sheet stat for NEW ISSUE (use finding_type, not key)
-                        finding_type = new_f.get("finding_type", "")
-                        sheet_name = self._get_sheet_name_from_finding_type(
-                            finding_type
-                        )
-
-                        # Fallback
-                        if not sheet_name:
-                            sheet_name = self._get_sheet_name_from_key(key)
-
-                        if sheet_name:
-                            if sheet_name not in result.sheet_stats:
-                                result.sheet_stats[sheet_name] = defaultdict(int)
-                            result.sheet_stats[sheet_name]["new_issues"] += 1
+        for key, new_r in new_map.items():
+            if key in old_map:
+                continue
+            new_status = new_r.status
+            # Only count if not already exceptioned
+            if new_status and new_status.is_discrepant() and not new_r.exceptioned:
+                result.new_issues += 1
+                if new_r.sheet:
+                    stats = result.sheet_stats.get(new_r.sheet)
+                    if stats is None:
+                        stats = result.sheet_stats[new_r.sheet] = defaultdict(int)
+                    stats["new_issues"] += 1
 
         return result
 
+    def _diff_docs(
+        self,
+        result: DiffResult,
+        old_annotations: dict[str, dict],
+        new_annotations: dict[str, dict],
+        valid_instances: set[str],
+    ) -> None:
+        """
+        Count documentation changes (Notes/Dates) on ALL items.
+
+        This runs independently of status changes. When both sides are the
+        same annotation snapshot nothing can have changed, so it is skipped.
+        """
+        if not old_annotations or not new_annotations:
+            return
+        if old_annotations is new_annotations:
+            return
+
+        valid_lower = {v.lower() for v in valid_instances}
+
+        # Check for Additions / Updates
+        for key, new_ann in new_annotations.items():
+            if valid_lower and not self._key_in_instances(key, valid_lower):
+                continue
+
+            new_has = self._has_docs(new_ann)
+
+            if key not in old_annotations:
+                # New annotation key
+                if new_has:
+                    result.docs_added += 1
+            else:
+                # Existing annotation key
+                old_ann = old_annotations[key]
+                old_has = self._has_docs(old_ann)
+
+                if not old_has and new_has:
+                    # Existing key, but docs newly added
+                    result.docs_added += 1
+                elif old_has and not new_has:
+                    # Existing key, docs cleared
+                    result.docs_removed += 1
+                elif old_has and new_has:
+                    # Both have docs, check if changed
+                    if self._has_docs_changed(old_ann, new_ann):
+                        result.docs_updated += 1
+
+        # Check for Removed Keys (where key itself disappears)
+        for key, old_ann in old_annotations.items():
+            if valid_lower and not self._key_in_instances(key, valid_lower):
+                continue
+
+            if key not in new_annotations:
+                if self._has_docs(old_ann):
+                    result.docs_removed += 1
+
     def _get_sheet_name_from_key(self, key: str) -> str:
         """Derive readable sheet name from entity key prefix."""
-        # This mapping should match SHEET_ANNOTATION_CONFIG keys in annotation_sync
-        # or be readable enough for the user.
         parts = key.split("|")
         if not parts:
             return "Unknown"
 
         etype = parts[0].lower()
-        mapping = {
-            "instance": "Instances",
-            "sa_account": "SA Account",
-            "login": "Server Logins",
-            "server_role_member": "Sensitive Roles",
-            "config": "Configuration",
-            "service": "Services",
-            "database": "Databases",
-            "db_user": "Database Users",
-            "db_role": "Database Roles",
-            "permission": "Permission Grants",
-            "orphaned_user": "Orphaned Users",
-            "linked_server": "Linked Servers",
-            "trigger": "Triggers",
-            "protocol": "Client Protocols",
-            "backup": "Backups",
-            "audit_settings": "Audit Settings",
-            "encryption": "Encryption",
-        }
-        return mapping.get(etype, etype.capitalize())
+        return KEY_PREFIX_SHEETS.get(etype, etype.capitalize())
 
     def _get_sheet_name_from_finding_type(self, finding_type: str) -> str:
         """Derive readable sheet name from finding_type field directly."""
@@ -754,37 +845,7 @@ class StatsService:
             return ""
 
         etype = finding_type.lower().strip()
-        # Comprehensive mapping - MUST cover all entity types in the system
-        mapping = {
-            # Instance-level
-            "instance": "Instances",
-            "version": "Instances",
-            # Security findings
-            "sa_account": "Server Logins",
-            "login": "Server Logins",
-            "server_role_member": "Sensitive Roles",
-            "role_member": "Sensitive Roles",
-            "sensitive_role": "Sensitive Roles",
-            # Configuration
-            "config": "Configuration",
-            "service": "Services",
-            "protocol": "Client Protocols",
-            "audit_settings": "Audit Settings",
-            # Database-level
-            "database": "Databases",
-            "db_user": "Database Users",
-            "db_role": "Database Roles",
-            "db_role_member": "Database Roles",
-            "permission": "Permission Grants",
-            "db_permission": "Permission Grants",
-            "orphaned_user": "Orphaned Users",
-            # Infrastructure
-            "linked_server": "Linked Servers",
-            "trigger": "Triggers",
-            "backup": "Backups",
-            "encryption": "Encryption",
-        }
-        return mapping.get(etype, etype.replace("_", " ").title())
+        return FINDING_TYPE_SHEETS.get(etype, etype.replace("_", " ").title())
 
     def _has_docs(self, fields: dict) -> bool:
         """Check if annotation has non-exception documentation (Notes/Date)."""
@@ -828,21 +889,22 @@ class StatsService:
         if not valid_instances:
             return True  # If no validation, assume valid
 
-        key_lower = entity_key.lower()
-        parts = key_lower.split("|")
+        return self._key_in_instances(
+            entity_key, {valid.lower() for valid in valid_instances}
+        )
 
-        for valid in valid_instances:
-            valid_lower = valid.lower()
+    @staticmethod
+    def _key_in_instances(entity_key: str, valid_lower: set[str]) -> bool:
+        """Check an entity key against pre-lowercased 'server|instance' keys."""
+        parts = entity_key.lower().split("|")
 
-            # Try Type|Server|Instance format
-            if len(parts) >= 3:
-                if f"{parts[1]}|{parts[2]}" == valid_lower:
-                    return True
+        # Try Type|Server|Instance format
+        if len(parts) >= 3 and f"{parts[1]}|{parts[2]}" in valid_lower:
+            return True
 
-            # Try Server|Instance format
-            if len(parts) >= 2:
-                if f"{parts[0]}|{parts[1]}" == valid_lower:
-                    return True
+        # Try Server|Instance format
+        if len(parts) >= 2 and f"{parts[0]}|{parts[1]}" in valid_lower:
+            return True
 
         return False
 
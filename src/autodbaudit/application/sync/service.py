@@ -120,6 +120,17 @@ class AnnotationSyncService:
         """
         return self.load_from_db()
 
+    def get_annotations_as_of(self, run_id: int) -> dict[str, dict] | None:
+        """
+        Load annotations as they were at the end of a sync run.
+
+        Returns:
+            Dict of {entity_type|entity_key: {field_name: value}}, or None
+            if no snapshot was recorded for that run
+        """
+        from autodbaudit.utils.database import load_annotations_as_of
+        return load_annotations_as_of(self.db_path, run_id)
+
     def detect_exception_changes(
         self,
         old_annotations: dict[str, dict],
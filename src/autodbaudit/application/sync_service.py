@@ -21,6 +21,7 @@ from typing import Any, TYPE_CHECKING
 
 from autodbaudit.infrastructure.sqlite import HistoryStore
 from autodbaudit.infrastructure.excel import EnhancedReportWriter
+from autodbaudit.infrastructure.excel.carry_forward import read_instance_rows
 
 # Domain types
 from autodbaudit.domain.change_types import (
@@ -39,6 +40,7 @@ from autodbaudit.application.actions.action_detector import (
     consolidate_actions,
 )
 from autodbaudit.application.actions.action_recorder import ActionRecorder
+from autodbaudit.application.rescan_planner import RescanPlan, plan_targeted_rescan
 
 if TYPE_CHECKING:
     from autodbaudit.application.audit_service import AuditService
@@ -107,10 +109,17 @@ class SyncService:
         targets_file: str | None = "sql_targets.json",
         audit_manager: Any = None,
         audit_id: int | None = None,
+        targeted: bool = False,
+        only_targets: list[str] | None = None,
     ) -> dict:
         """
         Execute sync operation.
 
+        Args:
+            targeted: Only rescan instances with pending work (open findings,
+                executed remediation scripts); carry the rest forward
+            only_targets: Target names that must be rescanned (implies targeted)
+
         Returns dict with status, stats, and report path.
         """
         # ─────────────────────────────────────────────────────────────
@@ -195,6 +204,27 @@ class SyncService:
                     config_dir=Path("config"), output_dir=Path("output")
                 )
 
+            # Targeted sync: decide which instances actually need a rescan
+            previous_run_id = self.get_latest_run_id()
+            plan: RescanPlan | None = None
+            if (targeted or only_targets) and previous_run_id:
+                # Carried instances are copied from the previous report
+                if not (input_excel and input_excel.exists()):
+                    msg = (
+                        f"Targeted sync needs the previous report ({input_excel}). "
+                        "Run a full sync (without --targeted/--only) instead."
+                    )
+                    logger.error(msg)
+                    print(f"\n{RED}⛔ {msg}{RESET}")
+                    return {"error": "Previous report not found"}
+                plan = self._plan_rescan(
+                    audit_service,
+                    targets_file,
+                    previous_run_id,
+                    current_annotations or annot_sync.load_from_db(),
+                    only_targets,
+                )
+
             # Prepare writer
             writer = EnhancedReportWriter()
             baseline_org = run.organization if run else "Unspecified"
@@ -208,8 +238,14 @@ class SyncService:
             )
 
             try:
+                audit_kwargs = {}
+                if plan is not None:
+                    audit_kwargs["target_filter"] = plan.includes
                 processed_writer = audit_service.run_audit(
-                    targets_file=targets_file, writer=writer, skip_save=True
+                    targets_file=targets_file,
+                    writer=writer,
+                    skip_save=True,
+                    **audit_kwargs,
                 )
             except Exception as e:
                 logger.error("Re-audit failed: %s", e)
@@ -231,6 +267,12 @@ class SyncService:
             if current_run_id != initial_run_id:
                 self.store.mark_run_as_sync(current_run_id)
 
+            # Instances skipped by a targeted sync keep their last findings
+            if plan is not None and current_run_id != previous_run_id:
+                self.store.carry_forward_instances(
+                    previous_run_id, current_run_id, plan.carried_instance_ids
+                )
+
             # ─────────────────────────────────────────────────────────────
             # PHASE 4: Diff Findings
             # ─────────────────────────────────────────────────────────────
@@ -407,6 +449,12 @@ class SyncService:
             fixed_conn.commit()
             fixed_conn.close()
 
+            # Snapshot annotations for this run so later syncs can diff
+            # documentation against it (point-in-time reads)
+            self.store.record_annotation_versions(
+                current_run_id, annot_sync.load_from_db()
+            )
+
             # ─────────────────────────────────────────────────────────────
             # PHASE 6: Calculate Stats
             # ─────────────────────────────────────────────────────────────
@@ -512,7 +560,16 @@ class SyncService:
                     action_id=aid if aid.isdigit() else None,
                 )
 
-            # Save report
+            # Save report (carried-forward rows are read before it is overwritten)
+            if plan is not None and plan.carried:
+                carried_ids = set(plan.carried_instance_ids)
+                processed_writer.add_carried_rows(
+                    read_instance_rows(input_excel, plan.carried_report_keys),
+                    findings=[
+                        f for f in current_findings if f.get("instance_id") in carried_ids
+                    ],
+                )
+
             if hasattr(processed_writer, "save"):
                 processed_writer.save(final_excel)
 
@@ -533,6 +590,11 @@ class SyncService:
                 "stats_obj": stats,  # Return object for CLI renderer
                 "report_path": str(final_excel),
                 "actions_recorded": recorded,
+                "targeted": (
+                    {"rescanned": len(plan.rescan), "carried": len(plan.carried)}
+                    if plan is not None
+                    else None
+                ),
                 # Legacy compatibility fields
                 "exceptions": stats.exceptions_added_since_last,
                 "total_exceptions": stats.documented_exceptions,
@@ -564,6 +626,32 @@ class SyncService:
                 self.store.fail_audit_run(possible_run, f"Critical Failure: {str(e)}")
             return {"error": f"Sync failed: {e}"}
 
+    def _plan_rescan(
+        self,
+        audit_service: "AuditService",
+        targets_file: str,
+        previous_run_id: int,
+        annotations: dict,
+        only_targets: list[str] | None,
+    ) -> RescanPlan:
+        """Build and print the targeted rescan plan."""
+        targets = audit_service.config_loader.load_sql_targets(targets_file)
+        plan = plan_targeted_rescan(
+            store=self.store,
+            previous_run_id=previous_run_id,
+            targets=targets,
+            annotations=annotations,
+            only=only_targets,
+        )
+
+        print(
+            f"\n{CYAN}🎯 Targeted sync: rescanning {len(plan.rescan)} of "
+            f"{len(plan.rescan) + len(plan.carried)} targets{RESET}"
+        )
+        for name, why in plan.reasons.items():
+            print(f"   • {name}: {', '.join(why)}")
+        return plan
+
 
 def create_exception_action(
     change_type: ChangeType,
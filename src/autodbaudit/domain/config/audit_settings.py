@@ -87,6 +87,18 @@ class AuditSettings(BaseModel):
         le=20
     )
 
+    enable_reachability_prescan: bool = Field(
+        default=True,
+        description="Whether to TCP-probe all targets before preparing them"
+    )
+
+    prescan_timeout_ms: int = Field(
+        default=750,
+        description="Per-connect timeout in milliseconds for the reachability pre-scan",
+        ge=50,
+        le=10000
+    )
+
     enable_fallback_scripts: bool = Field(
         default=True,
         description="Whether to generate PowerShell fallback scripts when remoting fails"
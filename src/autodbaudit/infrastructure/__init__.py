@@ -11,20 +11,7 @@ Contains all I/O and external system integrations:
 - Version-specific query providers
 """
 
-from autodbaudit.infrastructure.config_loader import (
-    ConfigLoader,
-    SqlTarget,
-    AuditConfig,
-)
-from autodbaudit.infrastructure.sql import (
-    SqlConnector,
-    QueryProvider,
-    get_query_provider,
-)
-from autodbaudit.infrastructure.sql.connector import SqlServerInfo
-from autodbaudit.infrastructure.logging_config import setup_logging
-from autodbaudit.infrastructure.odbc_check import check_odbc_drivers
-from autodbaudit.infrastructure.sqlite import HistoryStore
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = [
     # Config
@@ -44,3 +31,17 @@ __all__ = [
     # History
     "HistoryStore",
 ]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ConfigLoader": "autodbaudit.infrastructure.config_loader",
+    "SqlTarget": "autodbaudit.infrastructure.config_loader",
+    "AuditConfig": "autodbaudit.infrastructure.config_loader",
+    "SqlConnector": "autodbaudit.infrastructure.sql",
+    "QueryProvider": "autodbaudit.infrastructure.sql",
+    "get_query_provider": "autodbaudit.infrastructure.sql",
+    "SqlServerInfo": "autodbaudit.infrastructure.sql.connector",
+    "setup_logging": "autodbaudit.infrastructure.logging_config",
+    "check_odbc_drivers": "autodbaudit.infrastructure.odbc_check",
+    "HistoryStore": "autodbaudit.infrastructure.sqlite",
+})
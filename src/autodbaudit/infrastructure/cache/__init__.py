@@ -4,5 +4,6 @@ Ultra-granular caching components.
 """
 
 from autodbaudit.infrastructure.cache.os_data_manager import OsDataCacheManager, CachedOsData
+from autodbaudit.infrastructure.cache.os_data_store import OsDataStore
 
-__all__ = ["OsDataCacheManager", "CachedOsData"]
+__all__ = ["OsDataCacheManager", "CachedOsData", "OsDataStore"]
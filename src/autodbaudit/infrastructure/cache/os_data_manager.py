@@ -53,7 +53,7 @@ class OsDataCacheManager:
             }
 
             cache_path.write_text(
-                json.dumps(cache_obj, indent=2, default=str),
+                json.dumps(cache_obj, separators=(",", ":"), default=str),
                 encoding="utf-8"
             )
 
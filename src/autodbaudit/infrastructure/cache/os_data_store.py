@@ -0,0 +1,227 @@
+"""
+OS Data Store micro-component.
+Fleet-wide OS data cache in one indexed SQLite table.
+
+Replaces one pretty-printed JSON file per target: rows hold zlib-compressed
+compact JSON, carry collected_at/expires_at (both indexed), and are loaded
+into memory once so lookups never touch the disk again. Without a db_path
+the store keeps entries in memory only.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from autodbaudit.infrastructure.cache.os_data_manager import CachedOsData
+from autodbaudit.infrastructure.remediation.results import Result, Success, Failure
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OS_DATA_TTL_SECONDS = 7 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS os_data_cache (
+    target_id TEXT PRIMARY KEY,
+    hostname TEXT,
+    payload BLOB NOT NULL,
+    collected_at TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_os_data_cache_collected ON os_data_cache(collected_at);
+CREATE INDEX IF NOT EXISTS idx_os_data_cache_expires ON os_data_cache(expires_at);
+CREATE INDEX IF NOT EXISTS idx_os_data_cache_host ON os_data_cache(hostname);
+"""
+
+
+def _encode(data: dict[str, Any]) -> bytes:
+    return zlib.compress(json.dumps(data, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _decode(payload: bytes) -> dict[str, Any]:
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+class OsDataStore:
+    """
+    SQLite-backed OS data cache served from memory.
+    Railway-oriented: returns Success with cached data or Failure.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        ttl_seconds: float = DEFAULT_OS_DATA_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the store (nothing is read until the first lookup).
+
+        Args:
+            db_path: SQLite database file, normally <output_dir>/audit_history.db
+                (None = memory only)
+            ttl_seconds: Age after which entries are no longer served
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[CachedOsData, float]] | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _loaded(self) -> dict[str, tuple[CachedOsData, float]]:
+        """All unexpired entries, read from the database on first use."""
+        with self._lock:
+            if self._entries is not None:
+                return self._entries
+            entries: dict[str, tuple[CachedOsData, float]] = {}
+            rows = []
+            if self.db_path is not None:
+                conn = self._connect()
+                try:
+                    rows = conn.execute(
+                        "SELECT target_id, payload, collected_at, expires_at "
+                        "FROM os_data_cache WHERE expires_at > ?",
+                        (time.time(),),
+                    ).fetchall()
+                finally:
+                    conn.close()
+            for target_id, payload, collected_at, expires_at in rows:
+                try:
+                    entries[target_id] = (
+                        CachedOsData(
+                            target_id=target_id,
+                            data=_decode(payload),
+                            collected_at=datetime.fromisoformat(collected_at),
+                        ),
+                        float(expires_at),
+                    )
+                except (ValueError, zlib.error) as exc:
+                    logger.debug("Skipping unreadable OS data entry %s: %s", target_id, exc)
+            logger.debug("Loaded %d cached OS data entries", len(entries))
+            self._entries = entries
+            return entries
+
+    def store(self, target_id: str, data: dict[str, Any]) -> Result[bool, str]:
+        """Store OS data for one target."""
+        return self.store_many({target_id: data})
+
+    def store_many(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        hostnames: Mapping[str, str] | None = None,
+    ) -> Result[bool, str]:
+        """
+        Store OS data for many targets in one transaction.
+
+        Args:
+            items: target_id -> OS data
+            hostnames: Optional target_id -> hostname (indexed, for per-host lookups)
+        """
+        if not items:
+            return Success(True)
+        collected = datetime.now(timezone.utc)
+        expires_at = time.time() + self.ttl_seconds
+        hostnames = hostnames or {}
+        try:
+            rows = [
+                (
+                    target_id,
+                    hostnames.get(target_id),
+                    _encode(data),
+                    collected.isoformat(),
+                    expires_at,
+                )
+                for target_id, data in items.items()
+            ]
+            entries = self._loaded()
+            if self.db_path is not None:
+                conn = self._connect()
+                try:
+                    with conn:
+                        conn.executemany(
+                            """
+                            INSERT INTO os_data_cache
+                                (target_id, hostname, payload, collected_at, expires_at)
+                            VALUES (?, ?, ?, ?, ?)
+                            ON CONFLICT(target_id) DO UPDATE SET
+                                hostname = excluded.hostname,
+                                payload = excluded.payload,
+                                collected_at = excluded.collected_at,
+                                expires_at = excluded.expires_at
+                            """,
+                            rows,
+                        )
+                finally:
+                    conn.close()
+            with self._lock:
+                for target_id, data in items.items():
+                    entries[target_id] = (
+                        CachedOsData(target_id=target_id, data=data, collected_at=collected),
+                        expires_at,
+                    )
+            logger.debug("Cached OS data for %d targets", len(rows))
+            return Success(True)
+        except Exception as e:
+            return Failure(f"Failed to cache OS data for {len(items)} targets: {str(e)}")
+
+    def retrieve(self, target_id: str) -> Result[CachedOsData | None, str]:
+        """
+        Retrieve cached OS data from memory.
+        Returns Success with cached data or None if not found/expired, or Failure on error.
+        """
+        try:
+            entry = self._loaded().get(target_id)
+        except Exception as e:
+            return Failure(f"Failed to retrieve cached data for {target_id}: {str(e)}")
+        if entry is None or entry[1] <= time.time():
+            return Success(None)
+        return Success(entry[0])
+
+    def retrieve_many(self, target_ids: Iterable[str]) -> Result[dict[str, CachedOsData], str]:
+        """Retrieve cached OS data for many targets (missing/expired ones are omitted)."""
+        try:
+            entries = self._loaded()
+        except Exception as e:
+            return Failure(f"Failed to load cached OS data: {str(e)}")
+        now = time.time()
+        return Success({
+            target_id: entries[target_id][0]
+            for target_id in target_ids
+            if target_id in entries and entries[target_id][1] > now
+        })
+
+    def purge_expired(self) -> Result[int, str]:
+        """Delete expired rows; returns how many were removed."""
+        now = time.time()
+        removed = 0
+        if self.db_path is not None:
+            try:
+                conn = self._connect()
+                try:
+                    with conn:
+                        removed = conn.execute(
+                            "DELETE FROM os_data_cache WHERE expires_at <= ?", (now,)
+                        ).rowcount
+                finally:
+                    conn.close()
+            except Exception as e:
+                return Failure(f"Failed to purge OS data cache: {str(e)}")
+        with self._lock:
+            if self._entries is not None:
+                expired = [t for t, (_, exp) in self._entries.items() if exp <= now]
+                for target_id in expired:
+                    del self._entries[target_id]
+                if self.db_path is None:
+                    removed = len(expired)
+        return Success(max(removed, 0))
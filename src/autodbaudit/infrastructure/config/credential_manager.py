@@ -7,10 +7,12 @@ encryption/decryption capabilities and secure storage patterns.
 
 import base64
 import hashlib
+import hmac
 import json
 import logging
 import secrets
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -18,17 +20,25 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from pydantic import SecretStr
 
 from autodbaudit.domain.config.models import Credential
+from .key_agent import KeyAgent, key_id_for_salt  # pylint: disable=relative-beyond-top-level
 from .repository import ConfigRepository  # pylint: disable=relative-beyond-top-level
 
 logger = logging.getLogger(__name__)
 
+# Keys derived in this process: (salt, password digest, iterations) -> key.
+# Never persisted; spares every further CredentialManager the PBKDF2 run.
+_derived_keys: Dict[Tuple[bytes, bytes, int], bytes] = {}
+_derived_keys_lock = threading.Lock()
+
 
 class CredentialManager:
     """
     Manager for secure credential operations.
 
     Provides encryption/decryption of credentials and secure storage patterns.
-    Uses PBKDF2 key derivation and Fernet symmetric encryption.
+    Uses PBKDF2 key derivation and Fernet symmetric encryption. Derived keys
+    are reused within the process and, with a key agent, across processes
+    for the agent's session lifetime.
     """
 
     # Key derivation parameters
@@ -36,16 +46,23 @@ class CredentialManager:
     ITERATIONS = 100000
     KEY_LENGTH = 32
 
-    def __init__(self, repository: ConfigRepository, master_password: Optional[str] = None):
+    def __init__(
+        self,
+        repository: ConfigRepository,
+        master_password: Optional[str] = None,
+        key_agent: Optional[KeyAgent] = None,
+    ):
         """
         Initialize the credential manager.
 
         Args:
             repository: Config repository for file operations
             master_password: Master password for encryption (optional, will prompt if needed)
+            key_agent: Session key agent; with an unlocked session no master password is needed
         """
         self.repository = repository
         self.master_password = master_password
+        self.key_agent = key_agent
         self._encryption_key: Optional[bytes] = None
         self._salt: Optional[bytes] = None
 
@@ -111,12 +128,51 @@ class CredentialManager:
         if self._encryption_key is not None:
             return self._encryption_key
 
-        if not self.master_password:
-            raise ValueError("Master password required for credential encryption")
-
         salt = self._get_or_create_salt()
-        self._encryption_key = self._derive_key(self.master_password, salt)
-        return self._encryption_key
+        key_id = key_id_for_salt(salt)
+
+        if self.master_password:
+            cache_key = (
+                salt,
+                hmac.new(salt, self.master_password.encode(), hashlib.sha256).digest(),
+                self.ITERATIONS,
+            )
+            with _derived_keys_lock:
+                key = _derived_keys.get(cache_key)
+            if key is None:
+                key = self._derive_key(self.master_password, salt)
+                with _derived_keys_lock:
+                    _derived_keys[cache_key] = key
+            if self.key_agent is not None:
+                self.key_agent.store_key(key_id, key)
+            self._encryption_key = key
+            return key
+
+        # No password given: an unlocked agent session can still supply the key
+        if self.key_agent is not None:
+            key = self.key_agent.get_key(key_id)
+            if key is not None:
+                logger.debug("Using encryption key from key agent session")
+                self._encryption_key = key
+                return key
+
+        raise ValueError("Master password required for credential encryption")
+
+    def lock(self) -> bool:
+        """
+        End the key agent session and forget the key held by this manager.
+
+        Returns:
+            True if a key agent session was ended (or none could exist yet)
+        """
+        self._encryption_key = None
+        if self.key_agent is None:
+            return False
+        salt_file = self.repository.config_dir / "credentials" / ".salt"
+        if self._salt is None and not salt_file.exists():
+            return True  # No credential store yet, so no session to end
+        self.key_agent.forget(key_id_for_salt(self._get_or_create_salt()))
+        return True
 
     def encrypt_credential(self, credential: Credential) -> Dict[str, Any]:
         """
@@ -168,42 +224,51 @@ class CredentialManager:
         """
         try:
             if not encrypted_data.get("encrypted", False):
-                # Handle unencrypted legacy format
-                return Credential(
-                    username=encrypted_data["username"],
-                    password=SecretStr(encrypted_data["password"])
-                )
+                return self._decrypt_with(None, "", encrypted_data)
 
-            key = self._get_encryption_key()
-            fernet = Fernet(key)
+            fernet = Fernet(self._get_encryption_key())
+            salt_hash = hashlib.sha256(self._get_or_create_salt()).hexdigest()
+            return self._decrypt_with(fernet, salt_hash, encrypted_data)
+        except Exception as e:
+            logger.error("Failed to decrypt credential: %s", e)
+            raise ValueError(f"Credential decryption failed: {e}") from e
 
-            # Verify salt hash if present
-            if "salt_hash" in encrypted_data:
-                expected_hash = hashlib.sha256(self._get_or_create_salt()).hexdigest()
-                if encrypted_data["salt_hash"] != expected_hash:
-                    raise ValueError("Salt hash mismatch - credential may be corrupted")
+    @staticmethod
+    def _decrypt_with(
+        fernet: Optional[Fernet], salt_hash: str, encrypted_data: Dict[str, str]
+    ) -> Credential:
+        """Decrypt one credential with an already constructed Fernet."""
+        if not encrypted_data.get("encrypted", False):
+            # Handle unencrypted legacy format
+            return Credential(
+                username=encrypted_data["username"],
+                password=SecretStr(encrypted_data["password"])
+            )
+        if fernet is None:
+            raise ValueError("Encryption key required for encrypted credential")
 
-            # Decrypt the data
-            encrypted_bytes = base64.b64decode(encrypted_data["data"])
-            decrypted_bytes = fernet.decrypt(encrypted_bytes)
-            decrypted_str = decrypted_bytes.decode()
+        # Verify salt hash if present
+        if "salt_hash" in encrypted_data and encrypted_data["salt_hash"] != salt_hash:
+            raise ValueError("Salt hash mismatch - credential may be corrupted")
 
-            # Parse the decrypted JSON data safely
-            try:
-                data = json.loads(decrypted_str)
-            except json.JSONDecodeError:
-                # Fallback for legacy format that might not be proper JSON
-                # Extract username and password from string representation
-                import ast
-                data = ast.literal_eval(decrypted_str)
+        # Decrypt the data
+        encrypted_bytes = base64.b64decode(encrypted_data["data"])
+        decrypted_bytes = fernet.decrypt(encrypted_bytes)
+        decrypted_str = decrypted_bytes.decode()
 
-            return Credential(
-                username=data["username"],
-                password=SecretStr(data["password"])
-            )
-        except Exception as e:
-            logger.error("Failed to decrypt credential: %s", e)
-            raise ValueError(f"Credential decryption failed: {e}") from e
+        # Parse the decrypted JSON data safely
+        try:
+            data = json.loads(decrypted_str)
+        except json.JSONDecodeError:
+            # Fallback for legacy format that might not be proper JSON
+            # Extract username and password from string representation
+            import ast
+            data = ast.literal_eval(decrypted_str)
+
+        return Credential(
+            username=data["username"],
+            password=SecretStr(data["password"])
+        )
 
     def save_encrypted_credential(self, cred_ref: str, credential: Credential) -> None:
         """
@@ -246,6 +311,62 @@ class CredentialManager:
             logger.error("Failed to load decrypted credential '%s': %s", cred_ref, e)
             raise ValueError(f"Failed to load credential '{cred_ref}': {e}") from e
 
+    def load_decrypted_credentials(
+        self, cred_refs: Iterable[str], strict: bool = True
+    ) -> Dict[str, Credential]:
+        """
+        Load and decrypt many credentials in one pass.
+
+        The key is resolved once and one Fernet instance decrypts every
+        credential; each distinct reference is read once.
+
+        Args:
+            cred_refs: Reference names (duplicates are loaded once)
+            strict: Raise if any credential fails; otherwise skip failures
+
+        Returns:
+            Dict of reference name -> decrypted Credential
+
+        Raises:
+            ValueError: If strict and any credential cannot be loaded or decrypted
+        """
+        refs = list(dict.fromkeys(cred_refs))
+        payloads: Dict[str, Dict[str, str]] = {}
+        failures: Dict[str, str] = {}
+        for cred_ref in refs:
+            try:
+                payloads[cred_ref] = self.repository.load_json_file(f"credentials/{cred_ref}")
+            except Exception as e:
+                failures[cred_ref] = str(e)
+
+        fernet: Optional[Fernet] = None
+        salt_hash = ""
+        if any(data.get("encrypted", False) for data in payloads.values()):
+            try:
+                fernet = Fernet(self._get_encryption_key())
+                salt_hash = hashlib.sha256(self._get_or_create_salt()).hexdigest()
+            except Exception as e:
+                if strict:
+                    raise ValueError(f"Credential decryption failed: {e}") from e
+                logger.error("Cannot decrypt encrypted credentials: %s", e)
+
+        credentials: Dict[str, Credential] = {}
+        for cred_ref, data in payloads.items():
+            try:
+                credentials[cred_ref] = self._decrypt_with(fernet, salt_hash, data)
+            except Exception as e:
+                failures[cred_ref] = str(e)
+
+        if failures:
+            for cred_ref, reason in failures.items():
+                logger.error("Failed to load decrypted credential '%s': %s", cred_ref, reason)
+            if strict:
+                raise ValueError(
+                    f"Failed to load credentials: {', '.join(sorted(failures))}"
+                )
+        logger.debug("Loaded %d decrypted credentials", len(credentials))
+        return credentials
+
     def migrate_legacy_credentials(self, master_password: str) -> Dict[str, str]:
         """
         Migrate legacy unencrypted credentials to encrypted format.
@@ -0,0 +1,255 @@
+"""
+Session key agent for credential encryption keys.
+
+Deriving the Fernet key from the master password (PBKDF2, 100k rounds)
+costs a noticeable fraction of a second, and every new CLI process paid
+it again. A key agent keeps the derived key for a session lifetime so
+later processes decrypt credentials without re-deriving (or re-prompting
+for) the master password, similar to ssh-agent:
+
+- KeyringKeyAgent: OS keyring via the optional ``keyring`` package
+  (Windows Credential Manager, macOS Keychain, Secret Service).
+- FileKeyAgent: a file only the current user can read, in the per-user
+  runtime directory. On Windows the key is encrypted with DPAPI, so this
+  backend is only available there when pywin32 is installed.
+
+Agents are opt-in. AUTODBAUDIT_KEY_AGENT selects one (off, auto, keyring,
+file) and AUTODBAUDIT_KEY_SESSION_SECONDS sets the session lifetime.
+Keys are stored per credential store (identified by its salt) and are
+never written once the session has expired.
+"""
+
+import base64
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+AGENT_ENV_VAR = "AUTODBAUDIT_KEY_AGENT"
+SESSION_ENV_VAR = "AUTODBAUDIT_KEY_SESSION_SECONDS"
+
+DEFAULT_SESSION_SECONDS = 900.0
+
+_KEYRING_SERVICE = "autodbaudit-key-agent"
+
+
+def key_id_for_salt(salt: bytes) -> str:
+    """Identifier of a credential store's key (does not reveal the salt)."""
+    return hashlib.sha256(b"autodbaudit-key-agent:" + salt).hexdigest()[:32]
+
+
+class KeyAgent(ABC):
+    """Keeps derived encryption keys for a limited session."""
+
+    def __init__(self, session_seconds: float = DEFAULT_SESSION_SECONDS) -> None:
+        """
+        Args:
+            session_seconds: How long a stored key stays usable
+        """
+        self.session_seconds = session_seconds
+
+    def get_key(self, key_id: str) -> Optional[bytes]:
+        """Stored key, or None if absent, expired or unreadable."""
+        try:
+            raw = self._load(key_id)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Key agent lookup failed: %s", e)
+            return None
+        if raw is None:
+            return None
+        try:
+            entry = json.loads(raw)
+            if float(entry["expires_at"]) <= time.time():
+                self.forget(key_id)
+                return None
+            return entry["key"].encode("ascii")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug("Dropping unreadable key agent entry: %s", e)
+            self.forget(key_id)
+            return None
+
+    def store_key(self, key_id: str, key: bytes) -> None:
+        """Keep a key for session_seconds; failures only cost the next process a derivation."""
+        if self.session_seconds <= 0:
+            return
+        entry = json.dumps(
+            {"key": key.decode("ascii"), "expires_at": time.time() + self.session_seconds}
+        )
+        try:
+            self._save(key_id, entry)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Key agent could not store the session key: %s", e)
+
+    def forget(self, key_id: str) -> None:
+        """Remove a stored key (ends the session)."""
+        try:
+            self._delete(key_id)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Key agent could not remove key: %s", e)
+
+    @abstractmethod
+    def _load(self, key_id: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def _save(self, key_id: str, entry: str) -> None: ...
+
+    @abstractmethod
+    def _delete(self, key_id: str) -> None: ...
+
+
+class KeyringKeyAgent(KeyAgent):
+    """Key agent backed by the OS keyring (requires the ``keyring`` package)."""
+
+    def __init__(self, session_seconds: float = DEFAULT_SESSION_SECONDS) -> None:
+        super().__init__(session_seconds)
+        import keyring  # pylint: disable=import-outside-toplevel
+
+        self._keyring = keyring
+
+    def _load(self, key_id: str) -> Optional[str]:
+        return self._keyring.get_password(_KEYRING_SERVICE, key_id)
+
+    def _save(self, key_id: str, entry: str) -> None:
+        self._keyring.set_password(_KEYRING_SERVICE, key_id, entry)
+
+    def _delete(self, key_id: str) -> None:
+        try:
+            self._keyring.delete_password(_KEYRING_SERVICE, key_id)
+        except self._keyring.errors.PasswordDeleteError:
+            pass
+
+
+class FileKeyAgent(KeyAgent):
+    """Key agent backed by owner-only files in the per-user runtime directory."""
+
+    def __init__(
+        self,
+        session_seconds: float = DEFAULT_SESSION_SECONDS,
+        directory: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            session_seconds: How long a stored key stays usable
+            directory: Where keys are kept (default: per-user runtime/temp directory)
+
+        Raises:
+            ImportError: On Windows without pywin32. File permissions are not
+                checked there, so keys are only written encrypted with DPAPI.
+        """
+        super().__init__(session_seconds)
+        if os.name == "nt" and importlib.util.find_spec("win32crypt") is None:
+            raise ImportError("pywin32 is required for the file key agent on Windows")
+        self.directory = directory or self._default_directory()
+
+    @staticmethod
+    def _default_directory() -> Path:
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir:
+            return Path(runtime_dir) / "autodbaudit"
+        owner = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+        return Path(tempfile.gettempdir()) / f"autodbaudit-{owner}"
+
+    def _secure_directory(self) -> Path:
+        """Create the directory owner-only; refuse one other users could read."""
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if os.name == "posix":
+            info = self.directory.stat()
+            if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+                raise PermissionError(f"Key agent directory is not private: {self.directory}")
+        return self.directory
+
+    def _path(self, key_id: str) -> Path:
+        return self.directory / f"{key_id}.key"
+
+    def _load(self, key_id: str) -> Optional[str]:
+        path = self._path(key_id)
+        if not path.exists():
+            return None
+        self._secure_directory()
+        return _unprotect(path.read_bytes()).decode("utf-8")
+
+    def _save(self, key_id: str, entry: str) -> None:
+        directory = self._secure_directory()
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".key-")  # Created 0600
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(_protect(entry.encode("utf-8")))
+            os.replace(tmp_name, self._path(key_id))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _delete(self, key_id: str) -> None:
+        self._path(key_id).unlink(missing_ok=True)
+
+
+def _protect(data: bytes) -> bytes:
+    """Encrypt for the current user with DPAPI on Windows; POSIX relies on file modes."""
+    if os.name != "nt":
+        return b"plain:" + base64.b64encode(data)
+    import win32crypt  # pylint: disable=import-outside-toplevel
+
+    return b"dpapi:" + base64.b64encode(win32crypt.CryptProtectData(data, None, None, None, None, 0))
+
+
+def _unprotect(blob: bytes) -> bytes:
+    scheme, _, payload = blob.partition(b":")
+    data = base64.b64decode(payload)
+    if scheme == b"dpapi":
+        import win32crypt  # pylint: disable=import-outside-toplevel
+
+        return win32crypt.CryptUnprotectData(data, None, None, None, 0)[1]
+    if os.name == "nt":
+        raise PermissionError("Refusing an unprotected key agent entry on Windows")
+    return data
+
+
+def get_key_agent(
+    mode: Optional[str] = None, session_seconds: Optional[float] = None
+) -> Optional[KeyAgent]:
+    """
+    Key agent selected by mode (default: AUTODBAUDIT_KEY_AGENT, else off).
+
+    Args:
+        mode: off | auto | keyring | file ("auto" prefers the OS keyring)
+        session_seconds: Session lifetime (default: AUTODBAUDIT_KEY_SESSION_SECONDS or 900)
+
+    Returns:
+        KeyAgent, or None when disabled or the requested backend is unavailable
+    """
+    mode = (mode or os.environ.get(AGENT_ENV_VAR) or "off").strip().lower()
+    if mode in ("off", "none", "0", "false"):
+        return None
+
+    if session_seconds is None:
+        try:
+            session_seconds = float(os.environ.get(SESSION_ENV_VAR, DEFAULT_SESSION_SECONDS))
+        except ValueError:
+            logger.warning("Ignoring invalid %s", SESSION_ENV_VAR)
+            session_seconds = DEFAULT_SESSION_SECONDS
+
+    if mode in ("auto", "keyring"):
+        try:
+            return KeyringKeyAgent(session_seconds)
+        except ImportError:
+            if mode == "keyring":
+                logger.warning("Key agent 'keyring' requested but the keyring package is not installed")
+                return None
+    if mode in ("auto", "file"):
+        try:
+            return FileKeyAgent(session_seconds)
+        except ImportError:
+            logger.warning("Key agent disabled: the file agent needs pywin32 on Windows")
+            return None
+
+    logger.warning("Unknown key agent mode %r; key agent disabled", mode)
+    return None
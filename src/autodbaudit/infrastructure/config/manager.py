@@ -7,7 +7,7 @@ It orchestrates domain models and infrastructure components.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from autodbaudit.domain.config import (
     AuditConfig,
@@ -17,6 +17,9 @@ from autodbaudit.domain.config import (
 )
 from autodbaudit.infrastructure.config.repository import ConfigRepository
 
+if TYPE_CHECKING:
+    from autodbaudit.infrastructure.config.credential_manager import CredentialManager
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,19 +31,25 @@ class ConfigManager:
     all configuration aspects of the application.
     """
 
-    def __init__(self, config_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        config_dir: Optional[Path] = None,
+        credential_manager: Optional["CredentialManager"] = None,
+    ):
         """
         Initialize the config manager.
 
         Args:
             config_dir: Base directory for configuration files.
                        Defaults to 'config' subdirectory of current working directory.
+            credential_manager: Decrypts encrypted credential files in bulk (optional)
         """
         if config_dir is None:
             config_dir = Path.cwd() / "config"
 
         self.config_dir = config_dir
         self.repository = ConfigRepository(config_dir)
+        self.credential_manager = credential_manager
         self._audit_config: Optional[AuditConfig] = None
         self._sql_targets: Optional[SqlTargets] = None
         self._credentials_cache: Dict[str, Credential] = {}
@@ -109,6 +118,55 @@ class ConfigManager:
 
         return self._credentials_cache[cred_ref]
 
+    def get_credentials(
+        self, cred_refs: Iterable[str], use_cache: bool = True, strict: bool = True
+    ) -> Dict[str, Credential]:
+        """
+        Get many credentials at once.
+
+        With a credential manager, every reference not yet cached is loaded
+        and decrypted in one pass, so the encryption key is resolved once.
+        References it cannot read (e.g. files outside config/credentials)
+        are loaded one by one as in get_credential.
+
+        Args:
+            cred_refs: Reference names (duplicates are loaded once)
+            use_cache: Whether to use and fill the credentials cache
+            strict: Raise if any credential fails; otherwise leave it out
+
+        Returns:
+            Dict of reference name -> Credential
+
+        Raises:
+            ValueError: If strict and any credential cannot be loaded
+        """
+        refs = list(dict.fromkeys(cred_refs))
+        credentials: Dict[str, Credential] = {}
+        if use_cache:
+            credentials.update(
+                (ref, self._credentials_cache[ref]) for ref in refs if ref in self._credentials_cache
+            )
+        pending = [ref for ref in refs if ref not in credentials]
+
+        if pending and self.credential_manager is not None:
+            credentials.update(
+                self.credential_manager.load_decrypted_credentials(pending, strict=False)
+            )
+            pending = [ref for ref in pending if ref not in credentials]
+
+        failures: Dict[str, str] = {}
+        for ref in pending:
+            try:
+                credentials[ref] = self.repository.load_credential(ref)
+            except ValueError as e:
+                failures[ref] = str(e)
+
+        if use_cache:
+            self._credentials_cache.update(credentials)
+        if failures and strict:
+            raise ValueError(f"Failed to load credentials: {', '.join(sorted(failures))}")
+        return credentials
+
     def get_enabled_targets(self) -> SqlTargets:
         """
         Get all enabled SQL targets.
@@ -152,11 +210,16 @@ class ConfigManager:
             errors.append(f"SQL targets validation failed: {e}")
             return errors  # Can't validate credentials without targets
 
-        # Validate credentials for each target
+        # Validate credentials for each target (all loaded in one pass)
+        credentials = self.get_credentials(
+            (t.credentials_ref for t in targets if t.credentials_ref), use_cache=False, strict=False
+        )
         for target in targets:
+            if not target.credentials_ref or target.credentials_ref in credentials:
+                continue
             try:
-                if target.credentials_ref:
-                    self.get_credential(target.credentials_ref, use_cache=False)
+                # Reload the failed one alone for its error message
+                self.get_credential(target.credentials_ref, use_cache=False)
             except Exception as e:
                 errors.append(f"Credential validation failed for target '{target.name}': {e}")
 
@@ -0,0 +1,89 @@
+"""
+Process-wide cache of parsed configuration.
+
+Loading sql_targets means reading and validating the targets file and
+every credential file it references. Many services build their own
+loader, so the same files were parsed again and again in one process.
+
+Entries are keyed by the loader's own key (e.g. resolved path) and are
+valid while every file they were built from keeps its mtime and size, so
+an edited file is picked up on the next load without explicit
+invalidation.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (path, mtime_ns, size); (path, None, None) for a missing file
+FileStamp = Tuple[str, Optional[int], Optional[int]]
+
+
+def file_signature(paths: Iterable[Path]) -> Tuple[FileStamp, ...]:
+    """mtime/size of each file, in order (missing files included as such)."""
+    stamps = []
+    for path in paths:
+        try:
+            info = os.stat(path)
+        except OSError:
+            stamps.append((str(path), None, None))
+        else:
+            stamps.append((str(path), info.st_mtime_ns, info.st_size))
+    return tuple(stamps)
+
+
+class ParsedConfigCache:
+    """Parsed values keyed by source, invalidated by file mtime/size."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[Tuple[FileStamp, ...], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Tuple[Any, Iterable[Path]]],
+    ) -> Any:
+        """
+        Cached value for key, or the result of loader() if any source file changed.
+
+        Args:
+            key: Cache key (include everything that changes the parse result)
+            loader: Returns (value, paths of every file the value was built from).
+                    The value must not be mutated by callers.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            signature, value = entry
+            if file_signature(Path(stamp[0]) for stamp in signature) == signature:
+                with self._lock:
+                    self.hits += 1
+                return value
+
+        value, paths = loader()
+        signature = file_signature(paths)
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self.misses += 1
+        logger.debug("Parsed config cached: %s", key)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+
+parsed_config_cache = ParsedConfigCache()
+
+
+def clear_parsed_config_cache() -> None:
+    """Forget all parsed configuration (e.g. after writing config files)."""
+    parsed_config_cache.clear()
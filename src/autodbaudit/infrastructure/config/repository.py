@@ -11,6 +11,10 @@ from pathlib import Path
 from typing import Any, Dict
 
 from autodbaudit.domain.config import AuditConfig, Credential, SqlTarget, SqlTargets
+from autodbaudit.infrastructure.config.parsed_cache import (
+    clear_parsed_config_cache,
+    parsed_config_cache,
+)
 
 # Simple JSONC (JSON with comments) support
 def _strip_comments(jsonc_content: str) -> str:
@@ -136,6 +140,8 @@ class ConfigRepository:
 
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
+        # Same-size rewrites within the filesystem's mtime granularity would look unchanged
+        clear_parsed_config_cache()
 
         logger.info("Saved config file: %s", filepath)
 
@@ -160,12 +166,27 @@ class ConfigRepository:
         """
         Load SQL targets configuration.
 
+        Parsed targets are shared process-wide until sql_targets.json(c)
+        changes; the returned list is new, the targets must not be mutated.
+
         Returns:
             List of parsed SqlTarget domain models
 
         Raises:
             ValueError: If config cannot be loaded or validated
         """
+        sources = [
+            self.config_dir / "sql_targets.json",
+            self.config_dir / "sql_targets.jsonc",
+        ]
+        targets = parsed_config_cache.get_or_load(
+            ("sql_targets_model", str(Path(self.config_dir).resolve())),
+            lambda: (tuple(self._parse_sql_targets()), sources),
+        )
+        return list(targets)
+
+    def _parse_sql_targets(self) -> SqlTargets:
+        """Read and validate sql_targets into domain models."""
         try:
             data = self.load_json_file("sql_targets")
             targets_data = data.get("targets", data)  # Support both formats
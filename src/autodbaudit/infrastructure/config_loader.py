@@ -5,21 +5,26 @@ Handles loading and validation of JSON configuration files:
 - sql_targets.json: SQL Server connection configurations
 - audit_config.json: Audit settings and requirements
 - hotfix_mapping.json: Hotfix version mappings
+
+Parsed targets are shared process-wide (see parsed_cache) and reloaded
+only when sql_targets.json or a referenced credential file changes.
 """
 
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
+from autodbaudit.infrastructure.config.parsed_cache import parsed_config_cache
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SqlTarget:
-    """SQL Server target configuration."""
+    """SQL Server target configuration (immutable; instances are shared)."""
 
     id: str
     server: str
@@ -79,6 +84,96 @@ class SqlTarget:
         return self.server
 
 
+DEFAULT_SQL_PORT = 1433
+
+_LOCALHOST_ALIASES = ("localhost", "127.0.0.1", ".")
+
+
+class TargetIndex:
+    """
+    Hash indexes over targets for (server, port, instance) lookups.
+
+    find() applies the same priority as scanning the list in order, but
+    each step is a dict lookup. Where several targets match a step, the
+    one listed first in sql_targets wins.
+    """
+
+    def __init__(self, targets: Tuple[SqlTarget, ...]):
+        self.targets = targets
+        # key -> (position, target) of the first target with that key
+        self._by_host_port_instance: Dict[tuple, Tuple[int, SqlTarget]] = {}
+        self._by_host_port: Dict[tuple, Tuple[int, SqlTarget]] = {}
+        self._by_host_instance: Dict[tuple, Tuple[int, SqlTarget]] = {}
+        self._by_host: Dict[str, Tuple[int, SqlTarget]] = {}
+        for position, target in enumerate(targets):
+            host = target.server.lower()
+            port = target.port or DEFAULT_SQL_PORT
+            instance = (target.instance or "").lower()
+            entry = (position, target)
+            self._by_host_port_instance.setdefault((host, port, instance), entry)
+            self._by_host_port.setdefault((host, port), entry)
+            self._by_host_instance.setdefault((host, instance), entry)
+            self._by_host.setdefault(host, entry)
+
+    @staticmethod
+    def _first(index: Dict[Any, Tuple[int, SqlTarget]], keys) -> Optional[SqlTarget]:
+        matches = [index[key] for key in keys if key in index]
+        return min(matches, key=lambda entry: entry[0])[1] if matches else None
+
+    def find(
+        self, server: str, port: int | None = None, instance: str | None = None
+    ) -> SqlTarget | None:
+        """
+        Find target matching criteria with prioritization:
+        1. Exact Match: Server + Port + Instance
+        2. Server + Port
+        3. Server + Instance
+        4. Server + Default Port (1433/None)
+        5. Short name of an FQDN server (+ port if given)
+        6. Server Only (First available)
+        """
+        server_norm = server.lower()
+        instance_norm = instance.lower() if instance else None
+
+        # Handle localhost aliases
+        hosts: Tuple[str, ...] = (server_norm,)
+        if server_norm in _LOCALHOST_ALIASES:
+            hosts = _LOCALHOST_ALIASES
+
+        if port and instance_norm is not None:
+            found = self._first(
+                self._by_host_port_instance, [(h, port, instance_norm) for h in hosts]
+            )
+            if found:
+                return found
+
+        if port:
+            found = self._first(self._by_host_port, [(h, port) for h in hosts])
+            if found:
+                return found
+
+        if instance_norm is not None:
+            found = self._first(self._by_host_instance, [(h, instance_norm) for h in hosts])
+            if found:
+                return found
+
+        if not port:
+            found = self._first(self._by_host_port, [(h, DEFAULT_SQL_PORT) for h in hosts])
+            if found:
+                return found
+
+        if "." in server_norm:
+            short_name = server_norm.split(".")[0]
+            if port:
+                found = self._first(self._by_host_port, [(short_name, port)])
+            else:
+                found = self._first(self._by_host, [short_name])
+            if found:
+                return found
+
+        return self._first(self._by_host, hosts)
+
+
 @dataclass
 class AuditConfig:
     """Audit configuration settings."""
@@ -90,6 +185,10 @@ class AuditConfig:
     filename_pattern: str = "{organization}_SQL_Audit_{date}.xlsx"
     include_charts: bool = True
     verbosity: str = "detailed"
+    history_storage: str = "full"  # 'full' or 'content_addressed'
+    prescan_enabled: bool = True  # TCP reachability sweep before connecting
+    prescan_timeout: float = 0.75  # Seconds per TCP connect in the sweep
+    prescan_winrm: bool = True  # Also sweep WinRM ports (5985/5986)
     minimum_sql_version: str = "2019"
     requirements: Dict[str, Any] = field(default_factory=dict)
 
@@ -199,10 +298,38 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config is invalid
         """
+        return list(self._parsed_targets(filename).targets)
+
+    def load_target_index(self, filename: str = "sql_targets.json") -> TargetIndex:
+        """
+        Load SQL targets with O(1) (server, port, instance) lookups.
+
+        Args:
+            filename: Config file name
+
+        Returns:
+            TargetIndex over the (shared, immutable) targets
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            ValueError: If config is invalid
+        """
+        return self._parsed_targets(filename)
+
+    def _parsed_targets(self, filename: str) -> TargetIndex:
+        """Parsed targets from the process-wide cache, parsing on change."""
         filepath = self.config_dir / filename
+        return parsed_config_cache.get_or_load(
+            ("sql_targets", str(filepath.resolve())),
+            lambda: self._parse_sql_targets(filepath),
+        )
+
+    def _parse_sql_targets(self, filepath: Path) -> Tuple[TargetIndex, List[Path]]:
+        """Read and validate targets; returns the index and every file read."""
         logger.info("Loading SQL targets from: %s", filepath)
 
         data = self._load_json_file(filepath, required=True)
+        sources = [filepath]
 
         targets = []
         for item in data.get("targets", []):
@@ -213,6 +340,7 @@ class ConfigLoader:
 
             if credential_file and not password:
                 creds = self._load_credential_file(credential_file)
+                sources.append(self._credential_path(credential_file))
                 username = creds.get("username", username)
                 password = creds.get("password")
 
@@ -223,6 +351,7 @@ class ConfigLoader:
 
             if os_credential_file and not os_password:
                 os_creds = self._load_credential_file(os_credential_file)
+                sources.append(self._credential_path(os_credential_file))
                 os_username = os_creds.get("username", os_username)
                 os_password = os_creds.get("password")
 
@@ -248,7 +377,15 @@ class ConfigLoader:
             logger.debug("Loaded target: %s", target.display_name)
 
         logger.info("Loaded %d SQL Server targets", len(targets))
-        return targets
+        return TargetIndex(tuple(targets)), sources
+
+    def _credential_path(self, filepath: str) -> Path:
+        """Resolve a credential file path (relative to project root or absolute)."""
+        path = Path(filepath)
+        if not path.is_absolute():
+            # Try relative to project root (parent of config_dir)
+            path = self.config_dir.parent / filepath
+        return path
 
     def _load_credential_file(self, filepath: str) -> dict:
         """
@@ -260,10 +397,7 @@ class ConfigLoader:
         Returns:
             Dictionary with 'username' and 'password' keys
         """
-        path = Path(filepath)
-        if not path.is_absolute():
-            # Try relative to project root (parent of config_dir)
-            path = self.config_dir.parent / filepath
+        path = self._credential_path(filepath)
 
         logger.debug("Loading credentials from: %s", path)
         data = self._load_json_file(path, required=False)
@@ -305,6 +439,10 @@ class ConfigLoader:
             ),
             include_charts=data.get("output", {}).get("include_charts", True),
             verbosity=data.get("output", {}).get("verbosity", "detailed"),
+            history_storage=data.get("output", {}).get("history_storage", "full"),
+            prescan_enabled=data.get("prescan", {}).get("enabled", True),
+            prescan_timeout=float(data.get("prescan", {}).get("timeout_seconds", 0.75)),
+            prescan_winrm=data.get("prescan", {}).get("include_winrm", True),
             minimum_sql_version=data.get("requirements", {}).get(
                 "minimum_sql_version", "2019"
             ),
@@ -33,6 +33,7 @@ Modules:
     backups.py      - Backup history and status
     audit_settings.py - Audit configuration
     actions.py      - Remediation action items
+    carry_forward.py - Copy rows of instances skipped by targeted sync
 """
 
 from autodbaudit.infrastructure.excel.writer import EnhancedReportWriter
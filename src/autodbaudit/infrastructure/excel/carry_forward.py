@@ -0,0 +1,335 @@
+"""
+Carry-Forward of report rows for instances that were not rescanned.
+
+Targeted sync only re-collects a subset of instances. The rows of the
+other instances are copied verbatim (values, styles and row UUIDs) from
+the previous workbook so the new report is still complete.
+
+Rows are matched on the Server/Instance columns of each sheet. Merged
+server/instance cells are forward-filled, so every copied row carries
+its own server and instance values. Copied rows are inserted at the end
+of their server's group in the new report (or after the last row for a
+server that was not rescanned at all), and the merged Instance/Database
+cells of the previous workbook are recreated around them.
+
+Usage:
+    rows = read_instance_rows(old_path, {("prod-sql01", "")})
+    writer.add_carried_rows(rows)
+    writer.save(new_path)
+"""
+
+from __future__ import annotations
+
+import logging
+from copy import copy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from openpyxl import load_workbook
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.worksheet import Worksheet
+
+logger = logging.getLogger(__name__)
+
+# Sheets rebuilt from the database on every sync, never copied
+SKIP_SHEETS = frozenset({"Cover", "Actions"})
+
+DEFAULT_INSTANCE_LABELS = frozenset({"", "(default)", "mssqlserver"})
+
+
+@dataclass(frozen=True, slots=True)
+class CopiedCell:
+    """Value and style of a single cell from the previous workbook."""
+
+    value: Any
+    font: Any
+    fill: Any
+    border: Any
+    alignment: Any
+    protection: Any
+    number_format: str
+
+
+@dataclass
+class CarriedBlock:
+    """Consecutive carried rows of one server."""
+
+    server: str
+    rows: list[list[CopiedCell]] = field(default_factory=list)
+    # (first_row, first_col, last_row, last_col); rows are 0-based in the block
+    merges: list[tuple[int, int, int, int]] = field(default_factory=list)
+
+
+@dataclass
+class CarriedSheet:
+    """Carried rows of one sheet, grouped by server."""
+
+    server_col: int
+    merge_server: bool
+    blocks: list[CarriedBlock] = field(default_factory=list)
+
+    @property
+    def row_count(self) -> int:
+        return sum(len(block.rows) for block in self.blocks)
+
+
+def _instance_label(value: Any) -> str:
+    """Normalize an Instance column value for matching."""
+    label = str(value or "").strip().lower()
+    return "" if label in DEFAULT_INSTANCE_LABELS else label
+
+
+def _find_columns(ws) -> tuple[int, int] | None:
+    """Return 1-based (server, instance) column numbers from the header row."""
+    headers = {
+        str(cell.value).strip(): cell.column
+        for cell in ws[1]
+        if cell.value is not None
+    }
+    if "Server" not in headers or "Instance" not in headers:
+        return None
+    return headers["Server"], headers["Instance"]
+
+
+def read_instance_rows(
+    path: Path | str, instance_keys: set[tuple[str, str]]
+) -> dict[str, CarriedSheet]:
+    """
+    Read rows belonging to the given instances from an existing report.
+
+    Args:
+        path: Previous report workbook
+        instance_keys: Lowercased (server, instance) pairs; default
+            instances use an empty instance name
+
+    Returns:
+        Dict of sheet name -> CarriedSheet
+    """
+    path = Path(path)
+    if not instance_keys or not path.exists():
+        return {}
+
+    wanted = {(server.lower(), _instance_label(inst)) for server, inst in instance_keys}
+    wb = load_workbook(path)
+    result: dict[str, CarriedSheet] = {}
+
+    try:
+        for ws in wb.worksheets:
+            if ws.title in SKIP_SHEETS:
+                continue
+            columns = _find_columns(ws)
+            if columns is None:
+                continue
+            server_col, instance_col = columns
+
+            last_server: Any = None
+            last_instance: Any = None
+            blocks: list[CarriedBlock] = []
+            # Source row number -> (block index, row index within block)
+            slots: dict[int, tuple[int, int]] = {}
+            previous_row = 0
+
+            for row in ws.iter_rows(min_row=2):
+                server_cell = row[server_col - 1]
+                instance_cell = row[instance_col - 1]
+
+                # Merged group cells only hold a value in their first row
+                if server_cell.value not in (None, ""):
+                    if server_cell.value != last_server:
+                        last_instance = None
+                    last_server = server_cell.value
+                if instance_cell.value not in (None, ""):
+                    last_instance = instance_cell.value
+
+                if not any(c.value not in (None, "") for c in row):
+                    continue
+                key = (str(last_server or "").lower(), _instance_label(last_instance))
+                if key not in wanted:
+                    continue
+
+                copied = []
+                for cell in row:
+                    value = cell.value
+                    if cell.column == server_col:
+                        value = last_server
+                    elif cell.column == instance_col:
+                        value = last_instance
+                    copied.append(
+                        CopiedCell(
+                            value=value,
+                            font=copy(cell.font),
+                            fill=copy(cell.fill),
+                            border=copy(cell.border),
+                            alignment=copy(cell.alignment),
+                            protection=copy(cell.protection),
+                            number_format=cell.number_format,
+                        )
+                    )
+
+                row_number = server_cell.row
+                server = str(last_server or "")
+                if previous_row != row_number - 1 or blocks[-1].server.lower() != key[0]:
+                    blocks.append(CarriedBlock(server=server))
+                slots[row_number] = (len(blocks) - 1, len(blocks[-1].rows))
+                blocks[-1].rows.append(copied)
+                previous_row = row_number
+
+            if not blocks:
+                continue
+
+            merge_server = False
+            for merged in ws.merged_cells.ranges:
+                if merged.min_col == server_col == merged.max_col:
+                    # Server merges are rebuilt around the new report's groups
+                    merge_server = True
+                    continue
+                first = slots.get(merged.min_row)
+                last = slots.get(merged.max_row)
+                if first and last and first[0] == last[0]:
+                    blocks[first[0]].merges.append(
+                        (first[1], merged.min_col, last[1], merged.max_col)
+                    )
+
+            result[ws.title] = CarriedSheet(
+                server_col=server_col, merge_server=merge_server, blocks=blocks
+            )
+    finally:
+        wb.close()
+
+    logger.info(
+        "Read %d carried-forward rows across %d sheets from %s",
+        sum(sheet.row_count for sheet in result.values()),
+        len(result),
+        path.name,
+    )
+    return result
+
+
+def insert_instance_rows(wb: Workbook, carried: dict[str, CarriedSheet]) -> int:
+    """
+    Insert previously read rows into the matching sheets of a new report.
+
+    Each block lands at the end of its server's group, so merged server
+    cells, colors and sorting stay intact. The autofilter of every updated
+    sheet is widened to cover the data rows.
+
+    Args:
+        wb: Report workbook before it is saved
+        carried: Output of read_instance_rows
+
+    Returns:
+        Number of rows inserted
+    """
+    inserted = 0
+
+    for sheet_name, sheet in carried.items():
+        if sheet_name not in wb.sheetnames:
+            logger.warning("Sheet %s missing from new report; rows dropped", sheet_name)
+            continue
+        ws = wb[sheet_name]
+        for block in sheet.blocks:
+            inserted += _insert_block(ws, sheet, block)
+        _extend_autofilter(ws)
+
+    if inserted:
+        logger.info("Inserted %d carried-forward rows", inserted)
+    return inserted
+
+
+def _server_group_end(ws: Worksheet, server_col: int, server: str) -> int | None:
+    """Return the last row of a server's group, or None if it has no rows."""
+    wanted = server.lower()
+    current = ""
+    end = None
+    for row_number, (value,) in enumerate(
+        ws.iter_rows(min_row=2, min_col=server_col, max_col=server_col, values_only=True),
+        start=2,
+    ):
+        if value not in (None, ""):
+            current = str(value).lower()
+        if current == wanted:
+            end = row_number
+    return end
+
+
+def _insert_rows(ws: Worksheet, at: int, count: int) -> None:
+    """Insert empty rows, moving merged ranges below them along."""
+    moved = [merged for merged in ws.merged_cells.ranges if merged.max_row >= at]
+    bounds = [merged.bounds for merged in moved]
+    for merged in moved:
+        ws.unmerge_cells(merged.coord)
+
+    ws.insert_rows(at, count)
+
+    for min_col, min_row, max_col, max_row in bounds:
+        if min_row >= at:
+            min_row += count
+        ws.merge_cells(
+            start_row=min_row,
+            start_column=min_col,
+            end_row=max_row + count,
+            end_column=max_col,
+        )
+
+
+def _insert_block(ws: Worksheet, sheet: CarriedSheet, block: CarriedBlock) -> int:
+    """Insert one block after its server's group and merge its cells."""
+    count = len(block.rows)
+    col = sheet.server_col
+    end = _server_group_end(ws, col, block.server)
+    at = end + 1 if end is not None else ws.max_row + 1
+
+    server_range = None
+    if end is not None:
+        server_range = next(
+            (
+                merged
+                for merged in ws.merged_cells.ranges
+                if merged.min_col == col == merged.max_col and merged.max_row == end
+            ),
+            None,
+        )
+    if at <= ws.max_row:
+        _insert_rows(ws, at, count)
+
+    for offset, copied_row in enumerate(block.rows):
+        for column, copied in enumerate(copied_row, start=1):
+            cell = ws.cell(row=at + offset, column=column)
+            cell.value = copied.value
+            cell.font = copied.font
+            cell.fill = copied.fill
+            cell.border = copied.border
+            cell.alignment = copied.alignment
+            cell.protection = copied.protection
+            cell.number_format = copied.number_format
+
+    for first_row, first_col, last_row, last_col in block.merges:
+        ws.merge_cells(
+            start_row=at + first_row,
+            start_column=first_col,
+            end_row=at + last_row,
+            end_column=last_col,
+        )
+
+    if sheet.merge_server:
+        start = at
+        if end is not None:
+            start = server_range.min_row if server_range else end
+            if server_range:
+                ws.unmerge_cells(server_range.coord)
+        if at + count - 1 > start:
+            ws.merge_cells(
+                start_row=start, start_column=col, end_row=at + count - 1, end_column=col
+            )
+    return count
+
+
+def _extend_autofilter(ws: Worksheet) -> None:
+    """Make the sheet's autofilter span the header and all data rows."""
+    if not ws.auto_filter.ref:
+        return
+    current = CellRange(ws.auto_filter.ref)
+    current.expand(down=max(ws.max_row - current.max_row, 0))
+    ws.auto_filter.ref = current.coord
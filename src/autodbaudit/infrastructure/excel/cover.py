@@ -52,6 +52,8 @@ class CoverSheetMixin(BaseSheetMixin):
     _stats_new: int = 0
     _stats_docs: int = 0
     _stats_exceptions_changed: int = 0
+    # Set once the counters come from StatsService (the whole run)
+    _stats_from_service: bool = False
 
     def set_audit_info(
         self,
@@ -109,6 +111,7 @@ class CoverSheetMixin(BaseSheetMixin):
         self._issue_count = active_issues
         self._warn_count = documented_exceptions
         self._pass_count = compliant_items
+        self._stats_from_service = True
 
         # Set granular stats
         self._stats_fixed = fixed
@@ -81,16 +81,20 @@ Dependencies:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 
 from openpyxl import Workbook
 
+from autodbaudit.domain.change_types import FindingStatus
+
 # ============================================================================
 # Sheet Mixin Imports
 # Each mixin provides one sheet's functionality
 # ============================================================================
 
 from autodbaudit.infrastructure.excel.base import SheetConfig
+from autodbaudit.infrastructure.excel.carry_forward import CarriedSheet, insert_instance_rows
 from autodbaudit.infrastructure.excel.cover import CoverSheetMixin
 from autodbaudit.infrastructure.excel.instances import (
     InstanceSheetMixin,
@@ -274,8 +278,39 @@ class EnhancedReportWriter(
         # All sheets start at row 2 (row 1 is the header)
         self._row_counters: dict[str, int] = {config.name: 2 for config in SHEET_ORDER}
 
+        # Rows of instances a targeted sync did not rescan (inserted on save)
+        self._carried_rows: dict[str, CarriedSheet] = {}
+
         logger.debug("EnhancedReportWriter initialized with empty workbook")
 
+    def add_carried_rows(
+        self, carried: dict[str, CarriedSheet], findings: Iterable[dict] = ()
+    ) -> None:
+        """
+        Queue rows copied from the previous report for insertion on save.
+
+        Carried rows never pass through the add_* methods, so the Cover
+        summary counts the carried instances' findings instead. Counters
+        set by set_stats_from_service already cover the whole run and are
+        left alone.
+
+        Args:
+            carried: Output of carry_forward.read_instance_rows
+            findings: Findings of the carried instances (dicts with "status")
+        """
+        self._carried_rows = carried
+        if self._stats_from_service:
+            return
+
+        for finding in findings:
+            status = FindingStatus.from_string(finding.get("status"))
+            if status is FindingStatus.PASS:
+                self._increment_pass()
+            elif status is FindingStatus.WARN:
+                self._increment_warn()
+            elif status is FindingStatus.FAIL:
+                self._increment_issue()
+
     def _ensure_all_sheets(self) -> None:
         """
         Create all sheets with headers, even if no data was added.
@@ -370,6 +405,7 @@ class EnhancedReportWriter(
         This method performs the following steps:
 
         1. Creates any sheets that weren't populated (headers only)
+           and inserts rows queued with add_carried_rows()
         2. Creates the Cover sheet with summary statistics
         3. Reorders all sheets to the standard order
         4. Saves the workbook to the specified path
@@ -413,6 +449,9 @@ class EnhancedReportWriter(
         # Step 1: Ensure all sheets exist (even empty ones)
         self._ensure_all_sheets()
 
+        # Step 1b: Insert carried-forward rows into their server groups
+        insert_instance_rows(self.wb, self._carried_rows)
+
         # Step 2: Create cover sheet with summary statistics
         # This uses counters populated by the add_* methods
         self.create_cover_sheet()
@@ -4,9 +4,10 @@ ODBC driver detection and diagnostics.
 Utility to check available SQL Server ODBC drivers on the system.
 """
 
-import pyodbc
 import logging
 
+from autodbaudit.infrastructure.sql.odbc import get_odbc
+
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ def check_odbc_drivers():
     
     Prints driver information to console and logs.
     """
-    drivers = pyodbc.drivers()
+    drivers = get_odbc().drivers()
     
     print("\n" + "=" * 60)
     print("Available ODBC Drivers")
@@ -5,6 +5,16 @@ Exports a structured, reusable API surface for downstream modules.
 """
 
 from .base import PSRemotingFacade
+from .batch import HOST_INVENTORY_BLOCKS, clear_host_inventory, get_host_inventory
 from .runner import ParallelRunner
+from .session_pool import PowerShellSessionPool, get_session_pool
 
-__all__ = ["PSRemotingFacade", "ParallelRunner"]
+__all__ = [
+    "PSRemotingFacade",
+    "ParallelRunner",
+    "PowerShellSessionPool",
+    "get_session_pool",
+    "HOST_INVENTORY_BLOCKS",
+    "get_host_inventory",
+    "clear_host_inventory",
+]
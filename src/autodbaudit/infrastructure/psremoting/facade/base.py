@@ -7,14 +7,17 @@ downstream modules (prepare/audit/remediate/sync/hotfix) can reuse.
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, Mapping, Optional
 
 from autodbaudit.application.prepare.cache.cache_manager import ConnectionCacheManager
 from autodbaudit.application.prepare.status_service import PrepareStatusService
 from ..connection_manager import PSRemotingConnectionManager
-from ..models import CommandResult, PSRemotingResult, ConnectionMethod
+from ..models import BatchCommandResult, CommandResult, PSRemotingResult, ConnectionMethod
 from ..repository import PSRemotingRepository
+from .batch import build_batch_command, parse_batch_output
 from .executor import CommandExecutor
+from .session_pool import PowerShellSessionPool, get_session_pool
 
 
 class PSRemotingFacade:
@@ -24,6 +27,7 @@ class PSRemotingFacade:
     - ensure_prepared
     - run_command
     - run_script
+    - run_batch
     - revert
     """
 
@@ -33,16 +37,29 @@ class PSRemotingFacade:
         status_service: Optional[PrepareStatusService] = None,
         repository: Optional[PSRemotingRepository] = None,
         executor: Optional[CommandExecutor] = None,
+        session_pool: Optional[PowerShellSessionPool] = None,
+        use_session_pool: bool = True,
+        output_dir: Optional[Path | str] = None,
     ) -> None:
         self.connection_manager = connection_manager or PSRemotingConnectionManager()
         self.repository = repository or self.connection_manager.repository
-        cache_manager = ConnectionCacheManager()
+        # Same persistent tier as prepare (output_dir/audit_history.db), so
+        # audit/sync reuse prepared methods; memory only without an output dir
+        cache_manager = ConnectionCacheManager(
+            db_path=Path(output_dir) / "audit_history.db" if output_dir else None
+        )
         self.status_service = status_service or PrepareStatusService(
             cache_manager=cache_manager,
             ps_repo=self.repository,
             connection_manager=self.connection_manager,
         )
-        self.executor = executor or CommandExecutor(self.connection_manager, self.repository)
+        # Commands reuse long-lived shells/PSSessions shared across facades
+        if session_pool is None and use_session_pool:
+            session_pool = get_session_pool()
+        self.session_pool = session_pool
+        self.executor = executor or CommandExecutor(
+            self.connection_manager, self.repository, session_pool=session_pool
+        )
 
     def get_status(self, server: str):
         """Fetch cached/persisted status snapshot if available."""
@@ -72,6 +89,25 @@ class PSRemotingFacade:
         """Execute a PowerShell script (inline content or file path) on the target."""
         return self.executor.run_script(server, script, credentials, prefer_method)
 
+    def run_batch(
+        self,
+        server: str,
+        blocks: Mapping[str, str],
+        credentials: Dict[str, Any],
+        prefer_method: Optional[ConnectionMethod] = None,
+        depth: int = 2,
+    ) -> BatchCommandResult:
+        """
+        Run several named script blocks in a single Invoke-Command.
+
+        Each block's output is converted to JSON on the target and parsed
+        back into results[name]; a block that throws lands in errors[name]
+        without affecting the others.
+        """
+        command = build_batch_command(blocks, depth)
+        command_result = self.executor.run_command(server, command, credentials, prefer_method)
+        return parse_batch_output(blocks, command_result)
+
     def revert(
         self,
         server: str,
@@ -0,0 +1,182 @@
+"""
+Batched script blocks for PSRemotingFacade.
+
+Several named script blocks are wrapped into one remote command so a host
+costs a single Invoke-Command round trip. Each block runs in its own scope
+with ErrorActionPreference=Stop; its output (or error message) is stored
+under its name and the whole set is returned as one framed JSON line:
+
+    <<<ADBA-BATCH>>>{"services": {"ok": true, "data": [...]},
+                     "computer_info": {"ok": false, "error": "..."}}
+
+Collectors that need the same host data share one round trip through
+get_host_inventory(), which remembers the last successful batch per host
+and credential set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+from ..models import BatchCommandResult, CommandResult
+
+if TYPE_CHECKING:
+    from .base import PSRemotingFacade
+
+BATCH_PREFIX = "<<<ADBA-BATCH>>>"
+
+_BLOCK_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Host data used by more than one collector, fetched together
+HOST_INVENTORY_BLOCKS: Dict[str, str] = {
+    "services": (
+        "Get-CimInstance Win32_Service | ForEach-Object { [pscustomobject]@{ "
+        "name = $_.Name; display_name = $_.DisplayName; state = $_.State; "
+        "start_mode = $_.StartMode; start_name = $_.StartName } }"
+    ),
+    "computer_info": "Get-ComputerInfo",
+}
+
+INVENTORY_MAX_AGE_SECONDS = 300.0
+
+
+def build_batch_command(blocks: Mapping[str, str], depth: int = 2) -> str:
+    """
+    Wrap named script blocks into one PowerShell command.
+
+    Args:
+        blocks: Block name -> script. Names must be identifiers.
+        depth: ConvertTo-Json depth of each block's output
+
+    Raises:
+        ValueError: If no blocks are given or a name is not an identifier
+    """
+    if not blocks:
+        raise ValueError("At least one script block is required")
+
+    lines = ["$__adba = [ordered]@{}"]
+    for name, script in blocks.items():
+        if not _BLOCK_NAME.match(name):
+            raise ValueError(f"Invalid script block name: {name!r}")
+        lines.append(
+            f"$__adba['{name}'] = try {{ "
+            f"@{{ ok = $true; data = (& {{ $ErrorActionPreference = 'Stop'; {script}\n}}) }} "
+            "} catch { @{ ok = $false; error = $_.Exception.Message } }"
+        )
+    # Envelope (1) -> block entry (2) -> data (3...)
+    lines.append(
+        f"'{BATCH_PREFIX}' + ($__adba | ConvertTo-Json -Depth {depth + 2} -Compress)"
+    )
+    return "\n".join(lines)
+
+
+def parse_batch_output(
+    blocks: Mapping[str, str], command_result: CommandResult
+) -> BatchCommandResult:
+    """Split a batch command's output into per-block results and errors."""
+    payload: Optional[dict] = None
+    for line in reversed((command_result.stdout or "").splitlines()):
+        line = line.strip()
+        if line.startswith(BATCH_PREFIX):
+            try:
+                payload = json.loads(line[len(BATCH_PREFIX):])
+            except json.JSONDecodeError:
+                payload = None
+            break
+
+    if payload is None:
+        reason = (
+            command_result.stderr.strip()
+            if command_result.stderr
+            else "Batch produced no parseable output"
+        )
+        return BatchCommandResult(
+            success=False,
+            errors={name: reason for name in blocks},
+            command=command_result,
+        )
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name in blocks:
+        entry = payload.get(name)
+        if not isinstance(entry, dict):
+            errors[name] = "No result returned for block"
+        elif entry.get("ok"):
+            results[name] = entry.get("data")
+        else:
+            errors[name] = str(entry.get("error") or "Block failed")
+    return BatchCommandResult(
+        success=True, results=results, errors=errors, command=command_result
+    )
+
+
+def _inventory_key(server: str, credentials: Dict[str, Any]) -> str:
+    """Cache identity of a host inventory; credentials are hashed, never stored."""
+    canonical = json.dumps(credentials or {}, sort_keys=True, default=str)
+    cred = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+    return f"{server.lower()}|{cred}"
+
+
+class _InventoryCache:
+    """Last successful inventory batch per host and credential set."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._entries: Dict[str, tuple[float, BatchCommandResult]] = {}
+
+    def get(
+        self,
+        facade: "PSRemotingFacade",
+        server: str,
+        credentials: Dict[str, Any],
+        max_age: float,
+    ) -> BatchCommandResult:
+        key = _inventory_key(server, credentials)
+        with self._lock:
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+
+        # Concurrent collectors for the same host wait for one round trip
+        with host_lock:
+            cached = self._entries.get(key)
+            if cached and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+            result = facade.run_batch(server, HOST_INVENTORY_BLOCKS, credentials)
+            if result.success:
+                self._entries[key] = (time.monotonic(), result)
+            return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_inventory_cache = _InventoryCache()
+
+
+def get_host_inventory(
+    facade: "PSRemotingFacade",
+    server: str,
+    credentials: Dict[str, Any],
+    max_age: float = INVENTORY_MAX_AGE_SECONDS,
+) -> BatchCommandResult:
+    """
+    Run HOST_INVENTORY_BLOCKS on a host, reusing a recent result.
+
+    Results are remembered per host and credential set, so a caller with
+    other credentials never gets data fetched under someone else's. Only
+    successful round trips are remembered, so a failed attempt (e.g. wrong
+    credentials) is retried by the next caller.
+    """
+    return _inventory_cache.get(facade, server, credentials, max_age)
+
+
+def clear_host_inventory() -> None:
+    """Forget remembered inventory batches (e.g. between audit runs)."""
+    _inventory_cache.clear()
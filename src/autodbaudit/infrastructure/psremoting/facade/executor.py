@@ -2,10 +2,13 @@
 Command execution helper for PSRemotingFacade.
 
 Responsible for selecting/ensuring a connection profile and running commands/scripts.
+Commands go through a persistent session pool when one is available and fall
+back to a one-shot powershell process otherwise.
 """
 
 from __future__ import annotations
 
+import logging
 import os
 import subprocess
 import time
@@ -15,6 +18,9 @@ from ..connection_manager import PSRemotingConnectionManager
 from ..credentials import CredentialHandler
 from ..models import CommandResult, ConnectionMethod, ConnectionProfile, PSRemotingResult
 from ..repository import PSRemotingRepository
+from .session_pool import PoolUnavailableError, PowerShellSessionPool
+
+logger = logging.getLogger(__name__)
 
 
 class CommandExecutor:
@@ -24,10 +30,12 @@ class CommandExecutor:
         self,
         connection_manager: PSRemotingConnectionManager,
         repository: PSRemotingRepository,
+        session_pool: Optional[PowerShellSessionPool] = None,
     ) -> None:
         self.connection_manager = connection_manager
         self.repository = repository
         self.credential_handler = CredentialHandler()
+        self.session_pool = session_pool
 
     def run_command(
         self,
@@ -90,7 +98,8 @@ class CommandExecutor:
                 script_content = handle.read()
         else:
             script_content = script
-        wrapped = f"Invoke-Expression \"{script_content.replace('\"', '`\"')}\""
+        escaped = script_content.replace('"', '`"')
+        wrapped = f'Invoke-Expression "{escaped}"'
         return self.run_command(server, wrapped, credentials, prefer_method)
 
     def _ensure_connection_profile(
@@ -134,6 +143,21 @@ class CommandExecutor:
         auth = profile.auth_method or "Default"
         port = profile.port or 5985
         protocol = (profile.protocol or "http").lower()
+
+        if self.session_pool is not None:
+            try:
+                return self.session_pool.run(
+                    profile.server_name,
+                    command,
+                    port=port,
+                    auth=auth,
+                    use_ssl=protocol == "https",
+                    credential_script=ps_cred,
+                )
+            except PoolUnavailableError as exc:
+                logger.debug("Session pool unavailable, using one-shot call: %s", exc)
+                self.session_pool = None
+
         use_ssl = "-UseSSL" if protocol == "https" else ""
 
         escaped_command = command.replace("'", "''")
@@ -38,8 +38,14 @@ class ParallelRunner:
     RESET = "\033[0m"
     ICONS = {"start": "🚀", "done": "✅", "fail": "❌"}
 
-    def __init__(self, max_workers: int = 4, log_dir: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        max_workers: int = 4,
+        log_dir: Optional[str] = None,
+        output_dir: Optional[str] = None,
+    ) -> None:
         self.max_workers = max_workers
+        self.output_dir = output_dir
         self._log_queue: queue.Queue[str] = queue.Queue()
         self._stop_event = threading.Event()
         self._printer = threading.Thread(target=self._log_consumer, daemon=True)
@@ -63,7 +69,7 @@ class ParallelRunner:
         """
         results: list[Any] = []
         self._printer.start()
-        facade = PSRemotingFacade()
+        facade = PSRemotingFacade(output_dir=self.output_dir)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as pool:
             futures = {
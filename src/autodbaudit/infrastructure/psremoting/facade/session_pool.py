@@ -0,0 +1,397 @@
+"""
+Persistent PowerShell session pool for PSRemotingFacade.
+
+Starting powershell.exe and opening a WinRM session costs seconds; a
+one-line command usually takes milliseconds. The pool keeps shell
+processes alive, each holding open PSSessions keyed by server/port/auth,
+and sends commands to them over stdin. Shells are started on demand, one
+per concurrent caller, up to a cap.
+
+Wire protocol (one JSON object per line each way):
+
+    request:  {"id": 1, "op": "run", "key": "...", "server": "...",
+               "port": 5985, "auth": "Negotiate", "use_ssl": false,
+               "credential_script": "...", "command": "..."}
+              {"id": 2, "op": "close", "key": "..."}
+              {"id": 3, "op": "exit"}
+    reply:    <<<ADBA>>>{"id": 1, "exit_code": 0, "stdout": "...",
+                         "stderr": "...", "session_new": true}
+
+Reply lines carry a prefix so stray output from profiles or modules is
+ignored. Any process speaking this protocol works as the shell, e.g.
+stand_in_shell for local testing without WinRM:
+
+    AUTODBAUDIT_PS_SHELL="python -m autodbaudit.infrastructure.psremoting.facade.stand_in_shell"
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import hashlib
+import json
+import logging
+import os
+import queue
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+FRAME_PREFIX = "<<<ADBA>>>"
+SHELL_ENV_VAR = "AUTODBAUDIT_PS_SHELL"
+
+# Upper bound on shells; one is started per concurrent caller up to this
+DEFAULT_MAX_SHELLS = 16
+
+# Request loop run inside each pooled PowerShell process
+_LOOP_SCRIPT = r"""
+$sessions = @{}
+$prefix = '<<<ADBA>>>'
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($null -eq $line) { break }
+    if (-not $line.Trim()) { continue }
+    $req = $line | ConvertFrom-Json
+    if ($req.op -eq 'exit') { break }
+    $reply = @{ id = $req.id; exit_code = 0; stdout = ''; stderr = ''; session_new = $false }
+    try {
+        if ($req.op -eq 'close') {
+            if ($sessions.ContainsKey($req.key)) {
+                Remove-PSSession $sessions[$req.key] -ErrorAction SilentlyContinue
+                $sessions.Remove($req.key)
+            }
+        } else {
+            $s = $sessions[$req.key]
+            if ($null -eq $s -or $s.State -ne 'Opened') {
+                $credential = $null
+                if ($req.credential_script) { Invoke-Expression $req.credential_script }
+                $params = @{ ComputerName = $req.server; Port = $req.port; Authentication = $req.auth; ErrorAction = 'Stop' }
+                if ($req.use_ssl) { $params.UseSSL = $true }
+                if ($credential) { $params.Credential = $credential }
+                $s = New-PSSession @params
+                $sessions[$req.key] = $s
+                $reply.session_new = $true
+            }
+            $out = Invoke-Command -Session $s -ScriptBlock { param($c) Invoke-Expression $c } -ArgumentList $req.command 2>&1
+            $errs = @($out | Where-Object { $_ -is [System.Management.Automation.ErrorRecord] })
+            $reply.stdout = (@($out | Where-Object { $_ -isnot [System.Management.Automation.ErrorRecord] }) | Out-String)
+            if ($errs.Count -gt 0) {
+                $reply.stderr = ($errs | Out-String)
+                $reply.exit_code = 1
+            }
+        }
+    } catch {
+        $reply.exit_code = 1
+        $reply.stderr = $_.Exception.Message
+    }
+    [Console]::Out.WriteLine($prefix + ($reply | ConvertTo-Json -Compress))
+    [Console]::Out.Flush()
+}
+foreach ($s in $sessions.Values) { Remove-PSSession $s -ErrorAction SilentlyContinue }
+"""
+
+
+def default_shell_command() -> Optional[list[str]]:
+    """
+    Command line for a pooled shell process.
+
+    AUTODBAUDIT_PS_SHELL overrides the shell (e.g. a stand-in); otherwise
+    pwsh is preferred over Windows PowerShell. None if neither exists.
+    """
+    override = os.environ.get(SHELL_ENV_VAR)
+    if override:
+        return shlex.split(override)
+
+    exe = shutil.which("pwsh") or shutil.which("powershell")
+    if not exe:
+        return None
+    encoded = base64.b64encode(_LOOP_SCRIPT.encode("utf-16-le")).decode("ascii")
+    return [exe, "-NoLogo", "-NoProfile", "-NonInteractive", "-EncodedCommand", encoded]
+
+
+def session_key(
+    server: str, port: int, auth: str, use_ssl: bool, credential_script: Optional[str]
+) -> str:
+    """Identity of a remote session; credentials are hashed, never stored."""
+    cred = hashlib.sha256((credential_script or "").encode("utf-8")).hexdigest()[:16]
+    return f"{server.lower()}|{port}|{auth}|{int(use_ssl)}|{cred}"
+
+
+class PoolUnavailableError(RuntimeError):
+    """Raised when no shell can be started; callers fall back to one-shot calls."""
+
+
+class _ShellWorker:
+    """One long-lived shell process and the sessions it holds."""
+
+    def __init__(self, command: list[str]) -> None:
+        self.command = command
+        self.busy = False  # Checked out by a caller (guarded by the pool lock)
+        self.sessions: dict[str, float] = {}  # key -> last used (monotonic)
+        self.last_used = time.monotonic()
+        self._next_id = 0
+        self._replies: queue.Queue[Optional[dict]] = queue.Queue()
+        try:
+            self.process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except OSError as exc:
+            raise PoolUnavailableError(f"Cannot start shell {command[0]}: {exc}") from exc
+        self._reader = threading.Thread(target=self._read_replies, daemon=True)
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _read_replies(self) -> None:
+        """Forward framed reply lines; everything else is shell noise."""
+        assert self.process.stdout is not None
+        for line in self.process.stdout:
+            if not line.startswith(FRAME_PREFIX):
+                continue
+            try:
+                self._replies.put(json.loads(line[len(FRAME_PREFIX):]))
+            except json.JSONDecodeError:
+                logger.debug("Malformed reply from pooled shell: %.200s", line)
+        self._replies.put(None)  # EOF
+
+    def request(self, payload: dict[str, Any], timeout: float) -> dict:
+        """Send one request and wait for its reply (caller has checked the worker out)."""
+        self._next_id += 1
+        payload = {**payload, "id": self._next_id}
+        assert self.process.stdin is not None
+        try:
+            self.process.stdin.write(json.dumps(payload) + "\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError) as exc:
+            raise ConnectionError(f"Pooled shell is gone: {exc}") from exc
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.terminate()  # A stuck shell can't be trusted with the next request
+                raise TimeoutError(f"No reply from pooled shell within {timeout:g}s")
+            try:
+                reply = self._replies.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if reply is None:
+                raise ConnectionError("Pooled shell exited")
+            if reply.get("id") == payload["id"]:
+                self.last_used = time.monotonic()
+                return reply
+
+    def close_session(self, key: str, timeout: float) -> None:
+        """Remove an idle PSSession from the shell."""
+        self.sessions.pop(key, None)
+        if self.alive:
+            try:
+                self.request({"op": "close", "key": key}, timeout)
+            except (ConnectionError, TimeoutError):
+                pass
+
+    def terminate(self) -> None:
+        """Stop the shell process (sessions are closed by the shell on exit)."""
+        self.sessions.clear()
+        if not self.alive:
+            return
+        try:
+            assert self.process.stdin is not None
+            self.process.stdin.write(json.dumps({"op": "exit"}) + "\n")
+            self.process.stdin.flush()
+            self.process.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.process.kill()
+
+
+class PowerShellSessionPool:
+    """
+    Pool of persistent shells with open remoting sessions.
+
+    Each shell serves one request at a time, so the pool grows on demand:
+    a request goes to an idle shell that already holds its session, else
+    to any idle shell, else a new shell is started, up to max_shells
+    (sized for the widest caller, the fleet OS-data collector). Only when
+    all max_shells are busy does a request wait. Sessions (and whole
+    shells) unused for longer than idle_timeout are closed on the next call.
+    """
+
+    def __init__(
+        self,
+        max_shells: int = DEFAULT_MAX_SHELLS,
+        idle_timeout: float = 300.0,
+        request_timeout: float = 60.0,
+        shell_command: Optional[list[str]] = None,
+    ) -> None:
+        self.max_shells = max(1, max_shells)
+        self.idle_timeout = idle_timeout
+        self.request_timeout = request_timeout
+        self.shell_command = shell_command
+        self._workers: list[_ShellWorker] = []
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._stats = {
+            "requests": 0,
+            "sessions_opened": 0,
+            "sessions_reused": 0,
+            "sessions_evicted": 0,
+            "shells_started": 0,
+            "waits": 0,
+            "errors": 0,
+        }
+
+    def run(
+        self,
+        server: str,
+        command: str,
+        port: int = 5985,
+        auth: str = "Default",
+        use_ssl: bool = False,
+        credential_script: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command on a server through a pooled session.
+
+        Returns:
+            CompletedProcess-compatible result (returncode/stdout/stderr)
+
+        Raises:
+            PoolUnavailableError: no shell could be started
+        """
+        self.evict_idle()
+        key = session_key(server, port, auth, use_ssl, credential_script)
+        payload = {
+            "op": "run",
+            "key": key,
+            "server": server,
+            "port": port,
+            "auth": auth,
+            "use_ssl": use_ssl,
+            "credential_script": credential_script,
+            "command": command,
+        }
+
+        worker = self._checkout(key)
+        try:
+            reply = worker.request(payload, timeout or self.request_timeout)
+            worker.sessions[key] = time.monotonic()
+        except (ConnectionError, TimeoutError) as exc:
+            self._count("errors")
+            return subprocess.CompletedProcess(
+                args=["pooled-shell", server], returncode=1, stdout="", stderr=str(exc)
+            )
+        finally:
+            self._checkin(worker)
+
+        self._count("requests")
+        self._count("sessions_opened" if reply.get("session_new") else "sessions_reused")
+        return subprocess.CompletedProcess(
+            args=["pooled-shell", server],
+            returncode=int(reply.get("exit_code", 1)),
+            stdout=reply.get("stdout") or "",
+            stderr=reply.get("stderr") or "",
+        )
+
+    def _checkout(self, key: str) -> _ShellWorker:
+        """Take an idle shell (preferring one holding key), starting one if needed."""
+        with self._released:
+            waited = False
+            while True:
+                self._workers = [w for w in self._workers if w.busy or w.alive]
+                idle = [w for w in self._workers if not w.busy]
+                worker = next((w for w in idle if key in w.sessions), None)
+                if worker is None and idle:
+                    worker = idle[0]
+                if worker is None and len(self._workers) < self.max_shells:
+                    command = self.shell_command or default_shell_command()
+                    if not command:
+                        raise PoolUnavailableError("No PowerShell executable found")
+                    worker = _ShellWorker(command)
+                    self._workers.append(worker)
+                    self._stats["shells_started"] += 1
+                if worker is not None:
+                    worker.busy = True
+                    return worker
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                self._released.wait()
+
+    def _checkin(self, worker: _ShellWorker) -> None:
+        with self._released:
+            worker.busy = False
+            self._released.notify()
+
+    def evict_idle(self) -> int:
+        """Close sessions/shells idle longer than idle_timeout. Returns sessions closed."""
+        now = time.monotonic()
+        with self._lock:
+            workers = [w for w in self._workers if not w.busy]
+            for worker in workers:
+                worker.busy = True  # Keep callers off while closing sessions
+        evicted = 0
+        try:
+            for worker in workers:
+                if worker.alive and now - worker.last_used > self.idle_timeout:
+                    # Whole shell idle: exiting it closes all its sessions
+                    evicted += len(worker.sessions)
+                    worker.terminate()
+                    continue
+                stale = [k for k, used in worker.sessions.items() if now - used > self.idle_timeout]
+                for key in stale:
+                    worker.close_session(key, self.request_timeout)
+                evicted += len(stale)
+        finally:
+            for worker in workers:
+                self._checkin(worker)
+        if evicted:
+            self._count("sessions_evicted", evicted)
+        return evicted
+
+    def close(self) -> None:
+        """Terminate all shells."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.terminate()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters plus currently running shells and open sessions."""
+        with self._lock:
+            stats = dict(self._stats)
+            alive = [w for w in self._workers if w.alive]
+            stats["shells"] = len(alive)
+            stats["open_sessions"] = sum(len(w.sessions) for w in alive)
+        return stats
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+
+_shared_pool: Optional[PowerShellSessionPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_session_pool() -> PowerShellSessionPool:
+    """Process-wide pool shared by all facades; closed at interpreter exit."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = PowerShellSessionPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
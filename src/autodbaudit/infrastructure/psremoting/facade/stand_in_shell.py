@@ -0,0 +1,49 @@
+"""
+Stand-in shell for PowerShellSessionPool.
+
+Speaks the pool's line protocol without PowerShell or WinRM: "sessions"
+are just remembered keys and commands run through the local shell. Used
+for local testing and development on machines without remoting.
+
+    AUTODBAUDIT_PS_SHELL="python -m autodbaudit.infrastructure.psremoting.facade.stand_in_shell"
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+FRAME_PREFIX = "<<<ADBA>>>"
+
+
+def main() -> int:
+    """Serve requests from stdin until EOF or an exit request."""
+    sessions: set[str] = set()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        req = json.loads(line)
+        if req.get("op") == "exit":
+            break
+
+        reply = {"id": req.get("id"), "exit_code": 0, "stdout": "", "stderr": "", "session_new": False}
+        if req.get("op") == "close":
+            sessions.discard(req.get("key"))
+        else:
+            key = req.get("key")
+            if key not in sessions:
+                sessions.add(key)
+                reply["session_new"] = True
+            proc = subprocess.run(
+                req.get("command", ""), shell=True, capture_output=True, text=True, check=False
+            )
+            reply.update(exit_code=proc.returncode, stdout=proc.stdout, stderr=proc.stderr)
+
+        sys.stdout.write(FRAME_PREFIX + json.dumps(reply) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """Execute PowerShell direct connection attempts."""
 
 import subprocess
+import threading
 import time
 from typing import Optional
 
@@ -8,6 +9,35 @@ from ...models import PSSession, ConnectionProfile, CredentialBundle
 from ...credentials import CredentialHandler
 from .command_builder import build_connection_command
 
+ATTEMPT_TIMEOUT_SECONDS = 12
+
+
+class AttemptCancelledError(RuntimeError):
+    """Raised when an in-flight attempt is cancelled (another one already succeeded)."""
+
+
+def _run_cancellable(
+    args: list[str], timeout: float, cancel_event: threading.Event
+) -> subprocess.CompletedProcess:
+    """subprocess.run() that also kills the child as soon as cancel_event is set."""
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    ) as proc:
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.25)
+                return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                if cancel_event.is_set():
+                    proc.kill()
+                    proc.communicate()
+                    raise AttemptCancelledError("Cancelled: another attempt succeeded") from None
+                if time.monotonic() >= deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+
 
 def execute_connection_attempt(
     profile: ConnectionProfile,
@@ -17,8 +47,13 @@ def execute_connection_attempt(
     is_windows: bool,
     username_override: str | None = None,
     password_override: str | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> Optional[PSSession]:
-    """Execute actual PowerShell connection attempt."""
+    """
+    Execute actual PowerShell connection attempt.
+
+    With cancel_event, the attempt can be abandoned mid-flight (racing mode).
+    """
     if not is_windows:
         raise RuntimeError("PS Remoting only supported on Windows")
 
@@ -26,13 +61,17 @@ def execute_connection_attempt(
         profile, bundle, credential_handler, username_override, password_override
     )
 
-    result = subprocess.run(
-        ["powershell", "-Command", ps_command],
-        capture_output=True,
-        text=True,
-        timeout=12,
-        check=False,
-    )
+    args = ["powershell", "-Command", ps_command]
+    if cancel_event is None:
+        result = subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            timeout=ATTEMPT_TIMEOUT_SECONDS,
+            check=False,
+        )
+    else:
+        result = _run_cancellable(args, ATTEMPT_TIMEOUT_SECONDS, cancel_event)
 
     if result.returncode == 0 and "Connected" in result.stdout:
         return PSSession(
@@ -0,0 +1,19 @@
+"""TCP reachability probes for WinRM ports."""
+
+from typing import Iterable
+
+from autodbaudit.infrastructure.reachability import scan_endpoints
+
+
+def probe_ports(host: str, ports: Iterable[int], timeout: float = 2.0) -> dict[int, bool]:
+    """
+    Probe several ports on a host concurrently.
+
+    Total wall time is bounded by timeout regardless of the number of ports.
+    Recent results from a fleet pre-scan are reused instead of probing again.
+
+    Returns:
+        Dict of port -> reachable
+    """
+    results = scan_endpoints(((host, port) for port in ports), timeout, reuse_recent=True)
+    return {port: reachable for (_, port), reachable in results.items()}
@@ -0,0 +1,213 @@
+"""
+Learned ordering of direct connection attempts per host.
+
+Every attempt lands in psremoting_attempts. For a host we have seen
+before, the combination that worked last time is by far the most likely
+to work again, so it should be tried first instead of walking the fixed
+auth_priority() list.
+
+Each (auth, protocol, port, credential type) combination gets a success
+rate from its recorded attempts, weighted by age (half-life decay) and
+smoothed so that one data point doesn't dominate:
+
+    rate = (decayed successes + 1) / (decayed attempts + 2)
+
+Unseen combinations sit at 0.5, so known winners move ahead of them and
+known failures behind them. Ties go to the lower mean latency, then to
+the original priority order.
+
+History is ignored from before the host's last configuration change:
+an attempt that changed WinRM/client configuration, or an explicit reset
+(e.g. after revert).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence, TypeVar
+
+from .utils import enum_to_value
+
+logger = logging.getLogger(__name__)
+
+# (auth_method, protocol, port, credential_type), lower-case strings
+ComboKey = tuple[str, str, int, str]
+
+SpecT = TypeVar("SpecT")
+
+# Attempts that never ran say nothing about the combination
+_NOT_RUN_PREFIXES = ("Skipped:", "Cancelled")
+
+
+@dataclass
+class ComboStats:
+    """Decayed attempt statistics of one combination."""
+
+    successes: float = 0.0
+    attempts: float = 0.0
+    latency_ms: float = 0.0  # Decay-weighted sum over successes
+
+    @property
+    def success_rate(self) -> float:
+        return (self.successes + 1.0) / (self.attempts + 2.0)
+
+    @property
+    def mean_latency_ms(self) -> float:
+        return self.latency_ms / self.successes if self.successes else math.inf
+
+
+def combo_key(auth_method: Any, protocol: Any, port: Any, credential_type: Any) -> ComboKey:
+    """Normalize a combination to its ranking key."""
+    return (
+        str(enum_to_value(auth_method) or "").lower(),
+        str(enum_to_value(protocol) or "").lower(),
+        int(port or 0),
+        str(enum_to_value(credential_type) or "").lower(),
+    )
+
+
+def _parse_ts(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class MethodRanker:
+    """Ranks connection combinations for a host from its attempt history."""
+
+    def __init__(
+        self,
+        repository,
+        half_life_days: float = 7.0,
+        window_days: int = 90,
+        memo_seconds: float = 300.0,
+    ) -> None:
+        """
+        Args:
+            repository: PSRemotingRepository (attempt history source)
+            half_life_days: Age at which an attempt counts half
+            window_days: Attempts older than this are not read at all
+            memo_seconds: How long a host's computed statistics are reused
+        """
+        self.repository = repository
+        self.half_life_days = half_life_days
+        self.window_days = window_days
+        self.memo_seconds = memo_seconds
+        self._lock = threading.Lock()
+        self._memo: dict[str, tuple[float, dict[ComboKey, ComboStats], dict[str, ComboStats]]] = {}
+
+    def invalidate(self, server_name: Optional[str] = None) -> None:
+        """Drop memoized statistics (one host, or all)."""
+        with self._lock:
+            if server_name is None:
+                self._memo.clear()
+            else:
+                self._memo.pop(server_name.lower(), None)
+
+    def reset_history(self, server_name: str) -> None:
+        """Disregard all history recorded so far for a host (its configuration changed)."""
+        self.repository.reset_attempt_history(server_name)
+        self.invalidate(server_name)
+
+    def _load(self, server_name: str) -> tuple[dict[ComboKey, ComboStats], dict[str, ComboStats]]:
+        memo_key = server_name.lower()
+        with self._lock:
+            cached = self._memo.get(memo_key)
+            if cached and time.monotonic() - cached[0] < self.memo_seconds:
+                return cached[1], cached[2]
+
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=self.window_days)
+        reset = _parse_ts(self.repository.get_history_reset(server_name))
+        if reset and reset > cutoff:
+            cutoff = reset
+        rows = self.repository.get_attempt_history(server_name)
+
+        # Attempts before the latest configuration change describe a different host
+        for row in rows:
+            ts = _parse_ts(row.get("attempt_timestamp"))
+            if row.get("config_changes") and ts and ts > cutoff:
+                cutoff = ts
+
+        combos: dict[ComboKey, ComboStats] = {}
+        methods: dict[str, ComboStats] = {}
+        decay = math.log(2) / (self.half_life_days * 86400.0)
+        for row in rows:
+            ts = _parse_ts(row.get("attempt_timestamp"))
+            if ts is None or ts < cutoff:
+                continue
+            error = row.get("error_message") or ""
+            if error.startswith(_NOT_RUN_PREFIXES):
+                continue
+            weight = math.exp(-decay * max((now - ts).total_seconds(), 0.0))
+            success = bool(row.get("success"))
+            targets = [
+                combos.setdefault(
+                    combo_key(row["auth_method"], row["protocol"], row["port"], row["credential_type"]),
+                    ComboStats(),
+                ),
+                methods.setdefault(str(row.get("connection_method") or "").lower(), ComboStats()),
+            ]
+            for stats in targets:
+                stats.attempts += weight
+                if success:
+                    stats.successes += weight
+                    stats.latency_ms += weight * float(row.get("duration_ms") or 0)
+
+        with self._lock:
+            self._memo[memo_key] = (time.monotonic(), combos, methods)
+        return combos, methods
+
+    def combo_stats(self, server_name: str) -> dict[ComboKey, ComboStats]:
+        """Decayed statistics per combination for a host."""
+        return self._load(server_name)[0]
+
+    def method_scores(self, server_name: str) -> dict[str, float]:
+        """Smoothed success rate per connection method value for a host."""
+        return {m: s.success_rate for m, s in self._load(server_name)[1].items() if m}
+
+    def order(
+        self,
+        server_name: str,
+        specs: Sequence[SpecT],
+        key_of,
+    ) -> list[SpecT]:
+        """
+        Reorder attempt specs, best first.
+
+        Args:
+            server_name: Host the specs target
+            specs: Candidates in default priority order
+            key_of: Function spec -> ComboKey
+
+        Returns:
+            Specs sorted by (success rate desc, latency asc); stable for ties
+        """
+        try:
+            stats = self.combo_stats(server_name)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("No attempt history for %s: %s", server_name, exc)
+            return list(specs)
+        if not stats:
+            return list(specs)
+
+        prior = ComboStats()
+
+        def rank(spec: SpecT) -> tuple[float, float]:
+            entry = stats.get(key_of(spec), prior)
+            return (-entry.success_rate, entry.mean_latency_ms)
+
+        ordered = sorted(specs, key=rank)
+        if ordered and ordered[0] is not specs[0]:
+            logger.debug("Learned ordering for %s starts with %s", server_name, key_of(ordered[0]))
+        return ordered
+
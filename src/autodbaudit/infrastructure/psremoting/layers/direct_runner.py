@@ -4,11 +4,18 @@ Direct connection attempt runner for PowerShell remoting.
 Encapsulates Layer 1 direct connection attempts so the main connection manager
 can stay focused on orchestration. All timing, attempt logging, and profile
 construction live here.
+
+Attempts are raced by default: WinRM ports are TCP-probed first so
+combinations on a closed port are skipped, and the remaining attempts run
+concurrently (capped) until one succeeds, at which point the rest are
+cancelled. Every combination still ends up in the attempts list.
 """
 
+import threading
 import time
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Optional, Callable
 import socket
 
@@ -26,6 +33,8 @@ from ..credentials import CredentialHandler
 from .direct import ConnectionPlan
 from .direct.profile_builder import build_connection_profile
 from .direct.executor import execute_connection_attempt
+from .direct.probe import probe_ports
+from .direct.ranking import MethodRanker, combo_key
 from .direct.utils import (
     auth_priority,
     credential_variants,
@@ -36,6 +45,9 @@ from .direct.utils import (
 logger = logging.getLogger(__name__)
 # pylint: disable=too-many-locals,too-many-arguments,too-many-positional-arguments,line-too-long
 
+# (plan, username override, password override)
+AttemptSpec = tuple[ConnectionPlan, Optional[str], Optional[str]]
+
 
 class DirectAttemptRunner:
     """Executes direct (Layer 1) PowerShell remoting attempts."""
@@ -45,10 +57,18 @@ class DirectAttemptRunner:
         credential_handler: CredentialHandler,
         timestamp_provider: Callable[[], str],
         is_windows: bool,
+        race: bool = True,
+        max_concurrency: int = 4,
+        probe_timeout: float = 2.0,
+        ranker: Optional[MethodRanker] = None,
     ):
         self.credential_handler = credential_handler
         self._timestamp = timestamp_provider
         self._is_windows = is_windows
+        self.race = race
+        self.max_concurrency = max(1, max_concurrency)
+        self.probe_timeout = probe_timeout
+        self.ranker = ranker
 
     def layer1_direct_attempts(
         self,
@@ -77,6 +97,7 @@ class DirectAttemptRunner:
             )
         is_ip_target = is_ip_address(server_name)
 
+        specs: list[AttemptSpec] = []
         for auth_method in base_auth_methods:
             for protocol, port in protocol_port_pairs:
                 for username, password in variants:
@@ -89,11 +110,31 @@ class DirectAttemptRunner:
                         protocol=protocol,
                         port=port,
                     )
-                    result = self.try_single_connection(
-                        plan, bundle, attempts, profile_id, username, password
-                    )
-                    if result.is_success():
-                        return result
+                    specs.append((plan, username, password))
+
+        if self.ranker is not None:
+            # Host's recorded winners first; unseen combinations keep priority order
+            credential_type = enum_to_value(self.credential_handler.get_credential_type(bundle))
+            specs = self.ranker.order(
+                server_name,
+                specs,
+                lambda spec: combo_key(
+                    spec[0].auth_method, spec[0].protocol, spec[0].port, credential_type
+                ),
+            )
+            self.ranker.invalidate(server_name)  # This run adds new history
+
+        if self.race:
+            result = self._race_attempts(server_name, bundle, specs, attempts, profile_id)
+            if result is not None:
+                return result
+        else:
+            for plan, username, password in specs:
+                result = self.try_single_connection(
+                    plan, bundle, attempts, profile_id, username, password
+                )
+                if result.is_success():
+                    return result
 
         return PSRemotingResult(
             success=False,
@@ -106,23 +147,102 @@ class DirectAttemptRunner:
             revert_scripts=None,
         )
 
-    def try_single_connection(
+    def _race_attempts(
         self,
-        plan: ConnectionPlan,
+        server_name: str,
         bundle: CredentialBundle,
+        specs: list[AttemptSpec],
         attempts: List[ConnectionAttempt],
         profile_id: int,
-        username_override: str | None = None,
-        password_override: str | None = None,
+    ) -> Optional[PSRemotingResult]:
+        """
+        Probe ports, then run the live attempts concurrently; first success wins.
+
+        Attempts are recorded in plan order regardless of completion order.
+        Returns the winning result, or None if every attempt failed.
+        """
+        reachable = probe_ports(
+            server_name, [spec[0].port for spec in specs], self.probe_timeout
+        )
+        closed = sorted(port for port, is_open in reachable.items() if not is_open)
+        if closed:
+            logger.info(
+                "WinRM port(s) %s not reachable on %s; skipping those attempts",
+                ", ".join(map(str, closed)),
+                server_name,
+            )
+
+        cancel_event = threading.Event()
+        recorded: list[list[ConnectionAttempt]] = [[] for _ in specs]
+        winner: Optional[PSRemotingResult] = None
+        live: list[int] = []
+        for index, (plan, _, _) in enumerate(specs):
+            if reachable.get(plan.port, True):
+                live.append(index)
+            else:
+                recorded[index].append(
+                    self._skipped_attempt(
+                        plan, bundle, profile_id, f"Skipped: TCP port {plan.port} not reachable"
+                    )
+                )
+
+        if live:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(live)),
+                thread_name_prefix="psremoting-race",
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        self._race_one, specs[index], bundle, recorded[index], profile_id, cancel_event
+                    ): index
+                    for index in live
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if winner is None and result.is_success():
+                        winner = result
+                        cancel_event.set()
+
+        for batch in recorded:
+            attempts.extend(batch)
+        if winner is not None:
+            winner.attempts_made = attempts
+        return winner
+
+    def _race_one(
+        self,
+        spec: AttemptSpec,
+        bundle: CredentialBundle,
+        attempts: List[ConnectionAttempt],
+        profile_id: int,
+        cancel_event: threading.Event,
     ) -> PSRemotingResult:
-        """Try a single connection configuration."""
-        username_variant = None
-        if username_override:
-            username_variant = username_override
-        elif bundle.windows_explicit:
-            username_variant = bundle.windows_explicit.get("username")
+        """Run one raced attempt unless a winner was already found."""
+        plan, username, password = spec
+        if cancel_event.is_set():
+            attempt = self._skipped_attempt(
+                plan, bundle, profile_id, "Skipped: another attempt succeeded"
+            )
+            attempts.append(attempt)
+            return PSRemotingResult(
+                success=False,
+                session=None,
+                error_message=attempt.error_message,
+                attempts_made=attempts,
+                duration_ms=0,
+                troubleshooting_report=None,
+                manual_setup_scripts=None,
+                revert_scripts=None,
+            )
+        return self.try_single_connection(
+            plan, bundle, attempts, profile_id, username, password, cancel_event=cancel_event
+        )
 
-        attempt = ConnectionAttempt(
+    def _new_attempt(
+        self, plan: ConnectionPlan, bundle: CredentialBundle, profile_id: int
+    ) -> ConnectionAttempt:
+        """Attempt record for a plan (not yet run)."""
+        return ConnectionAttempt(
             profile_id=profile_id,
             server_name=plan.server_name,
             auth_method=enum_to_value(plan.auth_method),
@@ -141,6 +261,42 @@ class DirectAttemptRunner:
             manual_script_path=None,
         )
 
+    def _skipped_attempt(
+        self, plan: ConnectionPlan, bundle: CredentialBundle, profile_id: int, reason: str
+    ) -> ConnectionAttempt:
+        """Attempt record for a combination that was not run."""
+        attempt = self._new_attempt(plan, bundle, profile_id)
+        attempt.error_message = reason
+        return attempt
+
+    def note_config_change(self, server_name: str) -> None:
+        """Forget learned ordering for a host whose WinRM configuration just changed."""
+        if self.ranker is None:
+            return
+        try:
+            self.ranker.reset_history(server_name)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("Could not reset attempt history for %s: %s", server_name, exc)
+
+    def try_single_connection(
+        self,
+        plan: ConnectionPlan,
+        bundle: CredentialBundle,
+        attempts: List[ConnectionAttempt],
+        profile_id: int,
+        username_override: str | None = None,
+        password_override: str | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> PSRemotingResult:
+        """Try a single connection configuration."""
+        username_variant = None
+        if username_override:
+            username_variant = username_override
+        elif bundle.windows_explicit:
+            username_variant = bundle.windows_explicit.get("username")
+
+        attempt = self._new_attempt(plan, bundle, profile_id)
+
         start_time = time.time()
         try:
             profile = build_connection_profile(plan, bundle, self.credential_handler)
@@ -152,6 +308,7 @@ class DirectAttemptRunner:
                 self._is_windows,
                 username_override=username_override,
                 password_override=password_override,
+                cancel_event=cancel_event,
             )
             if session:
                 attempt.duration_ms = int((time.time() - start_time) * 1000)
@@ -53,6 +53,7 @@ class ClientLayerRunner:
         trusted_success, trusted_revert = self.client_config.add_to_trusted_hosts(server_name)
         if trusted_revert:
             self._record_revert(trusted_revert)
+            self.direct_runner.note_config_change(server_name)
         if trusted_success:
             result = self.direct_runner.layer1_direct_attempts(
                 server_name, bundle, attempts, profile_id
@@ -67,6 +68,8 @@ class ClientLayerRunner:
         policy_success, previous = apply_winrm_policy("localhost", self._run_local_ps)
         if policy_success:
             self._record_revert(build_revert_script("localhost", previous))
+        if client_success or policy_success:
+            self.direct_runner.note_config_change(server_name)
 
         if client_success:
             return self.direct_runner.layer1_direct_attempts(
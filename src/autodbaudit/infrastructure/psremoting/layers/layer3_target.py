@@ -62,6 +62,7 @@ class TargetLayerRunner:
             self._ensure_winrm_listeners(server_name, bundle)
             self._configure_target_trustedhosts(server_name, bundle)
             self._trigger_gpupdate(server_name, bundle)
+            self.direct_runner.note_config_change(server_name)
 
             return self.direct_runner.layer1_direct_attempts(
                 server_name, bundle, attempts, profile_id
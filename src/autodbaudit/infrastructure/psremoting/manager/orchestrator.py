@@ -21,6 +21,7 @@ from ..repository import PSRemotingRepository
 from ..elevation import ShellElevationService
 from ..layers.localhost_prep import LocalhostPreparer
 from ..layers.direct.utils import is_ip_address
+from ..layers.direct.ranking import MethodRanker
 from .revert_service import RevertService
 from .connect_flow import ConnectionFlow
 
@@ -37,10 +38,12 @@ class PSRemotingConnectionManager:  # pylint: disable=too-many-instance-attribut
         self.target_config: TargetConfigurator = TargetConfigurator()
         self._is_windows = platform.system() == "Windows"
         self.revert_tracker: RevertTracker = RevertTracker(self._get_timestamp)
+        self.method_ranker: MethodRanker = MethodRanker(self.repository)
         self.direct_runner: DirectAttemptRunner = DirectAttemptRunner(
             self.credential_handler,
             self._get_timestamp,
             self._is_windows,
+            ranker=self.method_ranker,
         )
         self.client_layer: ClientLayerRunner = ClientLayerRunner(
             self.client_config,
@@ -95,7 +98,10 @@ class PSRemotingConnectionManager:  # pylint: disable=too-many-instance-attribut
         self, server_name: str, credentials: Dict[str, Any], dry_run: bool = False
     ) -> PSRemotingResult:
         """Delegate revert to the revert service."""
-        return self.revert_service.revert_server(server_name, credentials, dry_run)
+        result = self.revert_service.revert_server(server_name, credentials, dry_run)
+        if not dry_run:
+            self.direct_runner.note_config_change(server_name)
+        return result
 
     def test_connection(self, server_name: str, credentials: Dict[str, Any]) -> bool:
         """Quick test if connection is possible without making config changes."""
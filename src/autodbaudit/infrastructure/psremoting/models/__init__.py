@@ -15,7 +15,7 @@ from .attempt import ConnectionAttempt
 from .server_state import ServerState
 from .session import PSSession
 from .elevation import ElevationStatus
-from .result import PSRemotingResult, CommandResult
+from .result import PSRemotingResult, CommandResult, BatchCommandResult
 
 __all__ = [
     "AuthMethod",
@@ -31,4 +31,5 @@ __all__ = [
     "ElevationStatus",
     "PSRemotingResult",
     "CommandResult",
+    "BatchCommandResult",
 ]
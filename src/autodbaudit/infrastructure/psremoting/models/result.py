@@ -64,3 +64,22 @@ class CommandResult(BaseModel):
         None, description="Troubleshooting report if available"
     )
     model_config = ConfigDict(use_enum_values=True)
+
+
+class BatchCommandResult(BaseModel):
+    """
+    Result of running several named script blocks in one remoting call.
+
+    success reflects the round trip itself; individual blocks can still fail
+    and are reported in errors.
+    """
+
+    success: bool = Field(..., description="Whether the remoting call itself succeeded")
+    results: Dict[str, Any] = Field(default_factory=dict, description="Parsed JSON output per block")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Error message per failed block")
+    command: Optional[CommandResult] = Field(None, description="Underlying command result")
+    model_config = ConfigDict(use_enum_values=True)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a block's result, or default if it failed or was not run."""
+        return self.results.get(name, default)
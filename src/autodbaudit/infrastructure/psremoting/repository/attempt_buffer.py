@@ -0,0 +1,134 @@
+"""
+Buffered attempt logging for PS remoting.
+
+A prepare run records dozens of connection attempts per host (racing,
+retries, fallbacks). Writing each one in its own transaction makes SQLite
+fsync for every row. While a buffer is active, attempt rows are collected
+in memory and written with executemany in one transaction when:
+
+- max_pending rows are waiting,
+- flush_interval seconds have passed since the first pending row,
+- the buffer is stopped (end of the prepare run), or
+- the process exits (atexit).
+
+Readers of attempt history flush first, so they always see every row.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import weakref
+from typing import Callable, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+AttemptRow = tuple
+
+DEFAULT_FLUSH_INTERVAL = 2.0
+DEFAULT_MAX_PENDING = 500
+
+
+class AttemptBuffer:
+    """Collects attempt rows and writes them in batches."""
+
+    def __init__(
+        self,
+        writer: Callable[[Sequence[AttemptRow]], None],
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """
+        Initialize the buffer.
+
+        Args:
+            writer: Writes a batch of rows in one transaction
+            flush_interval: Seconds a row may wait before a timed flush (<= 0 disables the timer)
+            max_pending: Row count that triggers an immediate flush
+        """
+        self._writer = writer
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: List[AttemptRow] = []
+        self._timer: threading.Timer | None = None
+        self._closed = False
+        self.flushes = 0
+        self.rows_written = 0
+        _live_buffers.add(self)
+
+    def add(self, rows: Sequence[AttemptRow]) -> None:
+        """Queue rows; flushes when the buffer is full."""
+        if not rows:
+            return
+        with self._lock:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                self._pending.extend(rows)
+                full = len(self._pending) >= self.max_pending
+                if not full and self._timer is None and self.flush_interval > 0:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if closed:
+            # Late rows after stop() still reach the database
+            self._writer(list(rows))
+        elif full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all pending rows in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        # Flushes are serialized so rows land in the order they were added
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            if not rows:
+                return 0
+            try:
+                self._writer(rows)
+            except Exception:
+                with self._lock:
+                    self._pending[:0] = rows  # Keep them for the next flush
+                raise
+            self.flushes += 1
+            self.rows_written += len(rows)
+            return len(rows)
+
+    @property
+    def pending(self) -> int:
+        """Rows waiting to be written."""
+        with self._lock:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Flush and stop buffering; later rows are written directly."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+        _live_buffers.discard(self)
+
+
+_live_buffers: "weakref.WeakSet[AttemptBuffer]" = weakref.WeakSet()
+
+
+def _flush_all_at_exit() -> None:
+    for buffer in list(_live_buffers):
+        try:
+            buffer.flush()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Could not flush %d buffered attempts at exit: %s", buffer.pending, exc)
+
+
+atexit.register(_flush_all_at_exit)
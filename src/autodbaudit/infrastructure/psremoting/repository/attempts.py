@@ -3,58 +3,73 @@ Attempt logging helpers for PS remoting.
 """
 
 import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from ..models import ConnectionAttempt
+from .attempt_buffer import DEFAULT_FLUSH_INTERVAL, DEFAULT_MAX_PENDING, AttemptBuffer
 from .base import RepositoryBase
 
+logger = logging.getLogger(__name__)
+
+_BUFFER_LOCK = threading.Lock()
+
 
 class AttemptsMixin(RepositoryBase):
     """Logging operations for attempts."""
 
-    def log_connection_attempt(self, attempt: ConnectionAttempt) -> int:
-        """Log a single connection attempt."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+    _INSERT_ATTEMPT_SQL = """
+        INSERT INTO psremoting_attempts
+        (profile_id, server_name, attempt_timestamp, layer, connection_method,
+         protocol, port, credential_type, auth_method, success, error_message,
+         duration_ms, config_changes, rollback_actions, manual_script_path,
+         created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
-            config_changes_json = (
-                json.dumps(attempt.config_changes) if attempt.config_changes else None
-            )
-            rollback_actions_json = (
-                json.dumps(attempt.rollback_actions) if attempt.rollback_actions else None
-            )
-            now = datetime.now(timezone.utc).isoformat()
+    def _attempt_row(self, attempt: ConnectionAttempt) -> tuple:
+        """Column values of one psremoting_attempts row."""
+        config_changes_json = (
+            json.dumps(attempt.config_changes) if attempt.config_changes else None
+        )
+        rollback_actions_json = (
+            json.dumps(attempt.rollback_actions) if attempt.rollback_actions else None
+        )
+        now = datetime.now(timezone.utc).isoformat()
+        return (
+            attempt.profile_id,
+            attempt.server_name,
+            attempt.attempt_timestamp or now,
+            attempt.layer or "",
+            self._cm_value(attempt.connection_method) or "",
+            attempt.protocol,
+            attempt.port,
+            attempt.credential_type,
+            attempt.auth_method,
+            1 if attempt.success else 0,
+            attempt.error_message,
+            attempt.duration_ms,
+            config_changes_json,
+            rollback_actions_json,
+            attempt.manual_script_path,
+            attempt.created_at or now,
+        )
 
-            cursor.execute(
-                """
-                INSERT INTO psremoting_attempts
-                (profile_id, server_name, attempt_timestamp, layer, connection_method,
-                 protocol, port, credential_type, auth_method, success, error_message,
-                 duration_ms, config_changes, rollback_actions, manual_script_path,
-                 created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    attempt.profile_id,
-                    attempt.server_name,
-                    attempt.attempt_timestamp or now,
-                    attempt.layer or "",
-                    self._cm_value(attempt.connection_method) or "",
-                    attempt.protocol,
-                    attempt.port,
-                    attempt.credential_type,
-                    attempt.auth_method,
-                    1 if attempt.success else 0,
-                    attempt.error_message,
-                    attempt.duration_ms,
-                    config_changes_json,
-                    rollback_actions_json,
-                    attempt.manual_script_path,
-                    attempt.created_at or now,
-                ),
-            )
+    def _write_attempt_rows(self, rows: Sequence[tuple]) -> None:
+        """Insert attempt rows in a single transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(self._INSERT_ATTEMPT_SQL, rows)
+            conn.commit()
 
+    def log_connection_attempt(self, attempt: ConnectionAttempt) -> int:
+        """Log a single connection attempt immediately (bypasses any buffer)."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._INSERT_ATTEMPT_SQL, self._attempt_row(attempt))
             attempt_id = cursor.lastrowid
             conn.commit()
             return int(attempt_id or 0)
@@ -62,14 +77,66 @@ class AttemptsMixin(RepositoryBase):
     def log_attempts(
         self, attempts: List[ConnectionAttempt], profile_id: Optional[int] = None
     ) -> None:
-        """Log multiple attempts, applying profile_id if provided."""
+        """
+        Log multiple attempts, applying profile_id if provided.
+
+        Rows go to the active attempt buffer if there is one, otherwise they
+        are written together in one transaction.
+        """
+        if not attempts:
+            return
         for attempt in attempts:
             if profile_id and not attempt.profile_id:
                 attempt.profile_id = profile_id
-            self.log_connection_attempt(attempt)
+        rows = [self._attempt_row(attempt) for attempt in attempts]
+
+        buffer = getattr(self, "_attempt_buffer", None)
+        if buffer is not None:
+            buffer.add(rows)
+        else:
+            self._write_attempt_rows(rows)
+
+    @contextmanager
+    def buffered_attempts(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> Iterator[AttemptBuffer]:
+        """
+        Buffer log_attempts() writes for the duration of the block.
+
+        Nested blocks share the outermost buffer. Everything is flushed when
+        the outermost block exits (or at interpreter exit, whichever is first).
+
+        Args:
+            flush_interval: Seconds a row may wait before a timed flush
+            max_pending: Row count that triggers an immediate flush
+        """
+        with _BUFFER_LOCK:
+            buffer = getattr(self, "_attempt_buffer", None)
+            owner = buffer is None
+            if owner:
+                buffer = AttemptBuffer(self._write_attempt_rows, flush_interval, max_pending)
+                self._attempt_buffer = buffer
+        try:
+            yield buffer
+        finally:
+            if owner:
+                with _BUFFER_LOCK:
+                    self._attempt_buffer = None
+                try:
+                    buffer.close()
+                except sqlite3.Error as exc:
+                    logger.warning("Failed to write %d buffered attempts: %s", buffer.pending, exc)
+
+    def flush_attempts(self) -> int:
+        """Write buffered attempts now; returns the number of rows written."""
+        buffer = getattr(self, "_attempt_buffer", None)
+        return buffer.flush() if buffer is not None else 0
 
     def get_recent_attempts(self, limit: int = 50) -> List[ConnectionAttempt]:
         """Retrieve the most recent connection attempts."""
+        self.flush_attempts()
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -113,3 +180,50 @@ class AttemptsMixin(RepositoryBase):
                     )
                 )
             return attempts_list
+
+    def get_attempt_history(
+        self, server_name: str, since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Attempts recorded for a server, oldest first.
+
+        Args:
+            server_name: Server as recorded in attempts
+            since: Only attempts at or after this ISO timestamp
+        """
+        self.flush_attempts()
+        query = """
+            SELECT auth_method, protocol, port, credential_type, connection_method,
+                   success, duration_ms, error_message, attempt_timestamp, config_changes
+            FROM psremoting_attempts
+            WHERE server_name = ?
+        """
+        params: list[Any] = [server_name]
+        if since:
+            query += " AND attempt_timestamp >= ?"
+            params.append(since)
+        query += " ORDER BY attempt_timestamp"
+        with self._get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+
+    def get_history_reset(self, server_name: str) -> Optional[str]:
+        """Timestamp before which a server's attempt history is disregarded, if any."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT reset_at FROM psremoting_history_resets WHERE server_name = ?",
+                (server_name,),
+            ).fetchone()
+            return row["reset_at"] if row else None
+
+    def reset_attempt_history(self, server_name: str) -> None:
+        """Mark a server's attempt history as outdated (e.g. after its config was reverted)."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO psremoting_history_resets (server_name, reset_at) VALUES (?, ?)
+                ON CONFLICT(server_name) DO UPDATE SET reset_at = excluded.reset_at
+                """,
+                (server_name, now),
+            )
+            conn.commit()
@@ -87,6 +87,16 @@ def ensure_tables(cursor: sqlite3.Cursor) -> None:
         """
     )
 
+    # Servers whose attempt history predates a config change (ignored for method ranking)
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS psremoting_history_resets (
+            server_name TEXT PRIMARY KEY,
+            reset_at TEXT NOT NULL
+        )
+        """
+    )
+
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_psremoting_profiles_server ON psremoting_profiles(server_name)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_psremoting_profiles_success ON psremoting_profiles(successful, last_successful_attempt)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_profile ON psremoting_attempts(profile_id)")
@@ -116,3 +126,9 @@ def ensure_columns(cursor: sqlite3.Cursor) -> None:
         cursor.execute("ALTER TABLE psremoting_attempts ADD COLUMN port INTEGER")
     if "credential_type" not in attempt_cols:
         cursor.execute("ALTER TABLE psremoting_attempts ADD COLUMN credential_type TEXT")
+
+    # Per-host history lookups (method ranking); server_name may have just been added above
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_server "
+        "ON psremoting_attempts(server_name, attempt_timestamp)"
+    )
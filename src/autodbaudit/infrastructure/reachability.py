@@ -0,0 +1,177 @@
+"""
+Fleet-wide TCP reachability pre-scan.
+
+A host that is down costs a full connect timeout (30s by default for SQL,
+12s per PS remoting attempt) before anything notices. A TCP connect with
+a sub-second timeout answers the same question far sooner, and asyncio
+lets thousands of them run at once from a single thread:
+
+    results = scan_endpoints([("sql01", 1433), ("sql01", 5985)], timeout=0.75)
+    # {("sql01", 1433): True, ("sql01", 5985): False}
+
+Each host name is resolved once per scan, however many ports are probed.
+Results are remembered for a short while so later stages (e.g. the PS
+remoting port probe) can reuse them instead of probing again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import threading
+import time
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+Endpoint = tuple[str, int]
+
+DEFAULT_TIMEOUT = 0.75
+DEFAULT_CONCURRENCY = 2000
+RECENT_TTL_SECONDS = 120.0
+
+WINRM_PORTS = (5985, 5986)
+
+# Connection-string spellings of the local machine
+_LOCAL_ALIASES = {".", "(local)", "(localdb)"}
+
+# (host lower, port) -> (monotonic time, reachable)
+_recent: dict[Endpoint, tuple[float, bool]] = {}
+_recent_lock = threading.Lock()
+
+
+def probe_host(server: str) -> str:
+    """Host name to probe for a configured server (maps '.'/'(local)' to loopback)."""
+    server = server.strip()
+    return "127.0.0.1" if server.lower() in _LOCAL_ALIASES else server
+
+
+async def _resolve(host: str, timeout: float) -> str | None:
+    """Resolve a host name to one address; None if it doesn't resolve in time."""
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await asyncio.wait_for(
+            loop.getaddrinfo(host, None, type=socket.SOCK_STREAM), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return None
+    return infos[0][4][0] if infos else None
+
+
+async def _connect(address: str, port: int, timeout: float) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(address, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+async def _scan(
+    endpoints: list[Endpoint], timeout: float, concurrency: int
+) -> dict[Endpoint, bool]:
+    # Name resolution gets its own (longer) budget; DNS is often slower than a SYN
+    hosts = list(dict.fromkeys(host for host, _ in endpoints))
+    addresses = dict(
+        zip(hosts, await asyncio.gather(*(_resolve(h, max(timeout, 2.0)) for h in hosts)))
+    )
+    gate = asyncio.Semaphore(concurrency)
+
+    async def probe(endpoint: Endpoint) -> bool:
+        address = addresses.get(endpoint[0])
+        if address is None:
+            return False
+        async with gate:
+            return await _connect(address, endpoint[1], timeout)
+
+    results = await asyncio.gather(*(probe(e) for e in endpoints))
+    return dict(zip(endpoints, results))
+
+
+def _socket_budget(requested: int) -> int:
+    """Cap sockets in flight below the process file-descriptor limit."""
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:  # Windows: no RLIMIT_NOFILE, proactor loop has no select() cap
+        return requested
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return requested
+    return max(1, min(requested, soft - 64))
+
+
+def _run(coro_factory) -> dict[Endpoint, bool]:
+    """asyncio.run(), or on a helper thread when called from inside a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro_factory())
+
+    results: dict[Endpoint, bool] = {}
+    worker = threading.Thread(
+        target=lambda: results.update(asyncio.run(coro_factory())), daemon=True
+    )
+    worker.start()
+    worker.join()
+    return results
+
+
+def scan_endpoints(
+    endpoints: Iterable[Endpoint],
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    reuse_recent: bool = False,
+) -> dict[Endpoint, bool]:
+    """
+    Check TCP reachability of many (host, port) endpoints concurrently.
+
+    Args:
+        endpoints: (host, port) pairs; duplicates are probed once
+        timeout: Per-connect timeout in seconds
+        concurrency: Maximum sockets in flight
+        reuse_recent: Answer from results of a recent scan where available
+
+    Returns:
+        Dict of (host, port) -> reachable, keyed as given
+    """
+    unique = list(dict.fromkeys((host, int(port)) for host, port in endpoints))
+    results: dict[Endpoint, bool] = {}
+
+    pending = unique
+    if reuse_recent:
+        now = time.monotonic()
+        pending = []
+        with _recent_lock:
+            for host, port in unique:
+                seen = _recent.get((host.lower(), port))
+                if seen and now - seen[0] < RECENT_TTL_SECONDS:
+                    results[(host, port)] = seen[1]
+                else:
+                    pending.append((host, port))
+
+    if pending:
+        started = time.perf_counter()
+        scanned = _run(lambda: _scan(pending, timeout, _socket_budget(max(1, concurrency))))
+        results.update(scanned)
+        now = time.monotonic()
+        with _recent_lock:
+            for (host, port), reachable in scanned.items():
+                _recent[(host.lower(), port)] = (now, reachable)
+        logger.debug(
+            "Reachability scan: %d endpoints, %d open, %.2fs",
+            len(scanned),
+            sum(scanned.values()),
+            time.perf_counter() - started,
+        )
+    return results
+
+
+def clear_recent() -> None:
+    """Forget remembered scan results."""
+    with _recent_lock:
+        _recent.clear()
@@ -2,17 +2,37 @@
 Dry Run Validator micro-component.
 Validates remediation actions in simulation mode.
 Ultra-granular component (<50 lines) following Railway patterns.
+
+validate_on_server() compiles T-SQL batches on the target itself under
+SET NOEXEC ON (or SET PARSEONLY ON), so syntax and binding errors surface
+without changing anything. USE is not executed under NOEXEC, so the
+validator switches the connection's database itself.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import re
+from typing import TYPE_CHECKING, Any, Iterable
 from dataclasses import dataclass
 
 from autodbaudit.infrastructure.remediation.results import Result, Success, Failure
 
 if TYPE_CHECKING:
     from autodbaudit.infrastructure.remediation.results import ScriptExecutionSuccess
+    from autodbaudit.infrastructure.sql.batch_splitter import SqlBatch
+
+# Batches that would switch validation mode off must not reach the server
+_MODE_SWITCH = re.compile(r"\bSET\s+(NOEXEC|PARSEONLY|FMTONLY)\b", re.IGNORECASE)
+
+# USE <db> at the start of a line; the name is kept as written ([x], "x" or x)
+_USE = re.compile(
+    r'^[ \t]*USE[ \t]+(\[(?:[^\]]|\]\])+\]|"[^"]+"|[^\s;]+)', re.IGNORECASE | re.MULTILINE
+)
+
+# USE as a batch's first statement (after whitespace and comments)
+_LEADING_USE = re.compile(
+    r"\A(?:\s+|--[^\n]*(?:\n|\Z)|/\*.*?\*/)*USE\s", re.IGNORECASE | re.DOTALL
+)
 
 @dataclass(frozen=True)
 class DryRunValidator:
@@ -65,6 +85,77 @@ class DryRunValidator:
         except Exception as e:
             return Failure(f"Dry-run validation failed: {str(e)}")
 
+    def validate_on_server(
+        self,
+        connection: Any,
+        batches: Iterable[SqlBatch],
+        parse_only: bool = False,
+    ) -> Result[list[dict], str]:
+        """
+        Compile batches on the server without executing them.
+
+        NOEXEC compiles each batch (syntax plus name binding where the
+        objects exist); PARSEONLY only checks syntax. Statements are not
+        run, so object creation has no effect on later batches. USE is
+        tracked instead: the database is switched before a batch that
+        starts with USE, and after a batch that uses it further down.
+
+        Args:
+            connection: Open DB-API connection (autocommit) to the target
+            batches: Batches of one script, in order
+            parse_only: Use SET PARSEONLY instead of SET NOEXEC
+
+        Returns:
+            Success with one dict per batch (batch_num, start_line,
+            end_line, error or None, skipped) or Failure if the mode
+            can't be set
+        """
+        option = "PARSEONLY" if parse_only else "NOEXEC"
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"SET {option} ON")
+        except Exception as e:
+            return Failure(f"Could not enable SET {option}: {e}")
+
+        results: list[dict] = []
+        try:
+            for num, batch in enumerate(batches, start=1):
+                entry = {
+                    "batch_num": num,
+                    "start_line": batch.start_line,
+                    "end_line": batch.end_line,
+                    "error": None,
+                    "skipped": False,
+                }
+                if _MODE_SWITCH.search(batch.text):
+                    entry["skipped"] = True
+                    results.append(entry)
+                    continue
+
+                databases = _USE.findall(batch.text)
+                leading_use = bool(databases) and bool(_LEADING_USE.match(batch.text))
+                if leading_use:
+                    entry["error"] = _switch_database(cursor, option, databases[0])
+                if entry["error"] is None:
+                    try:
+                        cursor.execute(batch.text)
+                        while cursor.nextset():
+                            pass
+                    except Exception as e:
+                        entry["error"] = str(e)
+                if databases and not (leading_use and len(databases) == 1):
+                    entry["error"] = entry["error"] or _switch_database(
+                        cursor, option, databases[-1]
+                    )
+                results.append(entry)
+        finally:
+            try:
+                cursor.execute(f"SET {option} OFF")
+            except Exception:
+                pass  # Connection is closed by the caller anyway
+
+        return Success(results)
+
     def generate_preview(
         self,
         validation_result: dict,
@@ -141,3 +232,16 @@ class DryRunValidator:
             analysis['syntax_valid'] = script.strip().startswith('$') or '{' in script
 
         return analysis
+
+
+def _switch_database(cursor: Any, option: str, database: str) -> str | None:
+    """Run USE with the validation mode briefly off; returns an error or None."""
+    try:
+        cursor.execute(f"SET {option} OFF")
+        try:
+            cursor.execute(f"USE {database}")
+        finally:
+            cursor.execute(f"SET {option} ON")
+    except Exception as e:
+        return str(e)
+    return None
@@ -1,17 +1,32 @@
 """
 SQL Server infrastructure package.
 
-Provides SQL Server connectivity and version-specific query providers.
+Provides SQL Server connectivity, version-specific query providers and a
+stand-in driver for running without SQL Server.
 """
 
+from autodbaudit.infrastructure.sql.batch_splitter import (
+    SqlBatch,
+    iter_batches,
+    split_batches,
+)
 from autodbaudit.infrastructure.sql.connector import SqlConnector
+from autodbaudit.infrastructure.sql.odbc import get_odbc, use_odbc
 from autodbaudit.infrastructure.sql.query_provider import (
     QueryProvider,
     get_query_provider,
 )
+from autodbaudit.infrastructure.sql.stand_in import FleetSpec, StandInDriver
 
 __all__ = [
     "SqlConnector",
     "QueryProvider",
     "get_query_provider",
+    "SqlBatch",
+    "iter_batches",
+    "split_batches",
+    "get_odbc",
+    "use_odbc",
+    "FleetSpec",
+    "StandInDriver",
 ]
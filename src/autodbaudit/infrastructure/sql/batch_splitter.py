@@ -0,0 +1,175 @@
+"""
+T-SQL Batch Splitter - streaming GO separator handling.
+
+Splits a T-SQL script into batches the way sqlcmd/SSMS do:
+
+- GO must be alone on its line (optionally followed by a repeat count
+  and a -- comment), e.g. ``GO`` or ``GO 5``
+- GO inside block comments, string literals, [bracketed] or "quoted"
+  identifiers is not a separator; block comments may nest
+- Batches that contain only comments/whitespace are dropped
+
+Lines are consumed lazily from any iterable (an open file works), so only
+the current batch is held in memory. Each batch carries the 1-based line
+range it came from so execution errors can be mapped back to the source.
+
+Usage:
+    with open(path, encoding="utf-8") as handle:
+        for batch in iter_batches(handle):
+            for _ in range(batch.repeat):
+                cursor.execute(batch.text)
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+# GO [count] [-- comment], case-insensitive, alone on its line
+_GO_LINE = re.compile(r"^\s*GO(?:\s+(\d+))?\s*(?:--.*)?$", re.IGNORECASE)
+
+# Lexer states carried across lines
+_CODE = 0
+_BLOCK_COMMENT = 1
+_STRING = 2  # '...'
+_BRACKET = 3  # [...]
+_DQUOTE = 4  # "..."
+
+
+@dataclass(frozen=True, slots=True)
+class SqlBatch:
+    """One GO-separated batch."""
+
+    text: str
+    start_line: int  # 1-based, first non-blank line
+    end_line: int  # 1-based, last line before the separator
+    repeat: int = 1  # GO <count>
+
+
+class _Scanner:
+    """Tracks comment/string/identifier state across lines."""
+
+    __slots__ = ("state", "depth")
+
+    def __init__(self) -> None:
+        self.state = _CODE
+        self.depth = 0  # Block comment nesting
+
+    def scan(self, line: str) -> bool:
+        """
+        Advance over one line.
+
+        Returns:
+            True if the line contains anything besides comments/whitespace
+        """
+        has_code = False
+        i, n = 0, len(line)
+        while i < n:
+            ch = line[i]
+            state = self.state
+
+            if state == _BLOCK_COMMENT:
+                if line.startswith("*/", i):
+                    self.depth -= 1
+                    if self.depth == 0:
+                        self.state = _CODE
+                    i += 2
+                    continue
+                if line.startswith("/*", i):
+                    self.depth += 1
+                    i += 2
+                    continue
+                i += 1
+                continue
+
+            if state in (_STRING, _BRACKET, _DQUOTE):
+                has_code = True
+                close = "'" if state == _STRING else ("]" if state == _BRACKET else '"')
+                j = line.find(close, i)
+                if j < 0:
+                    return has_code  # Literal continues on the next line
+                # Doubled closing char is an escape, not the end
+                if line.startswith(close * 2, j):
+                    i = j + 2
+                    continue
+                self.state = _CODE
+                i = j + 1
+                continue
+
+            # _CODE
+            if ch == "-" and line.startswith("--", i):
+                return has_code  # Rest of the line is a comment
+            if ch == "/" and line.startswith("/*", i):
+                self.state = _BLOCK_COMMENT
+                self.depth = 1
+                i += 2
+                continue
+            if ch == "'":
+                self.state = _STRING
+            elif ch == "[":
+                self.state = _BRACKET
+            elif ch == '"':
+                self.state = _DQUOTE
+            if not ch.isspace():
+                has_code = True
+            i += 1
+        return has_code
+
+
+def iter_batches(lines: Iterable[str]) -> Iterator[SqlBatch]:
+    """
+    Yield batches from an iterable of lines (e.g. an open text file).
+
+    Args:
+        lines: Script lines, with or without trailing newlines
+
+    Yields:
+        SqlBatch for every batch that contains SQL
+    """
+    scanner = _Scanner()
+    buffer: list[str] = []
+    start_line = 0
+    has_code = False
+
+    def flush(repeat: int) -> SqlBatch | None:
+        if not has_code:
+            return None
+        last = len(buffer) - 1
+        while last > 0 and not buffer[last].strip():
+            last -= 1  # Trailing blank lines
+        return SqlBatch(
+            text="\n".join(buffer[: last + 1]).strip(),
+            start_line=start_line,
+            end_line=start_line + last,
+            repeat=repeat,
+        )
+
+    for line_no, raw in enumerate(lines, start=1):
+        line = raw.rstrip("\r\n")
+
+        if scanner.state == _CODE:
+            match = _GO_LINE.match(line)
+            if match:
+                batch = flush(int(match.group(1) or 1))
+                if batch is not None:
+                    yield batch
+                buffer, has_code, start_line = [], False, 0
+                continue
+
+        if scanner.scan(line):
+            has_code = True
+        if not buffer and not line.strip():
+            continue  # Skip leading blank lines
+        if not buffer:
+            start_line = line_no
+        buffer.append(line)
+
+    batch = flush(1)
+    if batch is not None:
+        yield batch
+
+
+def split_batches(content: str) -> list[SqlBatch]:
+    """Split an in-memory script into batches."""
+    return list(iter_batches(content.splitlines()))
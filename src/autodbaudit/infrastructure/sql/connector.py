@@ -10,10 +10,11 @@ Handles:
 """
 
 import logging
-import pyodbc
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+from autodbaudit.infrastructure.sql.odbc import get_odbc
+
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +78,7 @@ class SqlConnector:
         Raises:
             RuntimeError: If no suitable driver found
         """
-        drivers = pyodbc.drivers()
+        drivers = get_odbc().drivers()
         logger.debug("Available ODBC drivers: %s", drivers)
 
         # Preferred drivers (newest first)
@@ -153,7 +154,7 @@ class SqlConnector:
         """
         try:
             conn_str = self.build_connection_string()
-            with pyodbc.connect(conn_str) as conn:
+            with get_odbc().connect(conn_str) as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT @@VERSION")
                 version = cursor.fetchone()[0]
@@ -179,7 +180,7 @@ class SqlConnector:
 
         conn_str = self.build_connection_string()
 
-        with pyodbc.connect(conn_str) as conn:
+        with get_odbc().connect(conn_str) as conn:
             cursor = conn.cursor()
 
             # Get version information
@@ -241,7 +242,7 @@ class SqlConnector:
         conn_str = self.build_connection_string()
 
         # Use autocommit=True to allow admin commands like RECONFIGURE
-        with pyodbc.connect(conn_str, autocommit=True) as conn:
+        with get_odbc().connect(conn_str, autocommit=True) as conn:
             cursor = conn.cursor()
             cursor.execute(query)
 
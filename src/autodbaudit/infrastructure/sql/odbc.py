@@ -0,0 +1,65 @@
+"""
+ODBC driver module used for SQL Server connections.
+
+Normally this is ``pyodbc``. AUTODBAUDIT_SQL_STANDIN swaps in the
+stand-in driver (a synthetic fleet, see stand_in.py) so an audit can run
+without SQL Server or ODBC drivers installed:
+
+    AUTODBAUDIT_SQL_STANDIN="databases=20,query_latency_ms=2"
+
+Tests and benchmarks can install a driver directly with use_odbc().
+pyodbc is imported on first use, not when connector modules are imported.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STANDIN_ENV_VAR = "AUTODBAUDIT_SQL_STANDIN"
+
+_override: Optional[Any] = None
+_stand_ins: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def get_odbc() -> Any:
+    """
+    The pyodbc-compatible module to connect with.
+
+    Returns:
+        The driver installed with use_odbc(), else the stand-in configured by
+        AUTODBAUDIT_SQL_STANDIN, else pyodbc
+    """
+    if _override is not None:
+        return _override
+
+    spec = os.environ.get(STANDIN_ENV_VAR, "").strip()
+    if spec and spec.lower() not in ("0", "off", "false"):
+        with _lock:
+            driver = _stand_ins.get(spec)
+            if driver is None:
+                # pylint: disable-next=import-outside-toplevel
+                from autodbaudit.infrastructure.sql.stand_in import FleetSpec, StandInDriver
+
+                driver = _stand_ins[spec] = StandInDriver(FleetSpec.parse(spec))
+                logger.warning("Using SQL Server stand-in driver (%s=%s)", STANDIN_ENV_VAR, spec)
+        return driver
+
+    import pyodbc  # pylint: disable=import-outside-toplevel
+
+    return pyodbc
+
+
+def use_odbc(driver: Optional[Any]) -> Optional[Any]:
+    """
+    Install a pyodbc-compatible driver for all connections (None restores the default).
+
+    Returns:
+        The previously installed driver, so callers can restore it
+    """
+    global _override  # pylint: disable=global-statement
+    previous, _override = _override, driver
+    return previous
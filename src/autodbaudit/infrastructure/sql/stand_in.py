@@ -0,0 +1,1134 @@
+"""
+Stand-in SQL Server driver for offline testing and benchmarking.
+
+Collection performance can't be measured without a SQL Server fleet, so
+this module provides a ``pyodbc``-compatible driver (connect, cursors,
+rows with attribute access, the pyodbc exception names) that answers the
+queries of ``query_provider.py`` from synthetic data. A fleet is described
+by a FleetSpec: how many databases, logins, users and permissions each
+instance has, plus latency and failure injection:
+
+    AUTODBAUDIT_SQL_STANDIN="databases=50,users_per_db=200,query_latency_ms=3"
+
+Every server name in a connection string is an instance of the fleet.
+Its data is derived from (seed, server, query), so repeated runs and
+repeated queries see the same rows without keeping them in memory.
+
+Incoming SQL is matched against the rendered text of every QueryProvider
+method; anything else (version detection, ad hoc SELECTs) is answered
+with one row of instance properties projected onto the query's column
+aliases, and statements without a SELECT return no result set.
+"""
+
+from __future__ import annotations
+
+import inspect
+import random
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from autodbaudit.infrastructure.sql.query_provider import (
+    QueryProvider,
+    Sql2008Provider,
+    Sql2019PlusProvider,
+)
+
+STANDIN_DRIVER = "ODBC Driver 18 for SQL Server"
+
+# Product versions reported per major version
+_BUILDS = {
+    10: "10.50.6000.34",
+    11: "11.0.7001.0",
+    12: "12.0.6024.0",
+    13: "13.0.6300.2",
+    14: "14.0.3456.2",
+    15: "15.0.4345.5",
+    16: "16.0.4105.2",
+}
+
+_SYSTEM_DATABASES = ("master", "tempdb", "model", "msdb")
+
+_BASE_TIME = datetime(2024, 1, 1, 8, 0, 0)
+
+_DB_SENTINEL = "ADBASTANDINDATABASE"
+
+# "... AS Alias," / "... AS Alias" at the end of a select item (not CAST(x AS INT))
+_ALIAS_RE = re.compile(
+    r"\bAS\s+\[?([A-Za-z_][A-Za-z0-9_]*)\]?(?=\s*(?:,|;|$|\b(?:FROM|WHERE|UNION|ORDER|GROUP|INTO)\b))",
+    re.I,
+)
+
+
+# ---------------------------------------------------------------------------
+# pyodbc-compatible exceptions
+# ---------------------------------------------------------------------------
+
+
+class Error(Exception):
+    """Base class of stand-in driver errors (pyodbc.Error)."""
+
+
+class DatabaseError(Error):
+    """pyodbc.DatabaseError."""
+
+
+class OperationalError(DatabaseError):
+    """pyodbc.OperationalError (e.g. connection failures)."""
+
+
+class ProgrammingError(DatabaseError):
+    """pyodbc.ProgrammingError (e.g. failing statements)."""
+
+
+class InterfaceError(Error):
+    """pyodbc.InterfaceError (e.g. malformed connection strings)."""
+
+
+# ---------------------------------------------------------------------------
+# Fleet description
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FleetSpec:  # pylint: disable=too-many-instance-attributes
+    """
+    Shape of the synthetic fleet served by the stand-in.
+
+    Counts are per instance (per_db counts per user database). Failure
+    rates are probabilities in [0, 1]; offline_rate marks a stable subset
+    of instances as always unreachable.
+    """
+
+    instances: int = 10
+    databases: int = 10
+    logins: int = 50
+    users_per_db: int = 20
+    permissions_per_db: int = 50
+    server_permissions: int = 30
+    linked_servers: int = 2
+    triggers_per_db: int = 1
+    versions: Tuple[int, ...] = (16,)
+    connect_latency_ms: float = 0.0
+    query_latency_ms: float = 0.0
+    row_latency_us: float = 0.0
+    connect_failure_rate: float = 0.0
+    query_failure_rate: float = 0.0
+    offline_rate: float = 0.0
+    seed: int = 0
+
+    @classmethod
+    def parse(cls, text: str) -> "FleetSpec":
+        """
+        Spec from "key=value,key=value" (e.g. AUTODBAUDIT_SQL_STANDIN).
+
+        "1", "on" or "default" give the default fleet; versions is a
+        "+"-separated list of major versions (e.g. "versions=10+16").
+
+        Raises:
+            ValueError: On unknown keys or malformed values
+        """
+        text = text.strip()
+        if text.lower() in ("", "1", "on", "true", "default"):
+            return cls()
+
+        types = {f.name: f.type for f in fields(cls)}
+        values: Dict[str, Any] = {}
+        for item in filter(None, (part.strip() for part in text.split(","))):
+            key, sep, raw = item.partition("=")
+            key = key.strip()
+            if not sep or key not in types:
+                raise ValueError(f"Invalid stand-in fleet setting: {item!r}")
+            raw = raw.strip()
+            if key == "versions":
+                values[key] = tuple(int(v) for v in raw.split("+") if v)
+            elif "float" in str(types[key]):
+                values[key] = float(raw)
+            else:
+                values[key] = int(raw)
+        return cls(**values)
+
+    def server_names(self, prefix: str = "standin") -> List[str]:
+        """Host names of the fleet's instances (any other name works as well)."""
+        return [f"{prefix}{index:04d}" for index in range(1, self.instances + 1)]
+
+    def user_databases(self) -> List[str]:
+        """Names of the user databases every instance has."""
+        return [f"AppDb{index:03d}" for index in range(1, self.databases + 1)]
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+
+class _Instance:
+    """Synthetic data of one instance; rows are generated on demand."""
+
+    def __init__(self, spec: FleetSpec, server: str) -> None:
+        self.spec = spec
+        self.server = server
+        host, _, instance = server.partition("\\")
+        self.host = host.split(",")[0].strip()
+        self.instance_name = instance.strip() or None
+        port = host.split(",")[1].strip() if "," in host else ""
+        self.port = int(port) if port.isdigit() else 1433
+
+        checksum = zlib.crc32(f"{spec.seed}|{server.lower()}".encode())
+        self.offline = (checksum % 10_000) < spec.offline_rate * 10_000
+        self.version_major = spec.versions[checksum % len(spec.versions)]
+        self.properties = self._properties(random.Random(checksum))
+
+    def rng(self, *parts: object) -> random.Random:
+        """Deterministic generator for one query (and database)."""
+        return random.Random("|".join(map(str, (self.spec.seed, self.server) + parts)))
+
+    def _properties(self, rng: random.Random) -> Dict[str, Any]:
+        version = _BUILDS.get(self.version_major, f"{self.version_major}.0.1000.0")
+        parts = [int(p) for p in version.split(".")]
+        service = self.instance_name or "MSSQLSERVER"
+        server_name = self.host.upper() + (f"\\{self.instance_name}" if self.instance_name else "")
+        started = _BASE_TIME - timedelta(days=rng.randint(1, 90), minutes=rng.randint(0, 1440))
+        cpus = rng.choice((4, 8, 16, 32))
+        memory = rng.choice((16, 32, 64, 128))
+        data_path = f"D:\\MSSQL\\{service}\\Data\\"
+        return {
+            "ServerName": server_name,
+            "InstanceName": self.instance_name,
+            "ServiceName": service,
+            "MachineName": self.host.upper(),
+            "PhysicalMachine": self.host.upper(),
+            "PhysicalName": self.host.upper(),
+            "Version": version,
+            "VersionMajor": parts[0],
+            "VersionMinor": parts[1],
+            "BuildNumber": parts[2],
+            "Edition": rng.choice(
+                ("Enterprise Edition (64-bit)", "Standard Edition (64-bit)", "Developer Edition (64-bit)")
+            ),
+            "ProductLevel": "SP3" if parts[0] == 10 else "RTM",
+            "CULevel": None if parts[0] == 10 else f"CU{rng.randint(1, 25)}",
+            "KBArticle": None if parts[0] == 10 else f"KB50{rng.randint(10000, 99999)}",
+            "EngineEdition": 3,
+            "IsClustered": 0,
+            "IsHadrEnabled": int(rng.random() < 0.3),
+            "IsFullTextInstalled": 1,
+            "LicenseType": "DISABLED",
+            "OSPlatform": "Windows",
+            "OSDistribution": "Windows Server 2022 Datacenter",
+            "OSRelease": "10.0",
+            "CPUCount": cpus,
+            "CPU_Count": cpus,
+            "MemoryGB": memory,
+            "Memory_GB": memory,
+            "SQLStartTime": started,
+            "SQL_Start_Time": started,
+            "IPAddress": f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            "TCPPort": self.port,
+            "Collation": "SQL_Latin1_General_CP1_CI_AS",
+            "WindowsAuthOnly": int(rng.random() < 0.4),
+            "DefaultDataPath": data_path,
+            "DefaultLogPath": data_path.replace("Data", "Log"),
+            "DefaultBackupPath": data_path.replace("Data", "Backup"),
+        }
+
+    def version_string(self) -> str:
+        """@@VERSION text."""
+        return (
+            f"Microsoft SQL Server ({self.properties['Version']}) - "
+            f"{self.properties['Edition']} on Windows Server 2022 Datacenter"
+        )
+
+    # Principals shared by server- and database-level queries
+
+    def login_names(self) -> List[str]:
+        names = ["sa", "NT AUTHORITY\\SYSTEM", f"NT SERVICE\\{self.properties['ServiceName']}"]
+        names.extend(f"login{index:04d}" for index in range(1, max(self.spec.logins - 2, 0) + 1))
+        return names[: max(self.spec.logins, 1)]
+
+    def user_names(self, database: str) -> List[Tuple[str, Optional[str]]]:
+        """(user name, mapped login) of a database; a few users are orphaned."""
+        rng = self.rng("users", database)
+        logins = self.login_names()
+        users: List[Tuple[str, Optional[str]]] = [("dbo", "sa"), ("guest", None)]
+        for index in range(1, self.spec.users_per_db + 1):
+            orphaned = rng.random() < 0.05
+            login = None if orphaned else logins[rng.randrange(len(logins))]
+            users.append((f"user{index:04d}", login))
+        return users
+
+
+def _when(rng: random.Random, max_days: int = 900) -> datetime:
+    return _BASE_TIME - timedelta(days=rng.randint(0, max_days), seconds=rng.randint(0, 86_399))
+
+
+def _server_info(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    return [dict(inst.properties)]
+
+
+def _sql_services(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    service = inst.properties["ServiceName"]
+    suffix = f" ({service})"
+    rng = inst.rng("services")
+    rows = []
+    for name, kind, account in (
+        (f"SQL Server{suffix}", "Database Engine", f"NT Service\\{service}"),
+        (f"SQL Server Agent{suffix}", "SQL Agent", "NT Service\\SQLSERVERAGENT"),
+        (f"SQL Full-text Filter Daemon Launcher{suffix}", "Full-Text Search", "NT Service\\MSSQLFDLauncher"),
+        ("SQL Server Browser", "SQL Browser", "NT AUTHORITY\\LOCALSERVICE"),
+    ):
+        running = kind == "Database Engine" or rng.random() < 0.8
+        rows.append(
+            {
+                "ServiceName": name,
+                "ServiceType": kind,
+                "InstanceName": service if "(" in name else None,
+                "StartupType": "Automatic" if running else "Manual",
+                "Status": "Running" if running else "Stopped",
+                "ServiceAccount": account,
+                "DisplayName": name,
+                "ProcessId": rng.randint(1000, 9000) if running else None,
+                "LastStartup": inst.properties["SQLStartTime"] if running else None,
+                "IsClustered": "N",
+                "ClusterNode": None,
+                "FileInitEnabled": "Y",
+            }
+        )
+    return rows
+
+
+def _client_protocols(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    return [
+        {"ProtocolName": "TCP/IP", "IsEnabled": 1, "DefaultPort": inst.port, "Notes": "Network connections"},
+        {"ProtocolName": "Shared Memory", "IsEnabled": 0, "DefaultPort": None, "Notes": "Local connections only"},
+        {"ProtocolName": "Named Pipes", "IsEnabled": 0, "DefaultPort": None, "Notes": "Legacy protocol"},
+        {"ProtocolName": "VIA", "IsEnabled": 0, "DefaultPort": None, "Notes": "Deprecated protocol (removed in SQL 2012+)"},
+    ]
+
+
+# (name, default, maximum, risky value)
+_CONFIGURATIONS = (
+    ("Ad Hoc Distributed Queries", 0, 1, 1),
+    ("allow updates", 0, 1, 1),
+    ("backup compression default", 0, 1, None),
+    ("clr enabled", 0, 1, 1),
+    ("common criteria compliance enabled", 0, 1, None),
+    ("contained database authentication", 0, 1, 1),
+    ("cost threshold for parallelism", 5, 32767, None),
+    ("cross db ownership chaining", 0, 1, 1),
+    ("c2 audit mode", 0, 1, None),
+    ("Database Mail XPs", 0, 1, 1),
+    ("default trace enabled", 1, 1, 0),
+    ("max degree of parallelism", 0, 32767, None),
+    ("max server memory (MB)", 2147483647, 2147483647, None),
+    ("Ole Automation Procedures", 0, 1, 1),
+    ("remote access", 1, 1, None),
+    ("remote admin connections", 0, 1, None),
+    ("scan for startup procs", 0, 1, 1),
+    ("show advanced options", 0, 1, 1),
+    ("xp_cmdshell", 0, 1, 1),
+)
+
+_ADVANCED_FAIL = {"xp_cmdshell", "Ole Automation Procedures", "Ad Hoc Distributed Queries", "remote access", "Database Mail XPs"}
+
+
+def _configuration_values(inst: _Instance) -> List[Tuple[str, int, int]]:
+    rng = inst.rng("configurations")
+    values = []
+    for name, default, maximum, risky in _CONFIGURATIONS:
+        value = risky if risky is not None and rng.random() < 0.15 else default
+        values.append((name, value, maximum))
+    return values
+
+
+def _sp_configure(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "SettingName": name,
+            "ConfiguredValue": value,
+            "RunningValue": value,
+            "MinValue": 0,
+            "MaxValue": maximum,
+            "IsDynamic": 1,
+            "IsAdvanced": int(name[0].islower()),
+            "Description": name,
+        }
+        for name, value, maximum in _configuration_values(inst)
+    ]
+
+
+def _advanced_options(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rows = []
+    for name, value, _maximum in _configuration_values(inst):
+        if name in _ADVANCED_FAIL and value == 1:
+            status = "FAIL"
+        elif name == "clr enabled" and value == 1:
+            status = "WARN"
+        else:
+            status = "OK"
+        rows.append({"SettingName": name, "CurrentValue": value, "Status": status})
+    return rows
+
+
+def _server_logins(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("logins")
+    rows = []
+    for index, name in enumerate(inst.login_names(), start=1):
+        windows = "\\" in name or (index > 3 and rng.random() < 0.3)
+        created = _when(rng)
+        rows.append(
+            {
+                "LoginName": name,
+                "PrincipalId": 1 if name == "sa" else 255 + index,
+                "SID": index.to_bytes(16, "big"),
+                "LoginType": "WINDOWS_LOGIN" if windows else "SQL_LOGIN",
+                "IsDisabled": int(name != "sa" and rng.random() < 0.1),
+                "CreateDate": created,
+                "ModifyDate": created + timedelta(days=rng.randint(0, 30)),
+                "DefaultDatabase": "master",
+                "DefaultLanguage": "us_english",
+                "PasswordLastSet": None if windows else created,
+                "IsExpired": 0,
+                "IsLocked": 0,
+                "MustChangePassword": 0,
+                "BadPasswordCount": 0,
+                "IsSA": int(name == "sa"),
+                "PasswordPolicyEnforced": None if windows else int(rng.random() < 0.8),
+                "PasswordExpirationEnabled": None if windows else int(rng.random() < 0.5),
+                "IsEmptyPassword": 0,
+            }
+        )
+    return rows
+
+
+def _server_role_members(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("server_roles")
+    logins = {row["LoginName"]: row for row in _server_logins(inst, None)}
+    rows = []
+    for role_id, role in enumerate(("sysadmin", "securityadmin", "serveradmin", "dbcreator"), start=3):
+        members = ["sa"] if role == "sysadmin" else []
+        members += [name for name in logins if name != "sa" and rng.random() < 0.04]
+        for member in members:
+            login = logins[member]
+            rows.append(
+                {
+                    "RoleName": role,
+                    "RolePrincipalId": role_id,
+                    "MemberName": member,
+                    "MemberPrincipalId": login["PrincipalId"],
+                    "MemberType": login["LoginType"],
+                    "MemberDisabled": login["IsDisabled"],
+                    "MemberCreateDate": login["CreateDate"],
+                }
+            )
+    return rows
+
+
+_SERVER_PERMISSIONS = ("CONNECT SQL", "VIEW SERVER STATE", "VIEW ANY DATABASE", "ALTER ANY LOGIN", "CONTROL SERVER", "IMPERSONATE")
+_DATABASE_PERMISSIONS = ("SELECT", "INSERT", "UPDATE", "DELETE", "EXECUTE", "CONNECT", "ALTER", "CONTROL", "VIEW DEFINITION")
+_STATES = ("GRANT", "GRANT", "GRANT", "DENY", "GRANT_WITH_GRANT_OPTION")
+
+
+def _server_permissions(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("server_permissions")
+    logins = inst.login_names()
+    rows = []
+    for _ in range(inst.spec.server_permissions):
+        rows.append(
+            {
+                "GranteeName": logins[rng.randrange(len(logins))],
+                "GranteeType": "SQL_LOGIN",
+                "PermissionClass": "SERVER",
+                "PermissionName": rng.choice(_SERVER_PERMISSIONS),
+                "PermissionState": rng.choice(_STATES),
+                "EntityName": "SERVER",
+            }
+        )
+    rows.sort(key=lambda row: (row["GranteeName"], row["PermissionName"]))
+    return rows
+
+
+def _databases(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("databases")
+    rows = []
+    for database_id, name in enumerate(list(_SYSTEM_DATABASES) + inst.spec.user_databases(), start=1):
+        system = database_id <= len(_SYSTEM_DATABASES)
+        data = round(rng.uniform(8, 50_000), 2)
+        log = round(data * rng.uniform(0.05, 0.5), 2)
+        rows.append(
+            {
+                "DatabaseId": database_id,
+                "DatabaseName": name,
+                "CreateDate": _when(rng, 3000),
+                "Collation": "SQL_Latin1_General_CP1_CI_AS",
+                "UserAccess": "MULTI_USER",
+                "State": "ONLINE",
+                "RecoveryModel": "SIMPLE" if system else rng.choice(("FULL", "FULL", "SIMPLE")),
+                "CompatibilityLevel": inst.version_major * 10,
+                "AutoClose": int(not system and rng.random() < 0.05),
+                "AutoShrink": int(not system and rng.random() < 0.05),
+                "IsReadOnly": 0,
+                "IsTrustworthy": int(name == "msdb" or (not system and rng.random() < 0.05)),
+                "DbChaining": int(name in ("master", "tempdb")),
+                "BrokerEnabled": int(name == "msdb"),
+                "IsEncrypted": int(not system and rng.random() < 0.2),
+                "Containment": "NONE",
+                "Owner": "sa",
+                "SizeMB": data + log,
+                "DataSizeMB": data,
+                "LogSizeMB": log,
+            }
+        )
+    rows.sort(key=lambda row: row["DatabaseName"])
+    return rows
+
+
+def _database_users(inst: _Instance, database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("database_users", database)
+    rows = []
+    for principal_id, (name, login) in enumerate(inst.user_names(database or "master"), start=1):
+        created = _when(rng)
+        rows.append(
+            {
+                "UserName": name,
+                "PrincipalId": principal_id,
+                "UserType": "SQL_USER",
+                "DefaultSchema": "dbo",
+                "CreateDate": created,
+                "ModifyDate": created,
+                "AuthenticationType": "NONE" if name == "guest" else "INSTANCE",
+                "MappedLogin": login,
+                "IsOrphaned": int(login is None and name != "guest"),
+                "GuestEnabled": int(name == "guest" and database in ("master", "tempdb", "msdb")),
+            }
+        )
+    return rows
+
+
+def _database_role_members(inst: _Instance, database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("database_roles", database)
+    rows = [
+        {"RoleName": "db_owner", "RolePrincipalId": 16384, "MemberName": "dbo", "MemberPrincipalId": 1, "MemberType": "SQL_USER"}
+    ]
+    roles = ("db_owner", "db_datareader", "db_datawriter", "db_ddladmin")
+    for principal_id, (name, _login) in enumerate(inst.user_names(database or "master"), start=1):
+        if name in ("dbo", "guest"):
+            continue
+        if rng.random() < 0.5:
+            role_index = rng.randrange(len(roles))
+            rows.append(
+                {
+                    "RoleName": roles[role_index],
+                    "RolePrincipalId": 16384 + role_index,
+                    "MemberName": name,
+                    "MemberPrincipalId": principal_id,
+                    "MemberType": "SQL_USER",
+                }
+            )
+    rows.sort(key=lambda row: (row["RoleName"], row["MemberName"]))
+    return rows
+
+
+def _orphaned_users(inst: _Instance, database: Optional[str]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "UserName": row["UserName"],
+            "UserType": row["UserType"],
+            "CreateDate": row["CreateDate"],
+            "DefaultSchema": row["DefaultSchema"],
+        }
+        for row in _database_users(inst, database)
+        if row["IsOrphaned"]
+    ]
+
+
+def _database_permissions(inst: _Instance, database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("database_permissions", database)
+    users = [name for name, _ in inst.user_names(database or "master") if name not in ("dbo", "guest")]
+    if not users:
+        return []
+    rows = []
+    for _ in range(inst.spec.permissions_per_db):
+        on_object = rng.random() < 0.7
+        rows.append(
+            {
+                "GranteeName": users[rng.randrange(len(users))],
+                "GranteeType": "SQL_USER",
+                "PermissionClass": "OBJECT_OR_COLUMN" if on_object else "DATABASE",
+                "PermissionName": rng.choice(_DATABASE_PERMISSIONS),
+                "PermissionState": rng.choice(_STATES),
+                "EntityName": f"Table{rng.randint(1, 500):03d}" if on_object else database,
+            }
+        )
+    rows.sort(key=lambda row: (row["GranteeName"], row["PermissionName"]))
+    return rows
+
+
+def _linked_servers(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("linked_servers")
+    rows = []
+    for server_id in range(1, inst.spec.linked_servers + 1):
+        rows.append(
+            {
+                "ServerId": server_id,
+                "LinkedServerName": f"LINK{server_id:02d}",
+                "Product": "SQL Server",
+                "Provider": "SQLNCLI11",
+                "DataSource": f"remote{server_id:02d}.example.local",
+                "Location": None,
+                "ProviderString": None,
+                "Catalog": None,
+                "IsLinked": 1,
+                "RemoteLoginEnabled": 1,
+                "RpcOutEnabled": int(rng.random() < 0.5),
+                "DataAccessEnabled": 1,
+                "CollationCompatible": 0,
+                "UsesRemoteCollation": 1,
+                "CollationName": None,
+                "ConnectTimeout": 0,
+                "QueryTimeout": 0,
+                "ModifyDate": _when(rng),
+            }
+        )
+    return rows
+
+
+def _linked_server_logins(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("linked_server_logins")
+    rows = []
+    for server_id in range(1, inst.spec.linked_servers + 1):
+        remote = rng.choice(("sa", "app_reader", None))
+        rows.append(
+            {
+                "LinkedServerName": f"LINK{server_id:02d}",
+                "LocalLogin": "(All Logins)",
+                "RemoteLogin": remote or "(Impersonate)",
+                "Impersonate": int(remote is None),
+                "ModifyDate": _when(rng),
+                "RiskLevel": "HIGH_PRIVILEGE" if remote == "sa" else "NORMAL",
+            }
+        )
+    return rows
+
+
+def _server_triggers(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("server_triggers")
+    if rng.random() < 0.7:
+        return []
+    created = _when(rng)
+    return [
+        {
+            "TriggerName": "trg_audit_logon",
+            "TriggerLevel": "SERVER",
+            "EventType": "LOGON",
+            "CreateDate": created,
+            "ModifyDate": created,
+            "IsDisabled": 0,
+            "IsMsShipped": 0,
+        }
+    ]
+
+
+def _database_triggers(inst: _Instance, database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("database_triggers", database)
+    rows = []
+    for index in range(1, inst.spec.triggers_per_db + 1):
+        created = _when(rng)
+        rows.append(
+            {
+                "TriggerName": f"trg_table{index:03d}_audit",
+                "SchemaName": "dbo",
+                "ParentObject": f"Table{index:03d}",
+                "TriggerType": "SQL_TRIGGER",
+                "CreateDate": created,
+                "ModifyDate": created,
+                "IsDisabled": int(rng.random() < 0.1),
+                "IsInsteadOf": 0,
+                "NotForReplication": 0,
+                "IsMsShipped": 0,
+            }
+        )
+    return rows
+
+
+def _backup_history(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("backup_history")
+    rows = []
+    for name in inst.spec.user_databases():
+        days = rng.choice((0, 0, 1, 1, 2, 8, 40)) if rng.random() < 0.95 else None
+        finished = None if days is None else _BASE_TIME - timedelta(days=days, hours=rng.randint(0, 12))
+        size = round(rng.uniform(10, 50_000), 2)
+        rows.append(
+            {
+                "DatabaseName": name,
+                "RecoveryModel": "FULL",
+                "DatabaseState": "ONLINE",
+                "BackupDate": finished,
+                "BackupType": None if days is None else "D",
+                "BackupTypeName": None if days is None else "Full",
+                "BackupSizeMB": None if days is None else size,
+                "CompressedSizeMB": None if days is None else round(size * 0.3, 2),
+                "DurationMinutes": None if days is None else rng.randint(1, 120),
+                "BackupPath": None if days is None else f"{inst.properties['DefaultBackupPath']}{name}.bak",
+                "BackupServer": inst.properties["ServerName"],
+                "BackupUser": None if days is None else f"NT Service\\{inst.properties['ServiceName']}",
+                "IsCopyOnly": 0,
+                "DaysSinceBackup": days,
+            }
+        )
+    return rows
+
+
+def _backup_jobs(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("backup_jobs")
+    rows = []
+    for kind in ("FULL", "LOG"):
+        created = _when(rng)
+        rows.append(
+            {
+                "JobId": f"{zlib.crc32((inst.server + kind).encode()):08X}-0000-0000-0000-000000000000",
+                "JobName": f"DatabaseBackup - USER_DATABASES - {kind}",
+                "IsEnabled": 1,
+                "CreateDate": created,
+                "ModifyDate": created,
+                "Category": "Database Maintenance",
+                "Owner": "sa",
+                "LastRunStatus": "Succeeded" if rng.random() < 0.9 else "Failed",
+                "LastRunDateTime": _BASE_TIME - timedelta(hours=rng.randint(1, 30)),
+                "LastRunDuration": rng.randint(10, 3000),
+                "LastMessage": "The job succeeded.",
+            }
+        )
+    return rows
+
+
+def _audit_settings(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    level = inst.rng("audit").choice(("None", "Failure Only", "Both", "Both"))
+    return [
+        {"SettingName": "Login Auditing", "CurrentValue": level, "RecommendedValue": "Both",
+         "Status": "PASS" if level == "Both" else "FAIL"},
+        {"SettingName": "Default Trace", "CurrentValue": "Enabled", "RecommendedValue": "Enabled", "Status": "PASS"},
+        {"SettingName": "C2 Audit Mode", "CurrentValue": "Disabled", "RecommendedValue": "Disabled", "Status": "PASS"},
+        {"SettingName": "Common Criteria", "CurrentValue": "Disabled", "RecommendedValue": "Disabled", "Status": "PASS"},
+    ]
+
+
+def _service_master_key(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    created = inst.properties["SQLStartTime"] - timedelta(days=365)
+    return [
+        {"KeyType": "SMK", "KeyName": "##MS_ServiceMasterKey##", "Algorithm": "AES_256",
+         "CreatedDate": created, "ModifyDate": created, "KeyLength": 256}
+    ]
+
+
+def _database_master_keys(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("database_master_keys")
+    rows = []
+    for name in inst.spec.user_databases():
+        if rng.random() < 0.2:
+            created = _when(rng)
+            rows.append({"DatabaseName": name, "KeyName": "##MS_DatabaseMasterKey##", "Algorithm": "AES_256",
+                         "CreatedDate": created, "ModifyDate": created, "KeyLength": 256})
+    return rows
+
+
+def _tde_status(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    encrypted = {row["DatabaseName"] for row in _databases(inst, None) if row["IsEncrypted"]}
+    rows = []
+    for name in inst.spec.user_databases():
+        on = name in encrypted
+        rows.append(
+            {
+                "DatabaseName": name,
+                "IsEncrypted": int(on),
+                "EncryptionState": 3 if on else None,
+                "EncryptionStateDesc": "Encrypted" if on else "Unknown",
+                "Algorithm": "AES" if on else None,
+                "KeyLength": 256 if on else None,
+                "EncryptorType": "CERTIFICATE" if on else None,
+                "CertificateName": "TDECert" if on else None,
+                "CertExpiryDate": _BASE_TIME + timedelta(days=365) if on else None,
+                "CreatedDate": _BASE_TIME - timedelta(days=200) if on else None,
+                "ModifyDate": _BASE_TIME - timedelta(days=200) if on else None,
+                "PercentComplete": 0.0 if on else None,
+            }
+        )
+    return rows
+
+
+def _encryption_certificates(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rng = inst.rng("certificates")
+    rows = []
+    for index, name in enumerate(("BackupCert", "TDECert"), start=256):
+        expiry = _BASE_TIME + timedelta(days=rng.randint(-30, 720))
+        backed_up = rng.random() < 0.7
+        rows.append(
+            {
+                "CertificateName": name,
+                "CertificateId": index,
+                "Subject": name,
+                "Issuer": name,
+                "StartDate": expiry - timedelta(days=730),
+                "ExpiryDate": expiry,
+                "PrivateKeyEncryption": "ENCRYPTED_BY_MASTER_KEY",
+                "PrivateKeyLastBackup": _when(rng) if backed_up else None,
+                "IsActiveForDialog": 1,
+                "DaysUntilExpiry": (expiry - _BASE_TIME).days,
+                "IsBackedUp": int(backed_up),
+            }
+        )
+    return rows
+
+
+def _encryption_keys(inst: _Instance, _database: Optional[str]) -> List[Dict[str, Any]]:
+    rows = [{"DatabaseName": "master", "KeyName": "##MS_ServiceMasterKey##", "KeyType": "Service Master Key",
+             "Algorithm": "AES_256", "KeyLength": 256}]
+    rows.extend(
+        {"DatabaseName": "master", "KeyName": row["KeyName"], "KeyType": "Database Master Key",
+         "Algorithm": row["Algorithm"], "KeyLength": row["KeyLength"]}
+        for row in _database_master_keys(inst, None)[:1]
+    )
+    return rows
+
+
+Generator = Callable[[_Instance, Optional[str]], List[Dict[str, Any]]]
+
+# QueryProvider method -> rows it returns
+_GENERATORS: Dict[str, Generator] = {
+    "get_server_info": _server_info,
+    "get_instance_properties": _server_info,
+    "get_sql_services": _sql_services,
+    "get_client_protocols": _client_protocols,
+    "get_sp_configure": _sp_configure,
+    "get_advanced_options": _advanced_options,
+    "get_server_logins": _server_logins,
+    "get_server_role_members": _server_role_members,
+    "get_server_permissions": _server_permissions,
+    "get_database_permissions": _database_permissions,
+    "get_databases": _databases,
+    "get_database_users": _database_users,
+    "get_database_role_members": _database_role_members,
+    "get_orphaned_users": _orphaned_users,
+    "get_linked_servers": _linked_servers,
+    "get_linked_server_logins": _linked_server_logins,
+    "get_server_triggers": _server_triggers,
+    "get_database_triggers": _database_triggers,
+    "get_backup_history": _backup_history,
+    "get_backup_jobs": _backup_jobs,
+    "get_audit_settings": _audit_settings,
+    "get_service_master_key": _service_master_key,
+    "get_database_master_keys": _database_master_keys,
+    "get_tde_status": _tde_status,
+    "get_encryption_certificates": _encryption_certificates,
+    "get_encryption_keys": _encryption_keys,
+}
+
+# Single-row property queries: columns come from the query, values from properties
+_PROPERTY_QUERIES = {"get_server_info", "get_instance_properties"}
+
+
+# ---------------------------------------------------------------------------
+# Query recognition
+# ---------------------------------------------------------------------------
+
+
+def _normalize(sql: str) -> str:
+    return " ".join(sql.split())
+
+
+def _column_aliases(sql: str) -> List[str]:
+    """Column aliases of a query's select lists, in order, without duplicates."""
+    return list(dict.fromkeys(_ALIAS_RE.findall(sql)))
+
+
+class _QueryCatalog:
+    """Recognizes QueryProvider SQL and remembers the column aliases of each query."""
+
+    def __init__(self, providers: Sequence[QueryProvider]) -> None:
+        self._exact: Dict[str, str] = {}
+        self._patterns: List[Tuple[re.Pattern[str], str]] = []
+        for provider in providers:
+            for name in sorted(_GENERATORS):
+                method = getattr(provider, name)
+                if "database" in inspect.signature(method).parameters:
+                    text = re.escape(_normalize(method(_DB_SENTINEL)))
+                    text = text.replace(_DB_SENTINEL, r"(?P<db>[^\]']+?)", 1)
+                    text = text.replace(_DB_SENTINEL, r"(?P=db)")
+                    self._patterns.append((re.compile(text), name))
+                else:
+                    self._exact[_normalize(method())] = name
+
+    def match(self, sql: str) -> Tuple[Optional[str], Optional[str]]:
+        """(provider method, database) for sql, or (None, None) if unknown."""
+        normalized = _normalize(sql)
+        name = self._exact.get(normalized)
+        if name is not None:
+            return name, None
+        for pattern, name in self._patterns:
+            found = pattern.fullmatch(normalized)
+            if found:
+                return name, found.group("db")
+        return None, None
+
+
+# ---------------------------------------------------------------------------
+# Driver (pyodbc module interface)
+# ---------------------------------------------------------------------------
+
+
+class Row:
+    """Result row with index and attribute access (like pyodbc.Row)."""
+
+    __slots__ = ("_values", "_index", "cursor_description")
+
+    def __init__(self, values: Tuple[Any, ...], index: Dict[str, int], description: Any) -> None:
+        self._values = values
+        self._index = index
+        self.cursor_description = description
+
+    def __getitem__(self, item: Any) -> Any:
+        return self._values[item]
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[self._index[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        return tuple(self) == tuple(other) if isinstance(other, (Row, tuple)) else NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._values)
+
+
+def _description_entry(column: str, sample: Any) -> Tuple[Any, ...]:
+    return (column, type(sample) if sample is not None else str, None, None, None, None, True)
+
+
+class Cursor:
+    """pyodbc-style cursor over one stand-in connection."""
+
+    def __init__(self, connection: "Connection") -> None:
+        self.connection = connection
+        self.description: Optional[List[Tuple[Any, ...]]] = None
+        self.rowcount = -1
+        self._rows: List[Row] = []
+        self._position = 0
+
+    def execute(self, sql: str, *params: Any) -> "Cursor":
+        """Run a statement; SELECTs produce a single result set."""
+        del params  # Parameters don't change the synthetic data
+        columns, rows = self.connection.driver.run(self.connection.instance, sql)
+        if columns is None:
+            self.description, self._rows, self.rowcount = None, [], 0
+        else:
+            sample = rows[0] if rows else {}
+            self.description = [_description_entry(c, sample.get(c)) for c in columns]
+            index = {column: position for position, column in enumerate(columns)}
+            self._rows = [
+                Row(tuple(row.get(column) for column in columns), index, self.description)
+                for row in rows
+            ]
+            self.rowcount = len(self._rows)
+        self._position = 0
+        return self
+
+    def fetchone(self) -> Optional[Row]:
+        if self._position >= len(self._rows):
+            return None
+        self._position += 1
+        return self._rows[self._position - 1]
+
+    def fetchmany(self, size: int = 1) -> List[Row]:
+        rows = self._rows[self._position:self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchall(self) -> List[Row]:
+        rows = self._rows[self._position:]
+        self._position = len(self._rows)
+        return rows
+
+    def nextset(self) -> bool:
+        """The stand-in returns one result set per statement batch."""
+        self.description, self._rows, self._position = None, [], 0
+        return False
+
+    def close(self) -> None:
+        self._rows = []
+
+    def __iter__(self) -> Iterator[Row]:
+        return iter(self.fetchone, None)
+
+    def __enter__(self) -> "Cursor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class Connection:
+    """pyodbc-style connection to one synthetic instance."""
+
+    def __init__(self, driver: "StandInDriver", instance: _Instance, autocommit: bool) -> None:
+        self.driver = driver
+        self.instance = instance
+        self.autocommit = autocommit
+        self.closed = False
+
+    def cursor(self) -> Cursor:
+        if self.closed:
+            raise ProgrammingError("Attempt to use a closed connection.")
+        return Cursor(self)
+
+    def execute(self, sql: str, *params: Any) -> Cursor:
+        return self.cursor().execute(sql, *params)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __enter__(self) -> "Connection":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        # pyodbc commits (it does not close) when leaving the block
+        if not exc[0] and not self.autocommit:
+            self.commit()
+
+
+class StandInDriver:
+    """
+    pyodbc-compatible driver serving a synthetic fleet.
+
+    Exposes the parts of the pyodbc module the audit uses (connect,
+    drivers, the exception classes) and counts connections and queries
+    for benchmarks.
+    """
+
+    Error = Error
+    DatabaseError = DatabaseError
+    OperationalError = OperationalError
+    ProgrammingError = ProgrammingError
+    InterfaceError = InterfaceError
+
+    def __init__(self, spec: Optional[FleetSpec] = None) -> None:
+        """
+        Args:
+            spec: Fleet description (default: FleetSpec())
+        """
+        self.spec = spec or FleetSpec()
+        self._catalog = _QueryCatalog([Sql2008Provider(), Sql2019PlusProvider()])
+        self._instances: Dict[str, _Instance] = {}
+        self._aliases: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self._failures = random.Random(self.spec.seed)
+        self.connections = 0
+        self.queries = 0
+        self.rows_served = 0
+
+    def drivers(self) -> List[str]:
+        """Installed ODBC drivers (pyodbc.drivers())."""
+        return [STANDIN_DRIVER]
+
+    def connect(self, connection_string: str, autocommit: bool = False, **_kwargs: Any) -> Connection:
+        """
+        Open a connection to the instance named by SERVER= (pyodbc.connect).
+
+        Raises:
+            InterfaceError: If the connection string has no SERVER
+            OperationalError: If the instance is offline or a failure is injected
+        """
+        settings = dict(
+            part.split("=", 1) for part in connection_string.split(";") if "=" in part
+        )
+        server = next((v for k, v in settings.items() if k.strip().upper() == "SERVER"), "").strip()
+        if not server:
+            raise InterfaceError("IM002", "[stand-in] Data source name not found (no SERVER)")
+
+        self._sleep(self.spec.connect_latency_ms / 1000)
+        instance = self._instance(server)
+        with self._lock:
+            self.connections += 1
+            injected = self._failures.random() < self.spec.connect_failure_rate
+        if instance.offline or injected:
+            raise OperationalError(
+                "08001", f"[stand-in] Named Pipes Provider: Could not open a connection to {server}"
+            )
+        return Connection(self, instance, autocommit)
+
+    def run(self, instance: _Instance, sql: str) -> Tuple[Optional[List[str]], List[Dict[str, Any]]]:
+        """
+        Columns and rows for one statement batch (columns None: no result set).
+
+        Raises:
+            ProgrammingError: If a query failure is injected
+        """
+        with self._lock:
+            self.queries += 1
+            injected = self._failures.random() < self.spec.query_failure_rate
+        if injected:
+            raise ProgrammingError("42000", "[stand-in] Injected query failure")
+
+        columns, rows = self._answer(instance, sql)
+        with self._lock:
+            self.rows_served += len(rows)
+        self._sleep(self.spec.query_latency_ms / 1000 + len(rows) * self.spec.row_latency_us / 1e6)
+        return columns, rows
+
+    def _answer(self, instance: _Instance, sql: str) -> Tuple[Optional[List[str]], List[Dict[str, Any]]]:
+        name, database = self._catalog.match(sql)
+        aliases = self._query_aliases(sql)
+        if name is not None and name not in _PROPERTY_QUERIES:
+            rows = _GENERATORS[name](instance, database)
+            columns = list(rows[0]) if rows else []
+            columns += [alias for alias in aliases if alias not in columns]
+            return columns, rows
+
+        if "@@VERSION" in sql.upper() and not aliases:
+            return [""], [{"": instance.version_string()}]
+        if aliases:
+            return aliases, [{alias: instance.properties.get(alias) for alias in aliases}]
+        if re.search(r"\bSELECT\b", sql, re.I):
+            return ["Result"], [{"Result": None}]
+        return None, []
+
+    def _query_aliases(self, sql: str) -> List[str]:
+        aliases = self._aliases.get(sql)
+        if aliases is None:
+            aliases = _column_aliases(sql)
+            with self._lock:
+                self._aliases[sql] = aliases
+        return aliases
+
+    def _instance(self, server: str) -> _Instance:
+        key = server.lower()
+        instance = self._instances.get(key)
+        if instance is None:
+            instance = _Instance(self.spec, server)
+            with self._lock:
+                instance = self._instances.setdefault(key, instance)
+        return instance
+
+    @staticmethod
+    def _sleep(seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
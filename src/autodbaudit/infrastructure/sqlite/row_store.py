@@ -0,0 +1,428 @@
+"""
+Content-addressed row storage for per-run audit tables.
+
+By default every audit run inserts a full copy of findings, logins,
+databases, users, etc. In content-addressed mode each table T is split:
+
+    T_rows      (row_hash PRIMARY KEY, <content columns>)
+    T_run_rows  (id, audit_run_id, <unique key columns>, row_hash, collected_at)
+
+A row whose content did not change since the previous run is stored
+once and merely referenced by the new run. T itself becomes a view with
+the original column order, and INSTEAD OF triggers route INSERT/UPDATE/
+DELETE statements, so existing queries and save_* helpers keep working.
+
+The mode is opt-in (audit_config.json: output.history_storage) and
+one-way: enabling it migrates existing rows in place.
+
+Usage:
+    sqlite3.connect(path, factory=HistoryConnection)  # caches the mode
+    register_row_functions(conn)              # every connection
+    enable_content_addressed_storage(conn)    # once, idempotent
+    inserted_row_id(conn, cursor, table, ...) # id after a save_* INSERT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Per-run tables that may be stored by reference.
+# linked_servers is excluded: linked_server_logins holds a foreign key to it.
+CONTENT_ADDRESSED_TABLES: tuple[str, ...] = (
+    "findings",
+    "logins",
+    "login_role_memberships",
+    "databases",
+    "database_users",
+    "database_role_memberships",
+    "config_settings",
+    "triggers",
+    "audit_settings",
+    "sql_services",
+)
+
+# Columns that identify the run, not the content
+RUN_COLUMNS = frozenset({"id", "audit_run_id", "collected_at"})
+
+STORAGE_MODE_KEY = "history_storage"
+STORAGE_MODE_CONTENT_ADDRESSED = "content_addressed"
+
+
+def compute_row_hash(*values) -> str:
+    """Stable hash of a row's content columns."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        digest.update(type(value).__name__.encode())
+        digest.update(b"\x1f")
+        digest.update(repr(value).encode("utf-8", "surrogatepass"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class HistoryConnection(sqlite3.Connection):
+    """
+    Connection that remembers which per-run tables are stored by reference.
+
+    The set is read from the catalog on first use and refreshed by
+    enable_content_addressed_storage, so save_* helpers learn the storage
+    mode without a catalog query per insert.
+    """
+
+    content_addressed: frozenset[str] | None = None
+
+
+def register_row_functions(connection: sqlite3.Connection) -> None:
+    """Register row_hash() on a connection (required by the view triggers)."""
+    connection.create_function("row_hash", -1, compute_row_hash, deterministic=True)
+
+
+def _q(name: str) -> str:
+    """Quote an identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _object_type(connection: sqlite3.Connection, name: str) -> str | None:
+    row = connection.execute(
+        "SELECT type FROM sqlite_master WHERE name = ? AND type IN ('table', 'view')",
+        (name,),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def is_content_addressed(connection: sqlite3.Connection, table: str = "findings") -> bool:
+    """Check whether a table is stored by reference."""
+    return _object_type(connection, f"{table}_run_rows") == "table"
+
+
+def content_addressed_tables(connection: sqlite3.Connection) -> frozenset[str]:
+    """Tables stored by reference; cached on a HistoryConnection."""
+    cached = getattr(connection, "content_addressed", None)
+    if cached is not None:
+        return cached
+    tables = frozenset(
+        r[0][: -len("_run_rows")]
+        for r in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ? ESCAPE '\\'",
+            ("%\\_run\\_rows",),
+        )
+    )
+    if isinstance(connection, HistoryConnection):
+        connection.content_addressed = tables
+    return tables
+
+
+def _table_columns(connection: sqlite3.Connection, table: str) -> list[tuple[str, str]]:
+    """Return (name, declared type) for each column in order."""
+    return [(r[1], r[2] or "") for r in connection.execute(f"PRAGMA table_info({_q(table)})")]
+
+
+def _run_key_columns(connection: sqlite3.Connection, table: str) -> list[str] | None:
+    """Columns of the UNIQUE constraint that includes audit_run_id, minus audit_run_id."""
+    for index in connection.execute(f"PRAGMA index_list({_q(table)})").fetchall():
+        # (seq, name, unique, origin, partial)
+        if not index[2]:
+            continue
+        columns = [
+            r[2] for r in connection.execute(f"PRAGMA index_info({_q(index[1])})")
+        ]
+        if "audit_run_id" in columns:
+            return [c for c in columns if c != "audit_run_id"]
+    return None
+
+
+def _link_key_columns(connection: sqlite3.Connection, table: str) -> list[str]:
+    """Run key columns of a converted table's link table (without audit_run_id)."""
+    return [
+        n
+        for n, _ in _table_columns(connection, f"{table}_run_rows")
+        if n not in {"id", "audit_run_id", "row_hash", "collected_at"}
+    ]
+
+
+def _trigger_ddl(connection: sqlite3.Connection, table: str) -> dict[str, str]:
+    """CREATE TRIGGER statements routing writes on the view of a converted table."""
+    rows_t, links_t = f"{table}_rows", f"{table}_run_rows"
+    keys = _link_key_columns(connection, table)
+    content_names = [n for n, _ in _table_columns(connection, rows_t) if n != "row_hash"]
+
+    content_list = ", ".join(_q(n) for n in content_names)
+    key_list = ", ".join(_q(k) for k in keys)
+    new_hash = "row_hash(" + ", ".join(f"NEW.{_q(n)}" for n in content_names) + ")"
+    new_content = ", ".join(f"NEW.{_q(n)}" for n in content_names)
+    new_keys = ", ".join(f"NEW.{_q(k)}" for k in keys)
+    set_keys = ", ".join(f"{_q(k)} = NEW.{_q(k)}" for k in keys)
+    same_key = " AND ".join(f"{_q(k)} IS NEW.{_q(k)}" for k in keys)
+
+    # INSERT OR REPLACE on the view replaces the link row for the same run
+    # key; reusing its id keeps row ids stable across re-saves.
+    return {
+        f"{table}_cas_insert": f"""CREATE TRIGGER {_q(table + '_cas_insert')}
+        INSTEAD OF INSERT ON {_q(table)}
+        BEGIN
+            INSERT OR IGNORE INTO {_q(rows_t)} (row_hash, {content_list})
+            VALUES ({new_hash}, {new_content});
+            INSERT INTO {_q(links_t)} (id, audit_run_id, {key_list}, row_hash, collected_at)
+            VALUES (
+                COALESCE(NEW.id, (SELECT id FROM {_q(links_t)}
+                                  WHERE audit_run_id = NEW.audit_run_id AND {same_key})),
+                NEW.audit_run_id, {new_keys}, {new_hash},
+                COALESCE(NEW.collected_at, strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')));
+        END""",
+        f"{table}_cas_update": f"""CREATE TRIGGER {_q(table + '_cas_update')}
+        INSTEAD OF UPDATE ON {_q(table)}
+        BEGIN
+            INSERT OR IGNORE INTO {_q(rows_t)} (row_hash, {content_list})
+            VALUES ({new_hash}, {new_content});
+            UPDATE {_q(links_t)}
+            SET audit_run_id = NEW.audit_run_id, {set_keys},
+                row_hash = {new_hash}, collected_at = NEW.collected_at
+            WHERE id = OLD.id;
+        END""",
+        f"{table}_cas_delete": f"""CREATE TRIGGER {_q(table + '_cas_delete')}
+        INSTEAD OF DELETE ON {_q(table)}
+        BEGIN
+            DELETE FROM {_q(links_t)} WHERE id = OLD.id;
+        END""",
+    }
+
+
+def _create_triggers(connection: sqlite3.Connection, table: str) -> bool:
+    """Create or upgrade the view triggers of a converted table. Returns True if changed."""
+    existing = dict(
+        connection.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ?",
+            (table,),
+        ).fetchall()
+    )
+    changed = False
+    for name, ddl in _trigger_ddl(connection, table).items():
+        if existing.get(name) == ddl:
+            continue
+        connection.execute(f"DROP TRIGGER IF EXISTS {_q(name)}")
+        connection.execute(ddl)
+        changed = True
+    return changed
+
+
+def _migrate_table(connection: sqlite3.Connection, table: str) -> int:
+    """Convert one physical table to rows + links + view. Returns rows migrated."""
+    columns = _table_columns(connection, table)
+    keys = _run_key_columns(connection, table)
+    names = [name for name, _ in columns]
+    if not keys or "audit_run_id" not in names or "collected_at" not in names:
+        logger.warning("Table %s has no per-run unique key; left as-is", table)
+        return 0
+
+    content = [(n, t) for n, t in columns if n not in RUN_COLUMNS]
+    content_names = [n for n, _ in content]
+    key_types = dict(columns)
+
+    rows_t, links_t = f"{table}_rows", f"{table}_run_rows"
+    content_ddl = ", ".join(f"{_q(n)} {t}" for n, t in content)
+    key_ddl = ", ".join(f"{_q(k)} {key_types[k]}" for k in keys)
+    key_list = ", ".join(_q(k) for k in keys)
+    content_list = ", ".join(_q(n) for n in content_names)
+    hash_expr = "row_hash(" + ", ".join(_q(n) for n in content_names) + ")"
+
+    connection.execute(
+        f"CREATE TABLE {_q(rows_t)} (row_hash TEXT PRIMARY KEY, {content_ddl})"
+    )
+    connection.execute(
+        f"""
+        CREATE TABLE {_q(links_t)} (
+            id INTEGER PRIMARY KEY,
+            audit_run_id INTEGER NOT NULL REFERENCES audit_runs(id) ON DELETE CASCADE,
+            {key_ddl},
+            row_hash TEXT NOT NULL,
+            collected_at TEXT,
+            UNIQUE(audit_run_id, {key_list})
+        )
+        """
+    )
+    connection.execute(
+        f"CREATE INDEX {_q('idx_' + links_t + '_hash')} ON {_q(links_t)}(row_hash)"
+    )
+
+    # Existing rows: dedupe content, keep ids so external references stay valid
+    connection.execute(
+        f"INSERT OR IGNORE INTO {_q(rows_t)} (row_hash, {content_list}) "
+        f"SELECT {hash_expr}, {content_list} FROM {_q(table)}"
+    )
+    cursor = connection.execute(
+        f"INSERT INTO {_q(links_t)} (id, audit_run_id, {key_list}, row_hash, collected_at) "
+        f"SELECT id, audit_run_id, {key_list}, {hash_expr}, collected_at FROM {_q(table)}"
+    )
+    migrated = cursor.rowcount
+    connection.execute(f"DROP TABLE {_q(table)}")
+
+    # View with the original column order
+    select_cols = []
+    for name in names:
+        if name in RUN_COLUMNS:
+            select_cols.append(f"l.{_q(name)} AS {_q(name)}")
+        else:
+            select_cols.append(f"r.{_q(name)} AS {_q(name)}")
+    connection.execute(
+        f"CREATE VIEW {_q(table)} AS SELECT {', '.join(select_cols)} "
+        f"FROM {_q(links_t)} l JOIN {_q(rows_t)} r ON r.row_hash = l.row_hash"
+    )
+
+    _create_triggers(connection, table)
+    return migrated
+
+
+def enable_content_addressed_storage(
+    connection: sqlite3.Connection,
+    tables: tuple[str, ...] = CONTENT_ADDRESSED_TABLES,
+) -> dict[str, int]:
+    """
+    Switch per-run tables to content-addressed storage.
+
+    Idempotent: tables already converted (or not present) are skipped.
+    Runs in a single transaction so a failure leaves the DB untouched.
+
+    Returns:
+        Dict of table name -> number of existing rows migrated
+    """
+    register_row_functions(connection)
+    migrated: dict[str, int] = {}
+    if isinstance(connection, HistoryConnection):
+        connection.content_addressed = None  # Re-read after converting
+
+    # Databases converted by an earlier version get the current triggers
+    converted = [t for t in tables if is_content_addressed(connection, t)]
+    if any([_create_triggers(connection, t) for t in converted]):
+        connection.commit()
+
+    pending = [t for t in tables if _object_type(connection, t) == "table"]
+    if pending:
+        connection.commit()
+        try:
+            connection.execute("BEGIN")
+            for table in pending:
+                migrated[table] = _migrate_table(connection, table)
+            connection.execute(
+                "INSERT OR REPLACE INTO schema_meta (key, value) VALUES (?, ?)",
+                (STORAGE_MODE_KEY, STORAGE_MODE_CONTENT_ADDRESSED),
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        logger.info("Content-addressed storage enabled: %s", migrated)
+    return migrated
+
+
+def carry_forward_rows(
+    connection: sqlite3.Connection,
+    source_run_id: int,
+    target_run_id: int,
+    instance_ids: list[int],
+    tables: tuple[str, ...] = CONTENT_ADDRESSED_TABLES,
+) -> dict[str, int]:
+    """
+    Carry a previous run's rows of some instances into a new run.
+
+    Works in both storage modes: physical tables get copies made inside
+    SQLite, content-addressed tables only get new link rows. Tables without
+    an instance_id column (sql_services) are not carried in either mode.
+
+    Returns:
+        Dict of table name -> number of rows carried
+    """
+    if not instance_ids:
+        return {}
+
+    placeholders = ",".join("?" * len(instance_ids))
+    carried: dict[str, int] = {}
+    for table in tables:
+        if is_content_addressed(connection, table):
+            rows_t, links_t = f"{table}_rows", f"{table}_run_rows"
+            if "instance_id" not in {n for n, _ in _table_columns(connection, rows_t)}:
+                continue
+            keys = _link_key_columns(connection, table)
+            key_list = ", ".join(_q(k) for k in keys)
+            link_keys = ", ".join(f"l.{_q(k)}" for k in keys)
+            sql = f"""
+                INSERT OR IGNORE INTO {_q(links_t)}
+                    (audit_run_id, {key_list}, row_hash, collected_at)
+                SELECT ?, {link_keys}, l.row_hash, l.collected_at
+                FROM {_q(links_t)} l JOIN {_q(rows_t)} r ON r.row_hash = l.row_hash
+                WHERE l.audit_run_id = ? AND r.instance_id IN ({placeholders})
+            """
+        elif _object_type(connection, table) == "table":
+            columns = [
+                n for n, _ in _table_columns(connection, table) if n not in ("id", "audit_run_id")
+            ]
+            if "instance_id" not in columns:
+                continue
+            column_list = ", ".join(_q(c) for c in columns)
+            sql = f"""
+                INSERT OR IGNORE INTO {_q(table)} (audit_run_id, {column_list})
+                SELECT ?, {column_list}
+                FROM {_q(table)}
+                WHERE audit_run_id = ? AND instance_id IN ({placeholders})
+            """
+        else:
+            continue
+        cursor = connection.execute(sql, (target_run_id, source_run_id, *instance_ids))
+        carried[table] = cursor.rowcount
+    return carried
+
+
+def inserted_row_id(
+    connection: sqlite3.Connection,
+    cursor: sqlite3.Cursor,
+    table: str,
+    audit_run_id: int,
+    **key,
+) -> int:
+    """
+    Id of the row a save_* helper just inserted into a per-run table.
+
+    cursor.lastrowid is stale after an INSERT into a content-addressed view
+    (SQLite restores last_insert_rowid when the INSTEAD OF trigger ends),
+    so the link row is looked up by the run key instead. In full storage
+    mode on a HistoryConnection this runs no SQL at all.
+
+    Args:
+        key: The table's run key columns (besides audit_run_id) and values
+    """
+    if table not in content_addressed_tables(connection):
+        return cursor.lastrowid
+    where = " AND ".join(f"{_q(k)} IS ?" for k in key)
+    row = connection.execute(
+        f"SELECT id FROM {_q(table + '_run_rows')} WHERE audit_run_id = ? AND {where}",
+        (audit_run_id, *key.values()),
+    ).fetchone()
+    return row[0]
+
+
+def without_view_indexes(connection: sqlite3.Connection, script: str) -> str:
+    """
+    Drop single-line CREATE INDEX statements that target a view.
+
+    Schema DDL indexes the physical per-run tables; once a table is a view
+    those statements would fail, and the link table already carries the
+    run/key index.
+    """
+    views = {
+        r[0]
+        for r in connection.execute("SELECT name FROM sqlite_master WHERE type = 'view'")
+    }
+    if not views:
+        return script
+
+    kept = []
+    for line in script.splitlines():
+        stripped = line.strip()
+        if stripped.upper().startswith("CREATE INDEX") and " ON " in stripped.upper():
+            target = stripped[stripped.upper().index(" ON ") + 4 :].split("(", 1)[0].strip()
+            if target in views:
+                continue
+        kept.append(line)
+    return "\n".join(kept)
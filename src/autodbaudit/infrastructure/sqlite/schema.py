@@ -20,6 +20,8 @@ import logging
 import sqlite3
 from datetime import datetime, timezone
 
+from autodbaudit.infrastructure.sqlite.row_store import inserted_row_id, without_view_indexes
+
 logger = logging.getLogger(__name__)
 
 # Schema version 2 DDL statements
@@ -434,6 +436,7 @@ CREATE INDEX IF NOT EXISTS idx_logins_instance ON logins(instance_id, audit_run_
 CREATE INDEX IF NOT EXISTS idx_logins_name ON logins(login_name);
 CREATE INDEX IF NOT EXISTS idx_database_users_instance ON database_users(instance_id, audit_run_id);
 CREATE INDEX IF NOT EXISTS idx_annotations_key ON annotations(entity_type, entity_key);
+CREATE INDEX IF NOT EXISTS idx_annotations_entity ON annotations(entity_key, field_name);
 CREATE INDEX IF NOT EXISTS idx_backup_history_db ON backup_history(instance_id, database_name);
 CREATE INDEX IF NOT EXISTS idx_findings_key ON findings(entity_key);
 CREATE INDEX IF NOT EXISTS idx_findings_status ON findings(audit_run_id, status);
@@ -441,17 +444,6 @@ CREATE INDEX IF NOT EXISTS idx_finding_changes_runs ON finding_changes(from_run_
 CREATE INDEX IF NOT EXISTS idx_action_log_initial ON action_log(initial_run_id);
 CREATE INDEX IF NOT EXISTS idx_action_log_entity ON action_log(entity_key);
 
--- ============================================================================
--- PS Remoting Indexes
--- ============================================================================
-
-CREATE INDEX IF NOT EXISTS idx_psremoting_profiles_server ON psremoting_profiles(server_name);
-CREATE INDEX IF NOT EXISTS idx_psremoting_profiles_success ON psremoting_profiles(successful, last_successful_attempt);
-CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_profile ON psremoting_attempts(profile_id);
-CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_timestamp ON psremoting_attempts(attempt_timestamp);
-CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_layer ON psremoting_attempts(layer, success);
-CREATE INDEX IF NOT EXISTS idx_psremoting_server_state_profile ON psremoting_server_state(profile_id, state_type);
-
 -- ============================================================================
 -- PS Remoting Connection Profiles
 -- ============================================================================
@@ -532,6 +524,17 @@ CREATE TABLE IF NOT EXISTS psremoting_server_state (
     full_state_json TEXT,                   -- Complete JSON snapshot
     UNIQUE(profile_id, state_type)
 );
+
+-- ============================================================================
+-- PS Remoting Indexes
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_psremoting_profiles_server ON psremoting_profiles(server_name);
+CREATE INDEX IF NOT EXISTS idx_psremoting_profiles_success ON psremoting_profiles(successful, last_successful_attempt);
+CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_profile ON psremoting_attempts(profile_id);
+CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_timestamp ON psremoting_attempts(attempt_timestamp);
+CREATE INDEX IF NOT EXISTS idx_psremoting_attempts_layer ON psremoting_attempts(layer, success);
+CREATE INDEX IF NOT EXISTS idx_psremoting_server_state_profile ON psremoting_server_state(profile_id, state_type);
 """
 
 
@@ -562,7 +565,16 @@ def save_database_role_member(
             now,
         ),
     )
-    return cursor.lastrowid
+    return inserted_row_id(
+        connection,
+        cursor,
+        "database_role_memberships",
+        audit_run_id,
+        instance_id=instance_id,
+        database_name=database_name,
+        role_name=role_name,
+        member_name=member_name,
+    )
 
 
 def save_permission(
@@ -632,8 +644,9 @@ def initialize_schema_v2(connection) -> None:
     """
     logger.info("Initializing schema v2 tables...")
 
-    # Execute all DDL statements
-    connection.executescript(SCHEMA_V2_TABLES)
+    # Execute all DDL statements (tables turned into views by
+    # content-addressed storage cannot be indexed again)
+    connection.executescript(without_view_indexes(connection, SCHEMA_V2_TABLES))
 
     # Update schema version
     connection.execute(
@@ -878,7 +891,7 @@ def save_finding(
     )
 
     connection.commit()
-    return cursor.lastrowid
+    return inserted_row_id(connection, cursor, "findings", audit_run_id, entity_key=entity_key)
 
 
 def get_findings_for_run(
@@ -1105,6 +1118,120 @@ def get_annotations_for_entity(connection, entity_key: str) -> dict:
     return result
 
 
+def _annotation_value(value) -> str | None:
+    """Normalize an annotation value the way persist_annotations_to_db stores it."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def get_annotations_as_of(connection, run_id: int) -> dict[str, dict] | None:
+    """
+    Reconstruct annotations as they were at the end of a sync run.
+
+    Returns the latest version of each field at or before run_id. The
+    query walks the (entity_key, entity_type, field_name, run_id) unique
+    index once and groups as it goes, without a sort. Its cost therefore
+    grows with the number of stored versions. Versions are only written
+    when a field changes, so that is usually close to the number of
+    annotated fields.
+
+    Args:
+        connection: SQLite connection
+        run_id: Audit run ID
+
+    Returns:
+        Dict of {entity_type|entity_key: {field_name: value}}, or None if
+        no snapshot was recorded at or before this run
+    """
+    snapshot = connection.execute(
+        "SELECT 1 FROM annotation_snapshots WHERE run_id <= ? LIMIT 1",
+        (run_id,),
+    ).fetchone()
+    if snapshot is None:
+        return None
+
+    # SQLite returns the bare columns of the MAX(run_id) row per group
+    rows = connection.execute(
+        """
+        SELECT entity_type, entity_key, field_name, field_value, MAX(run_id)
+        FROM annotation_versions
+        WHERE run_id <= ?
+        GROUP BY entity_key, entity_type, field_name
+    """,
+        (run_id,),
+    ).fetchall()
+
+    annotations: dict[str, dict] = {}
+    for entity_type, entity_key, field_name, field_value, _ in rows:
+        if field_value is None:
+            continue  # Field was removed
+        annotations.setdefault(f"{entity_type}|{entity_key}", {})[field_name] = field_value
+    return annotations
+
+
+def record_annotation_versions(
+    connection, run_id: int, annotations: dict[str, dict]
+) -> int:
+    """
+    Record the annotation state at the end of a sync run.
+
+    Only fields that differ from the previous snapshot are written;
+    removed fields get a NULL tombstone.
+
+    Args:
+        connection: SQLite connection
+        run_id: Sync run the state belongs to
+        annotations: Dict of {entity_type|entity_key: {field_name: value}}
+
+    Returns:
+        Number of field versions written
+    """
+    previous = get_annotations_as_of(connection, run_id) or {}
+    now = datetime.now(timezone.utc).isoformat()
+    rows = []
+
+    current: dict[str, dict] = {}
+    for full_key, fields in annotations.items():
+        parts = full_key.lower().split("|", 1)
+        if len(parts) != 2:
+            continue
+        values = {
+            name: _annotation_value(value)
+            for name, value in fields.items()
+            if value is not None
+        }
+        current[f"{parts[0]}|{parts[1]}"] = values
+        old_fields = previous.get(f"{parts[0]}|{parts[1]}", {})
+        for name, value in values.items():
+            if old_fields.get(name) != value:
+                rows.append((parts[0], parts[1], name, value, run_id, now))
+
+    for full_key, old_fields in previous.items():
+        entity_type, entity_key = full_key.split("|", 1)
+        new_fields = current.get(full_key, {})
+        for name in old_fields:
+            if name not in new_fields:
+                rows.append((entity_type, entity_key, name, None, run_id, now))
+
+    connection.executemany(
+        """
+        INSERT OR REPLACE INTO annotation_versions
+        (entity_type, entity_key, field_name, field_value, run_id, recorded_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """,
+        rows,
+    )
+    connection.execute(
+        "INSERT OR REPLACE INTO annotation_snapshots (run_id, recorded_at) VALUES (?, ?)",
+        (run_id, now),
+    )
+    connection.commit()
+    return len(rows)
+
+
 # ============================================================================
 # Data Persistence Helpers
 # ============================================================================
@@ -1151,7 +1278,14 @@ def save_login(
         ),
     )
     connection.commit()
-    return cursor.lastrowid
+    return inserted_row_id(
+        connection,
+        cursor,
+        "logins",
+        audit_run_id,
+        instance_id=instance_id,
+        login_name=login_name,
+    )
 
 
 def save_database(
@@ -1207,7 +1341,14 @@ def save_database(
         ),
     )
     connection.commit()
-    return cursor.lastrowid
+    return inserted_row_id(
+        connection,
+        cursor,
+        "databases",
+        audit_run_id,
+        instance_id=instance_id,
+        database_name=database_name,
+    )
 
 
 def save_config_setting(
@@ -1255,7 +1396,14 @@ def save_config_setting(
         ),
     )
     connection.commit()
-    return cursor.lastrowid
+    return inserted_row_id(
+        connection,
+        cursor,
+        "config_settings",
+        audit_run_id,
+        instance_id=instance_id,
+        setting_name=setting_name,
+    )
 
 
 def save_db_user(
@@ -1301,7 +1449,15 @@ def save_db_user(
         ),
     )
     connection.commit()
-    return cursor.lastrowid
+    return inserted_row_id(
+        connection,
+        cursor,
+        "database_users",
+        audit_run_id,
+        instance_id=instance_id,
+        database_name=database_name,
+        user_name=user_name,
+    )
 
 
 def save_linked_server(
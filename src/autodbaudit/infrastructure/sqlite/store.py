@@ -5,6 +5,7 @@ Provides CRUD operations for:
 - Audit runs
 - Servers and instances
 - Audit run ↔ instance relationships
+- Remediation script executions
 
 Uses stdlib sqlite3 with no ORM.
 """
@@ -22,10 +23,18 @@ if TYPE_CHECKING:
 
 from autodbaudit.domain.models import AuditRun, Server, Instance
 from autodbaudit.infrastructure.sqlite.schema import (
+    get_annotations_as_of,
     get_annotations_for_entity,
     get_findings_for_run,
+    record_annotation_versions,
     upsert_annotation,
 )
+from autodbaudit.infrastructure.sqlite.row_store import (
+    HistoryConnection,
+    carry_forward_rows,
+    enable_content_addressed_storage,
+    register_row_functions,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -68,11 +77,14 @@ class HistoryStore:
             self._connection = sqlite3.connect(
                 self.db_path,
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                factory=HistoryConnection,  # Caches the storage mode for save_* helpers
             )
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
             # Use Row factory for dict-like access
             self._connection.row_factory = sqlite3.Row
+            # Needed by content-addressed storage triggers
+            register_row_functions(self._connection)
             logger.debug("Database connection established")
         return self._connection
 
@@ -213,6 +225,12 @@ class HistoryStore:
         """
         )
 
+        # Lookups by entity_key alone (remediation annotation pivot)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_annotations_entity "
+            "ON annotations(entity_key, field_name)"
+        )
+
         # Annotation History table (for audit trail of documentation)
         conn.execute(
             """
@@ -232,6 +250,37 @@ class HistoryStore:
         """
         )
 
+        # Annotation versions: field values as of each sync run.
+        # Only changes are stored; NULL field_value marks a removal.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS annotation_versions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                entity_type TEXT NOT NULL,
+                entity_key TEXT NOT NULL,
+                field_name TEXT NOT NULL,
+                field_value TEXT,
+                run_id INTEGER NOT NULL,
+                recorded_at TEXT NOT NULL,
+                FOREIGN KEY (run_id) REFERENCES audit_runs(id) ON DELETE CASCADE,
+                UNIQUE(entity_key, entity_type, field_name, run_id)
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS annotation_snapshots (
+                run_id INTEGER PRIMARY KEY,
+                recorded_at TEXT NOT NULL,
+                FOREIGN KEY (run_id) REFERENCES audit_runs(id) ON DELETE CASCADE
+            )
+        """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_annotation_versions_run "
+            "ON annotation_versions(run_id)"
+        )
+
         # Findings table (for persistent audit results)
         # Note: This table is expected by update_finding_status and ActionRecorder
         # but was missing from schema.
@@ -256,6 +305,27 @@ class HistoryStore:
         """
         )
 
+        # Remediation scripts executed against an instance (--remediate --apply).
+        # Targeted sync uses this to rescan instances that were touched.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS script_executions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                server_name TEXT NOT NULL,
+                instance_name TEXT NOT NULL DEFAULT '',
+                port INTEGER,
+                script_name TEXT NOT NULL,
+                successful INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                executed_at TEXT NOT NULL
+            )
+        """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_script_executions_at "
+            "ON script_executions(executed_at)"
+        )
+
         # Schema migrations for existing databases
         # Add server_name/instance_name to action_log (may already exist)
         try:
@@ -279,6 +349,17 @@ class HistoryStore:
         conn.commit()
         logger.info("Database schema initialized (version %d)", SCHEMA_VERSION)
 
+    def enable_content_addressed_storage(self) -> dict[str, int]:
+        """
+        Store unchanged per-run rows by reference instead of copying them.
+
+        See row_store for details. Idempotent and one-way.
+
+        Returns:
+            Dict of table name -> existing rows migrated (empty if already enabled)
+        """
+        return enable_content_addressed_storage(self._get_connection())
+
     # ========================================================================
     # Audit Run Operations
     # ========================================================================
@@ -644,6 +725,131 @@ class HistoryStore:
 
         return results
 
+    def get_instance_endpoints_for_run(self, run_id: int) -> list[dict]:
+        """
+        Get the connection endpoint of every instance audited in a run.
+
+        Unlike get_instances_for_run this includes the port, which is what
+        ties a stored instance back to its sql_targets.json entry.
+
+        Returns:
+            List of dicts with instance_id, hostname, instance_name, port, checked_at
+        """
+        conn = self._get_connection()
+        rows = conn.execute(
+            """
+            SELECT i.id AS instance_id, s.hostname, i.instance_name, i.port,
+                   ari.checked_at
+            FROM audit_run_instances ari
+            JOIN instances i ON ari.instance_id = i.id
+            JOIN servers s ON i.server_id = s.id
+            WHERE ari.audit_run_id = ?
+            ORDER BY s.hostname, i.instance_name
+        """,
+            (run_id,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def carry_forward_instances(
+        self, source_run_id: int, target_run_id: int, instance_ids: list[int]
+    ) -> int:
+        """
+        Carry findings and entity rows of instances that were not rescanned
+        into a new run.
+
+        Used by targeted sync: the instances keep their original checked_at
+        so the report still shows when they were last actually scanned.
+        Rows are copied inside SQLite, never materialized in Python; with
+        content-addressed storage they are only referenced.
+
+        Args:
+            source_run_id: Run holding the last known findings
+            target_run_id: Run being populated
+            instance_ids: Instances to carry forward
+
+        Returns:
+            Number of findings copied
+        """
+        if not instance_ids:
+            return 0
+
+        conn = self._get_connection()
+        placeholders = ",".join("?" * len(instance_ids))
+
+        conn.execute(
+            f"""
+            INSERT OR IGNORE INTO audit_run_instances (audit_run_id, instance_id, checked_at)
+            SELECT ?, instance_id, checked_at
+            FROM audit_run_instances
+            WHERE audit_run_id = ? AND instance_id IN ({placeholders})
+        """,
+            (target_run_id, source_run_id, *instance_ids),
+        )
+        # Findings and entity rows (logins, databases, ...) so entity diffs
+        # see carried instances as unchanged; referenced, not copied, with
+        # content-addressed storage
+        carried = carry_forward_rows(conn, source_run_id, target_run_id, instance_ids)
+        copied = carried.get("findings", 0)
+        conn.commit()
+
+        logger.info(
+            "Carried forward %d findings for %d instances (run %d -> %d)",
+            copied,
+            len(instance_ids),
+            source_run_id,
+            target_run_id,
+        )
+        return copied
+
+    def record_script_execution(
+        self,
+        server_name: str,
+        instance_name: str | None,
+        port: int | None,
+        script_name: str,
+        successful: int,
+        failed: int,
+    ) -> None:
+        """Record that a remediation script was executed against an instance."""
+        conn = self._get_connection()
+        conn.execute(
+            """
+            INSERT INTO script_executions (
+                server_name, instance_name, port, script_name,
+                successful, failed, executed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                server_name,
+                instance_name or "",
+                port,
+                script_name,
+                successful,
+                failed,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        conn.commit()
+
+    def get_script_executions_since(self, since: datetime | str) -> list[dict]:
+        """Get remediation script executions recorded after a point in time."""
+        if isinstance(since, datetime):
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            since = since.isoformat()
+        conn = self._get_connection()
+        rows = conn.execute(
+            """
+            SELECT server_name, instance_name, port, script_name,
+                   successful, failed, executed_at
+            FROM script_executions
+            WHERE executed_at > ?
+            ORDER BY executed_at
+        """,
+            (since,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
     def get_all_instances(self) -> list[Instance]:
         """Get all instances in the database."""
         conn = self._get_connection()
@@ -956,6 +1162,16 @@ class HistoryStore:
         """Get annotations for a specific entity."""
         return get_annotations_for_entity(self._get_connection(), entity_key)
 
+    def record_annotation_versions(
+        self, run_id: int, annotations: dict[str, dict]
+    ) -> int:
+        """Snapshot annotation state for a sync run (changes only)."""
+        return record_annotation_versions(self._get_connection(), run_id, annotations)
+
+    def get_annotations_as_of(self, run_id: int) -> dict[str, dict] | None:
+        """Annotations as they were at the end of a run (None if never recorded)."""
+        return get_annotations_as_of(self._get_connection(), run_id)
+
     def get_all_annotations(self, only_overrides: bool = False) -> list[dict]:
         """
         Get all annotations, optionally filtering for status overrides.
@@ -9,14 +9,12 @@ import argparse
 import logging
 from pathlib import Path
 
-from autodbaudit.application.audit_service import AuditService
-from autodbaudit.application.audit_manager import AuditManager
-from autodbaudit.application.remediation.service import RemediationService
-from autodbaudit.infrastructure.config_loader import ConfigLoader
 from autodbaudit.infrastructure.logging_config import setup_logging
-from autodbaudit.infrastructure.odbc_check import check_odbc_drivers
 from autodbaudit.interface.formatted_console import ConsoleRenderer
 
+# Services (and their openpyxl/pyodbc/jinja2 dependencies) are imported by
+# the command that needs them, so --help, audit --list etc. start quickly.
+
 logger = logging.getLogger(__name__)
 
 # Default paths
@@ -35,6 +33,8 @@ def _create_audit_service(args):
             output_dir=Path(str(args.output_dir or DEFAULT_OUTPUT_DIR)),
             finding_dir=args.finding_dir,
         )
+    from autodbaudit.application.audit_service import AuditService
+
     return AuditService(
         config_dir=DEFAULT_CONFIG_DIR,
         output_dir=Path(str(args.output_dir or DEFAULT_OUTPUT_DIR)),
@@ -116,6 +116,30 @@ def main() -> int:
     parser_rem.add_argument(
         "--rollback", action="store_true", help="Execute rollback scripts"
     )
+    parser_rem.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Apply up to N scripts at once across targets",
+    )
+    parser_rem.add_argument(
+        "--per-host",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Apply up to N scripts at once against the same host",
+    )
+    parser_rem.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop starting scripts after the first failure",
+    )
+    parser_rem.add_argument(
+        "--validate",
+        action="store_true",
+        help="With --apply: compile scripts on targets (SET NOEXEC ON) without running them",
+    )
 
     # Command: SYNC
     parser_sync = subparsers.add_parser("sync", help="Sync progress (Re-Audit)")
@@ -123,6 +147,17 @@ def main() -> int:
     parser_sync.add_argument(
         "--targets", default="sql_targets.json", help="Targets config file"
     )
+    parser_sync.add_argument(
+        "--targeted",
+        action="store_true",
+        help="Only rescan instances with open findings or executed remediation",
+    )
+    parser_sync.add_argument(
+        "--only",
+        action="append",
+        metavar="TARGET",
+        help="Rescan this target (repeatable, implies --targeted)",
+    )
 
     # Command: FINALIZE
     parser_fin = subparsers.add_parser("finalize", help="Finalize audit")
@@ -218,6 +253,8 @@ def main() -> int:
     try:
         if args.command == "audit":
             if args.list:
+                from autodbaudit.application.audit_manager import AuditManager
+
                 manager = AuditManager(str(DEFAULT_OUTPUT_DIR))
                 audits = manager.list_audits()
                 if not audits:
@@ -257,6 +294,8 @@ def main() -> int:
 
         elif args.command == "util":
             if args.check_drivers:
+                from autodbaudit.infrastructure.odbc_check import check_odbc_drivers
+
                 check_odbc_drivers()
                 return 0
             elif args.validate_config:
@@ -288,6 +327,8 @@ def main() -> int:
 
 def handle_remediation_command(args) -> int:
     """Handler for 'remediate' subcommand logic."""
+    from autodbaudit.application.audit_manager import AuditManager
+
     manager = AuditManager(str(DEFAULT_OUTPUT_DIR))
 
     # 1. GENERATE
@@ -336,6 +377,8 @@ def handle_remediation_command(args) -> int:
                     except Exception:
                         pass
 
+        from autodbaudit.application.remediation.service import RemediationService
+
         svc = RemediationService(
             db_path=DEFAULT_OUTPUT_DIR / "audit_history.db", output_dir=scripts_folder
         )
@@ -378,13 +421,29 @@ def handle_remediation_command(args) -> int:
         )
         path = Path(scripts_path)
 
+        if args.validate:
+            # Compile on the targets only; nothing is executed
+            workers = args.parallel if args.parallel > 1 else 8
+            if path.is_file():
+                results = executor.validate_scripts([path], max_workers=workers)
+            else:
+                results = executor.validate_folder(
+                    path, rollback=args.rollback, max_workers=workers
+                )
+            return 0 if all(r.success and not r.warnings for r in results) else 1
+
         sql_success = True
         if path.is_file():
             res = executor.execute_script(path, dry_run=args.dry_run)
             sql_success = res.success
         elif path.is_dir():
             results = executor.execute_folder(
-                path, dry_run=args.dry_run, rollback=args.rollback
+                path,
+                dry_run=args.dry_run,
+                rollback=args.rollback,
+                max_workers=args.parallel,
+                per_host=args.per_host,
+                fail_fast=args.fail_fast,
             )
             failed = sum(1 for r in results if not r.success)
             sql_success = failed == 0
@@ -398,6 +457,8 @@ def handle_remediation_command(args) -> int:
         # -- OS Hook Part --
         # Check config but default to TRUE if not specified,
         # or rely on presence of script files (Hybrid approach auto-detection)
+        from autodbaudit.infrastructure.config_loader import ConfigLoader
+
         loader = ConfigLoader(str(DEFAULT_CONFIG_DIR))
         audit_conf = loader.load_audit_config()
 
@@ -471,6 +532,7 @@ def handle_remediation_command(args) -> int:
 
 def handle_sync_command(args) -> int:
     logger.info("Syncing remediation progress")
+    from autodbaudit.application.audit_manager import AuditManager
     from autodbaudit.application.sync_service import SyncService
 
     manager = AuditManager(str(DEFAULT_OUTPUT_DIR))
@@ -495,6 +557,8 @@ def handle_sync_command(args) -> int:
         targets_file=args.targets,
         audit_manager=manager,
         audit_id=audit_id,
+        targeted=args.targeted,
+        only_targets=args.only,
     )
 
     if "error" in result:
@@ -619,6 +683,8 @@ def run_audit(args: argparse.Namespace) -> int:
     """
     logger.info("Running audit mode")
 
+    from autodbaudit.application.audit_manager import AuditManager
+
     # Initialize audit manager
     out_dir = args.output_dir if args.output_dir else str(DEFAULT_OUTPUT_DIR)
     manager = AuditManager(out_dir)
@@ -714,6 +780,7 @@ def validate_config(args: argparse.Namespace) -> int:
         Exit code (0 = valid)
     """
     logger.info("Validating configuration files")
+    from autodbaudit.infrastructure.config_loader import ConfigLoader
 
     loader = ConfigLoader(str(DEFAULT_CONFIG_DIR))
 
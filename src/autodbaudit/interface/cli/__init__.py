@@ -4,7 +4,12 @@ CLI package for AutoDBAudit.
 Contains command-line interface components.
 """
 
-from . import commands  # pylint: disable=no-name-in-module
-from .cli import main
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = ["commands", "main"]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "commands": ".commands",
+    "main": ".cli",
+})
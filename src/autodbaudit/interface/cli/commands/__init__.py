@@ -4,15 +4,7 @@ CLI commands package.
 Contains ultra-granular command implementations.
 """
 
-from autodbaudit.interface.cli.services import LocalhostRevertService
-from .prepare.apply import prepare_command
-from .prepare.cache import cache_info_command, cache_clear_command
-from .prepare.revert import revert_command
-from .config import config_validate, config_summary, audit_settings
-from .audit.findings import findings_list_command
-from .audit.sync import sync_command
-from .audit.remediation import remediation_execute_command
-from .report import report_generate_command
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "LocalhostRevertService",
@@ -28,3 +20,19 @@ __all__ = [
     "remediation_execute_command",
     "report_generate_command",
 ]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "LocalhostRevertService": "autodbaudit.interface.cli.services",
+    "prepare_command": ".prepare.apply",
+    "cache_info_command": ".prepare.cache",
+    "cache_clear_command": ".prepare.cache",
+    "revert_command": ".prepare.revert",
+    "config_validate": ".config",
+    "config_summary": ".config",
+    "audit_settings": ".config",
+    "findings_list_command": ".audit.findings",
+    "sync_command": ".audit.sync",
+    "remediation_execute_command": ".audit.remediation",
+    "report_generate_command": ".report",
+})
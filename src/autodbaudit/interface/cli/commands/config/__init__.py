@@ -4,12 +4,7 @@ Config command components package.
 Contains ultra-granular config command components.
 """
 
-from .services.config_validate_command import ConfigValidateCommand
-from .services.config_summary_command import ConfigSummaryCommand
-from .services.audit_settings_command import AuditSettingsCommand, SettingsUpdate
-from .cli.validate.cli import config_validate
-from .cli.summary.cli import config_summary
-from .cli.settings.cli import audit_settings
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "ConfigValidateCommand",
@@ -19,4 +14,17 @@ __all__ = [
     "config_validate",
     "config_summary",
     "audit_settings",
+    "config_lock",
 ]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ConfigValidateCommand": ".services.config_validate_command",
+    "ConfigSummaryCommand": ".services.config_summary_command",
+    "AuditSettingsCommand": ".services.audit_settings_command",
+    "SettingsUpdate": ".services.audit_settings_command",
+    "config_validate": ".cli.validate.cli",
+    "config_summary": ".cli.summary.cli",
+    "audit_settings": ".cli.settings.cli",
+    "config_lock": ".cli.lock.cli",
+})
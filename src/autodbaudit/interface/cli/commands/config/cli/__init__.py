@@ -10,6 +10,7 @@ import typer
 from .validate.cli import config_validate
 from .summary.cli import config_summary
 from .settings.cli import audit_settings
+from .lock.cli import config_lock
 
 # Create config app
 config_app = typer.Typer(
@@ -23,3 +24,4 @@ config_app = typer.Typer(
 config_app.command("validate")(config_validate)
 config_app.command("summary")(config_summary)
 config_app.command("settings")(audit_settings)
+config_app.command("lock")(config_lock)
@@ -0,0 +1,35 @@
+"""
+Lock Command Function - Credential Key Session
+
+Handles ending the credential key agent session.
+"""
+
+import logging
+
+import typer
+
+logger = logging.getLogger(__name__)
+
+
+def config_lock():
+    """
+    End the credential key agent session.
+
+    With AUTODBAUDIT_KEY_AGENT enabled, the derived credential key is kept
+    for a session so later commands need no master password. Locking
+    removes it; the next command that decrypts credentials asks again.
+    """
+    from autodbaudit.application.container import Container
+    from autodbaudit.infrastructure.config.key_agent import AGENT_ENV_VAR
+
+    container = Container()
+
+    try:
+        if container.credential_manager.lock():
+            print("🔒 Credential key session ended")
+        else:
+            print(f"No key agent configured ({AGENT_ENV_VAR} is off); nothing to lock")
+    except Exception as e:
+        logger.error("Config lock failed: %s", e)
+        print(f"[red]❌ Error:[/red] {e}")
+        raise typer.Exit(1)
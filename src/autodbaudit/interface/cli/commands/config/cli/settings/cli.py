@@ -9,9 +9,6 @@ from typing import Optional
 
 import typer
 
-from autodbaudit.application.container import Container
-from autodbaudit.interface.cli.commands.config.services.audit_settings_command import AuditSettingsCommand, SettingsUpdate
-
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +62,9 @@ def audit_settings(  # pylint: disable=too-many-positional-arguments,too-many-ar
     - Parallel processing configuration
     - Shell elevation requirements
     """
+    from autodbaudit.application.container import Container
+    from autodbaudit.interface.cli.commands.config.services.audit_settings_command import AuditSettingsCommand, SettingsUpdate
+
     container = Container()
     command = AuditSettingsCommand(container)
 
@@ -9,9 +9,6 @@ from typing import Optional
 
 import typer
 
-from autodbaudit.application.container import Container
-from ...services.config_summary_command import ConfigSummaryCommand
-
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +25,9 @@ def config_summary(
     This command provides the single source of truth for configuration state,
     showing loaded configs, available targets, credential status, and system health.
     """
+    from autodbaudit.application.container import Container
+    from ...services.config_summary_command import ConfigSummaryCommand
+
     container = Container()
     command = ConfigSummaryCommand(container)
 
@@ -9,9 +9,6 @@ from typing import Optional
 
 import typer
 
-from autodbaudit.application.container import Container
-from ...services.config_validate_command import ConfigValidateCommand
-
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +31,9 @@ def config_validate(
     - Credentials encryption and accessibility
     - Cross-references between configurations
     """
+    from autodbaudit.application.container import Container
+    from ...services.config_validate_command import ConfigValidateCommand
+
     container = Container()
     command = ConfigValidateCommand(container)
 
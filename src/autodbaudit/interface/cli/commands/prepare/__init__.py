@@ -4,11 +4,7 @@ Prepare command components package.
 Contains ultra-granular prepare command components.
 """
 
-from .apply.target_resolver import TargetResolver
-from .apply.parallel_processor import ParallelProcessor
-from .apply.fallback_script_generator import FallbackScriptGenerator
-from .apply.prepare_command import PrepareCommand
-from .apply.prepare_command_function import prepare_command
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "TargetResolver",
@@ -17,3 +13,12 @@ __all__ = [
     "PrepareCommand",
     "prepare_command",
 ]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "TargetResolver": ".apply.target_resolver",
+    "ParallelProcessor": ".apply.parallel_processor",
+    "FallbackScriptGenerator": ".apply.fallback_script_generator",
+    "PrepareCommand": ".apply.prepare_command",
+    "prepare_command": ".apply.prepare_command_function",
+})
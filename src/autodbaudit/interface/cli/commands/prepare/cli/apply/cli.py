@@ -7,8 +7,6 @@ Handles the application of audit preparation to targets.
 import typer
 from typing import List, Optional
 
-from autodbaudit.interface.cli.commands.prepare.services.apply_service import ApplyService
-
 
 def apply_targets(
     targets: Optional[List[str]] = typer.Option(
@@ -56,6 +54,8 @@ def apply_targets(
     If no targets are specified, processes ALL enabled targets from sql_targets.json.
     Multiple SQL instances on the same server are consolidated into one PS remoting operation.
     """
+    from autodbaudit.interface.cli.commands.prepare.services.apply_service import ApplyService
+
     service = ApplyService()
 
     result = service.apply_targets(
@@ -6,8 +6,6 @@ Handles caching of connection information and credentials.
 
 import typer
 
-from autodbaudit.interface.cli.commands.prepare.services.cache_service import CacheService
-
 app = typer.Typer(
     name="cache",
     help="💾 Manage connection cache for audit targets",
@@ -46,6 +44,8 @@ def clear_cache(
         typer.echo("❌ Must specify --all or --targets")
         raise typer.Exit(1)
 
+    from autodbaudit.interface.cli.commands.prepare.services.cache_service import CacheService
+
     service = CacheService()
 
     if all_targets:
@@ -74,6 +74,8 @@ def list_cache(
 
     Shows all currently cached targets and their connection status.
     """
+    from autodbaudit.interface.cli.commands.prepare.services.cache_service import CacheService
+
     service = CacheService()
 
     cache_data = service.list_cache()
@@ -7,8 +7,6 @@ Handles reverting audit preparation changes on targets.
 import typer
 from typing import List, Optional
 
-from autodbaudit.interface.cli.commands.prepare.services.revert_service import RevertService
-
 
 def revert_targets(
     targets: Optional[List[str]] = typer.Option(
@@ -66,6 +64,8 @@ def revert_targets(
             typer.echo("Cancelled")
             return
 
+    from autodbaudit.interface.cli.commands.prepare.services.revert_service import RevertService
+
     service = RevertService()
 
     result = service.revert_targets(
@@ -7,8 +7,6 @@ Displays recorded connection status and availability for all servers.
 import typer
 from typing import Optional
 
-from autodbaudit.interface.cli.commands.prepare.services.status_service import StatusService
-
 
 def show_status(
     format: str = typer.Option(
@@ -29,6 +27,8 @@ def show_status(
     Displays connection methods, authentication types, timestamps,
     and associated SQL targets for each server that has been prepared.
     """
+    from autodbaudit.interface.cli.commands.prepare.services.status_service import StatusService
+
     service = StatusService()
 
     result = service.show_status(
@@ -18,6 +18,7 @@ class ApplyService:
     def __init__(self):
         self.config_manager = ConfigManager()
         self.credential_manager = CredentialManager(self.config_manager.repository)
+        self.config_manager.credential_manager = self.credential_manager
         self.prepare_service = PrepareService(self.config_manager)
 
     def apply_targets(
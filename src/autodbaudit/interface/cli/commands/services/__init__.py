@@ -4,8 +4,13 @@ CLI command services - Ultra-granular service components.
 This package contains specialized service classes for CLI command operations.
 """
 
-from autodbaudit.interface.cli.services.localhost_revert_service import LocalhostRevertService
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "LocalhostRevertService",
 ]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "LocalhostRevertService": "autodbaudit.interface.cli.services.localhost_revert_service",
+})
@@ -12,8 +12,6 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from autodbaudit.application.container import Container
-
 # Import command modules
 from autodbaudit.interface.cli.commands.prepare.cli import prepare_app
 from autodbaudit.interface.cli.commands.config.cli import config_app
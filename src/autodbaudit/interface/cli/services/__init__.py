@@ -4,8 +4,13 @@ CLI Services package.
 Contains shared services for CLI commands.
 """
 
-from .localhost_revert_service import LocalhostRevertService
+from autodbaudit.utils.lazy_imports import lazy_exports
 
 __all__ = [
     "LocalhostRevertService",
 ]
+
+# Imported on first access, so importing a submodule stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "LocalhostRevertService": ".localhost_revert_service",
+})
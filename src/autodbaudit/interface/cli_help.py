@@ -150,6 +150,10 @@ def print_sync_help() -> None:
 
     table.add_row("--audit-id <ID>", "Audit to sync", "Latest audit")
     table.add_row("--targets <file>", "Target config file", "sql_targets.json")
+    table.add_row(
+        "--targeted", "Rescan only instances with pending work", "Full rescan"
+    )
+    table.add_row("--only <target>", "Rescan this target (repeatable)", "-")
 
     console.print(table)
 
@@ -176,6 +180,10 @@ def print_remediate_help() -> None:
     table.add_row("--aggressiveness <1-3>", "Fix intensity level")
     table.add_row("--scripts <folder>", "Custom scripts folder")
     table.add_row("--dry-run", "Simulate execution")
+    table.add_row("--parallel <N>", "Apply up to N scripts at once")
+    table.add_row("--per-host <N>", "Concurrent scripts per host (default 1)")
+    table.add_row("--fail-fast", "Stop after the first failed script")
+    table.add_row("--validate", "With --apply: compile on targets, don't execute")
 
     console.print(table)
 
@@ -96,6 +96,30 @@ def load_annotations_from_db(db_path: Path | str) -> Dict[str, Dict]:
     return annotations
 
 
+def load_annotations_as_of(db_path: Path | str, run_id: int) -> Dict[str, Dict] | None:
+    """
+    Load annotations as they were at the end of a sync run.
+
+    Args:
+        db_path: Path to SQLite database
+        run_id: Audit run ID
+
+    Returns:
+        Dict of {entity_type|entity_key: {field_name: value}}, or None if
+        no annotation snapshot exists for that run
+    """
+    from autodbaudit.infrastructure.sqlite.schema import get_annotations_as_of
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return get_annotations_as_of(conn, run_id)
+    except sqlite3.OperationalError:
+        # Versioning tables may not exist yet
+        return None
+    finally:
+        conn.close()
+
+
 def get_db_connection(db_path: Path | str) -> sqlite3.Connection:
     """Get a database connection with row factory set."""
     conn = sqlite3.connect(str(db_path))
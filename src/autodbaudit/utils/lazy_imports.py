@@ -0,0 +1,47 @@
+"""
+Lazy Package Exports.
+
+Package __init__ modules re-export their main classes for convenience.
+Importing them eagerly means that touching any submodule (e.g. the CLI
+entry point) loads every service together with openpyxl, pyodbc and
+jinja2. lazy_exports() builds PEP 562 module hooks that import an export
+on first attribute access instead:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "AuditService": "autodbaudit.application.audit_service",
+    })
+"""
+
+import importlib
+import sys
+from typing import Callable, Mapping
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    Build __getattr__/__dir__ for a package with lazily imported exports.
+
+    Args:
+        package: The package's __name__
+        exports: Export name -> module that defines it (absolute, or relative to package)
+
+    Returns:
+        (__getattr__, __dir__) to assign at package module level
+    """
+
+    def __getattr__(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name, package)
+        # A submodule export is the module itself (e.g. "commands")
+        value = module if module_name.rsplit(".", 1)[-1] == name else getattr(module, name)
+        setattr(sys.modules[package], name, value)  # Later lookups skip this hook
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -5,9 +5,12 @@ A self-contained, offline-capable tool for SQL Server security compliance auditi
 discrepancy analysis, remediation script generation, and centralized hotfix deployment.
 """
 
+import multiprocessing
 import sys
 from autodbaudit.interface.cli import main
 
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     sys.exit(main())
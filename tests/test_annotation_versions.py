@@ -0,0 +1,66 @@
+"""
+Tests for per-run annotation versions and point-in-time reads.
+
+Each test records annotation snapshots for a few real audit runs in a
+temporary history DB and reads them back as of earlier runs.
+"""
+
+import sqlite3
+
+import pytest
+
+from autodbaudit.infrastructure.sqlite.store import HistoryStore
+from autodbaudit.utils.database import load_annotations_as_of
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    store.initialize_schema()
+    yield store
+    store.close()
+
+
+def _runs(store, count):
+    return [store.begin_audit_run(organization="Test").id for _ in range(count)]
+
+
+def test_only_changed_fields_are_written_and_removals_are_tombstoned(store):
+    run1, run2, run3 = _runs(store, 3)
+
+    written = [
+        store.record_annotation_versions(
+            run1, {"login|sql01||sa": {"justification": "Break-glass", "notes": "Reviewed"}}
+        ),
+        store.record_annotation_versions(
+            run2, {"LOGIN|sql01||sa": {"justification": "Break-glass", "notes": "Re-reviewed"}}
+        ),
+        store.record_annotation_versions(run3, {"config|sql01||xp_cmdshell": {"notes": "Off"}}),
+    ]
+
+    assert written == [2, 1, 3]
+    assert store.get_annotations_as_of(run1) == {
+        "login|sql01||sa": {"justification": "Break-glass", "notes": "Reviewed"}
+    }
+    assert store.get_annotations_as_of(run2)["login|sql01||sa"]["notes"] == "Re-reviewed"
+    assert store.get_annotations_as_of(run3) == {"config|sql01||xp_cmdshell": {"notes": "Off"}}
+
+
+def test_reads_before_the_first_snapshot_and_between_runs(store):
+    run1, run2, run3 = _runs(store, 3)
+    store.record_annotation_versions(run2, {"login|sql01||sa": {"notes": "First"}})
+
+    assert store.get_annotations_as_of(run1) is None
+    # A run without its own snapshot sees the latest one before it
+    assert store.get_annotations_as_of(run3) == {"login|sql01||sa": {"notes": "First"}}
+
+
+def test_helper_reads_snapshots_and_tolerates_old_databases(store, tmp_path):
+    (run1,) = _runs(store, 1)
+    store.record_annotation_versions(run1, {"login|sql01||sa": {"notes": "First"}})
+
+    assert load_annotations_as_of(store.db_path, run1) == {"login|sql01||sa": {"notes": "First"}}
+
+    legacy = tmp_path / "legacy.db"
+    sqlite3.connect(legacy).close()
+    assert load_annotations_as_of(legacy, run1) is None
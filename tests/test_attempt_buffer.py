@@ -0,0 +1,113 @@
+"""
+Tests for buffered PS remoting attempt logging.
+
+The buffer is driven with a recording writer, so each test checks which
+batches were written and when: on size, on the flush timer, on close,
+and after a failed write. The last test runs buffered_attempts() against
+a real repository in a temporary SQLite file.
+"""
+
+import threading
+
+import pytest
+
+from autodbaudit.infrastructure.psremoting.models import ConnectionAttempt
+from autodbaudit.infrastructure.psremoting.repository import PSRemotingRepository
+from autodbaudit.infrastructure.psremoting.repository.attempt_buffer import AttemptBuffer
+
+
+class Writer:
+    """Records written batches; can fail the next write on demand."""
+
+    def __init__(self):
+        self.batches = []
+        self.fail_next = False
+        self.written = threading.Event()
+
+    def __call__(self, rows):
+        if self.fail_next:
+            self.fail_next = False
+            raise OSError("disk I/O error")
+        self.batches.append(list(rows))
+        self.written.set()
+
+
+def _rows(*ids):
+    return [(i,) for i in ids]
+
+
+def test_full_buffer_flushes_in_one_batch():
+    writer = Writer()
+    buffer = AttemptBuffer(writer, flush_interval=0, max_pending=3)
+
+    buffer.add(_rows(1, 2))
+    assert writer.batches == [] and buffer.pending == 2
+    buffer.add(_rows(3, 4))
+
+    assert writer.batches == [_rows(1, 2, 3, 4)]
+    assert (buffer.pending, buffer.flushes, buffer.rows_written) == (0, 1, 4)
+
+
+def test_timer_flushes_rows_left_waiting():
+    writer = Writer()
+    buffer = AttemptBuffer(writer, flush_interval=0.1, max_pending=100)
+
+    buffer.add(_rows(1))
+    buffer.add(_rows(2))
+
+    assert writer.written.wait(5)
+    assert writer.batches == [_rows(1, 2)]
+    buffer.close()
+
+
+def test_close_flushes_and_later_rows_are_written_directly():
+    writer = Writer()
+    buffer = AttemptBuffer(writer, flush_interval=60, max_pending=100)
+    buffer.add(_rows(1, 2))
+
+    buffer.close()
+    buffer.add(_rows(3))
+
+    assert writer.batches == [_rows(1, 2), _rows(3)]
+    assert buffer.flush() == 0
+
+
+def test_failed_write_keeps_rows_in_order_for_the_next_flush():
+    writer = Writer()
+    buffer = AttemptBuffer(writer, flush_interval=0, max_pending=100)
+    buffer.add(_rows(1, 2))
+    writer.fail_next = True
+
+    with pytest.raises(OSError):
+        buffer.flush()
+    buffer.add(_rows(3))
+
+    assert buffer.flush() == 3
+    assert writer.batches == [_rows(1, 2, 3)]
+
+
+def test_repository_buffers_until_read_or_block_exit(tmp_path):
+    repository = PSRemotingRepository(str(tmp_path / "audit_history.db"))
+    attempt = ConnectionAttempt(
+        profile_id=1,
+        server_name="sql01",
+        auth_method="Kerberos",
+        protocol="HTTP",
+        port=5985,
+        credential_type="windows",
+        layer="direct",
+        attempt_timestamp="2026-01-01T00:00:00+00:00",
+    )
+
+    with repository.buffered_attempts(flush_interval=0) as buffer:
+        with repository.buffered_attempts() as nested:
+            assert nested is buffer
+        repository.log_attempts([attempt, attempt])
+        assert buffer.pending == 2
+        # Reads flush first, so they see every row
+        assert len(repository.get_attempt_history("sql01")) == 2
+        repository.log_attempts([attempt])
+        assert buffer.pending == 1
+
+    assert buffer.pending == 0
+    assert len(repository.get_attempt_history("sql01")) == 3
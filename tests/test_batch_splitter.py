@@ -0,0 +1,86 @@
+"""
+Tests for the streaming T-SQL batch splitter.
+
+Scripts are written inline; each test checks where GO does and does not
+separate batches, plus the line ranges and repeat counts reported back.
+"""
+
+import io
+
+from autodbaudit.infrastructure.sql.batch_splitter import iter_batches, split_batches
+
+
+def _texts(script):
+    return [batch.text for batch in split_batches(script)]
+
+
+def test_go_alone_on_its_line_separates_batches():
+    batches = split_batches(
+        "\nSELECT 1\n\ngo\n  GO 3 -- run three times\nSELECT 2\nGO\r\nSELECT 3 GO\n"
+    )
+
+    assert [b.text for b in batches] == ["SELECT 1", "SELECT 2", "SELECT 3 GO"]
+    assert [(b.start_line, b.end_line) for b in batches] == [(2, 2), (6, 6), (8, 8)]
+    assert [b.repeat for b in batches] == [1, 1, 1]
+    assert split_batches("SELECT 1\nGO 5\n")[0].repeat == 5
+
+
+def test_go_inside_comments_is_not_a_separator():
+    script = (
+        "SELECT 1 -- trailing\n"
+        "/* outer\n"
+        "GO\n"
+        "/* nested\n"
+        "GO\n"
+        "*/ still outer\n"
+        "GO\n"
+        "*/\n"
+        "SELECT 2\n"
+        "GO\n"
+        "-- only a comment\n"
+        "/* and a block */\n"
+        "GO\n"
+    )
+
+    batches = split_batches(script)
+
+    assert len(batches) == 1
+    assert batches[0].text.startswith("SELECT 1") and batches[0].text.endswith("SELECT 2")
+    assert (batches[0].start_line, batches[0].end_line) == (1, 9)
+
+
+def test_go_inside_strings_and_identifiers_is_not_a_separator():
+    script = (
+        "PRINT 'first line\n"
+        "GO\n"
+        "it''s still the string'\n"
+        "SELECT [odd\n"
+        "GO\n"
+        "name]], here] FROM \"quoted\n"
+        "GO\n"
+        "\"\n"
+        "GO\n"
+        "SELECT '--not a comment' \n"
+        "GO\n"
+    )
+
+    texts = _texts(script)
+
+    assert len(texts) == 2
+    assert texts[0].count("\nGO\n") == 3
+    assert texts[1] == "SELECT '--not a comment'"
+
+
+def test_lines_are_read_lazily():
+    consumed = []
+
+    def lines():
+        for line in io.StringIO("SELECT 1\nGO\nSELECT 2\nGO\nSELECT 3\n"):
+            consumed.append(line)
+            yield line
+
+    batches = iter_batches(lines())
+
+    assert next(batches).text == "SELECT 1"
+    assert len(consumed) == 2
+    assert [b.text for b in batches] == ["SELECT 2", "SELECT 3"]
@@ -0,0 +1,101 @@
+"""
+Tests for the benchmark harness (timing and baseline comparison).
+
+Most tests cover the parts whose mistakes would silently skew or hide
+results. One runs the whole pipeline on the smoke preset (a few seconds)
+so a broken phase fails here rather than in the next benchmark run.
+"""
+
+import threading
+import time
+
+from benchmarks.compare import compare_results
+from benchmarks.e2e import PHASES, run_e2e
+from benchmarks.presets import describe_scale, fleet_for
+from benchmarks.timing import PhaseTimer, instrumented
+
+
+def _result(**seconds):
+    return {
+        "scale": {"instances": 10},
+        "phases": {name: {"seconds": value, "calls": 1} for name, value in seconds.items()},
+    }
+
+
+def test_nested_phases_are_exclusive():
+    timer = PhaseTimer()
+    with timer.phase("collect"):
+        time.sleep(0.02)
+        with timer.phase("persist"):
+            time.sleep(0.05)
+
+    results = timer.results()
+    assert results["persist"]["seconds"] >= 0.05
+    assert 0.02 <= results["collect"]["seconds"] < 0.05
+
+
+def test_phases_add_up_across_threads():
+    timer = PhaseTimer()
+
+    def work():
+        with timer.phase("connect"):
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=work) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert timer.results()["connect"]["calls"] == 3
+    assert timer.results()["connect"]["seconds"] >= 0.06
+
+
+def test_instrumented_restores_method():
+    class Service:
+        def run(self):
+            return "ran"
+
+    timer = PhaseTimer()
+    original = Service.run
+    with instrumented(timer, Service, "run", "run"):
+        assert Service().run() == "ran"
+    assert Service.run is original
+    assert timer.results()["run"]["calls"] == 1
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = _result(persist=1.0, diff=0.010, stats=0.5)
+    current = _result(persist=1.5, diff=0.030, excel_save=2.0)
+
+    comparison = compare_results(current, baseline, tolerance=0.25, min_seconds=0.05)
+
+    assert comparison["regressions"] == ["persist"]
+    assert comparison["phases"]["diff"]["status"] == "ok"  # 3x, but under the floor
+    assert comparison["phases"]["stats"]["status"] == "missing"
+    assert comparison["phases"]["excel_save"]["status"] == "new"
+    assert not comparison["scale_mismatch"]
+
+
+def test_presets_cover_requested_scales():
+    permission_rows = {
+        name: describe_scale(fleet_for(name))["permission_rows"]
+        for name in ("small", "medium", "large")
+    }
+
+    assert fleet_for("large").instances == 1000
+    assert 10_000 <= permission_rows["small"] < 20_000
+    assert 1_000_000 <= permission_rows["large"] < 1_100_000
+
+
+def test_smoke_preset_runs_every_phase(tmp_path):
+    result = run_e2e(fleet_for("smoke"), tmp_path)
+
+    # Collection is timed per collector as collect.<name>
+    assert set(PHASES) - {"collect"} <= set(result["phases"])
+    assert any(name.startswith("collect.") for name in result["phases"])
+    assert result["counts"]["queries"] > 0
+    assert result["counts"]["findings"] > 0
+    assert result["counts"]["annotation_cells_written"] > 0
+    assert result["report_bytes"] > 0
+    assert (tmp_path / "output" / "audit_history.db").exists()
@@ -0,0 +1,90 @@
+"""
+Import-time regression tests for the CLI entry point.
+
+Scripted wrappers start the CLI many times a day, so importing the entry
+point must not pull in services and their heavy dependencies (openpyxl,
+pyodbc, jinja2, the excel tree). Each test imports in a fresh interpreter
+with `python -X importtime` and checks which modules were loaded and how
+long the import took.
+
+The time budget can be adjusted for slow CI machines with
+AUTODBAUDIT_IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+IMPORT_BUDGET_MS = float(os.environ.get("AUTODBAUDIT_IMPORT_BUDGET_MS", "1500"))
+
+# Loaded only by the commands that need them
+HEAVY_MODULES = (
+    "openpyxl",
+    "pyodbc",
+    "jinja2",
+    "autodbaudit.application.audit_service",
+    "autodbaudit.application.remediation.service",
+    "autodbaudit.application.prepare_service",
+    "autodbaudit.application.container",
+    "autodbaudit.infrastructure.excel",
+)
+
+
+def _import_profile(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter; return module -> cumulative import time (us)."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), PYTHONDONTWRITEBYTECODE="1")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    profile: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        profile[name] = int(cumulative)
+    return profile
+
+
+def _heavy_loaded(profile: dict[str, int]) -> list[str]:
+    return sorted(
+        name
+        for name in profile
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    )
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "autodbaudit",
+        "autodbaudit.interface.cli",
+        "autodbaudit.interface.cli.cli",
+    ],
+)
+def test_entry_point_import_is_light(module):
+    """Importing the package and entry point loads no service modules."""
+    profile = _import_profile(module)
+
+    assert _heavy_loaded(profile) == []
+    assert profile[module] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_command_wiring_import_is_light():
+    """Building the typer app (all subcommands registered) loads no service modules."""
+    pytest.importorskip("typer")
+    module = "autodbaudit.interface.cli.orchestrator"
+    profile = _import_profile(module)
+
+    assert _heavy_loaded(profile) == []
+    assert profile[module] / 1000 < IMPORT_BUDGET_MS
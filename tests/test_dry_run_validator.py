@@ -0,0 +1,98 @@
+"""
+Tests for server-side script validation (SET NOEXEC / PARSEONLY).
+
+A fake cursor records the statements sent to the server and raises for
+unknown databases, so database switching and error capture can be
+checked without SQL Server.
+"""
+
+from autodbaudit.application.script_executor import ScriptExecutor
+from autodbaudit.infrastructure.remediation.dry_run_validator import DryRunValidator
+from autodbaudit.infrastructure.sql.batch_splitter import split_batches
+
+KNOWN_DATABASES = {"master", "[master]", "[App DB]", "msdb"}
+
+
+class FakeCursor:
+    def __init__(self):
+        self.sent = []
+        self.database = "master"
+        self.noexec = False
+
+    def execute(self, sql):
+        self.sent.append(sql)
+        if sql == "SET NOEXEC ON":
+            self.noexec = True
+        elif sql == "SET NOEXEC OFF":
+            self.noexec = False
+        elif sql.startswith("USE ") and not self.noexec:
+            name = sql[4:]
+            if name not in KNOWN_DATABASES:
+                raise RuntimeError(f"Database '{name}' does not exist")
+            self.database = name
+        elif "broken" in sql:
+            raise RuntimeError("Incorrect syntax near 'broken'")
+
+    def nextset(self):
+        return False
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursor_obj = FakeCursor()
+
+    def cursor(self):
+        return self.cursor_obj
+
+
+def _validate(script):
+    conn = FakeConnection()
+    outcome = DryRunValidator().validate_on_server(conn, split_batches(script))
+    return outcome.value, conn.cursor_obj
+
+
+def test_use_switches_the_database_for_later_batches():
+    results, cursor = _validate(
+        "-- target database\nUSE [App DB]\nGO\nCREATE USER u1\nGO\nUSE msdb\nGO\n"
+    )
+
+    assert [r["error"] for r in results] == [None, None, None]
+    assert cursor.database == "msdb"
+    # Each switch runs outside NOEXEC, and validation mode is restored after it
+    first_use = cursor.sent.index("USE [App DB]")
+    assert cursor.sent[first_use - 1 : first_use + 2] == [
+        "SET NOEXEC OFF",
+        "USE [App DB]",
+        "SET NOEXEC ON",
+    ]
+    assert cursor.sent[-1] == "SET NOEXEC OFF"
+
+
+def test_use_later_in_a_batch_applies_after_it():
+    results, cursor = _validate("ALTER LOGIN sa DISABLE;\nUSE [App DB];\nGO\n")
+
+    assert results[0]["error"] is None
+    batch_at = next(i for i, sql in enumerate(cursor.sent) if sql.startswith("ALTER LOGIN"))
+    assert cursor.sent.index("USE [App DB]") > batch_at
+    assert cursor.database == "[App DB]"
+
+
+def test_missing_database_and_compile_errors_are_reported_per_batch():
+    results, cursor = _validate("USE nowhere\nGO\nSELECT broken\nGO\nSET NOEXEC OFF\nGO\n")
+
+    assert "does not exist" in results[0]["error"]
+    assert "Incorrect syntax" in results[1]["error"]
+    assert results[2]["skipped"] and results[2]["error"] is None
+    assert cursor.database == "master"
+    assert [r["start_line"] for r in results] == [1, 3, 5]
+
+
+def test_unresolvable_script_becomes_its_own_result(tmp_path):
+    executor = ScriptExecutor(targets_file=tmp_path / "config" / "sql_targets.json")
+    missing = tmp_path / "gone.sql"
+
+    results = executor.validate_scripts([missing])
+
+    assert len(results) == 1
+    assert results[0].script_path == missing
+    assert results[0].warnings[0].startswith("Target not resolved")
@@ -0,0 +1,121 @@
+"""
+Tests for the findings diff between two runs.
+
+Each run is a list of plain finding dicts; the expected transitions are
+the ones the domain state machine defines, so the hash join and the
+precomputed transition table are checked against it key by key.
+"""
+
+from itertools import product
+
+from autodbaudit.application.diff.findings_diff import (
+    diff_findings,
+    get_exception_keys,
+    index_findings,
+)
+from autodbaudit.domain.change_types import ChangeType, FindingStatus
+from autodbaudit.domain.state_machine import classify_finding_transition
+
+
+def _run(**statuses):
+    return [
+        {"entity_key": f"login|sql01|default|{name}", "status": status}
+        for name, status in statuses.items()
+    ]
+
+
+def _names(changes):
+    return sorted(change.entity_key.rsplit("|", 1)[1] for change in changes)
+
+
+def test_status_transitions_are_classified_and_counted():
+    old = _run(fixed="FAIL", regressed="PASS", stuck="WARN", gone="FAIL", ok="PASS")
+    new = _run(fixed="PASS", regressed="FAIL", stuck="WARN", ok="PASS", fresh="FAIL", clean="PASS")
+
+    result = diff_findings(old, new)
+
+    assert _names(result.fixed) == ["fixed", "gone"]
+    assert _names(result.regressions) == ["regressed"]
+    assert _names(result.new_issues) == ["fresh"]
+    assert result.still_failing_count == 1
+    assert result.total_changes == 4
+    assert result.regressions[0].server == "sql01"
+    assert result.regressions[0].description.startswith("REGRESSION: 'regressed'")
+
+
+def test_exception_changes_and_unscanned_instances():
+    old = _run(waived="FAIL", unwaived="FAIL") + [
+        {"entity_key": "login|sql02|default|offline", "status": "FAIL"}
+    ]
+    new = _run(waived="FAIL", unwaived="FAIL")
+    key = "login|sql01|default|{}".format
+
+    result = diff_findings(
+        old,
+        new,
+        old_exceptions={key("unwaived")},
+        new_exceptions={key("waived")},
+        valid_instance_keys={"SQL01|default"},
+    )
+
+    assert (result.exception_added_count, result.exception_removed_count) == (1, 1)
+    assert [c.change_type for c in result.exception_changes] == [
+        ChangeType.EXCEPTION_ADDED,
+        ChangeType.EXCEPTION_REMOVED,
+    ]
+    # sql02 was not scanned, so its missing finding is not "fixed"
+    assert result.fixed_count == 0
+
+
+def test_every_transition_matches_the_state_machine():
+    statuses = [None, "PASS", "FAIL", "WARN"]
+    old, new, old_exc, new_exc, expected = [], [], set(), set(), {}
+    for i, (before, after, exc_before, exc_after) in enumerate(
+        product(statuses, statuses, (False, True), (False, True))
+    ):
+        key = f"login|sql01|default|k{i}"
+        if before:
+            old.append({"entity_key": key, "status": before})
+        if after:
+            new.append({"entity_key": key, "status": after})
+        if exc_before:
+            old_exc.add(key)
+        if exc_after:
+            new_exc.add(key)
+        transition = classify_finding_transition(
+            old_status=FindingStatus.from_string(before),
+            new_status=FindingStatus.from_string(after),
+            old_has_exception=bool(before) and exc_before,
+            new_has_exception=exc_after,
+            instance_was_scanned=True,
+        )
+        if transition.should_log and (before or transition.change_type == ChangeType.NEW_ISSUE):
+            expected[key] = transition.change_type
+
+    result = diff_findings(old, new, old_exc, new_exc)
+
+    logged = {
+        c.entity_key: c.change_type
+        for c in result.fixed + result.regressions + result.new_issues + result.exception_changes
+    }
+    assert logged == expected
+
+
+def test_index_shares_interned_keys_and_parsed_statuses():
+    old = index_findings([{"entity_key": "".join(["login|a|b|", "sa"]), "status": "fail"}])
+    new = index_findings([{"entity_key": "".join(["login|a|b|", "s", "a"]), "status": "FAIL"}, {"status": "PASS"}])
+
+    (old_key,), (new_key,) = old, new
+    assert old_key is new_key
+    assert old[old_key].status is new[new_key].status is FindingStatus.FAIL
+
+
+def test_exception_keys_need_a_discrepant_finding_and_justification():
+    findings = _run(sa="FAIL", app="PASS", svc="WARN")
+    annotations = {
+        "LOGIN|sql01|default|sa": {"justification": "Break-glass"},
+        "login|sql01|default|app": {"justification": "Irrelevant when passing"},
+        "login|sql01|default|svc": {"notes": "No justification"},
+    }
+
+    assert get_exception_keys(findings, annotations) == {"login|sql01|default|sa"}
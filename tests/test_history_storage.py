@@ -0,0 +1,178 @@
+"""
+Tests for the history DB storage modes.
+
+Content-addressed storage turns per-run tables into views over shared
+content rows; every save/read/carry-forward path must behave the same as
+with plain tables, and switching an existing DB over must keep its rows.
+"""
+
+import pytest
+
+from autodbaudit.infrastructure.sqlite.row_store import is_content_addressed
+from autodbaudit.infrastructure.sqlite.schema import (
+    initialize_schema_v2,
+    save_finding,
+    save_login,
+)
+from autodbaudit.infrastructure.sqlite.store import HistoryStore
+
+MODES = ["full", "content_addressed"]
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    stores = []
+
+    def factory(mode="full", name="history.db"):
+        store = HistoryStore(tmp_path / name)
+        store.initialize_schema()
+        initialize_schema_v2(store._get_connection())
+        if mode == "content_addressed":
+            store.enable_content_addressed_storage()
+        stores.append(store)
+        return store
+
+    yield factory
+    for store in stores:
+        store.close()
+
+
+def _instance(store, host):
+    server = store.upsert_server(host)
+    return store.upsert_instance(server, "", 1433, "16.0.4105.2", 16).id
+
+
+def _populate(store, run_id, instance_ids, status="FAIL"):
+    conn = store._get_connection()
+    for instance_id in instance_ids:
+        for index in range(3):
+            key = f"{instance_id}|login|l{index}"
+            save_finding(conn, run_id, instance_id, key, "login", f"l{index}", status)
+            save_login(conn, instance_id, run_id, f"l{index}", login_type="SQL_LOGIN")
+
+
+def _rows(store, table, run_id, columns):
+    return [
+        tuple(row)
+        for row in store._get_connection().execute(
+            f"SELECT {', '.join(columns)} FROM {table} WHERE audit_run_id = ? ORDER BY 1, 2",
+            (run_id,),
+        )
+    ]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_save_returns_the_saved_row_id(make_store, mode):
+    store = make_store(mode)
+    conn = store._get_connection()
+    run_id = store.begin_audit_run(organization="Test").id
+    instance_id = _instance(store, "sql01")
+
+    ids = [
+        save_finding(conn, run_id, instance_id, f"k{i}", "login", f"e{i}", "PASS") for i in range(3)
+    ]
+    resaved = save_finding(conn, run_id, instance_id, "k0", "login", "e0", "FAIL")
+    login_id = save_login(conn, instance_id, run_id, "sa", is_sa=True)
+
+    assert len(set(ids)) == 3
+    stored = dict(conn.execute("SELECT entity_key, id FROM findings").fetchall())
+    assert [stored["k0"], stored["k1"], stored["k2"]] == [resaved, ids[1], ids[2]]
+    status = conn.execute("SELECT status FROM findings WHERE id = ?", (resaved,)).fetchone()
+    login = conn.execute("SELECT login_name FROM logins WHERE id = ?", (login_id,)).fetchone()
+    assert (status[0], login[0]) == ("FAIL", "sa")
+
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_storage_mode_is_looked_up_once_per_connection(make_store, mode):
+    store = make_store(mode)
+    conn = store._get_connection()
+    run_id = store.begin_audit_run(organization="Test").id
+    instance_id = _instance(store, "sql01")
+    save_finding(conn, run_id, instance_id, "k0", "login", "e0", "PASS")
+    statements = []
+    conn.set_trace_callback(statements.append)
+
+    for i in range(1, 4):
+        save_finding(conn, run_id, instance_id, f"k{i}", "login", f"e{i}", "PASS")
+    conn.set_trace_callback(None)
+
+    assert not [s for s in statements if "sqlite_master" in s]
+    id_lookups = [s for s in statements if s.lstrip().startswith("SELECT id FROM")]
+    assert len(id_lookups) == (0 if mode == "full" else 3)
+
+def test_content_addressed_resave_keeps_row_id(make_store):
+    store = make_store("content_addressed")
+    conn = store._get_connection()
+    run_id = store.begin_audit_run(organization="Test").id
+    instance_id = _instance(store, "sql01")
+
+    first = save_finding(conn, run_id, instance_id, "k0", "login", "e0", "PASS")
+    second = save_finding(conn, run_id, instance_id, "k0", "login", "e0", "FAIL")
+
+    assert first == second
+    assert conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0] == 1
+
+
+def test_switching_modes_keeps_rows_and_dedupes_content(make_store):
+    store = make_store("full")
+    instance_ids = [_instance(store, "sql01"), _instance(store, "sql02")]
+    runs = [store.begin_audit_run(organization="Test").id for _ in range(2)]
+    for run_id in runs:
+        _populate(store, run_id, instance_ids)
+    conn = store._get_connection()
+    before = {
+        table: conn.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+        for table in ("findings", "logins")
+    }
+
+    migrated = store.enable_content_addressed_storage()
+
+    assert migrated["findings"] == 12 and migrated["logins"] == 12
+    assert is_content_addressed(conn, "findings")
+    for table, rows in before.items():
+        after = conn.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+        assert [tuple(r) for r in after] == [tuple(r) for r in rows]
+    # Both runs saved identical content, so it is stored once
+    assert conn.execute("SELECT COUNT(*) FROM findings_rows").fetchone()[0] == 6
+    assert store.enable_content_addressed_storage() == {}
+
+
+def test_enabling_again_upgrades_old_triggers(make_store):
+    store = make_store("content_addressed")
+    conn = store._get_connection()
+    conn.execute("DROP TRIGGER findings_cas_insert")
+    conn.execute(
+        "CREATE TRIGGER findings_cas_insert INSTEAD OF INSERT ON findings "
+        "BEGIN SELECT RAISE(ABORT, 'old trigger'); END"
+    )
+    conn.commit()
+
+    store.enable_content_addressed_storage()
+
+    run_id = store.begin_audit_run(organization="Test").id
+    assert save_finding(conn, run_id, _instance(store, "sql01"), "k", "login", "e", "PASS") == 1
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_carry_forward_copies_findings_and_entities(make_store, mode):
+    store = make_store(mode)
+    rescanned, carried = _instance(store, "sql01"), _instance(store, "sql02")
+    first = store.begin_audit_run(organization="Test").id
+    _populate(store, first, [rescanned, carried])
+    second = store.begin_audit_run(organization="Test").id
+    _populate(store, second, [rescanned], status="PASS")
+
+    copied = store.carry_forward_instances(first, second, [carried])
+
+    assert copied == 3
+    finding_columns = ("instance_id", "entity_key", "status", "collected_at")
+    login_columns = ("instance_id", "login_name", "login_type", "collected_at")
+    for table, columns in (("findings", finding_columns), ("logins", login_columns)):
+        before = [r for r in _rows(store, table, first, columns) if r[0] == carried]
+        after = [r for r in _rows(store, table, second, columns) if r[0] == carried]
+        assert after == before and len(after) == 3
+    rescanned_status = {
+        r[2] for r in _rows(store, "findings", second, finding_columns) if r[0] == rescanned
+    }
+    assert rescanned_status == {"PASS"}
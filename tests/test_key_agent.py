@@ -0,0 +1,153 @@
+"""
+Tests for derived-key reuse and the session key agent.
+
+PBKDF2 is counted by wrapping CredentialManager._derive_key, and the
+file agent writes into a private tmp directory, so sessions can be
+started, reused across managers and ended without an OS keyring. Bulk
+loads check that N credentials cost a single derivation.
+"""
+
+import os
+import stat
+
+import pytest
+from pydantic import SecretStr
+
+from autodbaudit.domain.config.models import Credential
+from autodbaudit.infrastructure.config import credential_manager as cm
+from autodbaudit.infrastructure.config import key_agent
+from autodbaudit.infrastructure.config.credential_manager import CredentialManager
+from autodbaudit.infrastructure.config.key_agent import FileKeyAgent, get_key_agent
+from autodbaudit.infrastructure.config.manager import ConfigManager
+from autodbaudit.infrastructure.config.repository import ConfigRepository
+
+
+@pytest.fixture
+def derivations(monkeypatch):
+    monkeypatch.setattr(cm, "_derived_keys", {})
+    calls = []
+    derive = CredentialManager._derive_key
+
+    def counting(self, password, salt):
+        calls.append(password)
+        return derive(self, password, salt)
+
+    monkeypatch.setattr(CredentialManager, "_derive_key", counting)
+    return calls
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return ConfigRepository(tmp_path / "config")
+
+
+@pytest.fixture
+def agent(tmp_path):
+    return FileKeyAgent(session_seconds=60, directory=tmp_path / "agent")
+
+
+def _secret():
+    return Credential(username="sa", password=SecretStr("Str0ng!"))
+
+
+def test_derived_keys_are_reused_per_password(repository, derivations):
+    saved = CredentialManager(repository, master_password="pw")
+    saved.save_encrypted_credential("sql", _secret())
+
+    loaded = CredentialManager(repository, master_password="pw").load_decrypted_credential("sql")
+    CredentialManager(repository, master_password="other")._get_encryption_key()
+
+    assert loaded.get_password() == "Str0ng!"
+    assert derivations == ["pw", "other"]
+
+
+def test_agent_session_supplies_the_key_until_locked(repository, agent, derivations):
+    CredentialManager(repository, master_password="pw", key_agent=agent).save_encrypted_credential(
+        "sql", _secret()
+    )
+
+    reader = CredentialManager(repository, key_agent=agent)
+    assert reader.load_decrypted_credential("sql").username == "sa"
+    assert derivations == ["pw"]
+
+    assert reader.lock() is True
+    with pytest.raises(ValueError, match="Master password required"):
+        CredentialManager(repository, key_agent=agent).load_decrypted_credential("sql")
+
+
+def test_expired_sessions_are_dropped(agent, monkeypatch):
+    agent.store_key("store1", b"a2V5")
+    now = key_agent.time.time()
+    monkeypatch.setattr(key_agent.time, "time", lambda: now + 61)
+
+    assert agent.get_key("store1") is None
+    assert not (agent.directory / "store1.key").exists()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_file_agent_keeps_keys_private(agent):
+    agent.store_key("store1", b"a2V5")
+
+    assert stat.S_IMODE(agent.directory.stat().st_mode) == 0o700
+    assert stat.S_IMODE((agent.directory / "store1.key").stat().st_mode) == 0o600
+    agent.directory.chmod(0o755)
+    assert agent.get_key("store1") is None
+
+
+def test_lock_without_a_store_creates_nothing(repository, agent):
+    assert CredentialManager(repository).lock() is False
+    assert CredentialManager(repository, key_agent=agent).lock() is True
+    assert not (repository.config_dir / "credentials" / ".salt").exists()
+
+
+def test_agent_selection(monkeypatch):
+    monkeypatch.delenv(key_agent.AGENT_ENV_VAR, raising=False)
+    assert get_key_agent() is None
+    assert isinstance(get_key_agent("file", session_seconds=5), FileKeyAgent)
+
+    monkeypatch.setattr(key_agent.os, "name", "nt")
+    monkeypatch.setattr(key_agent.importlib.util, "find_spec", lambda name: None)
+    assert get_key_agent("file") is None
+
+
+def test_bulk_load_derives_the_key_once_for_every_ref(repository, derivations):
+    refs = [f"sql{i}" for i in range(5)]
+    writer = CredentialManager(repository, master_password="pw")
+    for ref in refs:
+        writer.save_encrypted_credential(ref, _secret())
+    repository.save_json_file("credentials/legacy", {"username": "app", "password": "plain"})
+    cm._derived_keys.clear()
+    derivations.clear()
+    reader = CredentialManager(repository, master_password="pw")
+
+    loaded = reader.load_decrypted_credentials(refs + ["sql0", "legacy", "missing"], strict=False)
+
+    assert derivations == ["pw"]
+    assert sorted(loaded) == sorted(refs + ["legacy"])
+    assert {c.get_password() for c in loaded.values()} == {"Str0ng!", "plain"}
+    with pytest.raises(ValueError, match="missing"):
+        reader.load_decrypted_credentials(refs + ["missing"])
+
+
+def test_config_manager_loads_target_credentials_in_one_pass(repository, derivations):
+    writer = CredentialManager(repository, master_password="pw")
+    for ref in ("sql0", "sql1", "sql2"):
+        writer.save_encrypted_credential(ref, _secret())
+    # Wrapped format only the repository reader understands
+    repository.save_json_file(
+        "credentials/wrapped", {"credentials": {"username": "app", "password": "plain"}}
+    )
+    cm._derived_keys.clear()
+    derivations.clear()
+    manager = ConfigManager(
+        repository.config_dir,
+        credential_manager=CredentialManager(repository, master_password="pw"),
+    )
+
+    loaded = manager.get_credentials(["sql0", "sql1", "sql2", "wrapped"])
+
+    assert derivations == ["pw"]
+    assert loaded["wrapped"].username == "app"
+    assert manager.get_credential("sql2") is loaded["sql2"]
+    with pytest.raises(ValueError, match="missing"):
+        manager.get_credentials(["sql0", "missing"])
@@ -0,0 +1,127 @@
+"""
+Tests for the learned ordering of direct connection attempts.
+
+Attempt history comes from an in-memory repository; each row is built
+from a combination, an outcome and an age in days, and the specs being
+ordered are plain combination keys.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from autodbaudit.infrastructure.psremoting.layers.direct.ranking import MethodRanker, combo_key
+
+KERBEROS = combo_key("Kerberos", "HTTP", 5985, "Windows")
+NTLM = combo_key("NTLM", "HTTP", 5985, "Windows")
+BASIC = combo_key("Basic", "HTTPS", 5986, "Windows")
+DEFAULT = combo_key("Default", "HTTP", 5985, "Windows")
+SPECS = [KERBEROS, NTLM, BASIC, DEFAULT]  # Default priority order
+
+
+def _ago(days):
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def _row(combo, success, days=0.0, duration_ms=100, **extra):
+    auth, protocol, port, credential_type = combo
+    return {
+        "auth_method": auth,
+        "protocol": protocol,
+        "port": port,
+        "credential_type": credential_type,
+        "success": success,
+        "duration_ms": duration_ms,
+        "attempt_timestamp": _ago(days),
+        "connection_method": "powershell_remoting",
+        **extra,
+    }
+
+
+class Repository:
+    def __init__(self, rows, reset_at=None):
+        self.rows = rows
+        self.reset_at = reset_at
+        self.reads = 0
+
+    def get_attempt_history(self, server_name):
+        self.reads += 1
+        return self.rows
+
+    def get_history_reset(self, server_name):
+        return self.reset_at
+
+    def reset_attempt_history(self, server_name):
+        self.reset_at = _ago(0)
+
+
+def _order(repository, ranker=None):
+    ranker = ranker or MethodRanker(repository)
+    return ranker.order("sql01", SPECS, lambda spec: spec)
+
+
+def test_winners_lead_failures_trail_and_ties_keep_priority():
+    repository = Repository(
+        [
+            _row(BASIC, True, duration_ms=900),
+            _row(DEFAULT, True, duration_ms=200),
+            _row(KERBEROS, False),
+            # Never ran: says nothing about NTLM
+            _row(NTLM, False, error_message="Skipped: TCP port 5985 not reachable"),
+            _row(NTLM, False, error_message="Cancelled: another attempt succeeded"),
+        ]
+    )
+
+    assert _order(repository) == [DEFAULT, BASIC, NTLM, KERBEROS]
+    assert _order(Repository([])) == SPECS
+
+
+def test_old_attempts_decay_and_fall_out_of_the_window():
+    repository = Repository(
+        [_row(KERBEROS, True, days=28) for _ in range(4)]  # 1/16 weight each
+        + [_row(NTLM, True, days=0)]
+        + [_row(BASIC, False, days=120) for _ in range(5)]  # Beyond window_days
+    )
+    ranker = MethodRanker(repository)
+
+    stats = ranker.combo_stats("sql01")
+
+    assert round(stats[KERBEROS].attempts, 3) == 0.25
+    assert BASIC not in stats
+    # Four successes a month ago count for less than one today
+    assert _order(repository, ranker)[:2] == [NTLM, KERBEROS]
+
+
+def test_configuration_changes_and_resets_discard_earlier_history():
+    rows = [
+        _row(KERBEROS, True, days=3),
+        _row(NTLM, False, days=2, config_changes='["TrustedHosts"]'),
+        _row(BASIC, True, days=1),
+    ]
+
+    # History before the attempt that changed configuration is ignored; that attempt counts
+    assert _order(Repository(rows)) == [BASIC, KERBEROS, DEFAULT, NTLM]
+    assert _order(Repository(rows, reset_at=_ago(0.5))) == SPECS
+
+
+def test_statistics_are_memoized_until_invalidated_or_reset():
+    repository = Repository([_row(BASIC, True)])
+    ranker = MethodRanker(repository)
+
+    assert _order(repository, ranker)[0] == BASIC
+    assert _order(repository, ranker)[0] == BASIC
+    assert repository.reads == 1
+
+    ranker.invalidate("SQL01")
+    _order(repository, ranker)
+    assert repository.reads == 2
+
+    ranker.reset_history("sql01")
+    assert _order(repository, ranker) == SPECS
+    assert repository.reads == 3
+
+
+def test_unreadable_history_keeps_priority_order():
+    class Broken(Repository):
+        def get_attempt_history(self, server_name):
+            raise RuntimeError("no such table: psremoting_attempts")
+
+    assert _order(Broken([])) == SPECS
@@ -0,0 +1,70 @@
+"""
+Tests for the SQLite-backed OS data cache.
+
+Entries are served from memory after one load, so each test checks both
+what a lookup returns and what a fresh store reads back from the file.
+"""
+
+import sqlite3
+
+from autodbaudit.infrastructure.cache.os_data_store import OsDataStore
+from autodbaudit.infrastructure.remediation.results import Success
+
+
+def _value(result):
+    assert isinstance(result, Success), result
+    return result.value
+
+
+def test_store_many_writes_every_target_and_updates_in_place(tmp_path):
+    db = tmp_path / "audit_history.db"
+    store = OsDataStore(db)
+
+    _value(store.store_many(
+        {"sql01|": {"os": "2019"}, "sql01|inst2": {"os": "2019"}, "sql02|": {"os": "2022"}},
+        {"sql01|": "sql01", "sql01|inst2": "sql01", "sql02|": "sql02"},
+    ))
+    _value(store.store("sql02|", {"os": "2025"}))
+
+    rows = sqlite3.connect(db).execute(
+        "SELECT target_id, hostname FROM os_data_cache ORDER BY target_id"
+    ).fetchall()
+    assert rows == [("sql01|", "sql01"), ("sql01|inst2", "sql01"), ("sql02|", None)]
+    assert _value(store.retrieve("sql02|")).data == {"os": "2025"}
+    assert set(_value(store.retrieve_many(["sql01|", "sql02|", "sql09|"]))) == {
+        "sql01|",
+        "sql02|",
+    }
+
+
+def test_fresh_store_reloads_entries_from_the_database(tmp_path):
+    db = tmp_path / "audit_history.db"
+    _value(OsDataStore(db).store("sql01|", {"os": "2019", "cpus": 8}))
+
+    reloaded = _value(OsDataStore(db).retrieve("sql01|"))
+
+    assert reloaded.data == {"os": "2019", "cpus": 8}
+    assert reloaded.collected_at.tzinfo is not None
+
+
+def test_expired_entries_are_not_served_and_are_purged(tmp_path):
+    db = tmp_path / "audit_history.db"
+    store = OsDataStore(db, ttl_seconds=-1)  # Already expired when written
+    _value(store.store_many({"sql01|": {"os": "2019"}, "sql02|": {"os": "2022"}}))
+    _value(OsDataStore(db).store("sql03|", {"os": "2022"}))
+
+    assert _value(store.retrieve("sql01|")) is None
+    assert _value(OsDataStore(db).retrieve("sql02|")) is None
+    assert _value(store.purge_expired()) == 2
+    count = sqlite3.connect(db).execute("SELECT COUNT(*) FROM os_data_cache").fetchone()[0]
+    assert count == 1
+
+
+def test_store_without_db_path_stays_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = OsDataStore()
+
+    _value(store.store("sql01|", {"os": "2019"}))
+
+    assert _value(store.retrieve("sql01|")).data == {"os": "2019"}
+    assert list(tmp_path.iterdir()) == []
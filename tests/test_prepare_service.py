@@ -0,0 +1,144 @@
+"""
+Tests for PrepareService host coordination and its connection cache.
+
+The PS remoting connection manager is replaced by a mock (and host
+preparation by a counting stub where it matters), so these cover only the
+orchestration: what is cached, when hosts are prepared, which connection
+path is used for what and in which order results come back.
+"""
+
+import time
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+
+from autodbaudit.application import prepare_service as prepare_service_module
+from autodbaudit.application.prepare.cache.cache_manager import ConnectionCacheManager
+from autodbaudit.application.prepare_service import PrepareService, _HostOutcome
+from autodbaudit.domain.config import ServerConnectionInfo, SqlTarget
+from autodbaudit.domain.config.audit_settings import AuditSettings
+
+
+def _target(name, server):
+    return SqlTarget(id=name, name=name, server=server, auth="sql")
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def connection_manager():
+    manager = MagicMock()
+    manager.test_connection.return_value = True
+    return manager
+
+
+def _stale_service(connection_manager, tmp_path):
+    cache = ConnectionCacheManager(default_ttl=1, db_path=tmp_path / "audit_history.db")
+    service = PrepareService(
+        MagicMock(), cache_manager=cache, connection_manager=connection_manager
+    )
+    cache.put("sql01", ServerConnectionInfo(server_name="sql01", is_available=True), ttl_seconds=1)
+    cache._cache["sql01"].timestamp -= 5  # 4s past its TTL
+    return service, cache
+
+
+def test_stale_entry_is_revalidated_without_config_changes(connection_manager, tmp_path):
+    service, cache = _stale_service(connection_manager, tmp_path)
+
+    result = service.prepare_target(_target("t1", "sql01"))
+
+    assert result.success
+    _wait_for(lambda: cache.get_stats().refreshes == 1)
+    connection_manager.test_connection.assert_called_once()
+    connection_manager.connect_to_server.assert_not_called()
+    assert cache.get_entry_info("sql01")["is_expired"] is False
+
+
+def test_failed_revalidation_drops_the_entry(connection_manager, tmp_path):
+    connection_manager.test_connection.return_value = False
+    service, cache = _stale_service(connection_manager, tmp_path)
+
+    service.prepare_target(_target("t1", "sql01"))
+
+    _wait_for(lambda: cache.get_stats().refresh_failures == 1)
+    assert cache.get_entry_info("sql01") is None
+    connection_manager.connect_to_server.assert_not_called()
+
+
+def test_entries_beyond_the_stale_window_are_misses(tmp_path):
+    cache = ConnectionCacheManager(default_ttl=1, db_path=tmp_path / "audit_history.db")
+    cache.set_revalidator(MagicMock())
+    cache.put("sql01", ServerConnectionInfo(server_name="sql01"), ttl_seconds=1)
+    cache._cache["sql01"].timestamp -= 2 * 3600
+
+    assert cache.get("sql01") is None
+    assert cache.get_stats().stale_hits == 0
+
+
+def _pass_service(connection_manager, tmp_path, monkeypatch, failing=(), down=()):
+    """Service whose host prepare sleeps (slowest first) and counts calls per host."""
+    monkeypatch.setattr(
+        prepare_service_module,
+        "scan_endpoints",
+        lambda endpoints, timeout: {ep: ep[0] not in down for ep in endpoints},
+    )
+    service = PrepareService(
+        MagicMock(),
+        cache_manager=ConnectionCacheManager(db_path=tmp_path / "audit_history.db"),
+        audit_settings=AuditSettings(max_parallel_targets=4),
+        connection_manager=connection_manager,
+    )
+    calls = Counter()
+    delays = {"sql01": 0.15, "sql02": 0.05, "sql03": 0.0}
+
+    def prepare_host(target):
+        calls[target.server] += 1
+        time.sleep(delays.get(target.server, 0))
+        if target.server in failing:
+            return _HostOutcome(None, "WinRM refused")
+        return _HostOutcome(ServerConnectionInfo(server_name=target.server, is_available=True))
+
+    service._prepare_host_uncached = prepare_host
+    return service, calls
+
+
+def test_results_come_back_in_request_order(connection_manager, tmp_path, monkeypatch):
+    service, calls = _pass_service(
+        connection_manager, tmp_path, monkeypatch, failing={"sql02"}, down={"sql09"}
+    )
+    targets = [
+        _target("a1", "sql01"),
+        _target("down", "sql09"),
+        _target("a2", "sql01"),
+        _target("b1", "sql02"),
+        _target("c1", "sql03"),
+        _target("b2", "sql02"),
+    ]
+
+    results = service.prepare_targets(targets)
+
+    assert [r.target.name for r in results] == ["a1", "down", "a2", "b1", "c1", "b2"]
+    assert [r.success for r in results] == [True, False, True, False, True, False]
+    assert results[1].error_message.startswith("Host unreachable")
+    # One prepare per host and pass; only the failed host is retried
+    assert calls == {"sql01": 1, "sql02": 2, "sql03": 1}
+
+
+def test_host_outcomes_only_live_for_one_pass(connection_manager, tmp_path, monkeypatch):
+    service, calls = _pass_service(connection_manager, tmp_path, monkeypatch, failing={"sql02"})
+    targets = [_target("b1", "sql02"), _target("b2", "sql02")]
+
+    service.prepare_targets(targets, rerun_failed_once=False)
+    service.prepare_targets(targets, rerun_failed_once=False)
+    service.prepare_target(_target("b3", "sql02"))
+    service.prepare_target(_target("b4", "sql02"))
+
+    assert calls["sql02"] == 4
+    assert service._host_flights == {}
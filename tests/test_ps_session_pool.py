@@ -0,0 +1,113 @@
+"""
+Tests for the persistent PowerShell session pool.
+
+The pool is driven by stand_in_shell, which speaks the pool's protocol
+and runs commands in the local shell, so session reuse, concurrency and
+eviction can be checked without PowerShell or WinRM.
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from autodbaudit.infrastructure.psremoting.facade import stand_in_shell
+from autodbaudit.infrastructure.psremoting.facade.session_pool import PowerShellSessionPool
+
+STAND_IN = [sys.executable, stand_in_shell.__file__]
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def factory(**kwargs):
+        pool = PowerShellSessionPool(shell_command=STAND_IN, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+def _run_concurrently(pool, count, command):
+    results = [None] * count
+
+    def call(index):
+        results[index] = pool.run(f"host{index:02d}", command)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.monotonic() - started
+
+
+def test_session_is_reused_per_server_and_credentials(make_pool):
+    pool = make_pool()
+
+    first = pool.run("sql01", "echo one")
+    second = pool.run("SQL01", "echo two")
+    other_cred = pool.run("sql01", "echo three", credential_script="$credential = 'b'")
+
+    assert (first.returncode, first.stdout.strip()) == (0, "one")
+    assert second.stdout.strip() == "two"
+    assert other_cred.returncode == 0
+    stats = pool.get_stats()
+    assert stats["sessions_opened"] == 2
+    assert stats["sessions_reused"] == 1
+    assert stats["shells_started"] == 1
+
+
+def test_concurrent_callers_are_not_serialized(make_pool):
+    pool = make_pool()
+    pool.run("warmup", "true")  # One shell is already running
+
+    results, elapsed = _run_concurrently(pool, 6, "sleep 0.5")
+
+    assert all(r.returncode == 0 for r in results)
+    assert elapsed < 1.5  # Two shells would take at least 1.5s
+    assert pool.get_stats()["shells_started"] == 6
+
+
+def test_max_shells_caps_processes_and_queues_the_rest(make_pool):
+    pool = make_pool(max_shells=2)
+
+    results, elapsed = _run_concurrently(pool, 4, "sleep 0.3")
+
+    assert all(r.returncode == 0 for r in results)
+    assert elapsed >= 0.6
+    stats = pool.get_stats()
+    assert stats["shells_started"] == 2
+    assert stats["waits"] >= 1
+
+
+def test_failing_command_and_timeout_return_errors(make_pool):
+    pool = make_pool(request_timeout=0.5)
+
+    failed = pool.run("sql01", "exit 3")
+    timed_out = pool.run("sql01", "sleep 5")
+    recovered = pool.run("sql01", "echo back")
+
+    assert failed.returncode == 3
+    assert timed_out.returncode == 1 and "No reply" in timed_out.stderr
+    assert recovered.stdout.strip() == "back"  # Stuck shell was replaced
+    assert pool.get_stats()["errors"] == 1
+
+
+def test_idle_sessions_and_shells_are_evicted(make_pool):
+    pool = make_pool(idle_timeout=0.1)
+    pool.run("sql01", "true")
+    pool.run("sql02", "true")
+    assert pool.get_stats()["open_sessions"] == 2
+
+    time.sleep(0.2)
+
+    assert pool.evict_idle() == 2
+    stats = pool.get_stats()
+    assert stats["open_sessions"] == 0
+    assert stats["shells"] == 0
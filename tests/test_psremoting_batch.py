@@ -0,0 +1,109 @@
+"""
+Tests for batched PowerShell script blocks and the shared host inventory.
+
+The command text is checked as a string and the parser is fed canned
+stdout, so no PowerShell is needed. The inventory cache is exercised
+with a fake facade that counts round trips.
+"""
+
+import json
+
+import pytest
+
+from autodbaudit.infrastructure.psremoting.facade import batch
+from autodbaudit.infrastructure.psremoting.facade.batch import (
+    BATCH_PREFIX,
+    HOST_INVENTORY_BLOCKS,
+    build_batch_command,
+    clear_host_inventory,
+    get_host_inventory,
+    parse_batch_output,
+)
+from autodbaudit.infrastructure.psremoting.models import BatchCommandResult, CommandResult
+
+BLOCKS = {"services": "Get-Service", "disks": "Get-Disk"}
+
+
+def test_command_wraps_each_block_and_frames_the_output():
+    command = build_batch_command(BLOCKS, depth=3)
+
+    assert "$__adba['services'] = try {" in command
+    assert "Get-Disk\n" in command
+    assert command.index("'services'") < command.index("'disks'")
+    assert command.endswith(f"'{BATCH_PREFIX}' + ($__adba | ConvertTo-Json -Depth 5 -Compress)")
+
+
+@pytest.mark.parametrize("blocks", [{}, {"bad name": "Get-Service"}, {"1st": "x"}])
+def test_command_rejects_empty_sets_and_non_identifier_names(blocks):
+    with pytest.raises(ValueError):
+        build_batch_command(blocks)
+
+
+def test_output_is_split_into_results_and_errors():
+    payload = {"services": {"ok": True, "data": [{"name": "MSSQLSERVER"}]}, "disks": {"ok": False, "error": "Access denied"}}
+    stdout = f"WARNING: noise\n{BATCH_PREFIX}{json.dumps(payload)}\n"
+
+    result = parse_batch_output(BLOCKS, CommandResult(success=True, stdout=stdout))
+
+    assert result.success
+    assert result.get("services") == [{"name": "MSSQLSERVER"}]
+    assert result.errors == {"disks": "Access denied"}
+
+
+def test_missing_blocks_and_unparseable_output_are_errors():
+    partial = f"{BATCH_PREFIX}{json.dumps({'services': {'ok': True, 'data': None}})}"
+    result = parse_batch_output(BLOCKS, CommandResult(success=True, stdout=partial))
+    assert result.success and result.errors == {"disks": "No result returned for block"}
+
+    failed = parse_batch_output(
+        BLOCKS, CommandResult(success=False, stdout=f"{BATCH_PREFIX}{{broken", stderr="WinRM refused\n")
+    )
+    assert not failed.success
+    assert failed.errors == {"services": "WinRM refused", "disks": "WinRM refused"}
+
+
+class FakeFacade:
+    def __init__(self, success=True):
+        self.success = success
+        self.calls = []
+
+    def run_batch(self, server, blocks, credentials):
+        self.calls.append((server, credentials))
+        return BatchCommandResult(
+            success=self.success, results={name: credentials["user"] for name in blocks}
+        )
+
+
+@pytest.fixture(autouse=True)
+def fresh_inventory():
+    clear_host_inventory()
+    yield
+    clear_host_inventory()
+
+
+def test_inventory_is_shared_per_host_and_credentials():
+    facade = FakeFacade()
+    admin = {"user": "admin"}
+
+    first = get_host_inventory(facade, "SQL01", admin)
+    again = get_host_inventory(facade, "sql01", {"user": "admin"})
+    other = get_host_inventory(facade, "sql01", {"user": "reader"})
+
+    assert again is first
+    assert other.get("services") == "reader"
+    assert [c[1]["user"] for c in facade.calls] == ["admin", "reader"]
+    assert set(HOST_INVENTORY_BLOCKS) == set(first.results)
+
+
+def test_failed_and_expired_inventories_are_fetched_again(monkeypatch):
+    failing = FakeFacade(success=False)
+    get_host_inventory(failing, "sql01", {"user": "admin"})
+    get_host_inventory(failing, "sql01", {"user": "admin"})
+    assert len(failing.calls) == 2
+
+    facade = FakeFacade()
+    get_host_inventory(facade, "sql01", {"user": "admin"}, max_age=60)
+    now = batch.time.monotonic()
+    monkeypatch.setattr(batch.time, "monotonic", lambda: now + 61)
+    get_host_inventory(facade, "sql01", {"user": "admin"}, max_age=60)
+    assert len(facade.calls) == 2
@@ -0,0 +1,120 @@
+"""
+Tests for raced direct PS remoting attempts.
+
+The port probe and the PowerShell attempt are swapped for fakes keyed on
+auth method and port, so each test decides which combinations fail,
+succeed or hang until cancelled. The cancellable subprocess runner is
+exercised against a real child Python process.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from autodbaudit.infrastructure.psremoting.credentials import CredentialHandler
+from autodbaudit.infrastructure.psremoting.layers import direct_runner
+from autodbaudit.infrastructure.psremoting.layers.direct.executor import (
+    AttemptCancelledError,
+    _run_cancellable,
+)
+from autodbaudit.infrastructure.psremoting.layers.direct_runner import DirectAttemptRunner
+from autodbaudit.infrastructure.psremoting.models import CredentialBundle, PSSession
+
+BUNDLE = CredentialBundle(windows_explicit={"username": "CORP\\auditor", "password": "secret"})
+
+
+def _runner(monkeypatch, open_ports, outcome, race=True):
+    """Runner whose attempts return outcome(profile, cancel_event): True, False or raise."""
+    monkeypatch.setattr(
+        direct_runner, "probe_ports", lambda host, ports, timeout: {p: p in open_ports for p in ports}
+    )
+
+    def execute(profile, bundle, handler, timestamp, is_windows, cancel_event=None, **_):
+        if not outcome(profile, cancel_event):
+            raise RuntimeError("Access is denied")
+        return PSSession(
+            session_id="s1", server_name=profile.server_name, connection_profile=profile, created_at="now"
+        )
+
+    monkeypatch.setattr(direct_runner, "execute_connection_attempt", execute)
+    return DirectAttemptRunner(CredentialHandler(), lambda: "now", is_windows=True, race=race)
+
+
+def _combos(attempts):
+    return [(a.auth_method, a.port) for a in attempts]
+
+
+def test_closed_ports_are_skipped_and_attempts_keep_plan_order(monkeypatch):
+    sequential = []
+    _runner(monkeypatch, {5985}, lambda profile, _: False, race=False).layer1_direct_attempts(
+        "sql01", BUNDLE, sequential, 1
+    )
+    runner = _runner(monkeypatch, {5985}, lambda profile, _: profile.auth_method == "NTLM")
+    attempts = []
+
+    result = runner.layer1_direct_attempts("sql01", BUNDLE, attempts, 1)
+
+    assert result.is_success()
+    assert result.successful_permutations[0]["auth_method"] == "NTLM"
+    assert result.attempts_made is attempts
+    # Every combination is recorded once, in the same order as the sequential run
+    assert _combos(attempts) == _combos(sequential)
+    assert len(attempts) == 24
+    assert {a.error_message for a in attempts if a.port == 5986} == {
+        "Skipped: TCP port 5986 not reachable"
+    }
+    assert all(a.success for a in attempts if a.auth_method == "NTLM" and a.port == 5985)
+
+
+def test_first_success_cancels_attempts_still_running(monkeypatch):
+    def outcome(profile, cancel_event):
+        # Kerberos over HTTPS is in the first wave of max_concurrency attempts
+        if (profile.auth_method, profile.port) == ("Kerberos", 5986):
+            return True
+        if cancel_event.wait(5):
+            raise AttemptCancelledError("Cancelled: another attempt succeeded")
+        return False
+
+    runner = _runner(monkeypatch, {5985, 5986}, outcome)
+    attempts = []
+    started = time.monotonic()
+
+    result = runner.layer1_direct_attempts("sql01", BUNDLE, attempts, 1)
+
+    assert time.monotonic() - started < 4
+    assert result.successful_permutations[0]["port"] == 5986
+    assert len(attempts) == 24
+    losers = {a.error_message for a in attempts if not a.success}
+    assert losers == {
+        "Cancelled: another attempt succeeded",
+        "Skipped: another attempt succeeded",
+    }
+
+
+def test_no_attempt_runs_when_every_port_is_closed(monkeypatch):
+    runner = _runner(monkeypatch, set(), lambda profile, _: True)
+    attempts = []
+
+    result = runner.layer1_direct_attempts("sql01", BUNDLE, attempts, 1)
+
+    assert not result.is_success()
+    assert result.error_message == "Layer 1: All direct attempts failed"
+    assert len(attempts) == 24 and not any(a.success for a in attempts)
+
+
+def test_cancellable_run_returns_output_and_kills_on_cancel_or_timeout():
+    done = _run_cancellable([sys.executable, "-c", "print('Connected')"], 10, threading.Event())
+    assert (done.returncode, done.stdout.strip()) == (0, "Connected")
+
+    sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+    cancel = threading.Event()
+    threading.Timer(0.3, cancel.set).start()
+    started = time.monotonic()
+    with pytest.raises(AttemptCancelledError):
+        _run_cancellable(sleeper, 30, cancel)
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_cancellable(sleeper, 0.5, threading.Event())
+    assert time.monotonic() - started < 10
@@ -0,0 +1,90 @@
+"""
+Tests for the fleet TCP reachability pre-scan.
+
+Endpoints are real sockets on the loopback interface: one listening, one
+just closed. The .invalid top-level domain never resolves, which covers
+the DNS failure path without any network access.
+"""
+
+import asyncio
+import socket
+
+import pytest
+
+from autodbaudit.infrastructure.reachability import clear_recent, probe_host, scan_endpoints
+
+
+@pytest.fixture(autouse=True)
+def no_recent_results():
+    clear_recent()
+    yield
+    clear_recent()
+
+
+@pytest.fixture
+def listener():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def closed_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def test_open_closed_and_unresolvable_endpoints(listener, closed_port):
+    open_port = listener.getsockname()[1]
+
+    results = scan_endpoints(
+        [
+            ("127.0.0.1", open_port),
+            ("localhost", str(open_port)),
+            ("127.0.0.1", closed_port),
+            ("127.0.0.1", open_port),
+            ("sql01.invalid", 1433),
+        ],
+        timeout=1.0,
+    )
+
+    assert results == {
+        ("127.0.0.1", open_port): True,
+        ("localhost", open_port): True,
+        ("127.0.0.1", closed_port): False,
+        ("sql01.invalid", 1433): False,
+    }
+
+
+def test_recent_results_are_reused_only_when_asked(listener):
+    endpoint = ("127.0.0.1", listener.getsockname()[1])
+    assert scan_endpoints([endpoint], timeout=1.0) == {endpoint: True}
+    listener.close()
+
+    assert scan_endpoints([endpoint], timeout=1.0, reuse_recent=True) == {endpoint: True}
+    assert scan_endpoints([endpoint], timeout=1.0) == {endpoint: False}
+    clear_recent()
+    assert scan_endpoints([endpoint], timeout=1.0, reuse_recent=True) == {endpoint: False}
+
+
+def test_scan_works_from_inside_a_running_event_loop(listener):
+    endpoint = ("127.0.0.1", listener.getsockname()[1])
+
+    async def caller():
+        return scan_endpoints([endpoint], timeout=1.0)
+
+    assert asyncio.run(caller()) == {endpoint: True}
+
+
+def test_local_aliases_probe_loopback():
+    assert [probe_host(s) for s in (".", " (local) ", "(LocalDB)", "sql01")] == [
+        "127.0.0.1",
+        "127.0.0.1",
+        "127.0.0.1",
+        "sql01",
+    ]
@@ -0,0 +1,101 @@
+"""
+Tests for remediation script generation from a history DB.
+
+Findings are saved to a real temporary history DB. Each test checks the
+generated script files (which port each instance gets from the targets
+config, and whether serial and process-pool rendering agree) or the
+finding rows handed to each instance job.
+"""
+
+import pytest
+
+from autodbaudit.application.remediation.jinja_generator import clear_environment_cache
+from autodbaudit.application.remediation.service import RemediationService
+from autodbaudit.infrastructure.sqlite.schema import initialize_schema_v2, save_finding
+from autodbaudit.infrastructure.sqlite.store import HistoryStore
+
+
+@pytest.fixture(autouse=True)
+def fresh_environments():
+    clear_environment_cache()
+    yield
+    clear_environment_cache()
+
+
+@pytest.fixture
+def audit(tmp_path):
+    """A finished run with findings on three instances across two hosts."""
+    store = HistoryStore(tmp_path / "audit_history.db")
+    store.initialize_schema()
+    conn = store._get_connection()
+    initialize_schema_v2(conn)
+    run_id = store.begin_audit_run(organization="Test").id
+    for host, instance in (("sql01", "MSSQLSERVER"), ("sql01", "INST2"), ("sql02", "MSSQLSERVER")):
+        server = store.upsert_server(host)
+        instance_id = store.upsert_instance(server, instance, 1433, "16.0.4105.2", 16).id
+        store.link_instance_to_run(run_id, instance_id)
+        for option in ("xp_cmdshell", "clr enabled"):
+            save_finding(
+                conn, run_id, instance_id, f"config|{host}|{instance}|{option}", "config", option, "FAIL"
+            )
+    store.close()
+    return tmp_path
+
+
+def _service(workdir, name="scripts"):
+    return RemediationService(db_path=workdir / "audit_history.db", output_dir=workdir / name)
+
+
+def _body(path):
+    """Script lines without the generation timestamp."""
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if "Generated" not in line]
+
+
+TARGETS = [
+    {"server": "SQL01", "port": 1533, "username": "auditor"},
+    {"server": "sql01", "port": 1633},  # Same default instance: first target wins
+    {"server": "sql01", "instance": "inst2", "port": 1444},
+]
+
+
+def test_each_instance_gets_the_port_of_its_first_matching_target(audit):
+    paths = _service(audit).generate_scripts(sql_targets=TARGETS, max_workers=1)
+
+    names = sorted(p.name for p in paths if p.suffix == ".sql" and "ROLLBACK" not in p.name)
+    assert [n.rsplit("_", 2)[0] for n in names] == ["sql01_1444", "sql01_1533", "sql02"]
+    assert all(p.exists() for p in paths)
+    assert len(paths) == 9
+
+
+def test_process_pool_renders_the_same_files_as_serial(audit):
+    serial = _service(audit, "serial").generate_scripts(sql_targets=TARGETS, max_workers=1)
+    pooled = _service(audit, "pooled").generate_scripts(sql_targets=TARGETS, max_workers=3)
+
+    assert [p.name for p in pooled] == [p.name for p in serial]
+    assert [_body(p) for p in pooled] == [_body(p) for p in serial]
+
+
+def test_annotations_reach_each_finding_once_with_exception_and_justification(audit, monkeypatch):
+    store = HistoryStore(audit / "audit_history.db")
+    key = "config|sql01|MSSQLSERVER|xp_cmdshell"
+    store.upsert_annotation("config", key, "review_status", "Exception", status_override="exception")
+    store.upsert_annotation("config", key, "justification", "Needed by the backup agent")
+    store.upsert_annotation("config", key, "notes", "Reviewed")
+    store.close()
+    service = _service(audit)
+    jobs = []
+    monkeypatch.setattr(service, "_run_instance_jobs", lambda batch, workers: jobs.extend(batch) or [])
+
+    service.generate_scripts()
+
+    findings = {
+        (job[0], job[1]): {f["entity_name"]: (f["is_exceptionalized"], f["justification"]) for f in job[4]}
+        for job in jobs
+    }
+    # One row per finding, even though xp_cmdshell has three annotation fields
+    assert [len(job[4]) for job in jobs] == [2, 2, 2]
+    assert findings[("sql01", "MSSQLSERVER")] == {
+        "xp_cmdshell": (1, "Needed by the backup agent"),
+        "clr enabled": (0, ""),
+    }
+    assert set(findings[("sql02", "MSSQLSERVER")].values()) == {(0, "")}
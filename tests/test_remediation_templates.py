@@ -0,0 +1,74 @@
+"""
+Tests for remediation template rendering and its bytecode cache.
+
+Compiled templates are cached in the configured output folder and
+nowhere else, so these run from an empty working directory.
+"""
+
+import pytest
+
+from autodbaudit.application.remediation.handlers.base import RemediationContext
+from autodbaudit.application.remediation.handlers.infrastructure import InfrastructureHandler
+from autodbaudit.application.remediation.jinja_generator import (
+    JinjaScriptGenerator,
+    clear_environment_cache,
+)
+from autodbaudit.application.remediation.service import RemediationService
+
+
+@pytest.fixture(autouse=True)
+def fresh_environments(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    clear_environment_cache()
+    yield
+    clear_environment_cache()
+
+
+def _context(**kwargs):
+    values = dict(
+        server_name="sql01",
+        instance_name="SQLEXPRESS",
+        inst_id=1,
+        port=1434,
+        conn_user=None,
+        aggressiveness=2,
+    )
+    values.update(kwargs)
+    return RemediationContext(**values)
+
+
+def test_os_script_renders_context_values():
+    script = InfrastructureHandler(_context()).generate_os_script()
+
+    assert '$ServerName = "sql01"' in script
+    assert '$InstanceName = "SQLEXPRESS"' in script
+    assert "$Port = 1434" in script
+    assert "function Set-RegistryValue {" in script
+    assert script.endswith('=== OS Audit Complete ===" -ForegroundColor Cyan\n')
+    default = InfrastructureHandler(_context(instance_name="")).generate_os_script()
+    assert '$InstanceName = "MSSQLSERVER"' in default
+
+
+def test_non_windows_hosts_get_no_powershell():
+    script = InfrastructureHandler(_context(host_platform="Linux")).generate_os_script()
+
+    assert script.startswith("# UNIX/LINUX DETECTED")
+
+
+def test_service_caches_compiled_templates_in_its_output_dir(tmp_path):
+    output_dir = tmp_path / "audit_output"
+    service = RemediationService(
+        db_path=output_dir / "audit_history.db",
+        output_dir=output_dir / "remediation_scripts",
+    )
+
+    InfrastructureHandler(_context()).generate_os_script(service._template_env())
+
+    assert list((output_dir / "jinja_cache").glob("__jinja2_*.cache"))
+    assert not (output_dir / "remediation_scripts" / "jinja_cache").exists()
+
+
+def test_generator_without_output_dir_writes_nothing(tmp_path):
+    JinjaScriptGenerator()
+
+    assert list(tmp_path.iterdir()) == []
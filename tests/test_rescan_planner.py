@@ -0,0 +1,202 @@
+"""
+Tests for targeted sync: rescan planning and report carry-forward.
+
+Planning runs against a real history DB. Carry-forward builds the old and
+new reports with EnhancedReportWriter so merged server/instance groups and
+the autofilter look exactly as they do in a sync. The Cover totals of a
+targeted report are compared against the full report they replace.
+"""
+
+import pytest
+from openpyxl import load_workbook
+
+from autodbaudit.application.rescan_planner import plan_targeted_rescan
+from autodbaudit.infrastructure.config_loader import SqlTarget
+from autodbaudit.infrastructure.excel import EnhancedReportWriter
+from autodbaudit.infrastructure.excel.carry_forward import read_instance_rows
+from autodbaudit.infrastructure.sqlite.schema import initialize_schema_v2, save_finding
+from autodbaudit.infrastructure.sqlite.store import HistoryStore
+
+LOGINS = "Server Logins"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    store.initialize_schema()
+    initialize_schema_v2(store._get_connection())
+    yield store
+    store.close()
+
+
+def _previous_run(store, statuses):
+    """Audit each host once; statuses maps host -> finding status."""
+    run_id = store.begin_audit_run(organization="Test").id
+    conn = store._get_connection()
+    for host, status in statuses.items():
+        server = store.upsert_server(host)
+        instance_id = store.upsert_instance(server, "", 1433, "16.0.4105.2", 16).id
+        store.link_instance_to_run(run_id, instance_id)
+        save_finding(conn, run_id, instance_id, f"login|{host}||sa", "login", "sa", status)
+    return run_id
+
+
+def _targets(*hosts):
+    return [SqlTarget(id=host, server=host) for host in hosts]
+
+
+def _plan(store, run_id, hosts, **kwargs):
+    plan = plan_targeted_rescan(store, run_id, _targets(*hosts), **kwargs)
+    return [t.server for t in plan.rescan], [t.server for t in plan.carried], plan
+
+
+def test_only_instances_with_pending_work_are_rescanned(store):
+    run_id = _previous_run(store, {"sql01": "FAIL", "sql02": "PASS", "sql03": "WARN"})
+
+    rescan, carried, plan = _plan(store, run_id, ["sql01", "sql02", "sql03", "sql04"])
+
+    assert rescan == ["sql01", "sql03", "sql04"]
+    assert carried == ["sql02"]
+    assert plan.reasons["sql04"] == ["not in previous run"]
+    assert plan.carried_report_keys == {("sql02", "")}
+    assert len(plan.carried_instance_ids) == 1
+
+
+def test_documented_exceptions_are_not_pending(store):
+    run_id = _previous_run(store, {"sql01": "FAIL"})
+    annotations = {"login|sql01||sa": {"justification": "Break-glass account"}}
+
+    rescan, carried, _ = _plan(store, run_id, ["sql01"], annotations=annotations)
+
+    assert (rescan, carried) == ([], ["sql01"])
+
+
+def test_executed_scripts_and_only_force_a_rescan(store):
+    run_id = _previous_run(store, {"sql01": "PASS", "sql02": "PASS", "sql03": "PASS"})
+    store.record_script_execution("SQL02", None, 1433, "fix_sa.sql", 1, 0)
+
+    rescan, carried, plan = _plan(store, run_id, ["sql01", "sql02", "sql03"], only=["sql03"])
+
+    assert rescan == ["sql02", "sql03"]
+    assert carried == ["sql01"]
+    assert plan.reasons["sql02"] == ["remediation executed"]
+    assert plan.reasons["sql03"] == ["requested"]
+
+
+def _report(path, logins, carried=None):
+    writer = EnhancedReportWriter()
+    for server, instance, login in logins:
+        writer.add_login(server, instance, login, "SQL Login", is_disabled=False)
+    if carried:
+        writer.add_carried_rows(carried)
+    writer.save(path)
+    return path
+
+
+def _merged(ws, column):
+    return sorted(
+        (r.min_row, r.max_row)
+        for r in ws.merged_cells.ranges
+        if r.min_col == column == r.max_col
+    )
+
+
+def test_carried_rows_land_inside_their_server_group(tmp_path):
+    old = _report(
+        tmp_path / "old.xlsx",
+        [
+            ("sql01", "", "a"),
+            ("sql01", "", "b"),
+            ("sql01", "INST2", "c"),
+            ("sql01", "INST2", "d"),
+            ("sql02", "", "e"),
+            ("sql02", "", "f"),
+            ("sql03", "", "g"),
+        ],
+    )
+    carried = read_instance_rows(old, {("sql01", "inst2"), ("sql02", "")})
+
+    new = _report(
+        tmp_path / "new.xlsx",
+        [("sql01", "", "a2"), ("sql03", "", "g2")],
+        carried=carried,
+    )
+
+    ws = load_workbook(new)[LOGINS]
+    headers = [c.value for c in ws[1]]
+    server_col = headers.index("Server") + 1
+    instance_col = headers.index("Instance") + 1
+    logins = [row[headers.index("Login Name")] for row in ws.iter_rows(min_row=2, values_only=True)]
+    assert logins == ["a2", "c", "d", "g2", "e", "f"]
+    # sql01 is one group: its rescanned row plus the carried INST2 rows
+    assert _merged(ws, server_col) == [(2, 4), (6, 7)]
+    assert _merged(ws, instance_col) == [(3, 4), (6, 7)]
+    assert ws.cell(row=3, column=instance_col).value == "INST2"
+    assert ws.cell(row=6, column=server_col).value == "sql02"
+    assert ws.auto_filter.ref.endswith("7")
+    # Row UUIDs are carried over verbatim
+    old_ws = load_workbook(old)[LOGINS]
+    assert ws.cell(row=3, column=1).value == old_ws.cell(row=4, column=1).value
+
+
+def test_unknown_instances_and_missing_workbook_carry_nothing(tmp_path):
+    old = _report(tmp_path / "old.xlsx", [("sql01", "", "a")])
+
+    assert read_instance_rows(old, {("sql09", "")}) == {}
+    assert read_instance_rows(tmp_path / "missing.xlsx", {("sql01", "")}) == {}
+
+
+def _cover_counts(path):
+    ws = load_workbook(path)["Cover"]
+    counts = {}
+    for label, _, value in ws.iter_rows(min_col=2, max_col=4, values_only=True):
+        for name in ("Critical Issues", "Warnings Found", "Passed Checks"):
+            if label and name in str(label):
+                counts[name] = int(value) if value is not None else None
+    return counts
+
+
+def _config_report(path, hosts, carried=None, findings=()):
+    writer = EnhancedReportWriter()
+    for host, status in hosts.items():
+        writer.add_config_setting(host, "", "xp_cmdshell", int(status == "FAIL"), 0)
+    if carried:
+        writer.add_carried_rows(carried, findings)
+    writer.save(path)
+    return path, writer
+
+
+def test_cover_totals_cover_the_whole_fleet_after_a_targeted_sync(store, tmp_path):
+    fleet = {"sql01": "FAIL", "sql02": "PASS", "sql03": "PASS"}
+    previous_run_id = _previous_run(store, fleet)
+    old, _ = _config_report(tmp_path / "old.xlsx", fleet)
+    _, carried_hosts, plan = _plan(store, previous_run_id, list(fleet))
+    assert carried_hosts == ["sql02", "sql03"]
+
+    # sql01 is rescanned (still failing); the others are carried forward
+    run_id = store.begin_audit_run(organization="Test").id
+    sql01 = next(
+        f["instance_id"] for f in store.get_findings(previous_run_id) if "sql01" in f["entity_key"]
+    )
+    store.link_instance_to_run(run_id, sql01)
+    save_finding(store._get_connection(), run_id, sql01, "login|sql01||sa", "login", "sa", "FAIL")
+    store.carry_forward_instances(previous_run_id, run_id, plan.carried_instance_ids)
+    carried_findings = [
+        f for f in store.get_findings(run_id) if f["instance_id"] in plan.carried_instance_ids
+    ]
+
+    new, writer = _config_report(
+        tmp_path / "new.xlsx",
+        {"sql01": "FAIL"},
+        carried=read_instance_rows(old, plan.carried_report_keys),
+        findings=carried_findings,
+    )
+
+    assert _cover_counts(new) == _cover_counts(old)
+    assert _cover_counts(new) == {"Critical Issues": 1, "Warnings Found": 0, "Passed Checks": 2}
+
+    # Counters from StatsService already span the run; carried rows add nothing
+    writer = EnhancedReportWriter()
+    writer.set_stats_from_service(active_issues=1, documented_exceptions=0, compliant_items=2)
+    writer.add_carried_rows({}, carried_findings)
+    assert (writer._issue_count, writer._warn_count, writer._pass_count) == (1, 0, 2)
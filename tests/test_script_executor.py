@@ -0,0 +1,113 @@
+"""
+Tests for concurrent remediation apply in ScriptExecutor.
+
+run_one is replaced by a function that sleeps and prints, so the
+scheduling (per-host and global caps, fail-fast) and per-script output
+buffering are checked without SQL Server or PowerShell.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from autodbaudit.application.script_executor import ScriptExecutor
+
+
+@pytest.fixture
+def executor(tmp_path):
+    return ScriptExecutor(targets_file=tmp_path / "config" / "sql_targets.json")
+
+
+class Recorder:
+    """run_one stand-in that tracks how many scripts run at once."""
+
+    def __init__(self, delay=0.1, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.lock = threading.Lock()
+        self.running = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.started = []
+
+    def __call__(self, script, out):
+        host = script.parent.name
+        with self.lock:
+            self.started.append(script.name)
+            self.running[host] += 1
+            self.running["*"] += 1
+            for key in (host, "*"):
+                self.peak[key] = max(self.peak[key], self.running[key])
+        print(f"begin {script.name}", file=out)
+        time.sleep(self.delay)
+        print(f"end {script.name}", file=out)
+        with self.lock:
+            self.running[host] -= 1
+            self.running["*"] -= 1
+        return script.name not in self.failing
+
+
+def _run(executor, recorder, scripts, stop=None, **kwargs):
+    return executor._run_scripts(
+        scripts,
+        run_one=recorder,
+        host_of=lambda script: script.parent.name,
+        is_failure=lambda ok: ok is False,
+        cancelled=lambda script: None,
+        stop=stop,
+        **kwargs,
+    )
+
+
+def _scripts(**per_host):
+    return [Path(host) / f"{host}_{i}.sql" for host, count in per_host.items() for i in range(count)]
+
+
+def test_busy_host_does_not_hold_workers(executor):
+    recorder = Recorder()
+    scripts = _scripts(a=4, b=1, c=1)
+
+    started = time.monotonic()
+    results = _run(executor, recorder, scripts, max_workers=3, per_host=1)
+    elapsed = time.monotonic() - started
+
+    assert results == [True] * 6
+    assert recorder.peak["a"] == 1
+    assert recorder.peak["*"] == 3
+    # b and c run alongside a's first script instead of queuing behind a
+    assert set(recorder.started[:3]) == {"a_0.sql", "b_0.sql", "c_0.sql"}
+    assert elapsed < 0.6
+
+
+def test_output_of_each_script_is_written_in_one_block(executor, capsys):
+    _run(executor, Recorder(delay=0.05), _scripts(a=2, b=2), max_workers=4, per_host=2)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 8
+    for begin, end in zip(lines[::2], lines[1::2]):
+        assert begin.startswith("begin ") and end == "end " + begin[6:]
+
+
+def test_fail_fast_cancels_scripts_not_started(executor):
+    recorder = Recorder(delay=0.05, failing={"a_0.sql"})
+    stop = threading.Event()
+
+    results = _run(executor, recorder, _scripts(a=3), stop=stop, max_workers=2, per_host=1)
+
+    assert results == [False, None, None]
+    assert recorder.started == ["a_0.sql"]
+
+
+def test_sql_and_ps1_scripts_of_a_host_share_a_key(executor, tmp_path):
+    sql = tmp_path / "SQL01_1433_1_default.sql"
+    sql.write_text("/*\nServer: SQL01\nPort: 1433\nInstance: (Default)\n*/\nSELECT 1\n")
+    ps1 = tmp_path / "sql01.corp_1433_1_default_OS_AUDIT.ps1"
+    ps1.write_text('<#\n#>\n$ServerName = "SQL01"\n$Port = 1433\n')
+    legacy = tmp_path / "sql01_1433_1_default_OS_AUDIT.ps1"
+    legacy.write_text("Write-Host 'no header'\n")
+
+    assert executor._script_host(sql) == "sql01"
+    assert executor._script_host(ps1) == "sql01"
+    assert executor._script_host(legacy) == "sql01"
@@ -0,0 +1,113 @@
+"""
+Tests for the stand-in SQL Server driver.
+
+The stand-in has to answer every QueryProvider query the way SqlConnector
+and the collectors expect (same columns, stable data per instance), and
+its failure injection has to surface as driver errors.
+"""
+
+import inspect
+
+import pytest
+
+from autodbaudit.infrastructure.sql import (
+    FleetSpec,
+    SqlConnector,
+    StandInDriver,
+    get_query_provider,
+    use_odbc,
+)
+from autodbaudit.infrastructure.sql.odbc import STANDIN_ENV_VAR, get_odbc
+from autodbaudit.infrastructure.sql.stand_in import OperationalError, ProgrammingError
+
+
+@pytest.fixture
+def driver():
+    """Stand-in installed for all connections during the test."""
+    stand_in = StandInDriver(FleetSpec(databases=3, users_per_db=10, permissions_per_db=25))
+    previous = use_odbc(stand_in)
+    yield stand_in
+    use_odbc(previous)
+
+
+def _provider_queries(provider, database="AppDb001"):
+    for name in sorted(n for n in dir(provider) if n.startswith("get_")):
+        method = getattr(provider, name)
+        args = (database,) if "database" in inspect.signature(method).parameters else ()
+        yield name, method(*args)
+
+
+@pytest.mark.parametrize("version_major", [10, 16])
+def test_every_provider_query_is_served(driver, version_major):
+    """Each query is recognized and returns rows keyed by its column aliases."""
+    driver_spec = FleetSpec(versions=(version_major,))
+    use_odbc(StandInDriver(driver_spec))
+    connector = SqlConnector("standin0001")
+    provider = get_query_provider(connector.detect_version().version_major)
+
+    for name, sql in _provider_queries(provider):
+        rows = connector.execute_query(sql)
+        assert isinstance(rows, list), name
+
+    logins = connector.execute_query(provider.get_server_logins())
+    assert len(logins) == driver_spec.logins
+    assert {"LoginName", "LoginType", "IsDisabled", "IsSA"} <= set(logins[0])
+    permissions = connector.execute_query(provider.get_database_permissions("AppDb002"))
+    assert len(permissions) == driver_spec.permissions_per_db
+
+
+def test_detect_version_and_test_connection(driver):
+    connector = SqlConnector("host01\\INST1")
+
+    assert connector.test_connection()
+    info = connector.detect_version()
+    assert info.server_name == "HOST01\\INST1"
+    assert info.instance_name == "INST1"
+    assert info.version_major == 16
+
+
+def test_data_is_stable_per_instance(driver):
+    provider = get_query_provider(16)
+    first = SqlConnector("standin0001").execute_query(provider.get_database_users("AppDb001"))
+    again = StandInDriver(driver.spec)
+    use_odbc(again)
+    second = SqlConnector("standin0001").execute_query(provider.get_database_users("AppDb001"))
+
+    assert first == second
+    assert len(first) == driver.spec.users_per_db + 2  # dbo and guest
+
+
+def test_non_select_statements_have_no_result_set(driver):
+    assert SqlConnector("standin0001").execute_query("ALTER LOGIN [sa] DISABLE") == []
+
+
+def test_failure_injection():
+    previous = use_odbc(StandInDriver(FleetSpec(offline_rate=1.0)))
+    try:
+        assert not SqlConnector("standin0001").test_connection()
+        with pytest.raises(OperationalError):
+            SqlConnector("standin0001").detect_version()
+
+        use_odbc(StandInDriver(FleetSpec(query_failure_rate=1.0)))
+        with pytest.raises(ProgrammingError):
+            SqlConnector("standin0001").execute_query("SELECT 1 AS One")
+    finally:
+        use_odbc(previous)
+
+
+def test_fleet_spec_parse():
+    spec = FleetSpec.parse("databases=5, versions=10+16, query_latency_ms=2.5")
+
+    assert (spec.databases, spec.versions, spec.query_latency_ms) == (5, (10, 16), 2.5)
+    assert FleetSpec.parse("1") == FleetSpec()
+    with pytest.raises(ValueError):
+        FleetSpec.parse("bogus=1")
+
+
+def test_environment_selects_stand_in(monkeypatch):
+    monkeypatch.setenv(STANDIN_ENV_VAR, "databases=4")
+
+    odbc = get_odbc()
+    assert isinstance(odbc, StandInDriver)
+    assert odbc.spec.databases == 4
+    assert get_odbc() is odbc
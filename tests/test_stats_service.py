@@ -0,0 +1,118 @@
+"""
+Tests for StatsService counters and the memoized exception index.
+
+Findings and annotations come from small in-memory providers, so each
+test spells out the before/after rows it counts.
+"""
+
+from autodbaudit.application.stats_service import ExceptionIndex, StatsService
+
+
+class Provider:
+    """Findings and annotations (current and as of a run) for a few runs."""
+
+    def __init__(self, runs, annotations=None, as_of=None):
+        self.runs = runs
+        self.annotations = annotations or {}
+        self.as_of = as_of or {}
+
+    def get_findings(self, run_id):
+        return [
+            {"entity_key": key, "finding_type": key.split("|", 1)[0], "status": status}
+            for key, status in self.runs[run_id].items()
+        ]
+
+    def get_all_annotations(self):
+        return self.annotations
+
+    def get_annotations_as_of(self, run_id):
+        return self.as_of.get(run_id)
+
+
+class Scanned:
+    def __init__(self, *instances):
+        self.instances = set(instances)
+
+    def get_scanned_instance_keys(self, run_id):
+        return self.instances
+
+
+EXCEPTION = {"justification": "Vendor requirement"}
+
+
+def test_current_state_and_changes_since_baseline():
+    provider = Provider(
+        {
+            1: {
+                "login|sql01|default|sa": "FAIL",  # fixed
+                "login|sql01|default|app": "PASS",  # regression
+                "config|sql01|default|xp_cmdshell": "FAIL",  # still failing
+                "login|sql02|default|old": "FAIL",  # sql02 not scanned: no change
+            },
+            2: {
+                "login|sql01|default|sa": "PASS",
+                "login|sql01|default|app": "FAIL",
+                "config|sql01|default|xp_cmdshell": "FAIL",
+                "login|sql01|default|new": "WARN",  # new issue
+                "login|sql01|default|svc": "FAIL",  # new, but documented
+            },
+        },
+        annotations={"LOGIN|SQL01|DEFAULT|SVC": EXCEPTION},
+    )
+
+    stats = StatsService(provider, provider, Scanned("sql01|default")).calculate(1, 2)
+
+    assert stats.total_findings == 5
+    assert (stats.active_issues, stats.documented_exceptions, stats.compliant_items) == (3, 1, 1)
+    assert stats.fixed_since_baseline == 1
+    assert stats.regressions_since_baseline == 1
+    assert stats.new_issues_since_baseline == 1
+    assert sum(sheet.get("exceptions", 0) for sheet in stats.sheet_stats.values()) == 1
+
+
+def test_previous_sync_uses_the_annotations_recorded_for_it():
+    runs = {
+        1: {"login|sql01|default|sa": "FAIL"},
+        2: {"login|sql01|default|sa": "FAIL", "login|sql01|default|app": "FAIL"},
+        3: {"login|sql01|default|sa": "FAIL", "login|sql01|default|app": "FAIL"},
+    }
+    key = "login|sql01|default|app"
+    provider = Provider(
+        runs,
+        annotations={key: {**EXCEPTION, "notes": "Reviewed"}},
+        as_of={2: {key: {"notes": "Pending review"}}},
+    )
+
+    stats = StatsService(provider, provider).calculate(1, 3, previous_run_id=2)
+
+    # Justified since run 2: no longer an active issue, and its notes changed
+    assert stats.documented_exceptions == 1
+    assert stats.new_issues_since_baseline == 0
+    assert (stats.docs_added_since_last, stats.docs_updated_since_last) == (0, 1)
+
+
+def test_exception_index_matches_legacy_and_uuid_keys():
+    index = ExceptionIndex(
+        {
+            "login|5f2c9a": {**EXCEPTION, "_legacy_entity_key": "sql01|default|sa"},
+            "config|a7f3b2c1": EXCEPTION,
+            "login|sql01|default|app": {"notes": "No justification"},
+        }
+    )
+
+    assert index.is_exceptioned("LOGIN|sql01|Default|SA")
+    assert index.is_exceptioned("config|sql01|default|a7f3b2c1")
+    assert not index.is_exceptioned("login|sql01|default|app")
+    assert not index.is_exceptioned("login|sql02|default|other")
+
+
+def test_exception_lookups_are_memoized_per_normalized_key(monkeypatch):
+    index = ExceptionIndex({"login|sql01|default|sa": EXCEPTION})
+    lookups = []
+    lookup = index._lookup
+    monkeypatch.setattr(index, "_lookup", lambda key: lookups.append(key) or lookup(key))
+
+    results = [index.is_exceptioned(k) for k in ("login|sql01|default|sa", "LOGIN|SQL01|DEFAULT|SA")]
+
+    assert results == [True, True]
+    assert lookups == ["login|sql01|default|sa"]
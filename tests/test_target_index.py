@@ -0,0 +1,132 @@
+"""
+Tests for indexed SQL target lookups and the shared parsed-targets cache.
+
+TargetIndex.find is compared against the linear scan it replaced,
+restated here in condensed form, over every combination of a small grid
+of queries. The cache tests load targets from files in a temp config dir.
+"""
+
+import json
+import os
+from itertools import product
+
+import pytest
+
+from autodbaudit.infrastructure.config.parsed_cache import clear_parsed_config_cache
+from autodbaudit.infrastructure.config_loader import ConfigLoader, SqlTarget, TargetIndex
+
+
+def _linear_find(targets, server, port=None, instance=None):
+    """The ScriptExecutor._find_target scan that TargetIndex replaced."""
+    server_norm = server.lower()
+    instance_norm = instance.lower() if instance else None
+    aliases = {server_norm}
+    if server_norm in ("localhost", "127.0.0.1", "."):
+        aliases = {"localhost", "127.0.0.1", "."}
+
+    def host_ok(t):
+        return t.server.lower() in aliases
+
+    steps = []
+    if port and instance_norm is not None:
+        steps.append(
+            lambda t: host_ok(t) and (t.port or 1433) == port and (t.instance or "").lower() == instance_norm
+        )
+    if port:
+        steps.append(lambda t: host_ok(t) and (t.port or 1433) == port)
+    if instance_norm is not None:
+        steps.append(lambda t: host_ok(t) and (t.instance or "").lower() == instance_norm)
+    if not port:
+        steps.append(lambda t: host_ok(t) and (t.port or 1433) == 1433)
+    if "." in server_norm:
+        short_name = server_norm.split(".")[0]
+        steps.append(
+            lambda t: t.server.lower() == short_name and (not port or (t.port or 1433) == port)
+        )
+    steps.append(host_ok)
+
+    for matches in steps:
+        for t in targets:
+            if matches(t):
+                return t
+    return None
+
+
+TARGETS = tuple(
+    SqlTarget(id=str(i), server=server, instance=instance, port=port)
+    for i, (server, instance, port) in enumerate(
+        [
+            ("sql01", "INST1", 1434),
+            ("SQL01", None, None),
+            ("sql01", "inst2", None),
+            ("sql01", None, 1433),  # Shadowed by the earlier default instance
+            ("localhost", "SQLEXPRESS", 1500),
+            (".", None, 1433),
+            ("sql02.corp.local", None, 1434),
+            ("sql03", "inst1", 1434),
+        ]
+    )
+)
+
+
+def test_find_matches_the_linear_scan_for_every_query():
+    index = TargetIndex(TARGETS)
+    servers = ["sql01", "SQL01.corp.local", "localhost", "127.0.0.1", ".", "sql02.corp.local",
+               "sql02", "sql03.corp.local", "unknown"]
+    ports = [None, 1433, 1434, 1500, 5000]
+    instances = [None, "", "inst1", "INST2", "sqlexpress", "missing"]
+
+    for server, port, instance in product(servers, ports, instances):
+        expected = _linear_find(TARGETS, server, port, instance)
+        assert index.find(server, port, instance) is expected, (server, port, instance)
+
+
+def test_first_listed_target_wins_within_a_step():
+    index = TargetIndex(TARGETS)
+
+    assert index.find("sql01").id == "1"  # Default port: SQL01 (listed before sql01:1433)
+    assert index.find("sql01", 1434, "inst1").id == "0"
+    assert index.find("127.0.0.1", 1500).id == "4"
+    assert index.find("sql03.corp.local", 1434).id == "7"
+    assert index.find("sql09") is None
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    clear_parsed_config_cache()
+    config = tmp_path / "config"
+    config.mkdir()
+    (tmp_path / "creds.json").write_text(json.dumps({"username": "auditor", "password": "one"}))
+    _write_targets(config, [{"id": "a", "server": "sql01", "auth": "sql", "credential_file": "creds.json"}])
+    yield config
+    clear_parsed_config_cache()
+
+
+def _write_targets(config, targets):
+    path = config / "sql_targets.json"
+    path.write_text(json.dumps({"targets": targets}))
+    # Bump mtime past the filesystem's granularity so the change is always seen
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_separate_loaders_share_parsed_targets(config_dir):
+    first = ConfigLoader(str(config_dir)).load_sql_targets()
+    second = ConfigLoader(str(config_dir)).load_sql_targets()
+
+    assert first == second and first is not second
+    assert first[0] is second[0]
+    assert first[0].password == "one"
+    assert ConfigLoader(str(config_dir)).load_target_index().find("SQL01") is first[0]
+
+
+def test_edits_to_targets_or_credential_files_are_reloaded(config_dir):
+    loader = ConfigLoader(str(config_dir))
+    assert loader.load_sql_targets()[0].password == "one"
+
+    creds = config_dir.parent / "creds.json"
+    creds.write_text(json.dumps({"username": "auditor", "password": "second"}))
+    assert loader.load_sql_targets()[0].password == "second"
+
+    _write_targets(config_dir, [{"id": "b", "server": "sql02"}])
+    assert [t.id for t in loader.load_sql_targets()] == ["b"]